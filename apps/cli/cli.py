@@ -2,13 +2,41 @@
 """Garbage Truck Query CLI Tool"""
 
 import argparse
+import json
+import logging
+import os
+import sqlite3
 import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Optional, TextIO
+from zoneinfo import ZoneInfo
 
 from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.clients.shared_cache import SharedResponseCache
+from trash_tracking_core.core.batch import BatchCheckpoint, BatchLookup, BatchResult, read_batch_rows
+from trash_tracking_core.core.catalog import CatalogError, RouteCatalog
+from trash_tracking_core.core.crawler import NEW_TAIPEI_BBOX, RouteCrawler, grid_tasks
+from trash_tracking_core.core.load_test import LoadTestReport, run_load_test
+from trash_tracking_core.core.polling import FixedIntervalPolicy, PollingPolicy, SchedulePolicy
+from trash_tracking_core.core.recorder import read_day
+from trash_tracking_core.core.replay import (
+    ReplayEngine,
+    ReplayReport,
+    frames_from_positions,
+    load_frames,
+    synthetic_frames,
+)
+from trash_tracking_core.core.simulator import FaultProfile, NTPCSimulator, SimulatedClock
 from trash_tracking_core.models.point import Point, PointStatus
 from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.config import ConfigError, ConfigManager
+from trash_tracking_core.utils.gazetteer import Gazetteer, GazetteerError
+from trash_tracking_core.utils.geocode_cache import GeocodeCache
 from trash_tracking_core.utils.geocoding import Geocoder, GeocodingError
-from trash_tracking_core.utils.logger import setup_logger
+from trash_tracking_core.utils.logger import logger, setup_logger
+from trash_tracking_core.utils.rate_limit import RateLimiter
 
 
 def format_point_info(point: Point, index: int, truck_diff: int = 0) -> str:
@@ -89,9 +117,35 @@ def display_truck_info(truck: TruckLine, next_points: int = 10) -> None:
     print()
 
 
-def _get_coordinates_from_address(address: str) -> tuple[float, float] | None:
+def _default_geocode_cache_path() -> Path:
+    """Location of the CLI's persistent geocode cache (XDG cache directory)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "trash_tracking" / "geocode.db"
+
+
+def _open_geocode_cache(enabled: bool = True) -> Optional[GeocodeCache]:
+    """Open the persistent geocode cache, or None when disabled or unavailable"""
+    if not enabled:
+        return None
+    try:
+        return GeocodeCache(str(_default_geocode_cache_path()))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Geocode cache unavailable, geocoding without cache: %s", e)
+        return None
+
+
+def _get_coordinates_from_address(
+    address: str, use_cache: bool = True, mode: str = "hedged", gazetteer_path: Optional[str] = None
+) -> tuple[float, float] | None:
     """Get coordinates from address"""
-    geocoder = Geocoder()
+    try:
+        gazetteer = Gazetteer(gazetteer_path) if gazetteer_path else None
+    except GazetteerError as e:
+        print(f"\n❌ {e}", file=sys.stderr)
+        return None
+
+    cache = _open_geocode_cache(use_cache)
+    geocoder = Geocoder(cache=cache, mode=mode, deadline=15.0, gazetteer=gazetteer)
     try:
         print(f"\n🔍 正在查詢地址座標: {address}")
         lat, lng = geocoder.address_to_coordinates(address)
@@ -100,18 +154,23 @@ def _get_coordinates_from_address(address: str) -> tuple[float, float] | None:
     except GeocodingError as e:
         print(f"\n❌ 地址查詢失敗: {e}", file=sys.stderr)
         return None
+    finally:
+        if cache is not None:
+            logger.debug("Geocode cache: %s", cache.stats.to_dict())
+            cache.close()
+        if gazetteer is not None:
+            gazetteer.close()
 
 
 def _query_and_display_trucks(lat: float, lng: float, args: argparse.Namespace) -> int:
     """Query and display truck information"""
     try:
-        client = NTPCApiClient()
-
         print(f"\n🔍 Query Location: ({lat}, {lng})")
         print(f"📏 Query Radius: {args.radius} meters")
 
         # Use Monday (week=1) to show routes even during off-hours
-        trucks = client.get_around_points(lat, lng, week=1)
+        with NTPCApiClient() as client:
+            trucks = client.get_around_points(lat, lng, week=1)
 
         if not trucks:
             print("\n❌ No garbage trucks found in query range")
@@ -147,8 +206,523 @@ def _query_and_display_trucks(lat: float, lng: float, args: argparse.Namespace)
         return 1
 
 
-def main() -> int:
+def _load_routes(path: str) -> list[TruckLine]:
+    """Load routes from a saved GetAroundPoints response (or a single route object)"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    routes = data.get("Line", [data]) if isinstance(data, dict) else data
+    return [TruckLine.from_dict(r) for r in routes]
+
+
+def _load_template(path: str, line_name: Optional[str]) -> TruckLine:
+    """Load a route template from a saved GetAroundPoints response (or a single route object)"""
+    lines = _load_routes(path)
+    if line_name:
+        lines = [line for line in lines if line.line_name == line_name]
+    if not lines:
+        raise ValueError(f"No route found in template: {path}")
+    return lines[0]
+
+
+def _build_policies(args: argparse.Namespace) -> list[PollingPolicy]:
+    """Build polling policies from replay arguments"""
+    policies: list[PollingPolicy] = [FixedIntervalPolicy(interval) for interval in args.interval]
+
+    if args.schedule:
+        time_start, _, time_end = args.schedule.partition("-")
+        weekdays = [int(d) for d in args.weekdays.split(",")] if args.weekdays else list(range(7))
+        for interval in args.interval:
+            policies.append(SchedulePolicy(weekdays, time_start, time_end, args.buffer, interval))
+
+    return policies
+
+
+def _print_replay_report(report: ReplayReport) -> None:
+    """Print a human-readable replay report"""
+    print(f"\n🎞️  Replayed {report.frames} frame(s) in {report.elapsed_seconds * 1000:.1f} ms")
+    if report.start and report.end:
+        print(f"   Timeline: {report.start:%Y-%m-%d %H:%M:%S} → {report.end:%H:%M:%S}")
+
+    print("\n📌 Reference transitions (every frame):")
+    for t in report.reference:
+        print(f"   {t.timestamp:%H:%M:%S}  {t.from_state} → {t.to_state}  ({t.reason})")
+    if not report.reference:
+        print("   (none)")
+
+    for policy in report.policies:
+        print(f"\n⏱️  {policy.policy}: {policy.api_calls} API call(s)")
+        for t, lag in zip(policy.transitions, policy.lag_seconds):
+            lag_str = f"+{lag:.0f}s" if lag is not None else "no reference"
+            print(f"   {t.timestamp:%H:%M:%S}  {t.from_state} → {t.to_state}  [{lag_str}]")
+        if not policy.transitions:
+            print("   (no transitions)")
+
+    print()
+
+
+def replay_main(argv: list[str]) -> int:
+    """Replay recorded or synthetic API responses through the tracker"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py replay",
+        description="Replay recorded or synthetic GetAroundPoints responses and compare polling policies",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Replay saved responses (JSON Lines of {"timestamp", "payload"})
+  %(prog)s --frames day.jsonl --enter "民生路二段80號" --exit "成功路23號"
+
+  # Synthetic run of a route template, 5 minutes late, comparing intervals and schedule gating
+  %(prog)s --synthetic --template route.json --date 2026-01-05 --delay 5 \\
+      --enter "民生路二段80號" --exit "成功路23號" --interval 30 60 --schedule 17:50-18:40
+
+  # Rebuild frames from the position recorder
+  %(prog)s --history ./history --date 2026-01-05 --template route.json --enter A --exit B
+        """,
+    )
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--frames", type=str, help="JSON Lines file of recorded API responses")
+    source.add_argument("--history", type=str, help="Position recorder directory (requires --template, --date)")
+    source.add_argument("--synthetic", action="store_true", help="Simulate the template route on schedule")
+
+    parser.add_argument("--template", type=str, help="Saved GetAroundPoints response used as route template")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(), help="Service date (YYYY-MM-DD)")
+    parser.add_argument("--delay", type=int, default=0, help="Synthetic delay in minutes (default: 0)")
+    parser.add_argument("--enter", type=str, required=True, help="Enter point name")
+    parser.add_argument("--exit", type=str, required=True, help="Exit point name")
+    parser.add_argument("--line", type=str, help="Route name to track (default: all routes)")
+    parser.add_argument(
+        "--interval", type=int, nargs="+", default=[30], help="Polling intervals in seconds (default: 30)"
+    )
+    parser.add_argument("--schedule", type=str, help="Also evaluate schedule gating for HH:MM-HH:MM")
+    parser.add_argument("--weekdays", type=str, help="Collection weekdays for --schedule (API format, e.g. 1,2,4)")
+    parser.add_argument("--buffer", type=int, default=10, help="Schedule buffer in minutes (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--debug", action="store_true", help="Show debug messages")
+
+    args = parser.parse_args(argv)
+    # Replays run thousands of polls; keep the tracker's per-poll INFO logs out of the report
+    setup_logger().setLevel(logging.DEBUG if args.debug else logging.WARNING)
+
+    if (args.history or args.synthetic) and not args.template:
+        parser.error("--template is required with --history and --synthetic")
+
+    try:
+        config = ConfigManager.from_dict(
+            {
+                "location": {"lat": 0.0, "lng": 0.0},
+                "tracking": {
+                    "enter_point": args.enter,
+                    "exit_point": args.exit,
+                    "target_lines": [args.line] if args.line else [],
+                },
+                "api": {},
+            }
+        )
+
+        if args.frames:
+            frames = load_frames(args.frames)
+        else:
+            template = _load_template(args.template, args.line)
+            if args.history:
+                frames = frames_from_positions(read_day(args.history, args.date), template)
+            else:
+                frames = synthetic_frames(template, args.date, delay_minutes=args.delay)
+
+        report = ReplayEngine(config).run(frames, _build_policies(args))
+
+    except (ConfigError, OSError, ValueError) as e:
+        print(f"\n❌ Replay failed: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        _print_replay_report(report)
+
+    return 0
+
+
+def _add_simulator_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add route, clock and fault-injection options shared by simulate and loadtest"""
+    parser.add_argument("--template", type=str, help="Saved GetAroundPoints response with the routes to serve")
+    parser.add_argument("--start", type=str, help="Simulated start time HH:MM today (default: now)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Simulated seconds per real second (default: 1)")
+    parser.add_argument("--delay", type=int, default=0, help="Minutes every route runs late (default: 0)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base response latency in ms (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency up to N ms (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500 responses (default: 0)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of slow responses (default: 0)")
+    parser.add_argument("--slow-ms", type=float, default=15000.0, help="Delay of slow responses in ms (default: 15000)")
+    parser.add_argument(
+        "--malformed-rate", type=float, default=0.0, help="Fraction of truncated JSON responses (default: 0)"
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible faults")
+
+
+def _build_simulator(args: argparse.Namespace) -> NTPCSimulator:
+    """Build a simulator from simulate/loadtest arguments"""
+    routes = _load_routes(args.template)
+    if not routes:
+        raise ValueError(f"No route found in template: {args.template}")
+
+    tz = ZoneInfo("Asia/Taipei")
+    start = datetime.now(tz)
+    if args.start:
+        start = datetime.combine(start.date(), datetime.strptime(args.start, "%H:%M").time(), tzinfo=tz)
+
+    faults = FaultProfile(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        malformed_rate=args.malformed_rate,
+    )
+    return NTPCSimulator(
+        routes,
+        faults=faults,
+        clock=SimulatedClock(start, speed=args.speed),
+        delays={route.line_id: args.delay for route in routes},
+        seed=args.seed,
+    )
+
+
+def simulate_main(argv: list[str]) -> int:
+    """Serve a local stand-in for the NTPC GetAroundPoints API"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py simulate",
+        description="Serve simulated GetAroundPoints responses with configurable latency and failures",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Replay the day's routes from 17:50 at 60x speed, with 10%% HTTP 500s
+  %(prog)s --template route.json --start 17:50 --speed 60 --error-rate 0.1 --port 8080
+
+  # Load-test it from another terminal
+  cli.py loadtest --url http://127.0.0.1:8080 --enter A --exit B
+        """,
+    )
+    _add_simulator_arguments(parser)
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to bind (default: 8080)")
+    parser.add_argument("--debug", action="store_true", help="Log every request")
+
+    args = parser.parse_args(argv)
+    setup_logger(log_level="DEBUG" if args.debug else "INFO")
+
+    if not args.template:
+        parser.error("--template is required")
+
+    try:
+        simulator = _build_simulator(args)
+        url = simulator.start(args.host, args.port)
+    except (OSError, ValueError) as e:
+        print(f"\n❌ Simulator failed to start: {e}", file=sys.stderr)
+        return 1
+
+    print(f"\n🛰️  Simulating {len(simulator.routes)} route(s) at {url}/GetAroundPoints (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+
+    print(f"\n📊 {json.dumps(simulator.stats.to_dict())}")
+    return 0
+
+
+def _print_load_report(report: LoadTestReport) -> None:
+    """Print a human-readable load test report"""
+    data = report.to_dict()
+    latency = data["latency_ms"]
+    print(f"\n🚚 {report.coordinators} coordinator(s) for {report.duration_seconds:.1f}s")
+    print(f"   Updates: {report.updates} ({report.throughput:.1f}/s), succeeded: {report.successes}")
+    for kind, count in sorted(report.failures.items()):
+        print(f"   Failed ({kind}): {count}")
+    print(
+        f"   Latency ms: p50 {latency['p50']:.1f} | p95 {latency['p95']:.1f} | "
+        f"p99 {latency['p99']:.1f} | max {latency['max']:.1f}"
+    )
+    if report.server:
+        counts = ", ".join(f"{key} {value}" for key, value in report.server.items())
+        print(f"\n🛰️  Server requests: {counts}")
+    print()
+
+
+def loadtest_main(argv: list[str]) -> int:
+    """Run concurrent coordinators against the simulator (or another endpoint)"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py loadtest",
+        description="Run N tracker coordinators against a simulated API and report latency percentiles",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # 50 coordinators polling every second for a minute, with failures injected
+  %(prog)s --template route.json --coordinators 50 --duration 60 --interval 1 \\
+      --latency 80 --jitter 40 --error-rate 0.05 --slow-rate 0.01 --slow-ms 12000
+
+  # Target an already running simulator
+  %(prog)s --url http://127.0.0.1:8080 --coordinators 10 --enter A --exit B
+        """,
+    )
+    _add_simulator_arguments(parser)
+    parser.add_argument("--url", type=str, help="Use a running endpoint instead of an in-process simulator")
+    parser.add_argument("--coordinators", type=int, default=10, help="Concurrent coordinators (default: 10)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test duration in seconds (default: 30)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between updates (default: 1)")
+    parser.add_argument("--timeout", type=int, default=10, help="Client timeout in seconds (default: 10)")
+    parser.add_argument("--retries", type=int, default=3, help="Client retry count (default: 3)")
+    parser.add_argument("--retry-delay", type=int, default=0, help="Client retry delay in seconds (default: 0)")
+    parser.add_argument("--enter", type=str, help="Enter point name (default: first point of the first route)")
+    parser.add_argument("--exit", type=str, help="Exit point name (default: last point of the first route)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--debug", action="store_true", help="Show debug messages")
+
+    args = parser.parse_args(argv)
+    # Injected failures make the client log every retry; the report already counts them
+    setup_logger().setLevel(logging.DEBUG if args.debug else logging.CRITICAL)
+
+    if not args.url and not args.template:
+        parser.error("--template is required without --url")
+    if args.url and not (args.enter and args.exit):
+        parser.error("--enter and --exit are required with --url")
+
+    simulator = None
+    try:
+        if args.url:
+            base_url = args.url
+        else:
+            simulator = _build_simulator(args)
+            base_url = simulator.start()
+
+        first = simulator.routes[0] if simulator else None
+        config = ConfigManager.from_dict(
+            {
+                "location": {"lat": 0.0, "lng": 0.0},
+                "tracking": {
+                    "enter_point": args.enter or first.points[0].point_name,
+                    "exit_point": args.exit or first.points[-1].point_name,
+                },
+                "api": {},
+            }
+        )
+        report = run_load_test(
+            base_url,
+            config,
+            coordinators=args.coordinators,
+            duration_seconds=args.duration,
+            interval_seconds=args.interval,
+            client_options={"timeout": args.timeout, "retry_count": args.retries, "retry_delay": args.retry_delay},
+        )
+        if simulator:
+            report.server = simulator.stats.to_dict()
+
+    except (ConfigError, IndexError, OSError, ValueError) as e:
+        print(f"\n❌ Load test failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if simulator:
+            simulator.stop()
+
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        _print_load_report(report)
+
+    return 0
+
+
+def _batch_rate_limits(args: argparse.Namespace) -> dict[str, RateLimiter]:
+    """Build per-service geocoding rate limiters from batch arguments"""
+    rates = {"nlsc": args.nlsc_rate, "nominatim": args.nominatim_rate, "tgos": args.tgos_rate}
+    return {service: RateLimiter(rate) for service, rate in rates.items() if rate}
+
+
+def batch_main(argv: list[str]) -> int:
+    """Geocode many addresses and look up the routes around each one"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py batch",
+        description="Geocode addresses from a CSV file or stdin and stream JSON Lines results",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # CSV with an "address" column (optional "id" column), results to a file, resumable
+  %(prog)s households.csv --output results.jsonl --checkpoint results.checkpoint
+
+  # One address per line from stdin, geocoding only
+  cat addresses.txt | %(prog)s --no-routes > coordinates.jsonl
+
+Rerunning with the same --checkpoint skips rows that already succeeded and
+appends the remaining results to --output (failed rows are retried). Exits
+with 2 when any row failed.
+        """,
+    )
+    parser.add_argument("input", nargs="?", default="-", help="CSV or one-address-per-line file (default: stdin)")
+    parser.add_argument("--output", "-o", type=str, help="JSON Lines output file (default: stdout)")
+    parser.add_argument("--checkpoint", type=str, help="Progress file for resuming an interrupted run")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent lookups (default: 4)")
+    parser.add_argument("--no-routes", action="store_true", help="Geocode only, skip the route lookup")
+    parser.add_argument("--week", type=int, choices=range(7), help="Week day for the route lookup (default: today)")
+    parser.add_argument(
+        "--nominatim-rate", type=float, default=1.0, help="Nominatim requests per second (default: 1, its usage policy)"
+    )
+    parser.add_argument("--nlsc-rate", type=float, help="NLSC requests per second (default: unlimited)")
+    parser.add_argument("--tgos-rate", type=float, help="TGOS requests per second (default: unlimited)")
+    parser.add_argument("--api-rate", type=float, help="NTPC API requests per second (default: unlimited)")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the persistent geocode cache")
+    parser.add_argument(
+        "--geocode-mode",
+        choices=Geocoder.MODES,
+        default="hedged",
+        help="How geocoding providers are queried (default: hedged)",
+    )
+    parser.add_argument("--gazetteer", type=str, help="Offline gazetteer index consulted before online geocoding")
+    parser.add_argument(
+        "--shared-cache", type=str, help="SQLite response cache shared with other processes on this machine"
+    )
+    parser.add_argument("--debug", action="store_true", help="Show debug messages")
+
+    args = parser.parse_args(argv)
+    # Results go to stdout; only warnings (e.g. exhausted API retries) go to the log
+    setup_logger().setLevel(logging.DEBUG if args.debug else logging.WARNING)
+
+    if args.shared_cache:
+        NTPCApiClient.set_cache_backend(SharedResponseCache(args.shared_cache))
+
+    cache = _open_geocode_cache(not args.no_cache)
+    gazetteer = None
+    checkpoint = None
+    source: TextIO = sys.stdin
+    output: TextIO = sys.stdout
+    try:
+        gazetteer = Gazetteer(args.gazetteer) if args.gazetteer else None
+        geocoder = Geocoder(
+            cache=cache,
+            mode=args.geocode_mode,
+            deadline=15.0,
+            gazetteer=gazetteer,
+            rate_limits=_batch_rate_limits(args),
+        )
+        lookup = BatchLookup(
+            geocoder,
+            workers=args.workers,
+            week=args.week,
+            with_routes=not args.no_routes,
+            api_rate_limit=RateLimiter(args.api_rate) if args.api_rate else None,
+        )
+        checkpoint = BatchCheckpoint(args.checkpoint) if args.checkpoint else None
+        if args.input != "-":
+            source = open(args.input, "r", encoding="utf-8-sig", newline="")
+        if args.output:
+            # A resumed run appends to the results of the earlier runs
+            output = open(args.output, "a" if checkpoint else "w", encoding="utf-8")
+
+        def write(result: BatchResult) -> None:
+            output.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+            output.flush()
+
+        summary = lookup.run(read_batch_rows(source), write, checkpoint)
+
+    except (GazetteerError, OSError, ValueError) as e:
+        print(f"\n❌ Batch failed: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\n⚠️  Batch interrupted; rerun with the same --checkpoint to resume", file=sys.stderr)
+        return 130
+    finally:
+        for resource in (checkpoint, cache, gazetteer):
+            if resource is not None:
+                resource.close()
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"📊 {json.dumps(summary.to_dict())}", file=sys.stderr)
+    return 0 if summary.failed == 0 else 2
+
+
+def _parse_bbox(value: str) -> tuple[float, float, float, float]:
+    """Parse "south,west,north,east" """
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 4:
+        raise argparse.ArgumentTypeError("expected south,west,north,east")
+    return parts[0], parts[1], parts[2], parts[3]
+
+
+def crawl_main(argv: list[str]) -> int:
+    """Crawl a grid of locations into a route catalog"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py crawl",
+        description="Query a grid of locations and collect every route into a catalog file",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # All of New Taipei, resumable
+  %(prog)s --catalog routes.json --checkpoint routes.checkpoint
+
+  # One district on weekdays only, at two requests per second
+  %(prog)s --catalog banqiao.json --bbox 24.99,121.43,25.04,121.48 --weeks 1,2,3,4,5 --api-rate 2
+
+Rerunning with the same --catalog and --checkpoint skips the queries already
+done; rerunning without --checkpoint refreshes an existing catalog. Exits with
+2 when any query failed.
+        """,
+    )
+    parser.add_argument("--catalog", type=str, required=True, help="Route catalog file, extended if it exists")
+    parser.add_argument("--checkpoint", type=str, help="Progress file for resuming an interrupted crawl")
+    parser.add_argument(
+        "--bbox", type=_parse_bbox, default=NEW_TAIPEI_BBOX, help="south,west,north,east (default: New Taipei City)"
+    )
+    parser.add_argument("--spacing", type=float, default=500.0, help="Meters between query points (default: 500)")
+    parser.add_argument("--weeks", type=str, default="0,1,2,3,4,5,6", help="Week days to query (default: all)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent queries (default: 4)")
+    parser.add_argument("--api-rate", type=float, default=2.0, help="NTPC API requests per second (default: 2)")
+    parser.add_argument("--debug", action="store_true", help="Show debug messages")
+
+    args = parser.parse_args(argv)
+    setup_logger().setLevel(logging.DEBUG if args.debug else logging.WARNING)
+
+    checkpoint = None
+    try:
+        catalog = RouteCatalog.load(args.catalog) if os.path.exists(args.catalog) else RouteCatalog()
+        tasks = grid_tasks(args.bbox, args.spacing, [int(week) for week in args.weeks.split(",")])
+        checkpoint = BatchCheckpoint(args.checkpoint) if args.checkpoint else None
+        crawler = RouteCrawler(workers=args.workers, rate_limit=RateLimiter(args.api_rate))
+        summary = crawler.crawl(tasks, catalog, args.catalog, checkpoint)
+    except (CatalogError, OSError, ValueError) as e:
+        print(f"\n❌ Crawl failed: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\n⚠️  Crawl interrupted; rerun with the same --checkpoint to resume", file=sys.stderr)
+        return 130
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    print(f"📊 {json.dumps(summary.to_dict())} — {len(catalog)} route(s) in {args.catalog}", file=sys.stderr)
+    return 0 if summary.failed == 0 else 2
+
+
+SUBCOMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "replay": replay_main,
+    "simulate": simulate_main,
+    "loadtest": loadtest_main,
+    "batch": batch_main,
+    "crawl": crawl_main,
+}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
     """Main program"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Query New Taipei City garbage truck real-time information",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -165,6 +739,13 @@ Examples:
 
   # Filter by specific route
   %(prog)s --address "新北市板橋區民生路二段80號" --line "A14路線下午"
+
+Subcommands:
+  replay    Replay recorded or synthetic responses (%(prog)s replay --help)
+  simulate  Serve a local NTPC API stand-in (%(prog)s simulate --help)
+  loadtest  Load-test coordinators against the simulator (%(prog)s loadtest --help)
+  batch     Look up many addresses from CSV or stdin (%(prog)s batch --help)
+  crawl     Collect every route of a region into a catalog (%(prog)s crawl --help)
         """,
     )
 
@@ -178,14 +759,34 @@ Examples:
 
     parser.add_argument("--line", type=str, help='Filter by specific route name (e.g., "A14路線下午")')
 
+    parser.add_argument("--no-cache", action="store_true", help="Skip the persistent geocode cache")
+
+    parser.add_argument(
+        "--geocode-mode",
+        choices=Geocoder.MODES,
+        default="hedged",
+        help="How geocoding providers are queried (default: hedged)",
+    )
+
+    parser.add_argument("--gazetteer", type=str, help="Offline gazetteer index consulted before online geocoding")
+
+    parser.add_argument(
+        "--shared-cache", type=str, help="SQLite response cache shared with other processes on this machine"
+    )
+
     parser.add_argument("--debug", action="store_true", help="Show debug messages")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     log_level = "DEBUG" if args.debug else "INFO"
     setup_logger(log_level=log_level)
 
-    coordinates = _get_coordinates_from_address(args.address)
+    if args.shared_cache:
+        NTPCApiClient.set_cache_backend(SharedResponseCache(args.shared_cache))
+
+    coordinates = _get_coordinates_from_address(
+        args.address, use_cache=not args.no_cache, mode=args.geocode_mode, gazetteer_path=args.gazetteer
+    )
     if not coordinates:
         return 1
     lat, lng = coordinates
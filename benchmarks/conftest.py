@@ -0,0 +1,78 @@
+"""Shared fixtures for the performance benchmarks
+
+Inputs are synthetic payloads scaled up from the BDD mock data
+(features/fixtures/mock_api_data.py), so the benchmarks exercise the same
+field shapes as the tests at thousands of routes and points.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trash_tracking_core.models.truck import TruckLine  # noqa: E402
+
+from features.fixtures.mock_api_data import MOCK_TRUCK_POINTS  # noqa: E402
+
+
+def make_point_payload(rank: int, passed: bool) -> dict:
+    """API point dict derived from the mock point at the same position in the cycle"""
+    base = MOCK_TRUCK_POINTS[(rank - 1) % len(MOCK_TRUCK_POINTS)].to_api_dict()
+    minutes = 17 * 60 + rank
+    base.update(
+        {
+            "SourcePointID": 10000 + rank,
+            "PointID": rank,
+            "PointRank": rank,
+            "PointName": f"{base['PointName']} #{rank}",
+            "Lat": base["Lat"] + rank * 1e-4,
+            "Lon": base["Lon"] + rank * 1e-4,
+            "PointTime": f"{minutes // 60 % 24:02d}:{minutes % 60:02d}",
+            "Arrival": f"{minutes // 60 % 24:02d}:{minutes % 60:02d}" if passed else "",
+            "ArrivalDiff": 0 if passed else 65535,
+        }
+    )
+    return base
+
+
+def make_line_payload(index: int, points: int, arrival_rank: int) -> dict:
+    """API route dict with ``points`` stops, the first ``arrival_rank`` of them passed"""
+    return {
+        "LineID": f"L{index:05d}",
+        "LineName": f"Route {index}",
+        "Area": "板橋區",
+        "ArrivalRank": arrival_rank,
+        "Diff": 2,
+        "CarNO": f"KKA-{index:04d}",
+        "Location": f"Stop {arrival_rank}",
+        "LocationLat": 25.0175,
+        "LocationLon": 121.4625,
+        "BarCode": f"BC{index:05d}",
+        "Point": [make_point_payload(rank, rank <= arrival_rank) for rank in range(1, points + 1)],
+    }
+
+
+def make_payload(routes: int, points: int) -> dict:
+    """GetAroundPoints response with ``routes`` routes of ``points`` stops, trucks halfway along"""
+    return {
+        "TimeStamp": "2026-01-05 18:00:00",
+        "Line": [make_line_payload(i, points, points // 2) for i in range(routes)],
+    }
+
+
+def make_lines(routes: int, points: int) -> list[TruckLine]:
+    """Parsed routes for ``make_payload``"""
+    return [TruckLine.from_dict(line) for line in make_payload(routes, points)["Line"]]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def quiet_logger():
+    """Measure the code, not console I/O: only warnings reach the handlers"""
+    core_logger = logging.getLogger("trash_tracking")
+    previous = core_logger.level
+    core_logger.setLevel(logging.WARNING)
+    yield
+    core_logger.setLevel(previous)
@@ -0,0 +1,46 @@
+"""Benchmarks for the per-poll tracking path"""
+
+import pytest
+from conftest import make_lines
+from trash_tracking_core.core.point_matcher import PointMatcher
+from trash_tracking_core.core.response_builder import StatusResponseBuilder
+from trash_tracking_core.core.state_manager import StateManager, TruckState
+
+
+@pytest.mark.parametrize("points", [60, 1000])
+def test_point_matcher_check_line_trigger(benchmark, points):
+    """IDLE → NEARBY trigger: enter point passed, exit point ahead"""
+    (line,) = make_lines(1, points)
+    half = points // 2
+    matcher = PointMatcher(
+        enter_point_name=line.points[half - 1].point_name, exit_point_name=line.points[-1].point_name
+    )
+
+    result = benchmark(matcher.check_line, line, current_state=TruckState.IDLE)
+
+    assert result.should_trigger
+
+
+@pytest.mark.parametrize("points", [60, 1000])
+def test_point_matcher_check_line_no_match(benchmark, points):
+    """Tracking window not on this route (the common case with many nearby routes)"""
+    (line,) = make_lines(1, points)
+    matcher = PointMatcher(enter_point_name="Nowhere A", exit_point_name="Nowhere B")
+
+    result = benchmark(matcher.check_line, line, current_state=TruckState.IDLE)
+
+    assert not result.should_trigger
+
+
+def test_status_response_builder_build(benchmark):
+    """Build the status response for a nearby truck"""
+    (line,) = make_lines(1, 60)
+    state_manager = StateManager()
+    state_manager.update_state(
+        "nearby", "bench", truck_line=line, enter_point=line.points[10], exit_point=line.points[20]
+    )
+    builder = StatusResponseBuilder()
+
+    response = benchmark(builder.build, state_manager)
+
+    assert response["status"] == "nearby"
@@ -0,0 +1,76 @@
+"""Benchmarks for model parsing and lookup"""
+
+import json
+
+import pytest
+from conftest import make_lines, make_payload
+from trash_tracking_core.clients.decoding import JSON_BACKENDS, available_json_backends, decode_around_points
+from trash_tracking_core.models.codec import pack_truck_lines, unpack_truck_lines
+from trash_tracking_core.models.tracking_window import TrackingWindow
+from trash_tracking_core.models.truck import TruckLine
+
+
+@pytest.mark.parametrize("routes", [10, 100, 1000])
+def test_truck_line_from_dict(benchmark, routes):
+    """Parse a GetAroundPoints payload of ``routes`` × 60 points"""
+    payload = make_payload(routes, 60)
+
+    lines = benchmark(lambda: [TruckLine.from_dict(line) for line in payload["Line"]])
+
+    assert len(lines) == routes
+
+
+@pytest.mark.parametrize("routes", [10, 100, 1000])
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_decode_around_points(benchmark, routes, backend):
+    """Response body to TruckLine objects with each JSON backend (json is the fallback path)"""
+    if backend not in available_json_backends():
+        pytest.skip(f"{backend} is not installed")
+    content = json.dumps(make_payload(routes, 60), ensure_ascii=False).encode()
+
+    payload = benchmark(decode_around_points, content, backend)
+
+    assert len(payload.lines) == routes
+
+
+@pytest.mark.parametrize("points", [60, 5000])
+def test_tracking_window_find_points(benchmark, points):
+    """Worst case: enter/exit points at the end of a long route"""
+    (line,) = make_lines(1, points)
+    window = TrackingWindow(line.points[-2].point_name, line.points[-1].point_name)
+
+    found = benchmark(window.find_points, line)
+
+    assert found is not None
+
+
+def encode_json(lines):
+    return json.dumps([line.to_api_dict() for line in lines], ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_json(text):
+    return [TruckLine.from_dict(line) for line in json.loads(text)]
+
+
+@pytest.mark.parametrize("routes", [10, 100, 1000])
+@pytest.mark.parametrize("codec", ["binary", "json"])
+def test_snapshot_encode(benchmark, routes, codec):
+    """Serialize ``routes`` × 60 points: binary snapshot vs. JSON of the API dicts"""
+    lines = make_lines(routes, 60)
+    encode = pack_truck_lines if codec == "binary" else encode_json
+
+    data = benchmark(encode, lines)
+
+    benchmark.extra_info["bytes"] = len(data if codec == "binary" else data.encode())
+
+
+@pytest.mark.parametrize("routes", [10, 100, 1000])
+@pytest.mark.parametrize("codec", ["binary", "json"])
+def test_snapshot_decode(benchmark, routes, codec):
+    """Deserialize ``routes`` × 60 points back to TruckLine objects"""
+    lines = make_lines(routes, 60)
+    data = pack_truck_lines(lines) if codec == "binary" else encode_json(lines)
+
+    decoded = benchmark(unpack_truck_lines if codec == "binary" else decode_json, data)
+
+    assert decoded == lines
@@ -0,0 +1,47 @@
+"""Benchmarks for route analysis and coordinate conversion"""
+
+import pytest
+from conftest import make_lines
+from trash_tracking_core.utils.geocoding import Geocoder
+from trash_tracking_core.utils.projection import twd97_to_wgs84_many
+from trash_tracking_core.utils.route_analyzer import RouteAnalyzer
+
+
+@pytest.mark.parametrize("routes", [10, 1000])
+def test_route_analyzer_analyze_all_routes(benchmark, routes):
+    """Recommend enter/exit points for ``routes`` × 60 points"""
+    lines = make_lines(routes, 60)
+    analyzer = RouteAnalyzer(25.0175, 121.4625)
+
+    recommendations = benchmark(analyzer.analyze_all_routes, lines)
+
+    assert len(recommendations) == routes
+
+
+def test_geocoder_twd97_to_wgs84(benchmark):
+    """Single TWD97 → WGS84 conversion"""
+    geocoder = Geocoder()
+
+    lat, lng = benchmark(geocoder._twd97_to_wgs84, 296000.0, 2770000.0)
+
+    assert 20 < lat < 30 and 119 < lng < 123
+
+
+def test_geocoder_twd97_to_wgs84_many(benchmark):
+    """10,000 TWD97 → WGS84 conversions (e.g. a gazetteer import)"""
+    geocoder = Geocoder()
+    coordinates = [(290000.0 + i, 2760000.0 + i) for i in range(10000)]
+
+    results = benchmark(lambda: [geocoder._twd97_to_wgs84(x, y) for x, y in coordinates])
+
+    assert len(results) == 10000
+
+
+def test_twd97_to_wgs84_many_batch(benchmark):
+    """10,000 TWD97 → WGS84 conversions in one batch call (NumPy when installed)"""
+    xs = [290000.0 + i for i in range(10000)]
+    ys = [2760000.0 + i for i in range(10000)]
+
+    lats, lngs = benchmark(twd97_to_wgs84_many, xs, ys)
+
+    assert len(lats) == len(lngs) == 10000
@@ -10,6 +10,8 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import TrashTrackingCoordinator
+from .diagnostics import get_metrics_sink
+from .trash_tracking_core.utils.logger import start_queue_logging
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +38,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Trash Tracking from a config entry."""
     _LOGGER.debug("Setting up Trash Tracking integration")
 
+    # Collect upstream call metrics from the first refresh on
+    get_metrics_sink(hass)
+
+    # Core logging runs on the event loop (point matching); keep its console I/O off the loop
+    start_queue_logging()
+
     # Create coordinator
     coordinator = TrashTrackingCoordinator(hass, entry)
 
@@ -59,8 +67,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Remove coordinator
+    # Remove coordinator and release its connections
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: TrashTrackingCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await hass.async_add_executor_job(coordinator.close)
 
     return unload_ok
@@ -1,11 +1,14 @@
 """Config flow for Trash Tracking integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import sqlite3
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
@@ -24,31 +27,63 @@ from .const import (
     CONF_SCHEDULE_TIME_START,
     CONF_SCHEDULE_WEEKDAYS,
     DOMAIN,
+    GAZETTEER_FILE,
+    GAZETTEER_KEY,
+    GEOCODE_CACHE_FILE,
+    GEOCODE_CACHE_KEY,
+    GEOCODE_DEADLINE,
+    GEOCODE_HEDGE_DELAY,
+    GEOCODE_MODE,
+    ROUTE_CATALOG_FILE,
+    ROUTE_CATALOG_KEY,
+    ROUTE_CATALOG_RADIUS,
     STEP_POINTS,
     STEP_ROUTE,
     STEP_USER,
 )
+from .diagnostics import get_metrics_sink
 from .trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from .trash_tracking_core.core.catalog import CatalogError, RouteCatalog
+from .trash_tracking_core.models.truck import TruckLine
+from .trash_tracking_core.utils.gazetteer import Gazetteer, GazetteerError
+from .trash_tracking_core.utils.geocode_cache import GeocodeCache
 from .trash_tracking_core.utils.geocoding import Geocoder, GeocodingError
 from .trash_tracking_core.utils.route_analyzer import RouteAnalyzer
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _extract_schedule_from_route(
-    route_recommendation: Any, api_client: Any, latitude: float, longitude: float
-) -> dict[str, Any]:
+def _around_points(
+    latitude: float, longitude: float, week: int, catalog: RouteCatalog | None = None
+) -> list[TruckLine] | None:
+    """Routes serving a location on one weekday, from the route catalog if the API fails (runs in executor)."""
+    try:
+        with NTPCApiClient() as client:
+            return client.get_around_points(lat=latitude, lng=longitude, week=week)
+    except NTPCApiError as err:
+        if catalog is None:
+            raise
+        _LOGGER.warning("API unavailable for week=%d, using the offline route catalog: %s", week, err)
+        return [route.to_truck_line() for route in catalog.routes_near(latitude, longitude, ROUTE_CATALOG_RADIUS, week)]
+
+
+def _routes_on_week(latitude: float, longitude: float, week: int, catalog: RouteCatalog | None = None) -> set[str]:
+    """Names of the routes serving a location on one weekday (runs in executor)."""
+    return {truck.line_name for truck in _around_points(latitude, longitude, week, catalog) or []}
+
+
+def _extract_schedule_from_route(route_recommendation: Any, routes_by_week: dict[int, set[str]]) -> dict[str, Any]:
     """
     Extract schedule information from route recommendation.
 
     Since PointWeekKnd only indicates waste types (N=Normal, R=Recyclable, F=Food),
-    we need to query the API with different week parameters to determine collection days.
+    collection days come from querying the API with each week value; a route
+    collects on the weekdays whose response lists it.
 
     Args:
         route_recommendation: Route recommendation object
-        api_client: NTPCApiClient instance for querying API
-        latitude: User's latitude
-        longitude: User's longitude
+        routes_by_week: Route names found near the user's location, by week value
+            (0=Sunday, 1-6=Monday-Saturday); weekdays whose query failed are missing
 
     Returns:
         dict: Schedule information with keys:
@@ -59,26 +94,7 @@ def _extract_schedule_from_route(
     points = route_recommendation.truck.points
     route_name = route_recommendation.truck.line_name
 
-    # Determine collection weekdays by querying API with each week value
-    # week: 0=Sunday, 1=Monday, ..., 6=Saturday
-    collection_weekdays = []
-
-    _LOGGER.debug("Determining collection days for route: %s", route_name)
-
-    for week in range(7):
-        try:
-            trucks = api_client.get_around_points(lat=latitude, lng=longitude, week=week)
-
-            # Check if this route appears in the results
-            route_found = any(truck.line_name == route_name for truck in trucks)
-
-            if route_found:
-                collection_weekdays.append(week)
-                _LOGGER.debug("Route %s collects on week=%d", route_name, week)
-
-        except Exception as e:
-            _LOGGER.warning("Failed to query API for week=%d: %s", week, e)
-            # Continue checking other days even if one fails
+    collection_weekdays = sorted(week for week, names in routes_by_week.items() if route_name in names)
 
     # Find earliest and latest collection times
     times = [point.point_time for point in points if point.point_time]
@@ -90,7 +106,8 @@ def _extract_schedule_from_route(
     }
 
     _LOGGER.debug(
-        "Extracted schedule: weekdays=%s, time_start=%s, time_end=%s",
+        "Extracted schedule for %s: weekdays=%s, time_start=%s, time_end=%s",
+        route_name,
         schedule["weekdays"],
         schedule["time_start"],
         schedule["time_end"],
@@ -99,6 +116,62 @@ def _extract_schedule_from_route(
     return schedule
 
 
+def _load_gazetteer(path: str) -> Gazetteer | None:
+    """Open the offline gazetteer if one was installed (runs in executor)."""
+    try:
+        return Gazetteer(path)
+    except GazetteerError as err:
+        _LOGGER.debug("Offline gazetteer not used: %s", err)
+        return None
+
+
+def _load_route_catalog(path: str) -> RouteCatalog | None:
+    """Open the offline route catalog if one was installed (runs in executor)."""
+    try:
+        return RouteCatalog.load(path)
+    except CatalogError as err:
+        _LOGGER.debug("Offline route catalog not used: %s", err)
+        return None
+
+
+async def _async_get_route_catalog(hass: HomeAssistant) -> RouteCatalog | None:
+    """Get the offline route catalog shared by all config flows."""
+    catalog = hass.data.get(ROUTE_CATALOG_KEY)
+    if catalog is None:
+        catalog = await hass.async_add_executor_job(_load_route_catalog, hass.config.path(ROUTE_CATALOG_FILE))
+        if catalog is not None:
+            hass.data[ROUTE_CATALOG_KEY] = catalog
+    return catalog
+
+
+async def _async_get_geocoder(hass: HomeAssistant) -> Geocoder:
+    """Get a hedged geocoder backed by the persistent cache and offline gazetteer shared by all config flows."""
+    get_metrics_sink(hass)
+
+    cache = hass.data.get(GEOCODE_CACHE_KEY)
+    if cache is None:
+        try:
+            cache = await hass.async_add_executor_job(GeocodeCache, hass.config.path(".storage", GEOCODE_CACHE_FILE))
+        except (OSError, sqlite3.Error) as err:
+            _LOGGER.warning("Geocode cache unavailable, geocoding without cache: %s", err)
+        else:
+            hass.data[GEOCODE_CACHE_KEY] = cache
+
+    gazetteer = hass.data.get(GAZETTEER_KEY)
+    if gazetteer is None:
+        gazetteer = await hass.async_add_executor_job(_load_gazetteer, hass.config.path(GAZETTEER_FILE))
+        if gazetteer is not None:
+            hass.data[GAZETTEER_KEY] = gazetteer
+
+    return Geocoder(
+        cache=cache,
+        mode=GEOCODE_MODE,
+        hedge_delay=GEOCODE_HEDGE_DELAY,
+        deadline=GEOCODE_DEADLINE,
+        gazetteer=gazetteer,
+    )
+
+
 class TrashTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Trash Tracking."""
 
@@ -111,6 +184,55 @@ class TrashTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._longitude: float | None = None
         self._route_recommendations: list[Any] | None = None
         self._selected_route: Any | None = None
+        # Weekday probe started as soon as the nearby routes are known, awaited in the points step
+        self._weekday_probe: asyncio.Task[dict[int, set[str]]] | None = None
+        # Route analysis started alongside the probe, awaited in the route step
+        self._route_analysis: asyncio.Future[list[Any]] | None = None
+        # Offline fallback for the route queries, loaded in the address step
+        self._catalog: RouteCatalog | None = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Cancel background work when the flow is closed."""
+        if self._weekday_probe is not None:
+            self._weekday_probe.cancel()
+        if self._route_analysis is not None:
+            self._route_analysis.cancel()
+
+    def _start_route_analysis(self, latitude: float, longitude: float, routes: list[Any]) -> None:
+        """Rank the nearby routes in the background; the route step awaits the result."""
+        if self._route_analysis is not None:
+            self._route_analysis.cancel()
+        analyzer = RouteAnalyzer(latitude, longitude)
+        self._route_analysis = self.hass.async_add_executor_job(analyzer.analyze_all_routes, routes)
+
+    def _start_weekday_probe(self, latitude: float, longitude: float, known: dict[int, set[str]]) -> None:
+        """Probe the weekdays not in ``known`` in the background while the user picks a route."""
+        if self._weekday_probe is not None:
+            self._weekday_probe.cancel()
+        self._weekday_probe = self.hass.async_create_task(self._async_probe_weekdays(latitude, longitude, known))
+
+    async def _async_probe_weekdays(
+        self, latitude: float, longitude: float, known: dict[int, set[str]]
+    ) -> dict[int, set[str]]:
+        """Query the routes of all remaining weekdays concurrently."""
+        weeks = [week for week in range(7) if week not in known]
+        results = await asyncio.gather(
+            *(
+                self.hass.async_add_executor_job(_routes_on_week, latitude, longitude, week, self._catalog)
+                for week in weeks
+            ),
+            return_exceptions=True,
+        )
+
+        routes_by_week = dict(known)
+        for week, result in zip(weeks, results):
+            if isinstance(result, BaseException):
+                # Continue with the other days even if one fails
+                _LOGGER.warning("Failed to query API for week=%d: %s", week, result)
+            else:
+                routes_by_week[week] = result
+        return routes_by_week
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step - address input."""
@@ -121,32 +243,27 @@ class TrashTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             try:
                 # Step 1: Geocode address
-                geocoder = Geocoder()
+                geocoder = await _async_get_geocoder(self.hass)
                 lat, lng = await self.hass.async_add_executor_job(geocoder.address_to_coordinates, address)
+                if geocoder.cache is not None:
+                    _LOGGER.debug("Geocode cache: %s", geocoder.cache.stats.to_dict())
 
                 # Step 2: Find nearby routes (use week=1 for Monday)
-                api_client = NTPCApiClient()
-                routes = await self.hass.async_add_executor_job(api_client.get_around_points, lat, lng, 0, 1)
+                self._catalog = await _async_get_route_catalog(self.hass)
+                routes = await self.hass.async_add_executor_job(_around_points, lat, lng, 1, self._catalog)
 
                 if not routes:
                     errors["base"] = "no_routes_found"
                 else:
-                    # Step 3: Analyze routes and generate recommendations
-                    analyzer = RouteAnalyzer(lat, lng)
-                    recommendations = await self.hass.async_add_executor_job(analyzer.analyze_all_routes, routes)
-
-                    if not recommendations:
-                        errors["base"] = "no_routes_found"
-                    else:
-                        # Store results
-                        self._address = address
-                        self._latitude = lat
-                        self._longitude = lng
-                        self._route_recommendations = recommendations
-
-                        _LOGGER.debug(
-                            f"Found {len(self._route_recommendations)} route recommendations for address: {address}"
-                        )
+                    # Warm start: the schedule probe and the route analysis (step 3) run in the
+                    # background, the route step awaits the analysis and the points step the probe
+                    self._start_weekday_probe(lat, lng, {1: {truck.line_name for truck in routes}})
+                    self._start_route_analysis(lat, lng, routes)
+
+                    # Store results
+                    self._address = address
+                    self._latitude = lat
+                    self._longitude = lng
 
                     # Move to route selection step
                     return await self.async_step_route()
@@ -159,7 +276,10 @@ class TrashTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception: %s", err)
                 errors["base"] = "unknown"
 
-        # Show form
+        return self._async_show_user_form(errors)
+
+    def _async_show_user_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the address form."""
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_ADDRESS): str,
@@ -174,6 +294,17 @@ class TrashTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_route(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the route selection step."""
+        if self._route_analysis is not None:
+            # Recommendations of the address step's analysis
+            self._route_recommendations = await self._route_analysis
+            self._route_analysis = None
+            if not self._route_recommendations:
+                return self._async_show_user_form({"base": "no_routes_found"})
+
+            _LOGGER.debug(
+                f"Found {len(self._route_recommendations)} route recommendations for address: {self._address}"
+            )
+
         if user_input is not None:
             # Find selected route
             selected_route_name = user_input[CONF_ROUTE_SELECTION]
@@ -211,18 +342,10 @@ class TrashTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_points(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the collection points configuration step."""
         if user_input is not None:
-            # Extract schedule information from selected route
-            # This requires querying API 7 times (once for each day of week)
-            from .trash_tracking_core.clients.ntpc_api import NTPCApiClient
-
-            api_client = NTPCApiClient()
-            schedule = await self.hass.async_add_executor_job(
-                _extract_schedule_from_route,
-                self._selected_route,
-                api_client,
-                self._latitude,
-                self._longitude,
-            )
+            # Collection days come from the weekday probe started in the address step
+            if self._weekday_probe is None:
+                self._start_weekday_probe(self._latitude, self._longitude, {})
+            schedule = _extract_schedule_from_route(self._selected_route, await self._weekday_probe)
 
             # Look up ranks for selected points
             enter_point_name = user_input[CONF_ENTER_POINT]
@@ -25,3 +25,29 @@ CONF_SCHEDULE_TIME_END = "schedule_time_end"
 # Default values
 DEFAULT_SCAN_INTERVAL = 30  # seconds
 SCHEDULE_BUFFER_MINUTES = 10  # Buffer time before/after scheduled time
+PREWARM_LEAD_SECONDS = 90  # Open API connections this long before the schedule window
+
+# Geocoding cache (shared by config flows, stored under .storage)
+GEOCODE_CACHE_FILE = "trash_tracking_geocode.db"
+GEOCODE_CACHE_KEY = f"{DOMAIN}_geocode_cache"
+
+# Optional offline gazetteer (built with scripts/build_gazetteer.py, placed in the config directory)
+GAZETTEER_FILE = "trash_tracking_gazetteer.db"
+GAZETTEER_KEY = f"{DOMAIN}_gazetteer"
+
+# Optional offline route catalog (built with the CLI's crawl command, placed in the config directory),
+# used by config flows when the API is unreachable
+ROUTE_CATALOG_FILE = "trash_tracking_routes.json"
+ROUTE_CATALOG_KEY = f"{DOMAIN}_route_catalog"
+ROUTE_CATALOG_RADIUS = 500  # meters
+
+# Learned arrival times of each entry's route (stored under .storage), used for the enter point ETA
+ETA_DATABASE_FILE = "trash_tracking_eta_{entry_id}.db"
+
+# Upstream call metrics (shared by all entries, shown in diagnostics)
+METRICS_KEY = f"{DOMAIN}_metrics"
+
+# Geocoding providers are queried hedged, within one overall deadline
+GEOCODE_MODE = "hedged"
+GEOCODE_HEDGE_DELAY = 1.0  # seconds between provider starts
+GEOCODE_DEADLINE = 15.0  # seconds
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -24,11 +25,18 @@ from .const import (
     CONF_SCHEDULE_WEEKDAYS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    ETA_DATABASE_FILE,
+    PREWARM_LEAD_SECONDS,
     SCHEDULE_BUFFER_MINUTES,
 )
 from .trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from .trash_tracking_core.clients.route_query import RouteQuery
+from .trash_tracking_core.core.eta_predictor import ArrivalPrediction, ArrivalPredictor
 from .trash_tracking_core.core.point_matcher import PointMatcher
+from .trash_tracking_core.core.polling import SchedulePolicy
 from .trash_tracking_core.core.state_manager import StateManager
+from .trash_tracking_core.models.pool import PointPool
+from .trash_tracking_core.models.snapshot import LineSnapshot, PollSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,8 +54,15 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
         )
 
         self.entry = entry
-        self._api_client = NTPCApiClient()
+        # Polls run for the whole uptime: reuse the points of earlier responses
+        self._point_pool = PointPool()
+        self._api_client = NTPCApiClient(point_pool=self._point_pool)
         self._state_manager = StateManager()
+        # Last poll, frozen: the state holds its routes, and the next poll shares what did not change
+        self._snapshot: PollSnapshot | None = None
+        # Learns the route's segment travel times, opened on the first poll that finds the route
+        self._eta_db_path = hass.config.path(".storage", ETA_DATABASE_FILE.format(entry_id=entry.entry_id))
+        self._predictor: ArrivalPredictor | None = None
 
         # Extract config from entry
         self._latitude = entry.data[CONF_LATITUDE]
@@ -64,6 +79,17 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
         self._schedule_weekdays = entry.data.get(CONF_SCHEDULE_WEEKDAYS, [])
         self._schedule_time_start = entry.data.get(CONF_SCHEDULE_TIME_START)
         self._schedule_time_end = entry.data.get(CONF_SCHEDULE_TIME_END)
+        # Narrowest API time filter for the route, falling back to all periods if it drops the route
+        self._route_query = RouteQuery(
+            self._api_client, self._target_line, self._schedule_time_start, self._schedule_time_end
+        )
+        self._schedule = SchedulePolicy(
+            self._schedule_weekdays,
+            self._schedule_time_start,
+            self._schedule_time_end,
+            buffer_minutes=SCHEDULE_BUFFER_MINUTES,
+            interval_seconds=DEFAULT_SCAN_INTERVAL,
+        )
 
         # Create point matcher
         self._point_matcher = PointMatcher(
@@ -85,70 +111,14 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
         Returns:
             bool: True if should update, False otherwise
         """
-        # If no schedule info (old configs), always update for backward compatibility
-        if not self._schedule_weekdays:
-            return True
-
-        now = datetime.now()
-
-        # Check weekday
-        # Python: 0=Monday, 6=Sunday
-        # API: 0=Sunday, 1=Monday, ..., 6=Saturday
-        # Convert Python weekday to API format
-        python_weekday = now.weekday()  # 0-6 (Mon-Sun)
-        api_weekday = python_weekday + 1 if python_weekday < 6 else 0  # Convert to API format
-
-        if api_weekday not in self._schedule_weekdays:
-            _LOGGER.debug(
-                "[%s] Today (%s, weekday=%d) not in schedule %s, skipping API call",
-                self._target_line,
-                now.strftime("%A"),
-                api_weekday,
-                self._schedule_weekdays,
-            )
-            return False
-
-        # Check time range (with buffer)
-        if self._schedule_time_start and self._schedule_time_end:
-            try:
-                start_time = datetime.strptime(self._schedule_time_start, "%H:%M").time()
-                end_time = datetime.strptime(self._schedule_time_end, "%H:%M").time()
-
-                # Add buffer
-                start_with_buffer = (
-                    datetime.combine(now.date(), start_time) - timedelta(minutes=SCHEDULE_BUFFER_MINUTES)
-                ).time()
-                end_with_buffer = (
-                    datetime.combine(now.date(), end_time) + timedelta(minutes=SCHEDULE_BUFFER_MINUTES)
-                ).time()
-
-                current_time = now.time()
-
-                # Check if current time is within range
-                if not (start_with_buffer <= current_time <= end_with_buffer):
-                    _LOGGER.debug(
-                        "[%s] Current time %s not in schedule range %s-%s (with %d min buffer), skipping API call",
-                        self._target_line,
-                        current_time.strftime("%H:%M"),
-                        start_with_buffer.strftime("%H:%M"),
-                        end_with_buffer.strftime("%H:%M"),
-                        SCHEDULE_BUFFER_MINUTES,
-                    )
-                    return False
-
-            except ValueError as e:
-                _LOGGER.warning("Failed to parse schedule times: %s, will update anyway", e)
-                return True
-
-        # Within schedule, should update
-        _LOGGER.debug("[%s] Within schedule, proceeding with API call", self._target_line)
-        return True
+        return self._schedule.should_poll(datetime.now())
 
     async def _async_update_data(self) -> dict[str, Any]:  # noqa: C901
         """Fetch data from API."""
         # Check if we should update based on schedule
         if not self._should_update_now():
             # Outside scheduled time, return idle state without API call
+            await self._async_prewarm()
             if not self._state_manager.is_idle():
                 self._state_manager.update_state(new_state="idle", reason="Outside scheduled operating hours")
             return self._state_manager.get_status_response()
@@ -156,20 +126,21 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
         try:
             # Fetch truck data from API (blocking I/O, run in executor)
             truck_lines = await self.hass.async_add_executor_job(
-                self._api_client.get_around_points,
+                self._route_query.fetch,
                 self._latitude,
                 self._longitude,
-                0,  # time_filter: 0 = no filter
             )
 
-            if not truck_lines:
+            self._snapshot = PollSnapshot.from_lines(truck_lines, self._snapshot)
+
+            if not self._snapshot:
                 _LOGGER.debug("No truck data returned from API")
                 if not self._state_manager.is_idle():
                     self._state_manager.update_state(new_state="idle", reason="No trucks nearby")
                 return self._state_manager.get_status_response()
 
             # Filter for target route
-            target_lines = [line for line in truck_lines if line.line_name == self._target_line]
+            target_lines = [line for line in self._snapshot.lines if line.line_name == self._target_line]
 
             if not target_lines:
                 _LOGGER.debug("Target route %s not found in nearby trucks", self._target_line)
@@ -206,7 +177,10 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
                     exit_point=exit_point,
                 )
 
-            return self._state_manager.get_status_response()
+            response = self._state_manager.get_status_response()
+            eta = await self.hass.async_add_executor_job(self._learn_arrivals, target_line)
+            response["eta"] = eta.to_dict() if eta else None
+            return response
 
         except NTPCApiError as err:
             _LOGGER.error("Error communicating with API: %s", err)
@@ -216,6 +190,44 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Unexpected error fetching data: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    async def _async_prewarm(self) -> None:
+        """Open the API connection shortly before the schedule window starts."""
+        if not self._schedule.should_prewarm(datetime.now(), timedelta(seconds=PREWARM_LEAD_SECONDS)):
+            return
+
+        # Warming on every tick of the lead time also keeps the connection from idling out
+        _LOGGER.debug("[%s] Schedule window starts soon, pre-warming API connection", self._target_line)
+        await self.hass.async_add_executor_job(self._api_client.prewarm)
+
+    def _learn_arrivals(self, target_line: LineSnapshot) -> ArrivalPrediction | None:
+        """Learn from the route's arrival stamps and predict the enter point (blocking, run in executor)."""
+        try:
+            if self._predictor is None:
+                self._predictor = ArrivalPredictor(self._eta_db_path)
+            self._predictor.observe(target_line)
+            return self._predictor.predict_point(target_line, self._enter_point_name)
+        except sqlite3.Error as err:
+            # Learning is best effort, tracking continues without an ETA
+            _LOGGER.warning("[%s] Failed to update arrival history: %s", self._target_line, err)
+            return None
+
+    def close(self) -> None:
+        """Release the API client's pooled connections and the arrival history (blocking, run in executor)."""
+        self._api_client.close()
+        if self._predictor is not None:
+            self._predictor.close()
+            self._predictor = None
+
+    @property
+    def route_query(self) -> RouteQuery:
+        """Return the filtered route query (with its payload savings)."""
+        return self._route_query
+
+    @property
+    def point_pool(self) -> PointPool:
+        """Return the pool of points reused across polls."""
+        return self._point_pool
+
     @property
     def route_name(self) -> str:
         """Return the route name."""
@@ -241,6 +253,11 @@ class TrashTrackingCoordinator(DataUpdateCoordinator):
         """Return truck information if available."""
         return self.data.get("truck") if self.data else None
 
+    @property
+    def enter_point_eta(self) -> dict[str, Any] | None:
+        """Return the predicted arrival at the enter point, if the route is nearby."""
+        return self.data.get("eta") if self.data else None
+
     @property
     def enter_point_name(self) -> str:
         """Return the enter point name."""
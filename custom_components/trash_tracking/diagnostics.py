@@ -0,0 +1,45 @@
+"""Diagnostics support for Trash Tracking."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ADDRESS, CONF_LATITUDE, CONF_LONGITUDE, DOMAIN, METRICS_KEY
+from .coordinator import TrashTrackingCoordinator
+from .trash_tracking_core.utils.metrics import HistogramSink, metrics
+
+TO_REDACT = {CONF_ADDRESS, CONF_LATITUDE, CONF_LONGITUDE}
+
+
+def get_metrics_sink(hass: HomeAssistant) -> HistogramSink:
+    """Get the sink collecting upstream call metrics, registering it on first use."""
+    sink = hass.data.get(METRICS_KEY)
+    if sink is None:
+        sink = hass.data[METRICS_KEY] = HistogramSink()
+        metrics.add_sink(sink)
+    return sink
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: TrashTrackingCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval_seconds": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "status": coordinator.status,
+            "reason": coordinator.reason,
+        },
+        "eta": coordinator.enter_point_eta,
+        "query": coordinator.route_query.to_dict(),
+        "point_pool": {"points": len(coordinator.point_pool), **coordinator.point_pool.stats.to_dict()},
+        # Shared by every entry (and the config flows) of this Home Assistant instance
+        "upstream": get_metrics_sink(hass).snapshot(),
+    }
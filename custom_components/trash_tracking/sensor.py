@@ -40,6 +40,9 @@ SENSORS: tuple[TrashTrackingSensorEntityDescription, ...] = (
             "last_update": coordinator.data.get("timestamp") if coordinator.data else None,
             "enter_point": coordinator.enter_point_name,
             "enter_point_rank": coordinator.enter_point_rank,
+            "enter_point_eta": coordinator.enter_point_eta["estimated"] if coordinator.enter_point_eta else None,
+            "enter_point_eta_lower": coordinator.enter_point_eta["lower"] if coordinator.enter_point_eta else None,
+            "enter_point_eta_upper": coordinator.enter_point_eta["upper"] if coordinator.enter_point_eta else None,
             "exit_point": coordinator.exit_point_name,
             "exit_point_rank": coordinator.exit_point_rank,
             "nearest_point": coordinator.nearest_point_name,
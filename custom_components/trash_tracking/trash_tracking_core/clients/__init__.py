@@ -1,5 +1,24 @@
 """API clients for trash tracking"""
 
+from ..clients.async_ntpc_api import AsyncNTPCApiClient
+from ..clients.cache import ResponseCache, StripedCache
+from ..clients.decoding import JSON_BACKENDS, available_json_backends, decode_around_points
 from ..clients.ntpc_api import NTPCApiClient, NTPCApiError
+from ..clients.route_query import RouteQuery, time_filter_for
+from ..clients.session import SessionManager
+from ..clients.shared_cache import SharedResponseCache
 
-__all__ = ["NTPCApiClient", "NTPCApiError"]
+__all__ = [
+    "NTPCApiClient",
+    "NTPCApiError",
+    "AsyncNTPCApiClient",
+    "SessionManager",
+    "ResponseCache",
+    "StripedCache",
+    "SharedResponseCache",
+    "RouteQuery",
+    "time_filter_for",
+    "JSON_BACKENDS",
+    "available_json_backends",
+    "decode_around_points",
+]
@@ -0,0 +1,169 @@
+"""GetAroundPoints Response Decoding"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional, Union
+
+from ..models.point import Point
+from ..models.truck import TruckLine
+from ..utils.logger import get_logger
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is optional
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+logger = get_logger(__name__)
+
+# In order of preference
+JSON_BACKENDS = ("msgspec", "orjson", "json")
+
+
+@dataclass
+class AroundPointsPayload:
+    """
+    Decoded GetAroundPoints response
+
+    Attributes:
+        timestamp: The response's TimeStamp field
+        lines: Parsed routes, None when the response has no Line field
+    """
+
+    timestamp: Any
+    lines: Optional[List[TruckLine]]
+
+
+def available_json_backends() -> List[str]:
+    """Get the installed JSON backends, fastest first"""
+    installed = {"msgspec": msgspec is not None, "orjson": orjson is not None, "json": True}
+    return [backend for backend in JSON_BACKENDS if installed[backend]]
+
+
+def default_json_backend() -> str:
+    """Get the fastest installed JSON backend"""
+    return available_json_backends()[0]
+
+
+def parse_around_points(data: Any) -> Optional[AroundPointsPayload]:
+    """
+    Build the routes from an already decoded response
+
+    Routes that fail to parse are skipped with a warning.
+
+    Args:
+        data: Response JSON
+
+    Returns:
+        AroundPointsPayload: Decoded response, None if it is not a JSON object
+    """
+    if not isinstance(data, dict):
+        return None
+    if "Line" not in data:
+        return AroundPointsPayload(data.get("TimeStamp"), None)
+
+    lines = []
+    for line_data in data["Line"] or []:
+        try:
+            lines.append(TruckLine.from_dict(line_data))
+        except Exception as e:
+            logger.warning("Failed to parse route data: %s", e)
+    return AroundPointsPayload(data.get("TimeStamp"), lines)
+
+
+def decode_around_points(content: bytes, backend: str = "json") -> Optional[AroundPointsPayload]:
+    """
+    Decode a response body
+
+    The msgspec backend validates the body against the API schema and builds
+    the models in one pass, without intermediate dicts; a body that does not
+    match the schema (e.g. a field of an unexpected type) is decoded again
+    through the generic path, so every backend returns the same result. The
+    orjson backend only replaces the JSON parser of the generic path.
+
+    Args:
+        content: Response body
+        backend: One of JSON_BACKENDS (it must be installed)
+
+    Returns:
+        AroundPointsPayload: Decoded response, None if it is not a JSON object
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if backend == "msgspec":
+        try:
+            response = _RESPONSE_DECODER.decode(content)
+        except msgspec.ValidationError as e:
+            logger.debug("Response does not match the API schema (%s), decoding generically", e)
+            return parse_around_points(_loads_msgspec(content))
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        return _from_structs(response)
+    if backend == "orjson":
+        return parse_around_points(orjson.loads(content))
+    if backend == "json":
+        return parse_around_points(json.loads(content))
+    raise ValueError(f"Unknown JSON backend: {backend}")
+
+
+def _loads_msgspec(content: bytes) -> Any:
+    """Decode JSON without a schema"""
+    try:
+        return msgspec.json.decode(content)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+if msgspec is not None:
+    # Mirrors of the API schema; field order and defaults match Point.from_dict and TruckLine.from_dict
+    class _ApiPoint(msgspec.Struct, rename="pascal"):
+        source_point_id: Optional[int] = msgspec.field(default=None, name="SourcePointID")
+        vil: str = ""
+        point_name: str = ""
+        lon: float = 0.0
+        lat: float = 0.0
+        point_id: Optional[int] = msgspec.field(default=None, name="PointID")
+        point_rank: int = 0
+        point_time: str = ""
+        arrival: str = ""
+        arrival_diff: int = 65535
+        fixed_point: int = 0
+        point_weekknd: str = msgspec.field(default="", name="PointWeekKnd")
+        in_scope: str = ""
+        like_count: int = 0
+
+    class _ApiLine(msgspec.Struct, rename="pascal"):
+        line_id: str = msgspec.field(default="", name="LineID")
+        line_name: str = ""
+        area: str = ""
+        arrival_rank: int = 0
+        diff: int = 0
+        car_no: str = msgspec.field(default="", name="CarNO")
+        location: str = ""
+        location_lat: float = 0.0
+        location_lon: float = 0.0
+        bar_code: str = ""
+        point: List[_ApiPoint] = []
+
+    class _ApiResponse(msgspec.Struct, rename="pascal"):
+        line: Union[List[_ApiLine], None, msgspec.UnsetType] = msgspec.UNSET
+        time_stamp: Any = None
+
+    _RESPONSE_DECODER = msgspec.json.Decoder(_ApiResponse)
+
+    def _from_structs(response: "_ApiResponse") -> AroundPointsPayload:
+        """Convert the decoded structs to models"""
+        if response.line is msgspec.UNSET:
+            return AroundPointsPayload(response.time_stamp, None)
+
+        astuple = msgspec.structs.astuple
+        lines = []
+        for line in response.line or []:
+            fields = astuple(line)
+            lines.append(TruckLine(*fields[:-1], [Point(*astuple(point)) for point in line.point]))
+        return AroundPointsPayload(response.time_stamp, lines)
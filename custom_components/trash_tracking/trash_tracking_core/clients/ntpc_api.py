@@ -1,14 +1,23 @@
 """New Taipei City Garbage Truck API Client"""
 
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import requests
 import urllib3
 
+from ..clients.cache import ResponseCache, StripedCache
+from ..clients.decoding import available_json_backends, decode_around_points, default_json_backend, parse_around_points
+from ..clients.session import SessionManager
+from ..models.pool import PointPool
+from ..models.snapshot import LineSnapshot, PollSnapshot
 from ..models.truck import TruckLine
-from ..utils.logger import logger
+from ..utils.geohash import tile_center
+from ..utils.logger import get_logger
+from ..utils.metrics import metrics
+from ..utils.route_analyzer import RouteAnalyzer
+
+logger = get_logger(__name__)
 
 # Disable SSL warnings for NTPC API (their certificate has issues)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -21,10 +30,10 @@ class NTPCApiError(Exception):
 class NTPCApiClient:
     """New Taipei City Garbage Truck API Client"""
 
-    # Class-level cache shared across all instances
+    # Class-level cache shared across all instances (and threads)
     # TTL is short (5s) to prevent duplicate API calls from multiple sensors
     # while ensuring fresh data on each scan interval (30s)
-    _cache: Dict[str, Tuple[List[TruckLine], datetime]] = {}
+    _cache: ResponseCache = StripedCache()
     _cache_ttl: int = 5  # seconds
 
     def __init__(
@@ -34,6 +43,12 @@ class NTPCApiClient:
         retry_count: int = 3,
         retry_delay: int = 2,
         cache_enabled: bool = True,
+        session_manager: Optional[SessionManager] = None,
+        tile_precision: Optional[int] = None,
+        tile_radius: float = 300.0,
+        json_backend: Optional[str] = None,
+        point_pool: Optional[PointPool] = None,
+        cache_backend: Optional[ResponseCache] = None,
     ):
         """
         Initialize API client
@@ -44,13 +59,48 @@ class NTPCApiClient:
             retry_count: Number of retries
             retry_delay: Retry delay in seconds
             cache_enabled: Enable response caching (default: True)
+            session_manager: Connection pool to use (default: the process-wide one)
+            tile_precision: Enable tiled mode: query at the center of the location's
+                geohash tile of this precision (7 is about 150 x 150 m), so nearby
+                locations share one upstream query and cache entry (default: off)
+            tile_radius: In tiled mode, keep the routes with a collection point
+                within this many meters of the actual location; keep it below the
+                API's search radius minus the tile's half diagonal (about 100 m at
+                precision 7), or routes near the edge of that radius may be missed
+            json_backend: Response decoder, one of JSON_BACKENDS (default: the
+                fastest installed; "json" is the standard library)
+            point_pool: Reuse the points of earlier responses (for long-running
+                pollers; default: off)
+            cache_backend: Response cache of this client only, e.g. a
+                SharedResponseCache owned by the caller (default: the cache
+                shared by all clients, see set_cache_backend)
+
+        Raises:
+            ValueError: If the JSON backend is unknown or not installed
         """
+        if json_backend is not None and json_backend not in available_json_backends():
+            raise ValueError(f"JSON backend {json_backend!r} is not available (installed: {available_json_backends()})")
+
         self.base_url = base_url
         self.timeout = timeout
         self.retry_count = retry_count
         self.retry_delay = retry_delay
         self.cache_enabled = cache_enabled
-        self.session = requests.Session()
+        self.tile_precision = tile_precision
+        self.tile_radius = tile_radius
+        self.json_backend = json_backend or default_json_backend()
+        self.point_pool = point_pool
+        if cache_backend is not None:
+            self._cache = cache_backend
+        self.session_manager = (session_manager or SessionManager.default()).acquire()
+        # Last response frozen by this client, whose unchanged routes and points the next one shares
+        self._last_snapshot: Optional[PollSnapshot] = None
+        self._closed = False
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared with the other clients of the session manager"""
+        return self.session_manager.session
 
     @classmethod
     def _get_cache_key(cls, lat: float, lng: float, time_filter: int, week: Optional[int]) -> str:
@@ -71,8 +121,7 @@ class NTPCApiClient:
         lng_rounded = round(lng, 4)
         return f"{lat_rounded},{lng_rounded},{time_filter},{week}"
 
-    @classmethod
-    def _get_from_cache(cls, cache_key: str) -> Optional[List[TruckLine]]:
+    def _get_from_cache(self, cache_key: str) -> Optional[PollSnapshot]:
         """
         Get data from cache if not expired
 
@@ -80,25 +129,19 @@ class NTPCApiClient:
             cache_key: Cache key
 
         Returns:
-            Optional[List[TruckLine]]: Cached data if valid, None if expired or not found
+            Optional[PollSnapshot]: Cached routes if valid, None if expired or not found
         """
-        if cache_key not in cls._cache:
+        data = self._cache.get(cache_key, max_age=self._cache_ttl)
+        if data is None:
             return None
 
-        data, cached_at = cls._cache[cache_key]
-        age = (datetime.now() - cached_at).total_seconds()
+        logger.debug("Cache hit for key %s", cache_key)
+        if isinstance(data, PollSnapshot):
+            return data
+        # Backends that serialize (SharedResponseCache) return freshly decoded routes
+        return self._freeze(data)
 
-        if age > cls._cache_ttl:
-            # Cache expired, remove it
-            logger.debug("Cache expired for key %s (age: %.1fs)", cache_key, age)
-            del cls._cache[cache_key]
-            return None
-
-        logger.debug("Cache hit for key %s (age: %.1fs)", cache_key, age)
-        return data
-
-    @classmethod
-    def _put_in_cache(cls, cache_key: str, data: List[TruckLine]) -> None:
+    def _put_in_cache(self, cache_key: str, data: PollSnapshot) -> None:
         """
         Store data in cache
 
@@ -106,18 +149,31 @@ class NTPCApiClient:
             cache_key: Cache key
             data: Data to cache
         """
-        cls._cache[cache_key] = (data, datetime.now())
+        self._cache.put(cache_key, data)
         logger.debug("Cached data for key %s", cache_key)
 
+    @classmethod
+    def set_cache_backend(cls, backend: Optional[ResponseCache]) -> None:
+        """
+        Replace the response cache shared by all clients (except those
+        created with their own ``cache_backend``)
+
+        Args:
+            backend: New cache, e.g. a SharedResponseCache used by several
+                processes; None restores a fresh in-memory cache
+        """
+        cls._cache = backend if backend is not None else StripedCache()
+        logger.info("API cache backend: %s", type(cls._cache).__name__)
+
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear all cached data"""
+        """Clear all data of the shared cache"""
         cls._cache.clear()
         logger.info("API cache cleared")
 
-    def get_around_points(  # noqa: C901
+    def get_around_points(
         self, lat: float, lng: float, time_filter: int = 0, week: Optional[int] = None
-    ) -> Optional[List[TruckLine]]:
+    ) -> Optional[List[LineSnapshot]]:
         """
         Query nearby garbage trucks
 
@@ -134,24 +190,91 @@ class NTPCApiClient:
                 Note: Sunday (0) and Wednesday (3) may have limited service
 
         Returns:
-            List[TruckLine]: List of truck routes, None on failure
+            List[LineSnapshot]: Frozen truck routes, shared with the response cache
+                (and, when unchanged, with earlier responses); None on failure; in
+                tiled mode, the routes of the location's tile with a point within
+                ``tile_radius``
+
+        Raises:
+            NTPCApiError: When all retries fail
+        """
+        return self.get_around_points_with_size(lat, lng, time_filter, week)[0]
+
+    def get_around_points_with_size(
+        self, lat: float, lng: float, time_filter: int = 0, week: Optional[int] = None
+    ) -> Tuple[Optional[List[LineSnapshot]], Optional[int]]:
+        """
+        Query nearby garbage trucks and the size of the response (see get_around_points)
+
+        Returns:
+            tuple: (truck routes, body size in bytes of the downloaded response,
+                or None when the routes came from the cache)
 
         Raises:
             NTPCApiError: When all retries fail
         """
-        # Check cache first if enabled
-        if self.cache_enabled:
-            cache_key = self._get_cache_key(lat, lng, time_filter, week)
+        if self.tile_precision is None:
+            snapshot, response_bytes = self._request_around_points(lat, lng, time_filter, week)
+            return (list(snapshot.lines) if snapshot is not None else None), response_bytes
+
+        # Neighbours in the same tile share one query (and cache entry) at its center
+        center_lat, center_lng = tile_center(lat, lng, self.tile_precision)
+        snapshot, response_bytes = self._request_around_points(center_lat, center_lng, time_filter, week)
+        if snapshot is None:
+            return None, response_bytes
+
+        analyzer = RouteAnalyzer(lat, lng)
+        return [line for line in snapshot if self._passes_within(analyzer, line, self.tile_radius)], response_bytes
+
+    @staticmethod
+    def _passes_within(analyzer: RouteAnalyzer, line: LineSnapshot, radius: float) -> bool:
+        """Check whether a route has a collection point within ``radius`` meters of the analyzer's location"""
+        return any(
+            analyzer.calculate_distance(point.lat, point.lon) <= radius
+            for point in line.points
+            if point.lat and point.lon
+        )
+
+    def _request_around_points(
+        self, lat: float, lng: float, time_filter: int, week: Optional[int]
+    ) -> Tuple[Optional[PollSnapshot], Optional[int]]:
+        """Query GetAroundPoints at exactly the given location (see get_around_points_with_size)"""
+        if not self.cache_enabled:
+            return self._download_around_points(lat, lng, time_filter, week)
+
+        cache_key = self._get_cache_key(lat, lng, time_filter, week)
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data is not None:
+            metrics.cache("ntpc", "GetAroundPoints", "hit")
+            return cached_data, None
+        metrics.cache("ntpc", "GetAroundPoints", "miss")
+
+        # With a shared backend, one process downloads while the others wait for its result
+        with self._cache.lease(cache_key, wait=self.timeout):
             cached_data = self._get_from_cache(cache_key)
             if cached_data is not None:
-                return cached_data
-
+                metrics.cache("ntpc", "GetAroundPoints", "coalesced")
+                return cached_data, None
+
+            snapshot, response_bytes = self._download_around_points(lat, lng, time_filter, week)
+            self._put_in_cache(cache_key, snapshot)
+            return snapshot, response_bytes
+
+    def _freeze(self, lines: List[TruckLine]) -> PollSnapshot:
+        """Freeze decoded routes, sharing what did not change since this client's last response"""
+        snapshot = self._last_snapshot = PollSnapshot.from_lines(lines, self._last_snapshot)
+        return snapshot
+
+    def _download_around_points(  # noqa: C901
+        self, lat: float, lng: float, time_filter: int, week: Optional[int]
+    ) -> Tuple[PollSnapshot, int]:
+        """Call GetAroundPoints with retries (no caching), returning the frozen routes and the response body size"""
         url = f"{self.base_url}/GetAroundPoints"
-        payload = {"lat": lat, "lng": lng, "time": time_filter}
+        form = {"lat": lat, "lng": lng, "time": time_filter}
 
         # Add week parameter if specified
         if week is not None:
-            payload["week"] = week
+            form["week"] = week
 
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
@@ -168,40 +291,37 @@ class NTPCApiClient:
                     time_filter,
                 )
 
-                response = self.session.post(url, data=payload, headers=headers, timeout=self.timeout, verify=False)
+                with metrics.call("ntpc", "GetAroundPoints", attempt + 1) as call:
+                    response = self.session.post(url, data=form, headers=headers, timeout=self.timeout, verify=False)
+                    call.bytes = response_bytes = len(response.content)
 
-                response.raise_for_status()
+                    response.raise_for_status()
 
-                data = response.json()
+                    with call.parsing():
+                        if self.json_backend == "json":
+                            decoded = parse_around_points(response.json())
+                        else:
+                            decoded = decode_around_points(response.content, self.json_backend)
 
-                if not isinstance(data, dict):
-                    raise NTPCApiError("API response format error: not a dictionary")
+                        if decoded is None:
+                            call.status = "parse_error"
+                            raise NTPCApiError("API response format error: not a dictionary")
 
-                if "Line" not in data:
-                    logger.warning("No 'Line' field in API response, possibly no trucks nearby")
-                    return []
-
-                lines = []
-                for line_data in data.get("Line", []):
-                    try:
-                        truck_line = TruckLine.from_dict(line_data)
-                        lines.append(truck_line)
-                    except Exception as e:
-                        logger.warning("Failed to parse route data: %s", e)
-                        continue
+                        if decoded.lines is None:
+                            call.status = "empty"
+                            logger.warning("No 'Line' field in API response, possibly no trucks nearby")
+                            return PollSnapshot(), response_bytes
 
                 logger.info(
                     "Successfully queried NTPC API: found %d route(s) (TimeStamp: %s)",
-                    len(lines),
-                    data.get("TimeStamp"),
+                    len(decoded.lines),
+                    decoded.timestamp,
                 )
 
-                # Cache the result if cache is enabled
-                if self.cache_enabled:
-                    cache_key = self._get_cache_key(lat, lng, time_filter, week)
-                    self._put_in_cache(cache_key, lines)
-
-                return lines
+                lines = decoded.lines
+                if self.point_pool is not None:
+                    lines = [self.point_pool.pool_line(line) for line in lines]
+                return self._freeze(lines), response_bytes
 
             except requests.exceptions.Timeout:
                 last_error = "Request timeout"
@@ -238,7 +358,31 @@ class NTPCApiClient:
         logger.error(error_msg)
         raise NTPCApiError(error_msg)
 
+    def prewarm(self) -> bool:
+        """
+        Open a keep-alive connection to the API ahead of the next query
+
+        Never raises; a failed warm-up only means the next query connects itself.
+
+        Returns:
+            bool: True if a connection was established
+        """
+        # Same TLS settings as get_around_points, so the query lands on the warmed pool
+        return self.session_manager.prewarm(self.base_url, verify=False, timeout=self.timeout)
+
+    def close(self) -> None:
+        """Release the shared session (closed once no client uses it)"""
+        if getattr(self, "_closed", True):
+            return
+        self._closed = True
+        self.session_manager.release()
+
+    def __enter__(self) -> "NTPCApiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __del__(self):
         """Clean up resources"""
-        if hasattr(self, "session"):
-            self.session.close()
+        self.close()
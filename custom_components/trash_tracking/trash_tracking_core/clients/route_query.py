@@ -0,0 +1,161 @@
+"""Filtered Route Queries"""
+
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from ..clients.ntpc_api import NTPCApiClient
+from ..models.truck import TruckLine
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# GetAroundPoints time filters: (filter, first hour, last hour)
+TIME_PERIODS = ((1, 6, 11), (2, 12, 17), (3, 18, 23))
+
+
+def time_filter_for(time_start: Optional[str], time_end: Optional[str]) -> int:
+    """
+    Get the narrowest API time filter covering a route's schedule
+
+    Args:
+        time_start: Earliest scheduled time (HH:MM)
+        time_end: Latest scheduled time (HH:MM)
+
+    Returns:
+        int: 1 (morning), 2 (afternoon) or 3 (evening) when both times fall in
+            that period, otherwise 0 (no filter)
+    """
+    try:
+        start = datetime.strptime(time_start or "", "%H:%M").hour
+        end = datetime.strptime(time_end or "", "%H:%M").hour
+    except ValueError:
+        return 0
+
+    for time_filter, first_hour, last_hour in TIME_PERIODS:
+        if first_hour <= start <= end <= last_hour:
+            return time_filter
+    return 0
+
+
+class RouteQuery:
+    """
+    Polls for one route with the narrowest time filter that still returns it
+
+    The first poll is unfiltered and measures the full response size; later
+    polls use the filter derived from the route's schedule and report the
+    bytes they saved against that size. When the route is missing from a
+    filtered response, the poll is repeated unfiltered, and if the route shows
+    up there the filter is dropped for good. Before the truck sets out the
+    route is missing from both, so the unfiltered check is repeated at most
+    once per ``recheck_seconds`` unless the last unfiltered response had the
+    route.
+    """
+
+    def __init__(
+        self,
+        client: NTPCApiClient,
+        line_name: str,
+        time_start: Optional[str] = None,
+        time_end: Optional[str] = None,
+        recheck_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize route query
+
+        Args:
+            client: API client doing the requests
+            line_name: Route to poll for
+            time_start: Earliest scheduled time of the route (HH:MM)
+            time_end: Latest scheduled time of the route (HH:MM)
+            recheck_seconds: Shortest time between unfiltered checks while the
+                route is missing everywhere
+            clock: Monotonic time source in seconds
+        """
+        self.client = client
+        self.line_name = line_name
+        self.time_filter = time_filter_for(time_start, time_end)
+        self.recheck_seconds = recheck_seconds
+        self.baseline_bytes: Optional[int] = None
+        self.last_bytes_saved: Optional[int] = None
+        self.total_bytes_saved = 0
+        self._clock = clock
+        self._unfiltered_at: Optional[float] = None
+        self._unfiltered_had_route = False
+
+    def fetch(self, lat: float, lng: float) -> Optional[List[TruckLine]]:
+        """
+        Query the routes around a location
+
+        Args:
+            lat: Latitude of query location
+            lng: Longitude of query location
+
+        Returns:
+            List[TruckLine]: Truck routes (possibly only those of the filtered period)
+
+        Raises:
+            NTPCApiError: When all retries fail
+        """
+        if self.time_filter == 0 or self.baseline_bytes is None:
+            self.last_bytes_saved = None
+            return self._unfiltered(lat, lng)
+
+        lines, filtered_bytes = self.client.get_around_points_with_size(lat, lng, self.time_filter)
+
+        if self._contains_route(lines) or not self._recheck_due():
+            self._count_saving(None if filtered_bytes is None else self.baseline_bytes - filtered_bytes)
+            return lines
+
+        logger.debug("Route %s missing with time filter %d, retrying unfiltered", self.line_name, self.time_filter)
+        # The filtered request was wasted
+        self._count_saving(None if filtered_bytes is None else -filtered_bytes)
+
+        lines = self._unfiltered(lat, lng)
+        if self._contains_route(lines):
+            logger.warning(
+                "Route %s is not returned with time filter %d, querying unfiltered from now on",
+                self.line_name,
+                self.time_filter,
+            )
+            self.time_filter = 0
+        return lines
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format"""
+        return {
+            "line_name": self.line_name,
+            "time_filter": self.time_filter,
+            "baseline_bytes": self.baseline_bytes,
+            "last_bytes_saved": self.last_bytes_saved,
+            "total_bytes_saved": self.total_bytes_saved,
+        }
+
+    def _unfiltered(self, lat: float, lng: float) -> Optional[List[TruckLine]]:
+        """Query all periods, refreshing the baseline size"""
+        lines, response_bytes = self.client.get_around_points_with_size(lat, lng, 0)
+        if response_bytes is not None:
+            self.baseline_bytes = response_bytes
+        self._unfiltered_at = self._clock()
+        self._unfiltered_had_route = self._contains_route(lines)
+        return lines
+
+    def _recheck_due(self) -> bool:
+        """Check whether a filtered miss is worth an unfiltered request"""
+        if self._unfiltered_had_route or self._unfiltered_at is None:
+            return True
+        return self._clock() - self._unfiltered_at >= self.recheck_seconds
+
+    def _contains_route(self, lines: Optional[List[TruckLine]]) -> bool:
+        return any(line.line_name == self.line_name for line in lines or [])
+
+    def _count_saving(self, saved: Optional[int]) -> None:
+        self.last_bytes_saved = saved
+        if saved is not None:
+            self.total_bytes_saved += saved
+            logger.debug("Time filter %d saved %d bytes on route %s", self.time_filter, saved, self.line_name)
+
+    def __str__(self) -> str:
+        """Return string representation of route query"""
+        return f"RouteQuery({self.line_name}, time_filter={self.time_filter})"
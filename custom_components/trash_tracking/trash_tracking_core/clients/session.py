@@ -0,0 +1,165 @@
+"""Shared HTTP Session"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SessionManager:
+    """
+    Process-wide pool of keep-alive HTTP connections
+
+    All API clients share one ``requests.Session`` (its connection pool is
+    thread-safe), so concurrent polls reuse warm TLS connections instead of
+    each client opening its own. Clients acquire the manager when created and
+    release it when closed; the session is closed when the last client
+    releases it and is recreated on the next use.
+
+    The shared manager does not know how many clients will use it at once, so
+    by default a busy pool opens an extra connection rather than making the
+    caller wait (urllib3 has no pool timeout). Callers with a known
+    concurrency (crawls, load tests) use their own manager sized to it.
+    """
+
+    _default: Optional["SessionManager"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10, pool_block: bool = False):
+        """
+        Initialize session manager
+
+        Args:
+            pool_connections: Number of hosts with a connection pool
+            pool_maxsize: Connections kept open per host
+            pool_block: When all connections to a host are busy, wait for one
+                (without a timeout) instead of opening an extra connection that
+                is discarded after use; only safe when at most ``pool_maxsize``
+                threads use the manager at once
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool sizes must be at least 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._session: Optional[requests.Session] = None
+        self._users = 0
+        # Reentrant: garbage collection can run a client's __del__ (which
+        # releases the manager) while this thread is creating the session
+        self._lock = threading.RLock()
+
+    @classmethod
+    def default(cls) -> "SessionManager":
+        """The manager shared by clients created without one"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @classmethod
+    def configure_default(cls, pool_maxsize: int = 10, pool_block: bool = False) -> "SessionManager":
+        """
+        Replace the shared manager (before any client uses it)
+
+        Args:
+            pool_maxsize: Connections kept open per host
+            pool_block: Wait for a free connection instead of opening an extra one
+
+        Returns:
+            SessionManager: The new shared manager
+
+        Raises:
+            RuntimeError: If clients already hold the current shared manager
+        """
+        with cls._default_lock:
+            if cls._default is not None and cls._default.users:
+                raise RuntimeError("the shared session manager is in use")
+            cls._default = cls(pool_maxsize=pool_maxsize, pool_block=pool_block)
+            return cls._default
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared session (created on first use)"""
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    @property
+    def users(self) -> int:
+        """Number of clients holding the manager"""
+        return self._users
+
+    def acquire(self) -> "SessionManager":
+        """Register a user of the session"""
+        with self._lock:
+            self._users += 1
+        return self
+
+    def release(self) -> None:
+        """Unregister a user; the last one closes the session"""
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users:
+                return
+        self.close()
+
+    def close(self) -> None:
+        """Close the session and its pooled connections (a later use opens a new one)"""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+            logger.debug("HTTP session closed")
+
+    def prewarm(self, url: str, verify: bool = True, timeout: float = 5.0) -> bool:
+        """
+        Open a pooled keep-alive connection to the host of ``url``
+
+        Sends a HEAD request, whose connection then stays in the pool for the
+        next request to the host. Pools are keyed by TLS settings too, so
+        ``verify`` must match the requests that should reuse the connection.
+
+        Args:
+            url: Any URL on the host to connect to
+            verify: Verify the TLS certificate
+            timeout: Connect and read timeout in seconds
+
+        Returns:
+            bool: True if the host answered (with any status)
+        """
+        try:
+            self.session.head(url, timeout=timeout, verify=verify, allow_redirects=False).close()
+        except requests.exceptions.RequestException as e:
+            logger.debug("Pre-warming connection to %s failed: %s", url, e)
+            return False
+
+        logger.debug("Pre-warmed connection to %s", url)
+        return True
+
+    def _create_session(self) -> requests.Session:
+        """Build a session with pooled keep-alive connections"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        logger.debug("HTTP session opened (pool_maxsize=%d, pool_block=%s)", self.pool_maxsize, self.pool_block)
+        return session
+
+    def __enter__(self) -> "SessionManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"SessionManager(pool_maxsize={self.pool_maxsize}, users={self._users})"
@@ -1,6 +1,18 @@
-"""Core logic for trash tracking"""
+"""
+Core logic for trash tracking
 
+The development tools (replay, simulator, load_test) are not re-exported here:
+they are left out of the Home Assistant copy, so import them from their modules.
+"""
+
+from ..core.async_tracker import AsyncTruckTracker
+from ..core.batch import BatchCheckpoint, BatchLookup, BatchResult, BatchRow, BatchSummary, read_batch_rows
+from ..core.catalog import CatalogError, CatalogPoint, CatalogRoute, RouteCatalog
+from ..core.crawler import CrawlSummary, CrawlTask, RouteCrawler, grid_tasks
+from ..core.eta_predictor import ArrivalPrediction, ArrivalPredictor, SegmentStats
 from ..core.point_matcher import MatchResult, PointMatcher
+from ..core.polling import FixedIntervalPolicy, PollingPolicy, SchedulePolicy
+from ..core.recorder import PositionRecord, PositionRecorder, RecorderError, read_day
 from ..core.response_builder import StatusResponseBuilder
 from ..core.state_machine import StateTransition, TruckStateMachine
 from ..core.state_manager import StateManager, TruckState
@@ -8,6 +20,7 @@ from ..core.tracker import TruckTracker
 
 __all__ = [
     "TruckTracker",
+    "AsyncTruckTracker",
     "StateManager",
     "TruckState",
     "PointMatcher",
@@ -15,4 +28,28 @@ __all__ = [
     "StatusResponseBuilder",
     "TruckStateMachine",
     "StateTransition",
+    "ArrivalPredictor",
+    "ArrivalPrediction",
+    "SegmentStats",
+    "PositionRecorder",
+    "PositionRecord",
+    "RecorderError",
+    "read_day",
+    "PollingPolicy",
+    "FixedIntervalPolicy",
+    "SchedulePolicy",
+    "BatchLookup",
+    "BatchRow",
+    "BatchResult",
+    "BatchSummary",
+    "BatchCheckpoint",
+    "read_batch_rows",
+    "RouteCatalog",
+    "CatalogRoute",
+    "CatalogPoint",
+    "CatalogError",
+    "RouteCrawler",
+    "CrawlTask",
+    "CrawlSummary",
+    "grid_tasks",
 ]
@@ -0,0 +1,90 @@
+"""Asynchronous Garbage Truck Tracker"""
+
+import asyncio
+import copy
+from typing import Any, Dict, Optional
+
+from ..clients.async_ntpc_api import AsyncNTPCApiClient
+from ..core.recorder import PositionRecorder
+from ..core.state_manager import StateManager
+from ..core.tracker import TruckTracker
+from ..utils.config import ConfigManager
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncTruckTracker:
+    """
+    Garbage truck tracker for asyncio servers
+
+    Any number of callers may await get_current_status concurrently: while a
+    poll is running, new callers wait for it instead of starting another, so
+    one upstream request and one state update serve them all. State updates
+    (and resets) are serialized by a lock and run on a worker thread, because
+    recording history writes to disk.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        recorder: Optional[PositionRecorder] = None,
+        api_client: Optional[AsyncNTPCApiClient] = None,
+    ):
+        """
+        Initialize async garbage truck tracker
+
+        Args:
+            config: Configuration manager
+            recorder: Optional position recorder (see TruckTracker)
+            api_client: Async API client, which may be shared by several trackers
+                (default: one wrapping a client built from config)
+        """
+        self.tracker = TruckTracker(config, recorder=recorder, api_client=api_client.client if api_client else None)
+        self.api_client = api_client or AsyncNTPCApiClient(self.tracker.api_client)
+        self._lock = asyncio.Lock()
+        self._poll: Optional["asyncio.Future[Dict[str, Any]]"] = None
+
+    @property
+    def state_manager(self) -> StateManager:
+        """State of the tracked location"""
+        return self.tracker.state_manager
+
+    async def get_current_status(self) -> Dict[str, Any]:
+        """
+        Get current garbage truck status
+
+        Returns:
+            dict: Status information containing status, reason, truck, timestamp;
+                every caller gets its own copy
+        """
+        poll = self._poll
+        if poll is None or poll.done():
+            poll = self._poll = asyncio.ensure_future(self._refresh())
+        else:
+            logger.debug("Joining running poll")
+        return copy.deepcopy(await asyncio.shield(poll))
+
+    async def reset(self) -> None:
+        """Reset tracker state (waits for a running state update)"""
+        async with self._lock:
+            self.tracker.reset()
+
+    async def _refresh(self) -> Dict[str, Any]:
+        """Poll the API once and update the state"""
+        location = self.tracker.config.location
+        try:
+            truck_lines = await self.api_client.get_around_points(lat=location["lat"], lng=location["lng"])
+            async with self._lock:
+                return await asyncio.to_thread(self.tracker.apply_poll, truck_lines)
+        except Exception as e:
+            async with self._lock:
+                return self.tracker.failure_response(e)
+
+    def close(self) -> None:
+        """Close what the wrapped tracker created (see TruckTracker.close)"""
+        self.tracker.close()
+
+    def __str__(self) -> str:
+        """Return string representation of tracker"""
+        return f"AsyncTruckTracker({self.state_manager})"
@@ -0,0 +1,316 @@
+"""Route Catalog"""
+
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..models.point import Point
+from ..models.truck import TruckLine
+from ..utils.logger import get_logger
+from ..utils.route_analyzer import RouteAnalyzer
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+
+# Spatial index cell size in degrees (about 1.1 km of latitude)
+_CELL_DEGREES = 0.01
+
+
+class CatalogError(Exception):
+    """Route catalog error"""
+
+
+@dataclass(frozen=True)
+class CatalogPoint:
+    """Static part of a collection point"""
+
+    rank: int
+    name: str
+    time: str
+    lat: float
+    lng: float
+
+
+@dataclass(frozen=True)
+class CatalogRoute:
+    """
+    Static description of a route
+
+    Attributes:
+        line_id: Route id (unique across the city)
+        line_name: Route name
+        area: District
+        weekdays: Days the route was returned by the API (0=Sunday, 1-6=Monday-Saturday)
+        points: Collection points in route order
+    """
+
+    line_id: str
+    line_name: str
+    area: str
+    weekdays: Tuple[int, ...]
+    points: Tuple[CatalogPoint, ...]
+
+    @classmethod
+    def from_truck_line(cls, line: TruckLine, weekdays: Iterable[int] = ()) -> "CatalogRoute":
+        """
+        Keep the static fields of a polled route
+
+        Args:
+            line: Route from the API
+            weekdays: Days the route is known to run
+
+        Returns:
+            CatalogRoute: Catalog entry
+        """
+        points = tuple(
+            CatalogPoint(rank=p.point_rank, name=p.point_name, time=p.point_time, lat=p.lat, lng=p.lon)
+            for p in sorted(line.points, key=lambda p: p.point_rank)
+        )
+        return cls(line.line_id, line.line_name, line.area, tuple(sorted(set(weekdays))), points)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CatalogRoute":
+        """
+        Create a route from its catalog file form
+
+        Args:
+            data: Route as written by to_dict
+
+        Returns:
+            CatalogRoute: Catalog entry
+        """
+        return cls(
+            line_id=data["id"],
+            line_name=data["name"],
+            area=data.get("area", ""),
+            weekdays=tuple(data.get("weekdays", ())),
+            points=tuple(CatalogPoint(*point) for point in data.get("points", ())),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to the catalog file form (points as [rank, name, time, lat, lng] rows)"""
+        return {
+            "id": self.line_id,
+            "name": self.line_name,
+            "area": self.area,
+            "weekdays": list(self.weekdays),
+            "points": [[p.rank, p.name, p.time, p.lat, p.lng] for p in self.points],
+        }
+
+    def to_truck_line(self) -> TruckLine:
+        """
+        Build a TruckLine without live data (no truck position, no arrivals)
+
+        Returns:
+            TruckLine: Route usable for route analysis and configuration
+        """
+        points = [
+            Point(
+                source_point_id=0,
+                vil="",
+                point_name=p.name,
+                lon=p.lng,
+                lat=p.lat,
+                point_id=0,
+                point_rank=p.rank,
+                point_time=p.time,
+                arrival="",
+                arrival_diff=65535,
+                fixed_point=0,
+                point_weekknd="",
+                in_scope="",
+                like_count=0,
+            )
+            for p in self.points
+        ]
+        return TruckLine(
+            line_id=self.line_id,
+            line_name=self.line_name,
+            area=self.area,
+            arrival_rank=0,
+            diff=0,
+            car_no="",
+            location="",
+            location_lat=0.0,
+            location_lon=0.0,
+            bar_code="",
+            points=points,
+        )
+
+
+class RouteCatalog:
+    """
+    Static routes of the whole city, keyed by line id
+
+    Besides the routes, the catalog keeps a spatial index (collection points
+    bucketed in ~1 km cells) and a schedule index (route ids by weekday), so
+    the routes around a location or on a weekday are found without scanning
+    every route. Adding routes is thread-safe.
+    """
+
+    def __init__(self, routes: Iterable[CatalogRoute] = ()):
+        """
+        Initialize catalog
+
+        Args:
+            routes: Initial routes
+        """
+        self._routes: Dict[str, CatalogRoute] = {}
+        self._cells: Dict[Tuple[int, int], Set[str]] = {}
+        self._by_weekday: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        for route in routes:
+            self._index(route)
+
+    @classmethod
+    def load(cls, path: str) -> "RouteCatalog":
+        """
+        Read a catalog file
+
+        Args:
+            path: File written by save
+
+        Returns:
+            RouteCatalog: Loaded catalog
+
+        Raises:
+            CatalogError: If the file is missing, unreadable or of another format version
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CatalogError(f"Cannot read route catalog {path}: {e}") from e
+
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            raise CatalogError(f"Unsupported route catalog format: {path}")
+
+        try:
+            return cls(CatalogRoute.from_dict(route) for route in data.get("routes", []))
+        except (KeyError, TypeError) as e:
+            raise CatalogError(f"Malformed route catalog {path}: {e}") from e
+
+    def save(self, path: str) -> None:
+        """
+        Write the catalog (atomically: readers see the old or the new file)
+
+        Args:
+            path: Catalog file path
+        """
+        with self._lock:
+            routes = [self._routes[line_id].to_dict() for line_id in sorted(self._routes)]
+
+        data = {"version": FORMAT_VERSION, "saved_at": datetime.now().isoformat(timespec="seconds"), "routes": routes}
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(target.name + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temporary, target)
+        logger.debug("Saved %d route(s) to %s", len(routes), path)
+
+    def add(self, line: TruckLine, week: Optional[int] = None) -> Optional[str]:
+        """
+        Merge a polled route
+
+        Args:
+            line: Route from the API
+            week: Week value of the query that returned it
+
+        Returns:
+            str: "added" for a new route, "updated" when its points or weekdays
+                changed, None when already known as is
+        """
+        with self._lock:
+            known = self._routes.get(line.line_id)
+            weekdays = set(known.weekdays if known else ())
+            if week is not None:
+                weekdays.add(week)
+
+            route = CatalogRoute.from_truck_line(line, weekdays)
+            if route == known:
+                return None
+            self._index(route)
+            return "updated" if known else "added"
+
+    def get(self, line_id: str) -> Optional[CatalogRoute]:
+        """Get a route by id"""
+        return self._routes.get(line_id)
+
+    def routes_near(self, lat: float, lng: float, radius: float, week: Optional[int] = None) -> List[CatalogRoute]:
+        """
+        Find the routes with a collection point within ``radius`` meters
+
+        Args:
+            lat: Latitude
+            lng: Longitude
+            radius: Search radius in meters
+            week: Only routes running on this weekday (0=Sunday, 1-6=Monday-Saturday)
+
+        Returns:
+            List[CatalogRoute]: Matching routes, nearest first
+        """
+        analyzer = RouteAnalyzer(lat, lng)
+        lat_cells = math.ceil(radius / 111_000 / _CELL_DEGREES)
+        lng_cells = math.ceil(radius / (111_000 * max(math.cos(math.radians(lat)), 0.01)) / _CELL_DEGREES)
+        row, column = _cell(lat, lng)
+
+        candidates: Set[str] = set()
+        for d_row in range(-lat_cells, lat_cells + 1):
+            for d_column in range(-lng_cells, lng_cells + 1):
+                candidates |= self._cells.get((row + d_row, column + d_column), set())
+        if week is not None:
+            candidates &= self._by_weekday.get(week, set())
+
+        found = []
+        for line_id in candidates:
+            route = self._routes[line_id]
+            distance = min(analyzer.calculate_distance(p.lat, p.lng) for p in route.points if p.lat and p.lng)
+            if distance <= radius:
+                found.append((distance, line_id, route))
+        return [route for _, _, route in sorted(found, key=lambda item: item[:2])]
+
+    def routes_on(self, week: int) -> List[CatalogRoute]:
+        """
+        Get the routes running on a weekday
+
+        Args:
+            week: Day (0=Sunday, 1-6=Monday-Saturday)
+
+        Returns:
+            List[CatalogRoute]: Routes, ordered by id
+        """
+        return [self._routes[line_id] for line_id in sorted(self._by_weekday.get(week, ()))]
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def __iter__(self) -> Iterator[CatalogRoute]:
+        return iter(list(self._routes.values()))
+
+    def _index(self, route: CatalogRoute) -> None:
+        """Store a route and (re)build its index entries (caller holds the lock or owns the catalog)"""
+        previous = self._routes.get(route.line_id)
+        if previous is not None:
+            for point in previous.points:
+                self._cells.get(_cell(point.lat, point.lng), set()).discard(route.line_id)
+            for week in previous.weekdays:
+                self._by_weekday.get(week, set()).discard(route.line_id)
+
+        self._routes[route.line_id] = route
+        for point in route.points:
+            if point.lat and point.lng:
+                self._cells.setdefault(_cell(point.lat, point.lng), set()).add(route.line_id)
+        for week in route.weekdays:
+            self._by_weekday.setdefault(week, set()).add(route.line_id)
+
+
+def _cell(lat: float, lng: float) -> Tuple[int, int]:
+    """Spatial index cell of a location"""
+    return math.floor(lat / _CELL_DEGREES), math.floor(lng / _CELL_DEGREES)
@@ -0,0 +1,247 @@
+"""City-wide Route Crawler"""
+
+import functools
+import math
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from ..clients.ntpc_api import NTPCApiClient, NTPCApiError
+from ..clients.session import SessionManager
+from ..core.batch import BatchCheckpoint
+from ..core.catalog import RouteCatalog
+from ..models.truck import TruckLine
+from ..utils.logger import get_logger
+from ..utils.rate_limit import RateLimiter
+
+logger = get_logger(__name__)
+
+# (south, west, north, east) of New Taipei City
+NEW_TAIPEI_BBOX = (24.67, 121.28, 25.30, 122.01)
+
+ALL_WEEKS = (0, 1, 2, 3, 4, 5, 6)
+
+
+@dataclass(frozen=True)
+class CrawlTask:
+    """One GetAroundPoints query of a crawl"""
+
+    lat: float
+    lng: float
+    week: int
+
+    @property
+    def task_id(self) -> str:
+        """Stable id, recorded in the checkpoint"""
+        return f"{self.week}@{self.lat:.5f},{self.lng:.5f}"
+
+
+@dataclass
+class CrawlSummary:
+    """Counters of a crawl run"""
+
+    queried: int = 0
+    failed: int = 0
+    skipped: int = 0
+    routes_added: int = 0
+    routes_updated: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "queried": self.queried,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "routes_added": self.routes_added,
+            "routes_updated": self.routes_updated,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+def grid_tasks(
+    bbox: Tuple[float, float, float, float] = NEW_TAIPEI_BBOX,
+    spacing: float = 500.0,
+    weeks: Sequence[int] = ALL_WEEKS,
+) -> Iterator[CrawlTask]:
+    """
+    Cover a bounding box with a grid of queries
+
+    Args:
+        bbox: (south, west, north, east) in degrees
+        spacing: Distance between neighbouring query points in meters; keep it
+            below the API's search radius so neighbouring queries overlap
+        weeks: Week values to query at every point
+
+    Yields:
+        CrawlTask: Queries, row by row from the south-west corner
+    """
+    south, west, north, east = bbox
+    if south >= north or west >= east:
+        raise ValueError("bbox must be (south, west, north, east)")
+    if spacing <= 0:
+        raise ValueError("spacing must be positive")
+
+    lat_step = spacing / 111_000
+    lng_step = spacing / (111_000 * math.cos(math.radians((south + north) / 2)))
+    rows = int((north - south) / lat_step) + 1
+    columns = int((east - west) / lng_step) + 1
+
+    for row in range(rows):
+        for column in range(columns):
+            for week in weeks:
+                yield CrawlTask(round(south + row * lat_step, 5), round(west + column * lng_step, 5), week)
+
+
+class RouteCrawler:
+    """
+    Build a route catalog from a grid of GetAroundPoints queries.
+
+    Queries run on a bounded worker pool under one shared rate limit; routes
+    are deduplicated by line id as results come in. A run is resumable and
+    incremental: the catalog is saved every ``save_every`` queries, and only
+    then are those queries recorded in the checkpoint, so an interrupted run
+    restarted with the same catalog and checkpoint repeats at most the
+    queries since the last save. Failed queries are not recorded and are
+    retried by the next run.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        rate_limit: Optional[RateLimiter] = None,
+        client_factory: Optional[Callable[[], NTPCApiClient]] = None,
+    ):
+        """
+        Initialize crawler
+
+        Args:
+            workers: Number of worker threads
+            rate_limit: Limiter shared by all API calls of the crawl
+            client_factory: Creates the per-thread API client (default: an
+                uncached client, since a crawl never repeats a query, on a
+                connection pool of its own with one connection per worker)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.workers = workers
+        self.rate_limit = rate_limit
+        self.session_manager = SessionManager(pool_maxsize=workers, pool_block=True)
+        self._client_factory = client_factory or functools.partial(
+            NTPCApiClient, cache_enabled=False, session_manager=self.session_manager
+        )
+        self._local = threading.local()
+
+    def crawl(
+        self,
+        tasks: Iterable[CrawlTask],
+        catalog: RouteCatalog,
+        catalog_path: Optional[str] = None,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        save_every: int = 50,
+    ) -> CrawlSummary:
+        """
+        Run queries and merge the routes they return into a catalog
+
+        Args:
+            tasks: Queries to run
+            catalog: Catalog to extend (e.g. one loaded from an earlier run)
+            catalog_path: Where to save the catalog (required with a checkpoint)
+            checkpoint: Skip queries done in earlier runs and record new ones
+            save_every: Queries between catalog saves
+
+        Returns:
+            CrawlSummary: Counters of this run
+        """
+        if checkpoint is not None and catalog_path is None:
+            raise ValueError("a checkpoint needs a catalog_path to save to")
+
+        summary = CrawlSummary()
+        started = time.perf_counter()
+        max_pending = 2 * self.workers
+        pending: Set["Future[Tuple[CrawlTask, Optional[List[TruckLine]]]]"] = set()
+        progress = _Progress(catalog, catalog_path, checkpoint, save_every)
+
+        def drain(return_when: str) -> None:
+            nonlocal pending
+            done, pending = wait(pending, return_when=return_when)
+            for future in done:
+                task, lines = future.result()
+                if lines is None:
+                    summary.failed += 1
+                else:
+                    self._merge(catalog, task, lines, summary)
+                    progress.done(task)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawl") as executor:
+            for task in tasks:
+                if checkpoint is not None and checkpoint.is_done(task.task_id):
+                    summary.skipped += 1
+                    continue
+                if len(pending) >= max_pending:
+                    drain(FIRST_COMPLETED)
+                pending.add(executor.submit(self._query, task))
+            if pending:
+                drain(ALL_COMPLETED)
+        self.session_manager.close()
+        progress.save()
+
+        summary.elapsed_seconds = time.perf_counter() - started
+        logger.info("Crawl finished: %s (%d route(s) in catalog)", summary.to_dict(), len(catalog))
+        return summary
+
+    @staticmethod
+    def _merge(catalog: RouteCatalog, task: CrawlTask, lines: List[TruckLine], summary: CrawlSummary) -> None:
+        """Add the routes of one query to the catalog"""
+        summary.queried += 1
+        for line in lines:
+            change = catalog.add(line, task.week)
+            if change == "added":
+                summary.routes_added += 1
+            elif change == "updated":
+                summary.routes_updated += 1
+
+    def _query(self, task: CrawlTask) -> Tuple[CrawlTask, Optional[List[TruckLine]]]:
+        """Run one query on a worker thread (None as result when it failed)"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self._client_factory()
+
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        try:
+            return task, client.get_around_points(task.lat, task.lng, week=task.week) or []
+        except NTPCApiError as e:
+            logger.warning("Crawl query %s failed: %s", task.task_id, e)
+            return task, None
+
+
+class _Progress:
+    """Saves the catalog every few finished queries, then records them in the checkpoint"""
+
+    def __init__(
+        self, catalog: RouteCatalog, path: Optional[str], checkpoint: Optional[BatchCheckpoint], save_every: int
+    ):
+        self.catalog = catalog
+        self.path = path
+        self.checkpoint = checkpoint
+        self.save_every = save_every
+        self._unsaved: List[CrawlTask] = []
+
+    def done(self, task: CrawlTask) -> None:
+        """Note a finished query"""
+        self._unsaved.append(task)
+        if len(self._unsaved) >= self.save_every:
+            self.save()
+
+    def save(self) -> None:
+        """Save the catalog and record the queries it now contains"""
+        if self.path is not None:
+            self.catalog.save(self.path)
+        if self.checkpoint is not None:
+            for task in self._unsaved:
+                self.checkpoint.mark_done(task.task_id)
+        self._unsaved.clear()
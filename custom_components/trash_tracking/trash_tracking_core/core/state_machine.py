@@ -6,7 +6,9 @@ from ..core.state_manager import TruckState
 from ..models.point import Point
 from ..models.tracking_window import TrackingWindow
 from ..models.truck import TruckLine
-from ..utils.logger import logger
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class StateTransition:
@@ -42,7 +44,7 @@ class TruckStateMachine:
             tracking_window: Tracking window defining enter and exit points
         """
         self.tracking_window = tracking_window
-        logger.info(f"StateMachine initialized: {tracking_window}")
+        logger.info("StateMachine initialized: %s", tracking_window)
 
     def evaluate_transition(self, current_state: TruckState, truck_line: TruckLine) -> Optional[StateTransition]:
         """
@@ -1,35 +1,85 @@
 """Garbage Truck Tracker"""
 
-from typing import Any, Dict, List
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, TypeVar
 
 from ..clients.ntpc_api import NTPCApiClient, NTPCApiError
+from ..clients.shared_cache import SharedResponseCache
+from ..core.eta_predictor import ArrivalPrediction, ArrivalPredictor
 from ..core.point_matcher import PointMatcher
+from ..core.recorder import PositionRecorder, RecorderError
 from ..core.state_manager import StateManager
+from ..models.pool import PointPool
+from ..models.snapshot import LineSnapshot, PollSnapshot
 from ..models.truck import TruckLine
 from ..utils.config import ConfigManager
-from ..utils.logger import logger
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
 
 
 class TruckTracker:
     """Garbage truck tracker"""
 
-    def __init__(self, config: ConfigManager):
+    def __init__(
+        self,
+        config: ConfigManager,
+        recorder: Optional[PositionRecorder] = None,
+        api_client: Optional[NTPCApiClient] = None,
+        predictor: Optional[ArrivalPredictor] = None,
+        record: bool = True,
+    ):
         """
         Initialize garbage truck tracker
 
         Args:
             config: Configuration manager
+            recorder: Optional position recorder; when omitted, one is created if
+                ``history.directory`` is configured
+            api_client: API client to use instead of one built from config
+                (e.g. a replay source)
+            predictor: Optional arrival predictor fed with every poll; when
+                omitted, one is created if ``history.eta_database`` is configured
+            record: Create the configured recorder and predictor; False for
+                simulated polls (replays, load tests) that must not end up in
+                the user's history
         """
         self.config = config
+        # Created here and closed by close(); passed-in objects belong to the caller
+        self._owned: List[Any] = []
 
-        self.api_client = NTPCApiClient(
-            base_url=config.api_base_url,
-            timeout=config.api_timeout,
-            retry_count=config.get("api.ntpc.retry_count", 3),
-            retry_delay=config.get("api.ntpc.retry_delay", 2),
-        )
+        history_directory = config.get("history.directory", None) if record else None
+        if recorder is None and history_directory:
+            recorder = self._own(PositionRecorder(str(history_directory)))
+        self.recorder = recorder
+
+        eta_database = config.get("history.eta_database", None) if record else None
+        if predictor is None and eta_database:
+            predictor = self._own(ArrivalPredictor(str(eta_database)))
+        self.predictor = predictor
+
+        if api_client is None:
+            shared_cache = config.get("api.ntpc.shared_cache", None)
+            api_client = self._own(
+                NTPCApiClient(
+                    base_url=config.api_base_url,
+                    timeout=config.api_timeout,
+                    retry_count=config.get("api.ntpc.retry_count", 3),
+                    retry_delay=config.get("api.ntpc.retry_delay", 2),
+                    tile_precision=config.get("api.ntpc.tile_precision", None),
+                    tile_radius=config.get("api.ntpc.tile_radius", 300.0),
+                    point_pool=PointPool() if config.get("api.ntpc.point_pool", True) else None,
+                    # Share responses with other processes polling on this machine
+                    cache_backend=self._own(SharedResponseCache(str(shared_cache))) if shared_cache else None,
+                )
+            )
+        self.api_client = api_client
 
         self.state_manager = StateManager()
+        # Last poll, frozen: the state holds its routes, and the next poll shares what did not change
+        self.snapshot: Optional[PollSnapshot] = None
 
         self.point_matcher = PointMatcher(
             enter_point_name=config.enter_point,
@@ -48,54 +98,87 @@ class TruckTracker:
         try:
             location = self.config.location
             truck_lines = self.api_client.get_around_points(lat=location["lat"], lng=location["lng"])
+            return self.apply_poll(truck_lines)
+        except Exception as e:
+            return self.failure_response(e)
 
-            if not truck_lines:
-                logger.info("API returned no truck data")
-                if self.state_manager.is_idle():
-                    return self.state_manager.get_status_response()
-                else:
-                    self.state_manager.update_state(new_state="idle", reason="No trucks nearby")
-                    return self.state_manager.get_status_response()
+    def apply_poll(self, truck_lines: Optional[List[TruckLine]]) -> Dict[str, Any]:
+        """
+        Update the state from one poll of the API
 
-            target_lines = self._filter_target_lines(truck_lines)
+        Args:
+            truck_lines: All truck routes returned by the poll
 
-            if not target_lines:
-                logger.info("Found %d route(s), but none match tracking criteria", len(truck_lines))
-                if not self.state_manager.is_idle():
-                    self.state_manager.update_state(new_state="idle", reason="Tracked routes not nearby")
-                return self.state_manager.get_status_response()
+        Returns:
+            dict: Status information containing status, reason, truck, timestamp
+        """
+        self._record_history(truck_lines)
+        previous = self.snapshot
+        self.snapshot = PollSnapshot.from_lines(truck_lines, previous)
+        self._observe_arrivals(self.snapshot.changed_since(previous))
 
-            for line in target_lines:
-                match_result = self.point_matcher.check_line(line, current_state=self.state_manager.current_state)
-
-                if match_result.should_trigger:
-                    self.state_manager.update_state(
-                        new_state=match_result.new_state,
-                        reason=match_result.reason,
-                        truck_line=match_result.truck_line,
-                        enter_point=match_result.enter_point,
-                        exit_point=match_result.exit_point,
-                    )
-                    break
+        if not self.snapshot:
+            logger.info("API returned no truck data")
+            if self.state_manager.is_idle():
+                return self.state_manager.get_status_response()
             else:
-                logger.debug("No route triggered state change, maintaining current state")
+                self.state_manager.update_state(new_state="idle", reason="No trucks nearby")
+                return self.state_manager.get_status_response()
 
+        target_lines = self._filter_target_lines(self.snapshot.lines)
+
+        if not target_lines:
+            logger.info("Found %d route(s), but none match tracking criteria", len(self.snapshot))
+            if not self.state_manager.is_idle():
+                self.state_manager.update_state(new_state="idle", reason="Tracked routes not nearby")
             return self.state_manager.get_status_response()
 
-        except NTPCApiError as e:
-            logger.error("NTPC API request failed: %s", e)
-            response = self.state_manager.get_status_response()
-            response["error"] = str(e)
-            return response
+        for line in target_lines:
+            match_result = self.point_matcher.check_line(line, current_state=self.state_manager.current_state)
 
-        except Exception as e:
-            logger.error("Unexpected error in tracker: %s", e, exc_info=True)
-            self.state_manager.reset()
+            if match_result.should_trigger:
+                self.state_manager.update_state(
+                    new_state=match_result.new_state,
+                    reason=match_result.reason,
+                    truck_line=match_result.truck_line,
+                    enter_point=match_result.enter_point,
+                    exit_point=match_result.exit_point,
+                )
+                break
+        else:
+            logger.debug("No route triggered state change, maintaining current state")
+
+        response = self.state_manager.get_status_response()
+        if self.predictor is not None:
+            eta = self._predict_enter_arrival(target_lines)
+            response["eta"] = eta.to_dict() if eta else None
+        return response
+
+    def failure_response(self, error: Exception) -> Dict[str, Any]:
+        """
+        Build the status response for a failed poll
+
+        An API failure keeps the current state; any other error resets it.
+
+        Args:
+            error: Exception raised while polling
+
+        Returns:
+            dict: Status information with an ``error`` entry
+        """
+        if isinstance(error, NTPCApiError):
+            logger.error("NTPC API request failed: %s", error)
             response = self.state_manager.get_status_response()
-            response["error"] = f"System error: {str(e)}"
+            response["error"] = str(error)
             return response
 
-    def _filter_target_lines(self, truck_lines: List[TruckLine]) -> List[TruckLine]:
+        logger.error("Unexpected error in tracker: %s", error, exc_info=error)
+        self.state_manager.reset()
+        response = self.state_manager.get_status_response()
+        response["error"] = f"System error: {str(error)}"
+        return response
+
+    def _filter_target_lines(self, truck_lines: Sequence[LineSnapshot]) -> Sequence[LineSnapshot]:
         """
         Filter target routes
 
@@ -103,7 +186,7 @@ class TruckTracker:
             truck_lines: All truck routes
 
         Returns:
-            List[TruckLine]: Routes matching tracking criteria
+            Sequence[LineSnapshot]: Routes matching tracking criteria
         """
         target_line_names = self.config.target_lines
 
@@ -117,11 +200,85 @@ class TruckTracker:
 
         return filtered
 
+    def _record_history(self, truck_lines: Optional[List[TruckLine]]) -> None:
+        """
+        Append polled positions to the history recorder (if enabled)
+
+        Recording is best-effort: a full disk must not break tracking.
+
+        Args:
+            truck_lines: All truck routes from this poll
+        """
+        if not truck_lines or self.recorder is None:
+            return
+
+        try:
+            self.recorder.record(truck_lines)
+        except (OSError, RecorderError) as e:
+            logger.warning("Failed to record truck positions: %s", e)
+
+    def _observe_arrivals(self, changed_lines: Sequence[LineSnapshot]) -> None:
+        """
+        Feed routes with new arrivals to the arrival predictor (if enabled)
+
+        Routes shared with the previous snapshot have no new arrivals and are
+        skipped. Like recording, learning must not break tracking.
+
+        Args:
+            changed_lines: Routes that changed since the previous poll
+        """
+        if self.predictor is None:
+            return
+
+        try:
+            for line in changed_lines:
+                self.predictor.observe(line)
+        except sqlite3.Error as e:
+            logger.warning("Failed to learn arrival times: %s", e)
+
+    def _predict_enter_arrival(self, target_lines: Sequence[LineSnapshot]) -> Optional[ArrivalPrediction]:
+        """
+        Predict when the first tracked route reaches the enter point
+
+        Args:
+            target_lines: Routes matching tracking criteria
+
+        Returns:
+            Optional[ArrivalPrediction]: Prediction with confidence interval, None
+                if no route passes the enter point or prediction failed
+        """
+        try:
+            for line in target_lines:
+                eta = self.predictor.predict_point(line, self.config.enter_point)
+                if eta is not None:
+                    return eta
+        except sqlite3.Error as e:
+            logger.warning("Failed to predict arrival time: %s", e)
+        return None
+
     def reset(self) -> None:
         """Reset tracker state"""
         logger.info("Resetting tracker")
         self.state_manager.reset()
 
+    def close(self) -> None:
+        """Close the API client, shared cache, recorder and predictor the tracker created"""
+        owned, self._owned = self._owned, []
+        # Latest first: the API client goes before the cache it uses
+        for resource in reversed(owned):
+            resource.close()
+
+    def _own(self, resource: T) -> T:
+        """Register a resource created by the tracker for close()"""
+        self._owned.append(resource)
+        return resource
+
+    def __enter__(self) -> "TruckTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __str__(self) -> str:
         """Return string representation of tracker"""
         return f"TruckTracker({self.state_manager})"
@@ -1,7 +1,23 @@
 """Data models for trash tracking"""
 
+from ..models.codec import CodecError, pack_truck_lines, unpack_truck_lines
 from ..models.point import Point, PointStatus
+from ..models.pool import PointPool, PoolStats
+from ..models.snapshot import LineSnapshot, PointSnapshot, PollSnapshot
 from ..models.tracking_window import TrackingWindow
 from ..models.truck import TruckLine
 
-__all__ = ["Point", "PointStatus", "TrackingWindow", "TruckLine"]
+__all__ = [
+    "CodecError",
+    "LineSnapshot",
+    "Point",
+    "PointPool",
+    "PointSnapshot",
+    "PointStatus",
+    "PollSnapshot",
+    "PoolStats",
+    "TrackingWindow",
+    "TruckLine",
+    "pack_truck_lines",
+    "unpack_truck_lines",
+]
@@ -0,0 +1,147 @@
+"""Collection Point Pool"""
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from operator import attrgetter
+from typing import Any, Dict, Optional
+
+from ..models.point import Point
+from ..models.truck import TruckLine
+
+# Fields that change from poll to poll; all others describe the point itself
+_LIVE_FIELDS = ("arrival", "arrival_diff")
+_static_fields = attrgetter(*(f.name for f in fields(Point) if f.name not in _LIVE_FIELDS))
+_live_fields = attrgetter(*_LIVE_FIELDS)
+_STRING_FIELDS = tuple(f.name for f in fields(Point) if f.type is str)
+
+
+@dataclass
+class PoolStats:
+    """Counters of a point pool"""
+
+    reused: int = 0
+    refreshed: int = 0
+    created: int = 0
+    evicted_routes: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "reused": self.reused,
+            "refreshed": self.refreshed,
+            "created": self.created,
+            "evicted_routes": self.evicted_routes,
+        }
+
+
+class PointPool:
+    """
+    Reuses collection points across polls
+
+    Every poll returns the same points of a route with mostly the same values.
+    The pool keeps the last Point seen for each (line_id, point_id) and hands
+    it out again when the polled point is unchanged; when only the live
+    fields (arrival, arrival_diff) changed, the new Point shares the pooled
+    one's strings. Strings are interned when a point enters the pool, so
+    names, times and weekday codes repeated across routes are stored once.
+
+    Pooled points are shared between polls and must not be modified. Points
+    without a point_id are interned but not pooled. Routes are kept for the
+    ``max_routes`` most recently polled line ids.
+    """
+
+    def __init__(self, max_routes: int = 64):
+        """
+        Initialize point pool
+
+        Args:
+            max_routes: Number of routes whose points are kept
+        """
+        if max_routes < 1:
+            raise ValueError("max_routes must be at least 1")
+
+        self.max_routes = max_routes
+        self.stats = PoolStats()
+        self._routes: "OrderedDict[str, Dict[Any, Point]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pool_line(self, line: TruckLine) -> TruckLine:
+        """
+        Replace the points of a freshly decoded route with pooled ones
+
+        Args:
+            line: Route from the API (its points are taken over by the pool)
+
+        Returns:
+            TruckLine: The same route, with pooled points and interned strings
+        """
+        line.line_name = _intern(line.line_name)
+        line.area = _intern(line.area)
+        line.location = _intern(line.location)
+        with self._lock:
+            route = self._route(line.line_id)
+            line.points = [self._pool_point(route, point) for point in line.points]
+        return line
+
+    def pool_point(self, line_id: str, point: Point) -> Point:
+        """
+        Get the pooled equivalent of a freshly decoded point
+
+        Args:
+            line_id: Route the point belongs to
+            point: Point from the API (taken over by the pool)
+
+        Returns:
+            Point: Pooled point equal to ``point``
+        """
+        with self._lock:
+            return self._pool_point(self._route(line_id), point)
+
+    def clear(self) -> None:
+        """Drop all pooled points"""
+        with self._lock:
+            self._routes.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(route) for route in self._routes.values())
+
+    def _route(self, line_id: str) -> Dict[Any, Point]:
+        """Pooled points of a route, by point id (caller holds the lock)"""
+        route = self._routes.get(line_id)
+        if route is not None:
+            self._routes.move_to_end(line_id)
+            return route
+
+        route = self._routes[line_id] = {}
+        if len(self._routes) > self.max_routes:
+            self._routes.popitem(last=False)
+            self.stats.evicted_routes += 1
+        return route
+
+    def _pool_point(self, route: Dict[Any, Point], point: Point) -> Point:
+        """Look up or add a point (caller holds the lock)"""
+        pooled = route.get(point.point_id)
+        if pooled is not None and _static_fields(pooled) == _static_fields(point):
+            if _live_fields(pooled) == _live_fields(point):
+                self.stats.reused += 1
+                return pooled
+            # Same point, new arrival: share the pooled strings
+            fresh = replace(pooled, arrival=_intern(point.arrival), arrival_diff=point.arrival_diff)
+            self.stats.refreshed += 1
+        else:
+            for name in _STRING_FIELDS:
+                setattr(point, name, _intern(getattr(point, name)))
+            fresh = point
+            self.stats.created += 1
+
+        if point.point_id is not None:
+            route[point.point_id] = fresh
+        return fresh
+
+
+def _intern(value: Optional[Any]) -> Any:
+    """Intern a string (other values are returned as is)"""
+    return sys.intern(value) if type(value) is str else value
@@ -0,0 +1,203 @@
+"""Immutable Poll Snapshots"""
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from ..models.point import Point
+from ..models.truck import TruckLine
+
+
+@dataclass(frozen=True, slots=True)
+class PointSnapshot:
+    """
+    Frozen collection point
+
+    Has the fields and read-only methods of Point, so it can be used wherever
+    a Point is read.
+    """
+
+    source_point_id: int
+    vil: str
+    point_name: str
+    lon: float
+    lat: float
+    point_id: int
+    point_rank: int
+    point_time: str
+    arrival: str
+    arrival_diff: int
+    fixed_point: int
+    point_weekknd: str
+    in_scope: str
+    like_count: int
+
+    @classmethod
+    def of(cls, point: Union[Point, "PointSnapshot"], previous: Optional["PointSnapshot"] = None) -> "PointSnapshot":
+        """
+        Freeze a point
+
+        Args:
+            point: Point to freeze (a snapshot is used as is, without copying)
+            previous: Snapshot of the same point from an earlier poll, returned
+                instead of ``point`` when nothing changed
+
+        Returns:
+            PointSnapshot: Frozen point
+        """
+        if isinstance(point, PointSnapshot):
+            return previous if point == previous else point
+        snapshot = cls(
+            point.source_point_id,
+            point.vil,
+            point.point_name,
+            point.lon,
+            point.lat,
+            point.point_id,
+            point.point_rank,
+            point.point_time,
+            point.arrival,
+            point.arrival_diff,
+            point.fixed_point,
+            point.point_weekknd,
+            point.in_scope,
+            point.like_count,
+        )
+        return previous if snapshot == previous else snapshot
+
+    to_api_dict = Point.to_api_dict
+    to_dict = Point.to_dict
+    has_passed = Point.has_passed
+    is_in_scope = Point.is_in_scope
+    get_status = Point.get_status
+    get_estimated_arrival = Point.get_estimated_arrival
+    get_delay_description = Point.get_delay_description
+    get_weekdays = Point.get_weekdays
+    __str__ = Point.__str__
+
+
+@dataclass(frozen=True, slots=True)
+class LineSnapshot:
+    """
+    Frozen truck route
+
+    Has the fields and read-only methods of TruckLine, with the points in a
+    tuple, so it can be used wherever a TruckLine is read.
+    """
+
+    line_id: str
+    line_name: str
+    area: str
+    arrival_rank: int
+    diff: int
+    car_no: str
+    location: str
+    location_lat: float
+    location_lon: float
+    bar_code: str
+    points: Tuple[PointSnapshot, ...]
+
+    @classmethod
+    def of(cls, line: Union[TruckLine, "LineSnapshot"], previous: Optional["LineSnapshot"] = None) -> "LineSnapshot":
+        """
+        Freeze a route, sharing what did not change since an earlier poll
+
+        Args:
+            line: Route to freeze (a snapshot is used as is, without copying)
+            previous: Snapshot of the same route from an earlier poll; its
+                unchanged points are reused, and it is returned itself when
+                nothing changed
+
+        Returns:
+            LineSnapshot: Frozen route
+        """
+        if isinstance(line, LineSnapshot):
+            return previous if line == previous else line
+        previous_points = previous.points if previous is not None else ()
+        points = tuple(
+            PointSnapshot.of(point, previous_points[index] if index < len(previous_points) else None)
+            for index, point in enumerate(line.points)
+        )
+        snapshot = cls(
+            line.line_id,
+            line.line_name,
+            line.area,
+            line.arrival_rank,
+            line.diff,
+            line.car_no,
+            line.location,
+            line.location_lat,
+            line.location_lon,
+            line.bar_code,
+            points,
+        )
+        return previous if snapshot == previous else snapshot
+
+    to_api_dict = TruckLine.to_api_dict
+    find_point = TruckLine.find_point
+    get_current_point = TruckLine.get_current_point
+    get_upcoming_points = TruckLine.get_upcoming_points
+    to_dict = TruckLine.to_dict
+    __str__ = TruckLine.__str__
+
+
+@dataclass(frozen=True, slots=True)
+class PollSnapshot:
+    """
+    Frozen result of one GetAroundPoints poll
+
+    One instance can be handed to the state, caches and entities without
+    copies, since none of them can change it. NTPCApiClient freezes each
+    response once when it is decoded, caches the snapshot and returns its
+    routes, so freezing them again is free. Successive snapshots share the
+    routes and points that did not change, so comparing two polls only needs
+    identity checks (see changed_since).
+    """
+
+    lines: Tuple[LineSnapshot, ...] = ()
+
+    @classmethod
+    def from_lines(
+        cls, lines: Optional[Iterable[Union[TruckLine, LineSnapshot]]], previous: Optional["PollSnapshot"] = None
+    ) -> "PollSnapshot":
+        """
+        Freeze the routes of a poll
+
+        Args:
+            lines: Routes returned by the API (None for no routes); route
+                snapshots are taken over without copying
+            previous: Snapshot of the previous poll, whose unchanged routes and
+                points are reused
+
+        Returns:
+            PollSnapshot: Frozen poll
+        """
+        known = {line.line_id: line for line in previous.lines} if previous is not None else {}
+        return cls(tuple(LineSnapshot.of(line, known.get(line.line_id)) for line in lines or ()))
+
+    def get(self, line_id: str) -> Optional[LineSnapshot]:
+        """Get a route by id"""
+        for line in self.lines:
+            if line.line_id == line_id:
+                return line
+        return None
+
+    def changed_since(self, previous: Optional["PollSnapshot"]) -> Tuple[LineSnapshot, ...]:
+        """
+        Get the routes that are new or changed since an earlier snapshot
+
+        Args:
+            previous: Snapshot this one was built on (None: all routes are new)
+
+        Returns:
+            tuple: Routes not shared with the previous snapshot
+        """
+        if previous is None:
+            return self.lines
+        shared = {id(line) for line in previous.lines}
+        return tuple(line for line in self.lines if id(line) not in shared)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __iter__(self) -> Iterator[LineSnapshot]:
+        return iter(self.lines)
@@ -50,6 +50,27 @@ class TruckLine:
             points=points,
         )
 
+    def to_api_dict(self) -> dict:
+        """
+        Convert back to the API response format (inverse of from_dict)
+
+        Returns:
+            dict: Route data in API field names, including all points
+        """
+        return {
+            "LineID": self.line_id,
+            "LineName": self.line_name,
+            "Area": self.area,
+            "ArrivalRank": self.arrival_rank,
+            "Diff": self.diff,
+            "CarNO": self.car_no,
+            "Location": self.location,
+            "LocationLat": self.location_lat,
+            "LocationLon": self.location_lon,
+            "BarCode": self.bar_code,
+            "Point": [p.to_api_dict() for p in self.points],
+        }
+
     def find_point(self, point_name: str) -> Optional[Point]:
         """
         Find collection point by name
@@ -1,8 +1,15 @@
 """Utilities for trash tracking"""
 
+from ..utils.address import AddressParts, ParsedAddress, normalize_component, parse_address, tokenize_address
 from ..utils.config import ConfigError, ConfigManager
+from ..utils.gazetteer import Gazetteer, GazetteerError, GazetteerMatch, build_gazetteer, build_gazetteer_from_csv
+from ..utils.geocode_cache import GeocodeCache, GeocodeCacheStats, GeocodeEntry
 from ..utils.geocoding import Geocoder, GeocodingError
+from ..utils.geohash import encode_geohash, geohash_bounds, tile_center
 from ..utils.logger import logger
+from ..utils.metrics import CallRecord, HistogramSink, Instrumentation, LoggingSink, MetricsSink, PrometheusSink
+from ..utils.projection import twd97_to_wgs84, twd97_to_wgs84_many, wgs84_to_twd97
+from ..utils.rate_limit import RateLimiter
 from ..utils.route_analyzer import CollectionPointRecommendation, RouteAnalyzer, RouteRecommendation
 
 __all__ = [
@@ -11,6 +18,32 @@ __all__ = [
     "logger",
     "Geocoder",
     "GeocodingError",
+    "GeocodeCache",
+    "GeocodeCacheStats",
+    "GeocodeEntry",
+    "Gazetteer",
+    "GazetteerError",
+    "GazetteerMatch",
+    "AddressParts",
+    "parse_address",
+    "normalize_component",
+    "ParsedAddress",
+    "tokenize_address",
+    "build_gazetteer",
+    "build_gazetteer_from_csv",
+    "twd97_to_wgs84",
+    "twd97_to_wgs84_many",
+    "wgs84_to_twd97",
+    "RateLimiter",
+    "encode_geohash",
+    "geohash_bounds",
+    "tile_center",
+    "CallRecord",
+    "Instrumentation",
+    "MetricsSink",
+    "HistogramSink",
+    "PrometheusSink",
+    "LoggingSink",
     "RouteAnalyzer",
     "RouteRecommendation",
     "CollectionPointRecommendation",
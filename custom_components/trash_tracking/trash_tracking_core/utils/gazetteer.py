@@ -0,0 +1,279 @@
+"""Offline Address Gazetteer"""
+
+import csv
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..utils.address import AddressParts, normalize_component, parse_address
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE places (
+    key TEXT PRIMARY KEY,
+    level TEXT NOT NULL,
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    points INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+# CSV header aliases (English and the national address-point open data columns)
+_COLUMNS = {
+    "district": ("district", "鄉鎮市區"),
+    "road": ("road", "街路段", "街道"),
+    "section": ("section", "段"),
+    "lane": ("lane", "巷"),
+    "alley": ("alley", "弄"),
+    "number": ("number", "號"),
+    "lat": ("lat", "latitude", "緯度"),
+    "lng": ("lng", "lon", "longitude", "經度"),
+}
+
+
+class GazetteerError(Exception):
+    """Gazetteer index error"""
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    """Location of an address found in the gazetteer"""
+
+    lat: float
+    lng: float
+    level: str
+    points: int
+    exact: bool
+
+    @property
+    def coordinates(self) -> Tuple[float, float]:
+        """(latitude, longitude)"""
+        return (self.lat, self.lng)
+
+
+class Gazetteer:
+    """
+    Read-only offline address index.
+
+    The index stores one averaged location per address at every level
+    (number, alley, lane, road section, road), so a lookup is a handful of
+    primary-key probes from the most specific level down. Addresses without a
+    district match only roads that exist in a single district.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open a gazetteer index
+
+        Args:
+            db_path: Index built by build_gazetteer
+
+        Raises:
+            GazetteerError: When the file is missing or not a gazetteer index
+        """
+        if not Path(db_path).is_file():
+            raise GazetteerError(f"Gazetteer index not found: {db_path}")
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+        try:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.DatabaseError as e:
+            self._conn.close()
+            raise GazetteerError(f"Not a gazetteer index: {db_path} ({e})")
+
+        if meta.get("version") != FORMAT_VERSION:
+            self._conn.close()
+            raise GazetteerError(f"Unsupported gazetteer version {meta.get('version')!r}: {db_path}")
+
+        self.points = int(meta.get("points", 0))
+        logger.info("Gazetteer loaded: %s (%d address points)", db_path, self.points)
+
+    def lookup(self, address: str) -> Optional[GazetteerMatch]:
+        """
+        Find the location of an address
+
+        Args:
+            address: Address string (cleaned or raw)
+
+        Returns:
+            Optional[GazetteerMatch]: Most specific match, None when the road is unknown
+        """
+        parts = parse_address(address)
+        levels = parts.levels()
+
+        with self._lock:
+            for level in levels:
+                row = self._conn.execute(
+                    "SELECT lat, lng, points FROM places WHERE key = ?", (parts.key(level),)
+                ).fetchone()
+                if row is not None:
+                    return GazetteerMatch(lat=row[0], lng=row[1], level=level, points=row[2], exact=level == levels[0])
+        return None
+
+    def __len__(self) -> int:
+        """Number of indexed address points"""
+        return self.points
+
+    def close(self) -> None:
+        """Close the index"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "Gazetteer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        """Return string representation of gazetteer"""
+        return f"Gazetteer({self.db_path})"
+
+
+def build_gazetteer(rows: Iterable[Dict[str, str]], db_path: str) -> int:
+    """
+    Compile address points into a gazetteer index
+
+    Each row needs ``road``, ``lat`` and ``lng``; ``district``, ``section``,
+    ``lane``, ``alley`` and ``number`` are optional. A road value that still
+    contains its section (e.g. "民生路二段") is split automatically. Rows that
+    cannot be parsed are skipped. An existing index at ``db_path`` is replaced.
+
+    Args:
+        rows: Address points
+        db_path: Output index path
+
+    Returns:
+        int: Number of address points indexed
+    """
+    sums: Dict[Tuple[str, str], List[float]] = {}
+    road_districts: Dict[str, Set[str]] = {}
+    points = 0
+
+    for row in rows:
+        parsed = _row_to_point(row)
+        if parsed is None:
+            continue
+        parts, lat, lng = parsed
+        points += 1
+
+        for level in parts.levels():
+            for district in {parts.district, ""}:
+                entry = sums.setdefault((level, parts.key(level, district)), [0.0, 0.0, 0])
+                entry[0] += lat
+                entry[1] += lng
+                entry[2] += 1
+        road_districts.setdefault(parts.key("road", ""), set()).add(parts.district)
+
+    ambiguous_roads = {key for key, districts in road_districts.items() if len(districts) > 1}
+
+    path = Path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT INTO places (key, level, lat, lng, points) VALUES (?, ?, ?, ?, ?)",
+            (
+                (key, level, lat_sum / count, lng_sum / count, count)
+                for (level, key), (lat_sum, lng_sum, count) in sums.items()
+                if not (key.startswith("|") and _road_key(key) in ambiguous_roads)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [("version", FORMAT_VERSION), ("points", str(points)), ("built_at", str(int(time.time())))],
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    tmp_path.replace(path)
+    logger.info("Gazetteer built: %s (%d address points, %d keys)", db_path, points, len(sums))
+    return points
+
+
+def build_gazetteer_from_csv(csv_path: str, db_path: str, encoding: str = "utf-8-sig") -> int:
+    """
+    Compile a CSV of address points into a gazetteer index
+
+    Column headers may be English (district, road, section, lane, alley, number,
+    lat, lng) or the Chinese headers of the national address-point open data
+    (鄉鎮市區, 街路段, 巷, 弄, 號, 緯度, 經度).
+
+    Args:
+        csv_path: Input CSV file
+        db_path: Output index path
+        encoding: CSV encoding
+
+    Returns:
+        int: Number of address points indexed
+    """
+    with open(csv_path, "r", encoding=encoding, newline="") as f:
+        return build_gazetteer(_normalize_rows(csv.DictReader(f)), db_path)
+
+
+def _normalize_rows(reader: "csv.DictReader[str]") -> Iterator[Dict[str, str]]:
+    """Map CSV header aliases onto the canonical column names"""
+    fieldnames = reader.fieldnames or []
+    mapping = {}
+    for column, aliases in _COLUMNS.items():
+        for name in fieldnames:
+            if name.strip().lower() in aliases:
+                mapping[column] = name
+                break
+
+    missing = {"road", "lat", "lng"} - mapping.keys()
+    if missing:
+        raise GazetteerError(f"CSV is missing required column(s): {', '.join(sorted(missing))}")
+
+    for row in reader:
+        yield {column: (row.get(name) or "") for column, name in mapping.items()}
+
+
+def _row_to_point(row: Dict[str, str]) -> Optional[Tuple[AddressParts, float, float]]:
+    """Parse one address point row, None when unusable"""
+    try:
+        lat = float(row["lat"])
+        lng = float(row["lng"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    road_parts = parse_address(row.get("road", ""))
+    if not road_parts.road:
+        return None
+
+    def component(level: str) -> str:
+        return normalize_component(level, row.get(level) or "")
+
+    parts = AddressParts(
+        district=(row.get("district") or "").strip(),
+        road=road_parts.road,
+        section=component("section") or road_parts.section,
+        lane=component("lane"),
+        alley=component("alley"),
+        number=component("number"),
+    )
+    return parts, lat, lng
+
+
+def _road_key(key: str) -> str:
+    """District-less road-level key of any key"""
+    return "|".join(key.split("|")[:2] + [""] * 4)
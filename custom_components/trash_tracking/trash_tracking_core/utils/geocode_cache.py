@@ -0,0 +1,232 @@
+"""Persistent Geocoding Cache"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    address TEXT PRIMARY KEY,
+    lat REAL,
+    lng REAL,
+    error TEXT,
+    cached_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class GeocodeEntry:
+    """Cached geocoding result: coordinates, or the error of a failed lookup"""
+
+    address: str
+    coordinates: Optional[Tuple[float, float]]
+    error: Optional[str]
+    cached_at: float
+
+    @property
+    def is_failure(self) -> bool:
+        """True for a negatively cached (failed) lookup"""
+        return self.coordinates is None
+
+
+@dataclass(frozen=True)
+class GeocodeCacheStats:
+    """Lookup counters of a geocode cache"""
+
+    hits: int
+    negative_hits: int
+    misses: int
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups"""
+        return self.hits + self.negative_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 without lookups)"""
+        return (self.hits + self.negative_hits) / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class GeocodeCache:
+    """
+    SQLite-backed cache of geocoding results.
+
+    Keys are normalized cleaned addresses (``ParsedAddress.key`` of the
+    ``Geocoder._clean_address`` output), so spelling variants such as "二段"
+    and "2段" or full-width digits share an entry. Successful lookups are
+    kept for ``ttl_seconds``; failed lookups are cached for the much shorter
+    ``negative_ttl_seconds`` so an address that no provider knows does not walk
+    the whole provider chain on every retry, while a transient outage heals quickly.
+    """
+
+    DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+    DEFAULT_NEGATIVE_TTL_SECONDS = 15 * 60
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        """
+        Initialize geocode cache
+
+        Args:
+            db_path: SQLite database path (parent directories are created; ":memory:" for a process-local cache)
+            ttl_seconds: Lifetime of successful lookups
+            negative_ttl_seconds: Lifetime of failed lookups (0 disables negative caching)
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if negative_ttl_seconds < 0:
+            raise ValueError("negative_ttl_seconds must not be negative")
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+
+        logger.debug("GeocodeCache initialized: db=%s", db_path)
+
+    @property
+    def stats(self) -> GeocodeCacheStats:
+        """Lookup counters since the cache was opened"""
+        with self._lock:
+            return GeocodeCacheStats(hits=self._hits, negative_hits=self._negative_hits, misses=self._misses)
+
+    def get(self, address: str, now: Optional[float] = None) -> Optional[GeocodeEntry]:
+        """
+        Look up an address
+
+        Args:
+            address: Normalized cleaned address (cache key)
+            now: Current epoch time (default: time.time())
+
+        Returns:
+            Optional[GeocodeEntry]: Unexpired entry, None on a miss
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lat, lng, error, cached_at FROM geocode WHERE address = ?", (address,)
+            ).fetchone()
+
+            entry = None
+            if row is not None:
+                lat, lng, error, cached_at = row
+                failed = lat is None or lng is None
+                ttl = self.negative_ttl_seconds if failed else self.ttl_seconds
+                if now - cached_at < ttl:
+                    entry = GeocodeEntry(address, None if failed else (lat, lng), error, cached_at)
+
+            if entry is None:
+                self._misses += 1
+            elif entry.is_failure:
+                self._negative_hits += 1
+            else:
+                self._hits += 1
+
+        return entry
+
+    def put(self, address: str, coordinates: Tuple[float, float], now: Optional[float] = None) -> None:
+        """
+        Store a successful lookup
+
+        Args:
+            address: Normalized cleaned address (cache key)
+            coordinates: (latitude, longitude)
+            now: Current epoch time (default: time.time())
+        """
+        lat, lng = coordinates
+        self._write(address, lat, lng, None, now)
+
+    def put_failure(self, address: str, error: str, now: Optional[float] = None) -> None:
+        """
+        Store a failed lookup (skipped when negative caching is disabled)
+
+        Args:
+            address: Normalized cleaned address (cache key)
+            error: Error message to re-raise on hits
+            now: Current epoch time (default: time.time())
+        """
+        if self.negative_ttl_seconds > 0:
+            self._write(address, None, None, error, now)
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """
+        Delete expired entries
+
+        Args:
+            now: Current epoch time (default: time.time())
+
+        Returns:
+            int: Number of deleted entries
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM geocode WHERE (lat IS NULL AND cached_at <= ?) OR (lat IS NOT NULL AND cached_at <= ?)",
+                (now - self.negative_ttl_seconds, now - self.ttl_seconds),
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete all entries and reset the counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM geocode")
+            self._conn.commit()
+            self._hits = self._negative_hits = self._misses = 0
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+
+    def _write(
+        self, address: str, lat: Optional[float], lng: Optional[float], error: Optional[str], now: Optional[float]
+    ) -> None:
+        """Insert or replace one entry"""
+        cached_at = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode (address, lat, lng, error, cached_at) VALUES (?, ?, ?, ?, ?)",
+                (address, lat, lng, error, cached_at),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def __str__(self) -> str:
+        """Return string representation of cache"""
+        return f"GeocodeCache({self.db_path})"
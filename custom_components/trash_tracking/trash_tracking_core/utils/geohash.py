@@ -0,0 +1,98 @@
+"""Geohash Tiles"""
+
+from typing import Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {char: index for index, char in enumerate(_BASE32)}
+
+
+def encode_geohash(lat: float, lng: float, precision: int = 7) -> str:
+    """
+    Encode a location as a geohash
+
+    Args:
+        lat: Latitude in degrees
+        lng: Longitude in degrees
+        precision: Number of characters (7 is a tile of about 150 x 150 m in Taiwan)
+
+    Returns:
+        str: Geohash of the tile containing the location
+    """
+    if precision < 1:
+        raise ValueError("precision must be at least 1")
+
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+
+    while len(chars) < precision:
+        # Bits alternate between longitude and latitude, starting with longitude
+        interval, coordinate = (lng_range, lng) if even else (lat_range, lat)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+
+    return "".join(chars)
+
+
+def geohash_bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """
+    Get the bounding box of a geohash tile
+
+    Args:
+        geohash: Geohash string
+
+    Returns:
+        tuple: (south, west, north, east) in degrees
+
+    Raises:
+        ValueError: If the geohash contains invalid characters
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for char in geohash.lower():
+        if char not in _DECODE:
+            raise ValueError(f"Invalid geohash character: {char!r}")
+        value = _DECODE[char]
+        for shift in range(4, -1, -1):
+            interval = lng_range if even else lat_range
+            middle = (interval[0] + interval[1]) / 2
+            if value >> shift & 1:
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def tile_center(lat: float, lng: float, precision: int = 7) -> Tuple[float, float]:
+    """
+    Snap a location to the center of its geohash tile
+
+    Args:
+        lat: Latitude in degrees
+        lng: Longitude in degrees
+        precision: Geohash precision (see encode_geohash)
+
+    Returns:
+        tuple: (latitude, longitude) of the tile center
+    """
+    south, west, north, east = geohash_bounds(encode_geohash(lat, lng, precision))
+    return (south + north) / 2, (west + east) / 2
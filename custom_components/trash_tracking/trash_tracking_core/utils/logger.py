@@ -1,50 +1,174 @@
 """Logging Module"""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
+
+ROOT_LOGGER = "trash_tracking"
+
+_PACKAGE = "trash_tracking_core."
+
+_listener: Optional[QueueListener] = None
 
 
 def setup_logger(
-    name: str = "trash_tracking", log_level: str = "INFO", log_file: Optional[str] = None
+    name: str = ROOT_LOGGER,
+    log_level: Optional[str] = None,
+    log_file: Optional[str] = None,
+    module_levels: Optional[Mapping[str, str]] = None,
 ) -> logging.Logger:
     """
     Configure and return logger instance
 
+    Handlers are attached once; later calls only change levels. Levels are
+    enforced on the loggers (handlers accept everything), so a module logger
+    set to DEBUG is not filtered out again by an INFO console handler.
+
     Args:
         name: Logger name
-        log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL); default INFO
+            on first setup, unchanged afterwards
         log_file: Log file path, if None only outputs to console
+        module_levels: Per-module log levels, see set_module_levels
 
     Returns:
         logging.Logger: Configured logger instance
     """
     logger = logging.getLogger(name)
 
-    if logger.handlers:
-        return logger
+    if not logger.handlers:
+        logger.setLevel(_level(log_level or "INFO"))
 
-    level = getattr(logging, log_level.upper(), logging.INFO)
-    logger.setLevel(level)
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
 
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        if log_file:
+            log_path = Path(log_file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
+    elif log_level is not None:
+        logger.setLevel(_level(log_level))
 
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    if module_levels:
+        set_module_levels(module_levels)
 
     return logger
 
 
+def get_logger(module_name: str) -> logging.Logger:
+    """
+    Get the logger of a package module
+
+    Module loggers are children of the package logger ("trash_tracking"), so
+    they share its handlers, and their level can be set on its own, e.g.
+    "trash_tracking.core.point_matcher" for core/point_matcher.py.
+
+    Args:
+        module_name: Module ``__name__``
+
+    Returns:
+        logging.Logger: Module logger
+    """
+    _, found, relative = module_name.rpartition(_PACKAGE)
+    return logging.getLogger(f"{ROOT_LOGGER}.{relative}" if found else ROOT_LOGGER)
+
+
+def set_module_levels(levels: Mapping[str, str]) -> None:
+    """
+    Set the log level of individual modules
+
+    Args:
+        levels: Level by module, relative to the package (e.g. {"core.point_matcher": "DEBUG"});
+            "NOTSET" makes a module follow the package level again
+    """
+    for module, level in levels.items():
+        logging.getLogger(f"{ROOT_LOGGER}.{module}").setLevel(_level(level))
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves all formatting to the listener thread
+
+    The standard QueueHandler merges the message and its arguments before
+    enqueueing; here the record is enqueued untouched, so the logging thread
+    only pays for creating the record. Arguments are rendered on the listener
+    thread, so they must not be mutated after the call (the package logs
+    strings, numbers and frozen objects).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_queue_logging(name: str = ROOT_LOGGER) -> QueueListener:
+    """
+    Move the handlers of a logger behind a queue served by a background thread
+
+    Logging calls then return as soon as the record is queued, instead of
+    waiting for console or file I/O. Calling it again returns the running listener.
+
+    Args:
+        name: Logger whose handlers to move
+
+    Returns:
+        QueueListener: The running listener
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    logger = logging.getLogger(name)
+    handlers = tuple(logger.handlers)
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(_DeferredQueueHandler(records))
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_queue_logging, name)
+    return _listener
+
+
+def stop_queue_logging(name: str = ROOT_LOGGER) -> None:
+    """
+    Flush queued records and give the handlers back to the logger
+
+    Args:
+        name: Logger passed to start_queue_logging
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    listener, _listener = _listener, None
+    listener.stop()
+
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+    atexit.unregister(stop_queue_logging)
+
+
+def _level(name: str) -> int:
+    """Convert a level name to its value (unknown names mean INFO)"""
+    return getattr(logging, name.upper(), logging.INFO)
+
+
 logger = setup_logger()
@@ -0,0 +1,415 @@
+"""Upstream Call Instrumentation"""
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Outcomes of a cache lookup: served from the cache, fetched upstream, or
+# answered by an upstream request another caller already had in flight
+CACHE_RESULTS = ("hit", "miss", "coalesced")
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0)
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """
+    One upstream request attempt
+
+    Attributes:
+        service: Upstream service ("ntpc", "nlsc", "nominatim", "tgos")
+        endpoint: Endpoint name (e.g. "GetAroundPoints")
+        attempt: 1-based attempt number (retries count up)
+        status: "ok", "empty" (answered without a result), "http_<code>", "timeout",
+            "network_error", "parse_error" or "error"
+        latency_ms: Wall time of the attempt, including parsing
+        bytes: Response body size
+        parse_ms: Time spent decoding the response into models
+    """
+
+    service: str
+    endpoint: str
+    attempt: int
+    status: str
+    latency_ms: float
+    bytes: int = 0
+    parse_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "service": self.service,
+            "endpoint": self.endpoint,
+            "attempt": self.attempt,
+            "status": self.status,
+            "latency_ms": round(self.latency_ms, 1),
+            "bytes": self.bytes,
+            "parse_ms": round(self.parse_ms, 2),
+        }
+
+
+class MetricsSink:
+    """Receives instrumentation events; subclasses override what they need"""
+
+    def record_call(self, record: CallRecord) -> None:
+        """Called after every upstream request attempt"""
+
+    def record_cache(self, service: str, endpoint: str, result: str) -> None:
+        """Called after every cache lookup (result is one of CACHE_RESULTS)"""
+
+
+class CallTimer:
+    """
+    Times one upstream request attempt (see Instrumentation.call)
+
+    The caller fills in ``bytes`` and, optionally, ``status``; when the block
+    raises and no status was set, the status is derived from the exception.
+    """
+
+    __slots__ = ("_instrumentation", "service", "endpoint", "attempt", "status", "bytes", "parse_ms", "_started")
+
+    def __init__(self, instrumentation: "Instrumentation", service: str, endpoint: str, attempt: int):
+        self._instrumentation = instrumentation
+        self.service = service
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.status: Optional[str] = None
+        self.bytes = 0
+        self.parse_ms = 0.0
+        self._started = 0.0
+
+    @contextmanager
+    def parsing(self) -> Iterator[None]:
+        """Time the response decoding done inside the block"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse_ms += (time.perf_counter() - started) * 1000
+
+    def __enter__(self) -> "CallTimer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if not self._instrumentation.sinks:
+            return
+        latency_ms = (time.perf_counter() - self._started) * 1000
+        status = self.status or ("ok" if exc is None else _status_of(exc))
+        self._instrumentation.emit_call(
+            CallRecord(self.service, self.endpoint, self.attempt, status, latency_ms, self.bytes, self.parse_ms)
+        )
+
+
+class Instrumentation:
+    """
+    Dispatches upstream call and cache events to registered sinks
+
+    Without sinks, events are dropped before any record is built, so
+    instrumented code pays only for two clock reads per request.
+    """
+
+    def __init__(self) -> None:
+        self._sinks: Tuple[MetricsSink, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def sinks(self) -> Tuple[MetricsSink, ...]:
+        """Registered sinks"""
+        return self._sinks
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        """Register a sink (registering the same sink twice has no effect)"""
+        with self._lock:
+            if sink not in self._sinks:
+                self._sinks = self._sinks + (sink,)
+
+    def remove_sink(self, sink: MetricsSink) -> None:
+        """Unregister a sink"""
+        with self._lock:
+            self._sinks = tuple(s for s in self._sinks if s is not sink)
+
+    def call(self, service: str, endpoint: str, attempt: int = 1) -> CallTimer:
+        """
+        Time an upstream request attempt
+
+        Usage:
+            with metrics.call("ntpc", "GetAroundPoints", attempt) as call:
+                response = session.post(...)
+                call.bytes = len(response.content)
+                with call.parsing():
+                    data = response.json()
+
+        Args:
+            service: Upstream service
+            endpoint: Endpoint name
+            attempt: 1-based attempt number
+
+        Returns:
+            CallTimer: Context manager recording the attempt on exit
+        """
+        return CallTimer(self, service, endpoint, attempt)
+
+    def cache(self, service: str, endpoint: str, result: str) -> None:
+        """
+        Record a cache lookup
+
+        Args:
+            service: Service whose responses are cached
+            endpoint: Endpoint name
+            result: One of CACHE_RESULTS
+        """
+        for sink in self._sinks:
+            sink.record_cache(service, endpoint, result)
+
+    def emit_call(self, record: CallRecord) -> None:
+        """Send a finished call to every sink"""
+        for sink in self._sinks:
+            sink.record_call(record)
+
+
+class _CallStats:
+    """Accumulated calls of one service endpoint"""
+
+    __slots__ = ("statuses", "buckets", "latency_sum_ms", "latency_max_ms", "bytes", "parse_ms", "retries")
+
+    def __init__(self) -> None:
+        self.statuses: Dict[str, int] = {}
+        # One count per bucket of LATENCY_BUCKETS_MS, plus the overflow bucket
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.bytes = 0
+        self.parse_ms = 0.0
+        self.retries = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets)
+
+    def add(self, record: CallRecord) -> None:
+        self.statuses[record.status] = self.statuses.get(record.status, 0) + 1
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, record.latency_ms)] += 1
+        self.latency_sum_ms += record.latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, record.latency_ms)
+        self.bytes += record.bytes
+        self.parse_ms += record.parse_ms
+        if record.attempt > 1:
+            self.retries += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of calls (None when empty or in overflow)"""
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return None
+
+
+class HistogramSink(MetricsSink):
+    """In-memory counters and latency histograms per service endpoint"""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[str, str], _CallStats] = {}
+        self._cache: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record_call(self, record: CallRecord) -> None:
+        with self._lock:
+            stats = self._calls.get((record.service, record.endpoint))
+            if stats is None:
+                stats = self._calls[(record.service, record.endpoint)] = _CallStats()
+            stats.add(record)
+
+    def record_cache(self, service: str, endpoint: str, result: str) -> None:
+        with self._lock:
+            counts = self._cache.setdefault((service, endpoint), dict.fromkeys(CACHE_RESULTS, 0))
+            counts[result] = counts.get(result, 0) + 1
+
+    def reset(self) -> None:
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._calls.clear()
+            self._cache.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Summarize the recorded events
+
+        Returns:
+            dict: ``{"calls": {...}, "cache": {...}}`` keyed by "service/endpoint"
+        """
+        with self._lock:
+            calls = {}
+            for (service, endpoint), stats in sorted(self._calls.items()):
+                count = stats.count
+                calls[f"{service}/{endpoint}"] = {
+                    "count": count,
+                    "statuses": dict(stats.statuses),
+                    "retries": stats.retries,
+                    "latency_ms": {
+                        "mean": round(stats.latency_sum_ms / count, 1),
+                        "p50": stats.percentile(0.5),
+                        "p95": stats.percentile(0.95),
+                        "max": round(stats.latency_max_ms, 1),
+                    },
+                    "bytes": stats.bytes,
+                    "parse_ms": round(stats.parse_ms, 1),
+                }
+            cache = {
+                f"{service}/{endpoint}": dict(counts) for (service, endpoint), counts in sorted(self._cache.items())
+            }
+        return {"calls": calls, "cache": cache}
+
+
+class PrometheusSink(HistogramSink):
+    """HistogramSink that renders its counters in the Prometheus text exposition format"""
+
+    def __init__(self, prefix: str = "trash_tracking"):
+        """
+        Initialize sink
+
+        Args:
+            prefix: Metric name prefix
+        """
+        super().__init__()
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """
+        Render all metrics (text format 0.0.4, as served on a /metrics endpoint)
+
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            calls = sorted(self._calls.items())
+            cache = sorted(self._cache.items())
+            return self._render(calls, cache)
+
+    def _render(
+        self, calls: List[Tuple[Tuple[str, str], _CallStats]], cache: List[Tuple[Tuple[str, str], Dict[str, int]]]
+    ) -> str:
+        """Format the counters (called with the lock held)"""
+        p = self.prefix
+        lines: List[str] = []
+
+        lines += [f"# HELP {p}_upstream_requests_total Upstream request attempts by outcome"]
+        lines += [f"# TYPE {p}_upstream_requests_total counter"]
+        for (service, endpoint), stats in calls:
+            for status, count in sorted(stats.statuses.items()):
+                labels = _labels(service=service, endpoint=endpoint, status=status)
+                lines.append(f"{p}_upstream_requests_total{labels} {count}")
+
+        lines += [f"# HELP {p}_upstream_retries_total Upstream request attempts after the first"]
+        lines += [f"# TYPE {p}_upstream_retries_total counter"]
+        for (service, endpoint), stats in calls:
+            lines.append(f"{p}_upstream_retries_total{_labels(service=service, endpoint=endpoint)} {stats.retries}")
+
+        lines += [f"# HELP {p}_upstream_latency_seconds Upstream request latency"]
+        lines += [f"# TYPE {p}_upstream_latency_seconds histogram"]
+        for (service, endpoint), stats in calls:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS + (float("inf"),), stats.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound / 1000)
+                labels = _labels(service=service, endpoint=endpoint, le=le)
+                lines.append(f"{p}_upstream_latency_seconds_bucket{labels} {cumulative}")
+            labels = _labels(service=service, endpoint=endpoint)
+            lines.append(f"{p}_upstream_latency_seconds_sum{labels} {_number(stats.latency_sum_ms / 1000)}")
+            lines.append(f"{p}_upstream_latency_seconds_count{labels} {stats.count}")
+
+        lines += [f"# HELP {p}_upstream_response_bytes_total Upstream response body bytes"]
+        lines += [f"# TYPE {p}_upstream_response_bytes_total counter"]
+        for (service, endpoint), stats in calls:
+            lines.append(
+                f"{p}_upstream_response_bytes_total{_labels(service=service, endpoint=endpoint)} {stats.bytes}"
+            )
+
+        lines += [f"# HELP {p}_upstream_parse_seconds_total Time spent decoding upstream responses"]
+        lines += [f"# TYPE {p}_upstream_parse_seconds_total counter"]
+        for (service, endpoint), stats in calls:
+            labels = _labels(service=service, endpoint=endpoint)
+            lines.append(f"{p}_upstream_parse_seconds_total{labels} {_number(stats.parse_ms / 1000)}")
+
+        lines += [f"# HELP {p}_cache_lookups_total Response cache lookups by result"]
+        lines += [f"# TYPE {p}_cache_lookups_total counter"]
+        for (service, endpoint), counts in cache:
+            for result, count in counts.items():
+                labels = _labels(service=service, endpoint=endpoint, result=result)
+                lines.append(f"{p}_cache_lookups_total{labels} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class LoggingSink(MetricsSink):
+    """Logs every event through the package logger"""
+
+    def __init__(self, level: int = logging.DEBUG):
+        """
+        Initialize sink
+
+        Args:
+            level: Log level of the event messages
+        """
+        self.level = level
+
+    def record_call(self, record: CallRecord) -> None:
+        logger.log(
+            self.level,
+            "%s %s attempt %d: %s in %.1f ms (%d bytes, parse %.1f ms)",
+            record.service,
+            record.endpoint,
+            record.attempt,
+            record.status,
+            record.latency_ms,
+            record.bytes,
+            record.parse_ms,
+        )
+
+    def record_cache(self, service: str, endpoint: str, result: str) -> None:
+        logger.log(self.level, "%s %s cache %s", service, endpoint, result)
+
+
+def _status_of(exc: BaseException) -> str:
+    """Classify the exception that ended a request attempt"""
+    if isinstance(exc, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        return f"http_{exc.response.status_code}"
+    if isinstance(exc, requests.exceptions.RequestException):
+        return "network_error"
+    if isinstance(exc, ValueError):
+        return "parse_error"
+    return "error"
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels, escaping the values"""
+
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    """Format a sample value"""
+    return repr(round(value, 6))
+
+
+# Process-wide instrumentation used by the API clients and the geocoder
+metrics = Instrumentation()
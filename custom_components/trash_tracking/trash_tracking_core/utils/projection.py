@@ -0,0 +1,135 @@
+"""TWD97 TM2 Projection"""
+
+import cmath
+import math
+from typing import Any, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+# GRS80 ellipsoid, Transverse Mercator 2° zone used by TWD97 (central meridian 121°E)
+A = 6378137.0
+F = 1 / 298.257222101
+K0 = 0.9999
+LON0 = math.radians(121.0)
+FALSE_EASTING = 250000.0
+FALSE_NORTHING = 0.0
+
+# Krüger series coefficients in the third flattening n (4th order, sub-millimetre inside the zone)
+_N = F / (2 - F)
+_RECTIFYING_RADIUS = A / (1 + _N) * (1 + _N**2 / 4 + _N**4 / 64)
+_ALPHA = (
+    _N / 2 - 2 * _N**2 / 3 + 5 * _N**3 / 16 + 41 * _N**4 / 180,
+    13 * _N**2 / 48 - 3 * _N**3 / 5 + 557 * _N**4 / 1440,
+    61 * _N**3 / 240 - 103 * _N**4 / 140,
+    49561 * _N**4 / 161280,
+)
+_BETA = (
+    _N / 2 - 2 * _N**2 / 3 + 37 * _N**3 / 96 - _N**4 / 360,
+    _N**2 / 48 + _N**3 / 15 - 437 * _N**4 / 1440,
+    17 * _N**3 / 480 - 37 * _N**4 / 840,
+    4397 * _N**4 / 161280,
+)
+_DELTA = (
+    2 * _N - 2 * _N**2 / 3 - 2 * _N**3 + 116 * _N**4 / 45,
+    7 * _N**2 / 3 - 8 * _N**3 / 5 - 227 * _N**4 / 45,
+    56 * _N**3 / 15 - 136 * _N**4 / 35,
+    4279 * _N**4 / 630,
+)
+_SCALE = K0 * _RECTIFYING_RADIUS
+_CONFORMAL = 2 * math.sqrt(_N) / (1 + _N)
+
+
+def twd97_to_wgs84(x: float, y: float) -> Tuple[float, float]:
+    """
+    Convert TWD97 TM2 grid coordinates to WGS84 latitude/longitude
+
+    Exact Transverse Mercator inverse (Krüger series) on GRS80; TWD97 and
+    WGS84 agree to well below a metre, so no datum shift is applied.
+
+    Args:
+        x: Easting in metres
+        y: Northing in metres
+
+    Returns:
+        tuple: (latitude, longitude) in degrees
+    """
+    zeta = complex(y - FALSE_NORTHING, x - FALSE_EASTING) / _SCALE
+    zeta_prime = zeta - _sin_series(_BETA, cmath.sin(2 * zeta), cmath.cos(2 * zeta))
+    xi_prime, eta_prime = zeta_prime.real, zeta_prime.imag
+
+    chi = math.asin(math.sin(xi_prime) / math.cosh(eta_prime))
+    lat = chi + _sin_series(_DELTA, math.sin(2 * chi), math.cos(2 * chi))
+    lng = LON0 + math.atan2(math.sinh(eta_prime), math.cos(xi_prime))
+    return (math.degrees(lat), math.degrees(lng))
+
+
+def wgs84_to_twd97(lat: float, lng: float) -> Tuple[float, float]:
+    """
+    Convert WGS84 latitude/longitude to TWD97 TM2 grid coordinates
+
+    Args:
+        lat: Latitude in degrees
+        lng: Longitude in degrees
+
+    Returns:
+        tuple: (x, y) easting and northing in metres
+    """
+    phi = math.radians(lat)
+    dlon = math.radians(lng) - LON0
+
+    t = math.sinh(math.atanh(math.sin(phi)) - _CONFORMAL * math.atanh(_CONFORMAL * math.sin(phi)))
+    xi_prime = math.atan2(t, math.cos(dlon))
+    eta_prime = math.atanh(math.sin(dlon) / math.sqrt(1 + t * t))
+
+    zeta_prime = complex(xi_prime, eta_prime)
+    zeta = zeta_prime + _sin_series(_ALPHA, cmath.sin(2 * zeta_prime), cmath.cos(2 * zeta_prime))
+    return (FALSE_EASTING + _SCALE * zeta.imag, FALSE_NORTHING + _SCALE * zeta.real)
+
+
+def twd97_to_wgs84_many(xs: Sequence[float], ys: Sequence[float]) -> Tuple[Sequence[float], Sequence[float]]:
+    """
+    Convert many TWD97 coordinates at once
+
+    Uses NumPy when installed (arrays in, arrays out, over ten times faster
+    than calling twd97_to_wgs84 in a loop); otherwise falls back to the scalar
+    conversion and returns lists.
+
+    Args:
+        xs: Eastings in metres
+        ys: Northings in metres (same length as xs)
+
+    Returns:
+        tuple: (latitudes, longitudes) in degrees
+    """
+    if len(xs) != len(ys):
+        raise ValueError("xs and ys must have the same length")
+
+    if np is None:
+        pairs = [twd97_to_wgs84(x, y) for x, y in zip(xs, ys)]
+        return [lat for lat, _ in pairs], [lng for _, lng in pairs]
+
+    zeta = (np.asarray(ys, dtype=float) - FALSE_NORTHING + 1j * (np.asarray(xs, dtype=float) - FALSE_EASTING)) / _SCALE
+    zeta_prime = zeta - _sin_series(_BETA, np.sin(2 * zeta), np.cos(2 * zeta))
+    xi_prime, eta_prime = zeta_prime.real, zeta_prime.imag
+
+    chi = np.arcsin(np.sin(xi_prime) / np.cosh(eta_prime))
+    lat = chi + _sin_series(_DELTA, np.sin(2 * chi), np.cos(2 * chi))
+    lng = LON0 + np.arctan2(np.sinh(eta_prime), np.cos(xi_prime))
+    return np.degrees(lat), np.degrees(lng)
+
+
+def _sin_series(coefficients: Sequence[float], sin2: Any, cos2: Any) -> Any:
+    """
+    Sum c1·sin(2z) + c2·sin(4z) + ... by Clenshaw recurrence
+
+    Only sin(2z) and cos(2z) are evaluated, so the same code serves floats,
+    complex numbers (the Krüger series in ξ + iη) and NumPy arrays.
+    """
+    factor = 2 * cos2
+    b1 = b2 = 0.0
+    for c in reversed(coefficients):
+        b1, b2 = c + factor * b1 - b2, b1
+    return b1 * sin2
@@ -1,5 +1,24 @@
 """API clients for trash tracking"""
 
+from trash_tracking_core.clients.async_ntpc_api import AsyncNTPCApiClient
+from trash_tracking_core.clients.cache import ResponseCache, StripedCache
+from trash_tracking_core.clients.decoding import JSON_BACKENDS, available_json_backends, decode_around_points
 from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.clients.route_query import RouteQuery, time_filter_for
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.clients.shared_cache import SharedResponseCache
 
-__all__ = ["NTPCApiClient", "NTPCApiError"]
+__all__ = [
+    "NTPCApiClient",
+    "NTPCApiError",
+    "AsyncNTPCApiClient",
+    "SessionManager",
+    "ResponseCache",
+    "StripedCache",
+    "SharedResponseCache",
+    "RouteQuery",
+    "time_filter_for",
+    "JSON_BACKENDS",
+    "available_json_backends",
+    "decode_around_points",
+]
@@ -0,0 +1,82 @@
+"""Asynchronous New Taipei City Garbage Truck API Client"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.logger import get_logger
+from trash_tracking_core.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class AsyncNTPCApiClient:
+    """
+    asyncio front end of NTPCApiClient
+
+    Requests run on worker threads (the blocking client keeps its retries and
+    response cache), at most ``max_concurrency`` at a time. Concurrent callers
+    asking for the same query share one upstream request. An instance belongs
+    to the event loop that first uses it.
+    """
+
+    def __init__(self, client: Optional[NTPCApiClient] = None, max_concurrency: int = 4):
+        """
+        Initialize async API client
+
+        Args:
+            client: Blocking client doing the requests (default: NTPCApiClient())
+            max_concurrency: Maximum number of requests in flight
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client or NTPCApiClient()
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, "asyncio.Future[Optional[List[TruckLine]]]"] = {}
+
+    async def get_around_points(
+        self, lat: float, lng: float, time_filter: int = 0, week: Optional[int] = None
+    ) -> Optional[List[TruckLine]]:
+        """
+        Query nearby garbage trucks
+
+        Cancelling a caller does not cancel a request other callers are waiting for.
+
+        Args:
+            lat: Latitude of query location
+            lng: Longitude of query location
+            time_filter: Time period filter (see NTPCApiClient.get_around_points)
+            week: Day of week filter (0=Sunday, ..., 6=Saturday), None for today
+
+        Returns:
+            List[TruckLine]: List of truck routes
+
+        Raises:
+            NTPCApiError: When all retries fail
+        """
+        key = NTPCApiClient._get_cache_key(lat, lng, time_filter, week)
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._fetch(lat, lng, time_filter, week))
+            self._inflight[key] = request
+            request.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            logger.debug("Joining in-flight request for %s", key)
+            metrics.cache("ntpc", "GetAroundPoints", "coalesced")
+        return await asyncio.shield(request)
+
+    async def _fetch(self, lat: float, lng: float, time_filter: int, week: Optional[int]) -> Optional[List[TruckLine]]:
+        """Run one blocking request on a worker thread"""
+        async with self._semaphore:
+            return await asyncio.to_thread(self.client.get_around_points, lat, lng, time_filter, week)
+
+    def _finish(self, key: str, request: "asyncio.Future[Optional[List[TruckLine]]]") -> None:
+        """Forget a finished request (its error is then owned by the callers that awaited it)"""
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
+        if not request.cancelled():
+            # Mark the error as retrieved even if every caller was cancelled meanwhile
+            request.exception()
@@ -0,0 +1,111 @@
+"""Response Cache"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class ResponseCache(ABC):
+    """
+    Cache backend interface of the API clients
+
+    Values are stored with the time they were stored; every read states the
+    oldest age it accepts.
+    """
+
+    @abstractmethod
+    def get(self, key: str, max_age: float) -> Optional[Any]:
+        """
+        Get a value stored at most ``max_age`` seconds ago
+
+        Args:
+            key: Cache key
+            max_age: Oldest acceptable entry age in seconds
+
+        Returns:
+            The cached value, or None when missing or too old
+        """
+
+    @abstractmethod
+    def put(self, key: str, value: Any) -> None:
+        """Store a value"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry"""
+
+    @contextmanager
+    def lease(self, key: str, wait: float) -> Iterator[bool]:
+        """
+        Hold the right to fill ``key`` while the block runs
+
+        Callers that miss the cache take the lease, check the cache again and
+        only then fetch, so a backend shared by several processes downloads a
+        response once. The default implementation does not coordinate at all.
+
+        Args:
+            key: Cache key about to be filled
+            wait: Longest time to wait for another holder, after which the
+                block runs without the lease
+
+        Yields:
+            bool: True when the lease is held
+        """
+        yield True
+
+
+class StripedCache(ResponseCache):
+    """
+    Thread-safe in-memory cache with per-read age limits
+
+    Keys are spread over independently locked stripes, so threads working on
+    different keys rarely wait for each other. Entries older than the age a
+    reader accepts are dropped when read. Leases do not coordinate (concurrent
+    queries within a process are coalesced by AsyncNTPCApiClient instead).
+    """
+
+    def __init__(self, stripes: int = 16, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize cache
+
+        Args:
+            stripes: Number of independently locked partitions
+            clock: Monotonic time source in seconds
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+
+        self._clock = clock
+        self._stripes: List[Tuple[threading.Lock, Dict[str, Tuple[Any, float]]]] = [
+            (threading.Lock(), {}) for _ in range(stripes)
+        ]
+
+    def get(self, key: str, max_age: float) -> Optional[Any]:
+        lock, entries = self._stripe(key)
+        with lock:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if self._clock() - stored_at > max_age:
+                del entries[key]
+                return None
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        lock, entries = self._stripe(key)
+        with lock:
+            entries[key] = (value, self._clock())
+
+    def clear(self) -> None:
+        for lock, entries in self._stripes:
+            with lock:
+                entries.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for _, entries in self._stripes)
+
+    def _stripe(self, key: str) -> Tuple[threading.Lock, Dict[str, Tuple[Any, float]]]:
+        return self._stripes[hash(key) % len(self._stripes)]
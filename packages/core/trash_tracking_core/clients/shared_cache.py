@@ -0,0 +1,180 @@
+"""Cross-process Response Cache"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+from trash_tracking_core.clients.cache import ResponseCache
+from trash_tracking_core.models.codec import CodecError, pack_truck_lines, unpack_truck_lines
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    stored_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def encode_truck_lines(lines: List[TruckLine]) -> str:
+    """Serialize GetAroundPoints results in the API's own format"""
+    return json.dumps([line.to_api_dict() for line in lines], ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_truck_lines(text: str) -> List[TruckLine]:
+    """Inverse of encode_truck_lines"""
+    return [TruckLine.from_dict(line) for line in json.loads(text)]
+
+
+class SharedResponseCache(ResponseCache):
+    """
+    Response cache in an SQLite file shared by several processes
+
+    The CLI, a standalone tracker and Home Assistant on the same machine can
+    point at the same file, so a location polled by one of them is served
+    from the cache to the others. The database runs in WAL mode (readers do
+    not block the writer), each thread uses its own connection, and ages are
+    measured on the wall clock since they are compared across processes.
+
+    Leases are rows with an owner and an expiry: a process that misses the
+    cache takes the lease for the key, and the others wait until it is
+    released (or expires, if its holder died) and then find the response in
+    the cache.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encode: Callable[[Any], Union[str, bytes]] = pack_truck_lines,
+        decode: Callable[[Any], Any] = unpack_truck_lines,
+        retention: float = 300.0,
+        lease_seconds: float = 30.0,
+        poll_interval: float = 0.05,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (or create) a shared cache
+
+        Args:
+            path: SQLite database file
+            encode: Serializes a cached value (binary route snapshots by default;
+                encode_truck_lines stores readable JSON instead)
+            decode: Inverse of encode
+            retention: Entries older than this many seconds are purged on writes
+            lease_seconds: Lifetime of a lease whose holder never releases it
+            poll_interval: Seconds between attempts to take a held lease
+            clock: Wall clock in seconds (shared by all processes)
+        """
+        self.path = path
+        self.retention = retention
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._encode = encode
+        self._decode = decode
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+    def get(self, key: str, max_age: float) -> Optional[Any]:
+        row = self._connection().execute("SELECT value, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or self._clock() - row[1] > max_age:
+            return None
+        try:
+            return self._decode(row[0])
+        except (CodecError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Dropping undecodable cache entry %s: %s", key, e)
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        now = self._clock()
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)",
+            (key, self._encode(value), now),
+        )
+        connection.execute("DELETE FROM responses WHERE stored_at < ?", (now - self.retention,))
+
+    def clear(self) -> None:
+        connection = self._connection()
+        connection.execute("DELETE FROM responses")
+        connection.execute("DELETE FROM leases")
+
+    @contextmanager
+    def lease(self, key: str, wait: float) -> Iterator[bool]:
+        owner = uuid.uuid4().hex
+        deadline = self._clock() + wait
+        held = self._try_lease(key, owner)
+        while not held and self._clock() < deadline:
+            time.sleep(self.poll_interval)
+            held = self._try_lease(key, owner)
+        if not held:
+            logger.debug("Lease on %s still held after %.1fs, fetching anyway", key, wait)
+
+        try:
+            yield held
+        finally:
+            if held:
+                self._connection().execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+
+    def close(self) -> None:
+        """Close the connections of all threads"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __enter__(self) -> "SharedResponseCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"SharedResponseCache({os.path.basename(self.path)})"
+
+    def _try_lease(self, key: str, owner: str) -> bool:
+        """Take the lease if it is free or expired"""
+        now = self._clock()
+        cursor = self._connection().execute(
+            "INSERT INTO leases (key, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE leases.expires_at < ?",
+            (key, owner, now + self.lease_seconds, now),
+        )
+        return cursor.rowcount == 1
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the current thread (autocommit, waits for locks held by other processes)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
@@ -1,6 +1,25 @@
-"""Core logic for trash tracking"""
+"""
+Core logic for trash tracking
 
+The development tools (replay, simulator, load_test) are not re-exported here:
+they are left out of the Home Assistant copy, so import them from their modules.
+"""
+
+from trash_tracking_core.core.async_tracker import AsyncTruckTracker
+from trash_tracking_core.core.batch import (
+    BatchCheckpoint,
+    BatchLookup,
+    BatchResult,
+    BatchRow,
+    BatchSummary,
+    read_batch_rows,
+)
+from trash_tracking_core.core.catalog import CatalogError, CatalogPoint, CatalogRoute, RouteCatalog
+from trash_tracking_core.core.crawler import CrawlSummary, CrawlTask, RouteCrawler, grid_tasks
+from trash_tracking_core.core.eta_predictor import ArrivalPrediction, ArrivalPredictor, SegmentStats
 from trash_tracking_core.core.point_matcher import MatchResult, PointMatcher
+from trash_tracking_core.core.polling import FixedIntervalPolicy, PollingPolicy, SchedulePolicy
+from trash_tracking_core.core.recorder import PositionRecord, PositionRecorder, RecorderError, read_day
 from trash_tracking_core.core.response_builder import StatusResponseBuilder
 from trash_tracking_core.core.state_machine import StateTransition, TruckStateMachine
 from trash_tracking_core.core.state_manager import StateManager, TruckState
@@ -8,6 +27,7 @@ from trash_tracking_core.core.tracker import TruckTracker
 
 __all__ = [
     "TruckTracker",
+    "AsyncTruckTracker",
     "StateManager",
     "TruckState",
     "PointMatcher",
@@ -15,4 +35,28 @@ __all__ = [
     "StatusResponseBuilder",
     "TruckStateMachine",
     "StateTransition",
+    "ArrivalPredictor",
+    "ArrivalPrediction",
+    "SegmentStats",
+    "PositionRecorder",
+    "PositionRecord",
+    "RecorderError",
+    "read_day",
+    "PollingPolicy",
+    "FixedIntervalPolicy",
+    "SchedulePolicy",
+    "BatchLookup",
+    "BatchRow",
+    "BatchResult",
+    "BatchSummary",
+    "BatchCheckpoint",
+    "read_batch_rows",
+    "RouteCatalog",
+    "CatalogRoute",
+    "CatalogPoint",
+    "CatalogError",
+    "RouteCrawler",
+    "CrawlTask",
+    "CrawlSummary",
+    "grid_tasks",
 ]
@@ -0,0 +1,333 @@
+"""Batch Address Lookup"""
+
+import csv
+import itertools
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.utils.geocoding import Geocoder, GeocodingError
+from trash_tracking_core.utils.logger import get_logger
+from trash_tracking_core.utils.rate_limit import RateLimiter
+from trash_tracking_core.utils.route_analyzer import RouteAnalyzer
+
+logger = get_logger(__name__)
+
+# Header names recognized as the address and row id columns of an input CSV
+_ADDRESS_COLUMNS = ("address", "地址")
+_ID_COLUMNS = ("id", "row_id", "編號")
+
+
+@dataclass(frozen=True)
+class BatchRow:
+    """One address to look up"""
+
+    row_id: str
+    address: str
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one address lookup"""
+
+    row_id: str
+    address: str
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    routes: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True when the lookup succeeded"""
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "id": self.row_id,
+            "address": self.address,
+            "ok": self.ok,
+            "lat": self.lat,
+            "lng": self.lng,
+            "routes": self.routes,
+            "error": self.error,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+@dataclass
+class BatchSummary:
+    """Counters of a batch run"""
+
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        """Rows looked up in this run"""
+        return self.succeeded + self.failed
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+class BatchCheckpoint:
+    """
+    Append-only record of finished row ids.
+
+    Only successful rows are recorded, so a rerun retries the rows that failed
+    (e.g. on a provider outage). A row id is appended (and flushed) only after
+    its result has been written,
+    so a run that is interrupted and restarted with the same checkpoint skips
+    the rows whose output is already on disk; at worst a row whose result was
+    written just before the interruption is looked up (and written) again.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a checkpoint file
+
+        Args:
+            path: Checkpoint file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._done: Set[str] = set()
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._done = {line.rstrip("\n") for line in f if line.strip()}
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+        if self._done:
+            logger.info("Resuming batch: %d row(s) already done (%s)", len(self._done), path)
+
+    def is_done(self, row_id: str) -> bool:
+        """Return True when a row finished in an earlier run"""
+        return row_id in self._done
+
+    def mark_done(self, row_id: str) -> None:
+        """Record a finished row"""
+        with self._lock:
+            if row_id in self._done:
+                return
+            self._done.add(row_id)
+            self._file.write(row_id + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the checkpoint file"""
+        with self._lock:
+            self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def __enter__(self) -> "BatchCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_batch_rows(lines: Iterable[str]) -> Iterator[BatchRow]:
+    """
+    Parse batch input: a CSV with an ``address`` (or ``地址``) column, or one address per line
+
+    Row ids come from an ``id`` column when present, otherwise they are the
+    1-based data row number, so they stay stable when the same input is re-read
+    for a resumed run. Blank rows are skipped but still counted.
+
+    Args:
+        lines: Input lines (a text file or sys.stdin)
+
+    Yields:
+        BatchRow: Rows to look up, in input order
+    """
+    reader = csv.reader(lines)
+    first = next(reader, None)
+    if first is None:
+        return
+
+    header = [name.strip().lower() for name in first]
+    address_col = next((header.index(name) for name in _ADDRESS_COLUMNS if name in header), None)
+    id_col = next((header.index(name) for name in _ID_COLUMNS if name in header), None)
+
+    if address_col is None:
+        # Plain list of addresses: the first line is data, and commas belong to the address
+        for number, row in enumerate(itertools.chain([first], reader), start=1):
+            address = ",".join(row).strip()
+            if address:
+                yield BatchRow(row_id=str(number), address=address)
+        return
+
+    for number, row in enumerate(reader, start=1):
+        address = row[address_col].strip() if len(row) > address_col else ""
+        if not address:
+            continue
+        row_id = row[id_col].strip() if id_col is not None and len(row) > id_col else ""
+        yield BatchRow(row_id=row_id or str(number), address=address)
+
+
+class BatchLookup:
+    """
+    Geocode many addresses and query the routes around each one.
+
+    Rows go through a bounded worker pool: at most ``2 * workers`` rows are
+    in flight, so input streamed from stdin is never read far ahead of the
+    output. The geocoder (with its cache and rate limiters) is shared by all
+    workers; each worker thread gets its own API client, which still share the
+    client's class-level response cache.
+    """
+
+    def __init__(
+        self,
+        geocoder: Geocoder,
+        workers: int = 4,
+        week: Optional[int] = None,
+        with_routes: bool = True,
+        api_rate_limit: Optional[RateLimiter] = None,
+        client_factory: Callable[[], NTPCApiClient] = NTPCApiClient,
+    ):
+        """
+        Initialize batch lookup
+
+        Args:
+            geocoder: Shared geocoder
+            workers: Number of worker threads
+            week: Week day passed to get_around_points (default: today)
+            with_routes: Also query the routes around each address
+            api_rate_limit: Limiter for NTPC API calls shared by all workers
+            client_factory: Creates the per-thread API client
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.geocoder = geocoder
+        self.workers = workers
+        self.week = week
+        self.with_routes = with_routes
+        self.api_rate_limit = api_rate_limit
+        self._client_factory = client_factory
+        self._local = threading.local()
+
+    def lookup(self, row: BatchRow) -> BatchResult:
+        """
+        Look up one row (never raises; failures are reported in the result)
+
+        Args:
+            row: Address to look up
+
+        Returns:
+            BatchResult: Coordinates and nearby routes, or the error
+        """
+        started = time.perf_counter()
+        result = BatchResult(row_id=row.row_id, address=row.address)
+        try:
+            result.lat, result.lng = self.geocoder.address_to_coordinates(row.address)
+            if self.with_routes:
+                result.routes = self._routes_around(result.lat, result.lng)
+        except (GeocodingError, NTPCApiError) as e:
+            result.error = str(e).split("\n", 1)[0]
+        except Exception as e:
+            logger.debug("Batch row %s failed", row.row_id, exc_info=True)
+            result.error = f"Unexpected error: {e}"
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        return result
+
+    def run(
+        self,
+        rows: Iterable[BatchRow],
+        on_result: Callable[[BatchResult], None],
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> BatchSummary:
+        """
+        Look up rows concurrently, reporting each result as soon as it finishes
+
+        ``on_result`` runs on the calling thread in completion order (not input
+        order); a successful row is marked in the checkpoint after it returns,
+        failed rows are left for the next run to retry.
+
+        Args:
+            rows: Rows to look up
+            on_result: Called with every finished result
+            checkpoint: Skip rows that succeeded earlier and record new successes
+
+        Returns:
+            BatchSummary: Counters of this run
+        """
+        summary = BatchSummary()
+        started = time.perf_counter()
+        max_pending = 2 * self.workers
+        pending: Set["Future[BatchResult]"] = set()
+
+        def drain(return_when: str) -> None:
+            nonlocal pending
+            done, pending = wait(pending, return_when=return_when)
+            for future in done:
+                result = future.result()
+                on_result(result)
+                if result.ok:
+                    summary.succeeded += 1
+                    if checkpoint is not None:
+                        checkpoint.mark_done(result.row_id)
+                else:
+                    summary.failed += 1
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch") as executor:
+            for row in rows:
+                if checkpoint is not None and checkpoint.is_done(row.row_id):
+                    summary.skipped += 1
+                    continue
+                if len(pending) >= max_pending:
+                    drain(FIRST_COMPLETED)
+                pending.add(executor.submit(self.lookup, row))
+            if pending:
+                drain(ALL_COMPLETED)
+
+        summary.elapsed_seconds = time.perf_counter() - started
+        logger.info("Batch finished: %s", summary.to_dict())
+        return summary
+
+    def _client(self) -> NTPCApiClient:
+        """API client of the current worker thread"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self._client_factory()
+        return client
+
+    def _routes_around(self, lat: float, lng: float) -> List[Dict[str, Any]]:
+        """Summarize the routes around a location with their nearest and suggested enter/exit points"""
+        if self.api_rate_limit is not None:
+            self.api_rate_limit.acquire()
+        trucks = self._client().get_around_points(lat, lng, week=self.week) or []
+
+        routes = []
+        for rec in RouteAnalyzer(lat, lng).analyze_all_routes(trucks):
+            routes.append(
+                {
+                    "line_id": rec.truck.line_id,
+                    "line_name": rec.truck.line_name,
+                    "nearest_point": rec.nearest_point.point_name,
+                    "distance_meters": round(rec.nearest_point.distance_meters, 1),
+                    "enter_point": rec.enter_point.point_name,
+                    "exit_point": rec.exit_point.point_name,
+                    "schedule": rec.schedule_info,
+                }
+            )
+        return routes
@@ -0,0 +1,452 @@
+"""Arrival Time Predictor"""
+
+import math
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from statistics import NormalDist
+from typing import List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.snapshot import LineSnapshot
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS arrivals (
+    line_id TEXT NOT NULL,
+    service_date TEXT NOT NULL,
+    point_rank INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    PRIMARY KEY (line_id, service_date, point_rank)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS segments (
+    line_id TEXT NOT NULL,
+    point_rank INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    PRIMARY KEY (line_id, point_rank)
+) WITHOUT ROWID;
+"""
+
+
+def _parse_minutes(value: str) -> Optional[int]:
+    """
+    Parse an API clock string ("HH:MM" or "HH:MM:SS") into minutes after midnight
+
+    Args:
+        value: Clock string
+
+    Returns:
+        Optional[int]: Minutes after midnight, None if the value is empty or malformed
+    """
+    if not value:
+        return None
+
+    parts = value.strip().split(":")
+    if len(parts) < 2:
+        return None
+
+    try:
+        hours, minutes = int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
+
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+
+    return hours * 60 + minutes
+
+
+@dataclass(frozen=True)
+class SegmentStats:
+    """Learned travel time from the previous collection point to ``point_rank``"""
+
+    line_id: str
+    point_rank: int
+    samples: int
+    mean_minutes: float
+    variance: float
+
+    @property
+    def stddev_minutes(self) -> float:
+        """Sample standard deviation in minutes"""
+        return math.sqrt(self.variance)
+
+
+@dataclass(frozen=True)
+class ArrivalPrediction:
+    """Predicted arrival time at a collection point with a confidence interval"""
+
+    point_name: str
+    point_rank: int
+    estimated: datetime
+    lower: datetime
+    upper: datetime
+    confidence: float
+    learned_segments: int
+    total_segments: int
+
+    @property
+    def is_learned(self) -> bool:
+        """True when every segment on the way to the point has learned history"""
+        return self.total_segments > 0 and self.learned_segments == self.total_segments
+
+    def to_dict(self) -> dict:
+        """
+        Convert to dictionary format
+
+        Returns:
+            dict: Prediction data dictionary
+        """
+        return {
+            "point_name": self.point_name,
+            "point_rank": self.point_rank,
+            "estimated": self.estimated.isoformat(),
+            "lower": self.lower.isoformat(),
+            "upper": self.upper.isoformat(),
+            "confidence": self.confidence,
+            "learned_segments": self.learned_segments,
+            "total_segments": self.total_segments,
+        }
+
+
+class ArrivalPredictor:
+    """
+    Learns per-route, per-segment travel times from observed arrivals.
+
+    Every poll's ``TruckLine`` is fed to :meth:`observe` (TruckTracker does this
+    when given a predictor or ``history.eta_database``). Arrival stamps of passed
+    points are stored once per route and service day, and each newly reached rank
+    contributes one travel-time sample for the segments since the previous reached
+    rank. Statistics are kept as running mean/variance (Welford), so storage grows
+    with the number of route segments, not with the number of polls. Arrival
+    stamps are only needed on their service day and are pruned after
+    ``retention_days``.
+    """
+
+    # Segments with fewer samples fall back to the published schedule
+    DEFAULT_MIN_SAMPLES = 3
+
+    # Uncertainty assumed for schedule-based segments (fraction of scheduled minutes)
+    FALLBACK_STDDEV_RATIO = 0.5
+    FALLBACK_MIN_STDDEV = 1.0
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        timezone: str = "Asia/Taipei",
+        confidence: float = 0.9,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        retention_days: int = 7,
+    ):
+        """
+        Initialize arrival predictor
+
+        Args:
+            db_path: SQLite database path (":memory:" keeps history in memory only)
+            timezone: Timezone of the API clock strings
+            confidence: Confidence level of predicted intervals (0-1)
+            min_samples: Minimum samples before a learned segment replaces the schedule
+            retention_days: Service days of arrival stamps to keep
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+        if retention_days < 1:
+            raise ValueError("retention_days must be at least 1")
+
+        self.db_path = db_path
+        self.timezone = ZoneInfo(timezone)
+        self.confidence = confidence
+        self.min_samples = min_samples
+        self.retention_days = retention_days
+        # Service day of the last pruning, so it runs once per day
+        self._pruned_on: Optional[date] = None
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        logger.info("ArrivalPredictor initialized: db=%s, confidence=%.2f", db_path, confidence)
+
+    def observe(self, truck_line: Union[TruckLine, LineSnapshot], observed_at: Optional[datetime] = None) -> int:
+        """
+        Learn from one poll of a truck route
+
+        Args:
+            truck_line: Truck route as returned by the API
+            observed_at: Poll time (default: now), used to determine the service day
+
+        Returns:
+            int: Number of new segment samples learned
+        """
+        observed_at = self._localize(observed_at)
+        service_date = observed_at.date().isoformat()
+        if self._pruned_on != observed_at.date():
+            self.prune(observed_at.date() - timedelta(days=self.retention_days))
+            self._pruned_on = observed_at.date()
+
+        arrivals: List[Tuple[int, int]] = []
+        for point in truck_line.points:
+            if not point.has_passed():
+                continue
+            minute = _parse_minutes(point.arrival)
+            if minute is not None:
+                arrivals.append((point.point_rank, minute))
+
+        if not arrivals:
+            return 0
+
+        arrivals.sort()
+        learned = 0
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT point_rank, minute FROM arrivals WHERE line_id = ? AND service_date = ? "
+                "ORDER BY point_rank DESC LIMIT 1",
+                (truck_line.line_id, service_date),
+            ).fetchone()
+            last_rank, last_minute = row if row else (None, None)
+
+            for rank, minute in arrivals:
+                if last_rank is not None and rank <= last_rank:
+                    continue
+
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO arrivals (line_id, service_date, point_rank, minute) VALUES (?, ?, ?, ?)",
+                    (truck_line.line_id, service_date, rank, minute),
+                )
+
+                if last_rank is not None and minute >= last_minute:
+                    per_segment = (minute - last_minute) / (rank - last_rank)
+                    for segment_rank in range(last_rank + 1, rank + 1):
+                        self._add_sample(truck_line.line_id, segment_rank, per_segment)
+                        learned += 1
+
+                last_rank, last_minute = rank, minute
+
+        if learned:
+            logger.debug("Learned %d segment sample(s) for route %s", learned, truck_line.line_name)
+
+        return learned
+
+    def prune(self, before: date) -> int:
+        """
+        Delete the arrival stamps of service days before ``before``
+
+        Learned segment statistics are kept.
+
+        Args:
+            before: Oldest service day to keep
+
+        Returns:
+            int: Number of deleted arrival stamps
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM arrivals WHERE service_date < ?", (before.isoformat(),)).rowcount
+
+        if deleted:
+            logger.debug("Pruned %d arrival stamp(s) before %s", deleted, before)
+        return deleted
+
+    def predict_point(
+        self, truck_line: Union[TruckLine, LineSnapshot], point_name: str, now: Optional[datetime] = None
+    ) -> Optional[ArrivalPrediction]:
+        """
+        Predict arrival time at the collection point named ``point_name``
+
+        Args:
+            truck_line: Current truck route data
+            point_name: Name of the point (e.g. the configured enter point)
+            now: Current time (default: now)
+
+        Returns:
+            Optional[ArrivalPrediction]: Prediction, None if the route has no such
+                point or no anchor time is known
+        """
+        target = truck_line.find_point(point_name)
+        if target is None:
+            return None
+        return self.predict(truck_line, target, now)
+
+    def segment_stats(self, line_id: str, point_rank: int) -> Optional[SegmentStats]:
+        """
+        Get learned travel time statistics for the segment ending at ``point_rank``
+
+        Args:
+            line_id: Route ID
+            point_rank: Rank of the segment's destination point
+
+        Returns:
+            Optional[SegmentStats]: Statistics, None if never observed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT n, mean, m2 FROM segments WHERE line_id = ? AND point_rank = ?",
+                (line_id, point_rank),
+            ).fetchone()
+
+        if not row:
+            return None
+
+        n, mean, m2 = row
+        variance = m2 / (n - 1) if n > 1 else 0.0
+        return SegmentStats(line_id=line_id, point_rank=point_rank, samples=n, mean_minutes=mean, variance=variance)
+
+    def predict(
+        self, truck_line: Union[TruckLine, LineSnapshot], target: Point, now: Optional[datetime] = None
+    ) -> Optional[ArrivalPrediction]:
+        """
+        Predict arrival time at a collection point
+
+        Learned segments are summed from the truck's last reached point to the target.
+        Segments without enough history use the scheduled ``point_time`` difference.
+
+        Args:
+            truck_line: Current truck route data
+            target: Collection point to predict (e.g. the enter point)
+            now: Current time (default: now)
+
+        Returns:
+            Optional[ArrivalPrediction]: Prediction, None if no anchor time is known
+        """
+        now = self._localize(now)
+
+        if target.has_passed():
+            arrived = self._at_minute(now, _parse_minutes(target.arrival))
+            if arrived is None:
+                return None
+            return ArrivalPrediction(
+                point_name=target.point_name,
+                point_rank=target.point_rank,
+                estimated=arrived,
+                lower=arrived,
+                upper=arrived,
+                confidence=self.confidence,
+                learned_segments=0,
+                total_segments=0,
+            )
+
+        anchor_rank, anchor_time = self._find_anchor(truck_line, target, now)
+        if anchor_time is None:
+            return None
+
+        points_by_rank = {p.point_rank: p for p in truck_line.points}
+        mean_total = 0.0
+        variance_total = 0.0
+        learned = 0
+        total = 0
+
+        for rank in range(anchor_rank + 1, target.point_rank + 1):
+            total += 1
+            stats = self.segment_stats(truck_line.line_id, rank)
+            if stats is not None and stats.samples >= self.min_samples:
+                mean_total += stats.mean_minutes
+                variance_total += stats.variance
+                learned += 1
+                continue
+
+            scheduled = self._scheduled_minutes(points_by_rank.get(rank - 1), points_by_rank.get(rank))
+            stddev = max(self.FALLBACK_MIN_STDDEV, scheduled * self.FALLBACK_STDDEV_RATIO)
+            mean_total += scheduled
+            variance_total += stddev**2
+
+        margin = self._z * math.sqrt(variance_total)
+        estimated = anchor_time + timedelta(minutes=mean_total)
+
+        # The truck has not reached the point yet, so nothing can be earlier than now
+        return ArrivalPrediction(
+            point_name=target.point_name,
+            point_rank=target.point_rank,
+            estimated=max(estimated, now),
+            lower=max(estimated - timedelta(minutes=margin), now),
+            upper=max(estimated + timedelta(minutes=margin), now),
+            confidence=self.confidence,
+            learned_segments=learned,
+            total_segments=total,
+        )
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+
+    def _add_sample(self, line_id: str, point_rank: int, minutes: float) -> None:
+        """Fold one travel-time sample into the segment's running statistics"""
+        row = self._conn.execute(
+            "SELECT n, mean, m2 FROM segments WHERE line_id = ? AND point_rank = ?", (line_id, point_rank)
+        ).fetchone()
+        n, mean, m2 = row if row else (0, 0.0, 0.0)
+
+        n += 1
+        delta = minutes - mean
+        mean += delta / n
+        m2 += delta * (minutes - mean)
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO segments (line_id, point_rank, n, mean, m2) VALUES (?, ?, ?, ?, ?)",
+            (line_id, point_rank, n, mean, m2),
+        )
+
+    def _find_anchor(
+        self, truck_line: Union[TruckLine, LineSnapshot], target: Point, now: datetime
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Find the last reached point before the target and when it was reached
+
+        Returns:
+            tuple: (anchor rank, anchor time); the time is None when unknown
+        """
+        reached = [p for p in truck_line.points if p.has_passed() and p.point_rank < target.point_rank and p.arrival]
+        if reached:
+            last = max(reached, key=lambda p: p.point_rank)
+            anchor_time = self._at_minute(now, _parse_minutes(last.arrival))
+            if anchor_time is not None:
+                return last.point_rank, anchor_time
+
+        if 0 < truck_line.arrival_rank < target.point_rank:
+            return truck_line.arrival_rank, now
+
+        # Truck has not started its route yet: anchor on the schedule shifted by its delay
+        scheduled = target.get_estimated_arrival(truck_line.diff)
+        if scheduled is None:
+            return target.point_rank, None
+
+        return target.point_rank, now.replace(hour=scheduled.hour, minute=scheduled.minute, second=0, microsecond=0)
+
+    @staticmethod
+    def _scheduled_minutes(previous: Optional[Point], current: Optional[Point]) -> float:
+        """Scheduled minutes between two consecutive points (0 when unknown)"""
+        if previous is None or current is None:
+            return 0.0
+
+        start = _parse_minutes(previous.point_time)
+        end = _parse_minutes(current.point_time)
+        if start is None or end is None or end < start:
+            return 0.0
+
+        return float(end - start)
+
+    def _at_minute(self, now: datetime, minute: Optional[int]) -> Optional[datetime]:
+        """Combine today's date with minutes after midnight"""
+        if minute is None:
+            return None
+        return now.replace(hour=minute // 60, minute=minute % 60, second=0, microsecond=0)
+
+    def _localize(self, value: Optional[datetime]) -> datetime:
+        """Return an aware datetime in the predictor's timezone"""
+        if value is None:
+            return datetime.now(self.timezone)
+        if value.tzinfo is None:
+            return value.replace(tzinfo=self.timezone)
+        return value.astimezone(self.timezone)
+
+    def __str__(self) -> str:
+        """Return string representation of predictor"""
+        return f"ArrivalPredictor(db={self.db_path}, confidence={self.confidence})"
@@ -0,0 +1,175 @@
+"""API Load Test Harness"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.core.tracker import TruckTracker
+from trash_tracking_core.utils.config import ConfigManager
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class LoadTestReport:
+    """Result of a load test run"""
+
+    coordinators: int
+    duration_seconds: float
+    successes: int = 0
+    failures: Dict[str, int] = field(default_factory=dict)
+    latencies_ms: List[float] = field(default_factory=list)
+    server: Optional[Dict[str, int]] = None
+
+    @property
+    def updates(self) -> int:
+        """Number of coordinator updates (API calls including their retries)"""
+        return len(self.latencies_ms)
+
+    @property
+    def throughput(self) -> float:
+        """Updates per second"""
+        return self.updates / self.duration_seconds if self.duration_seconds else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get a latency percentile (nearest-rank)
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            float: Latency in milliseconds (0.0 without samples)
+        """
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank = max(1, -(-len(ordered) * pct // 100))
+        return ordered[int(rank) - 1]
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "coordinators": self.coordinators,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "updates": self.updates,
+            "successes": self.successes,
+            "failures": dict(self.failures),
+            "throughput": round(self.throughput, 2),
+            "latency_ms": {
+                "p50": round(self.percentile(50), 2),
+                "p95": round(self.percentile(95), 2),
+                "p99": round(self.percentile(99), 2),
+                "max": round(max(self.latencies_ms, default=0.0), 2),
+            },
+            "server": self.server,
+        }
+
+
+class _TimedApiClient(NTPCApiClient):
+    """API client that reports the latency and outcome of every call"""
+
+    def __init__(self, report: LoadTestReport, lock: threading.Lock, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._report = report
+        self._lock = lock
+
+    def get_around_points(self, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        try:
+            lines = super().get_around_points(*args, **kwargs)
+        except NTPCApiError as e:
+            self._record(started, _failure_kind(e))
+            raise
+        self._record(started, None)
+        return lines
+
+    def _record(self, started: float, failure: Optional[str]) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._report.latencies_ms.append(elapsed_ms)
+            if failure is None:
+                self._report.successes += 1
+            else:
+                self._report.failures[failure] = self._report.failures.get(failure, 0) + 1
+
+
+def run_load_test(
+    base_url: str,
+    config: ConfigManager,
+    coordinators: int = 10,
+    duration_seconds: float = 30.0,
+    interval_seconds: float = 1.0,
+    client_options: Optional[Dict[str, Any]] = None,
+) -> LoadTestReport:
+    """
+    Run coordinators concurrently against an API endpoint
+
+    Each coordinator owns a tracker and API client and updates every
+    ``interval_seconds`` (measured from the end of the previous update, like
+    Home Assistant's DataUpdateCoordinator). Start times are staggered across
+    the first interval. The latency of an update covers the whole API call
+    including client retries.
+
+    Args:
+        base_url: API base URL (e.g. an NTPCSimulator)
+        config: Tracker configuration shared by all coordinators
+        coordinators: Number of concurrent coordinators
+        duration_seconds: How long to keep issuing updates
+        interval_seconds: Pause between a coordinator's updates
+        client_options: Extra NTPCApiClient arguments (timeout, retry_count, ...);
+            the shared response cache is disabled unless ``cache_enabled`` is
+            given, and the clients share a connection pool of the run's own
+
+    Returns:
+        LoadTestReport: Latency and outcome statistics
+    """
+    if coordinators <= 0:
+        raise ValueError("coordinators must be positive")
+
+    # One connection per coordinator, so no update waits for a free one
+    sessions = SessionManager(pool_maxsize=coordinators, pool_block=True)
+    options = {"cache_enabled": False, "session_manager": sessions, **(client_options or {})}
+    report = LoadTestReport(coordinators=coordinators, duration_seconds=duration_seconds)
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def coordinator(index: int) -> None:
+        with _TimedApiClient(report, lock, base_url=base_url, **options) as client:
+            tracker = TruckTracker(config, api_client=client, record=False)
+            if stop.wait(interval_seconds * index / coordinators):
+                return
+            while not stop.is_set():
+                tracker.get_current_status()
+                stop.wait(interval_seconds)
+
+    threads = [
+        threading.Thread(target=coordinator, args=(i,), name=f"load-coordinator-{i}", daemon=True)
+        for i in range(coordinators)
+    ]
+
+    logger.info("Starting load test: %d coordinator(s) for %.0fs against %s", coordinators, duration_seconds, base_url)
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    stop.wait(duration_seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    sessions.close()
+
+    report.duration_seconds = time.perf_counter() - started
+    return report
+
+
+def _failure_kind(error: NTPCApiError) -> str:
+    """Reduce a client error message to its category (e.g. "HTTP error: 500", "Request timeout")"""
+    reason = str(error).rsplit("retries: ", 1)[-1]
+    if reason.startswith("HTTP error"):
+        return reason
+    return reason.split(":", 1)[0]
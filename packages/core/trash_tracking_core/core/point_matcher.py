@@ -6,7 +6,9 @@ from trash_tracking_core.core.state_manager import TruckState
 from trash_tracking_core.models.point import Point
 from trash_tracking_core.models.tracking_window import TrackingWindow
 from trash_tracking_core.models.truck import TruckLine
-from trash_tracking_core.utils.logger import logger
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class MatchResult:
@@ -54,9 +56,9 @@ class PointMatcher:
             raise ValueError("Either tracking_window or both enter_point_name and exit_point_name must be provided")
 
         logger.info(
-            f"PointMatcher initialized: "
-            f"enter_point={self.tracking_window.enter_point_name}, "
-            f"exit_point={self.tracking_window.exit_point_name}"
+            "PointMatcher initialized: enter_point=%s, exit_point=%s",
+            self.tracking_window.enter_point_name,
+            self.tracking_window.exit_point_name,
         )
 
     @property
@@ -116,9 +118,10 @@ class PointMatcher:
         if self._should_trigger_enter(truck_line, enter_point, exit_point):
             reason = f"Truck approaching enter point: {self.tracking_window.enter_point_name}"
             logger.info(
-                f"✅ Trigger enter state: {truck_line.line_name} - "
-                f"current rank={truck_line.arrival_rank}, "
-                f"enter point rank={enter_point.point_rank}"
+                "✅ Trigger enter state: %s - current rank=%s, enter point rank=%s",
+                truck_line.line_name,
+                truck_line.arrival_rank,
+                enter_point.point_rank,
             )
             return MatchResult(
                 should_trigger=True,
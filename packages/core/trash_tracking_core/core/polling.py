@@ -0,0 +1,167 @@
+"""Polling Policies"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, time, timedelta
+from typing import List, Optional
+
+
+def to_api_weekday(moment: datetime) -> int:
+    """
+    Convert a datetime's weekday to the API format
+
+    Python uses 0=Monday ... 6=Sunday; the API uses 0=Sunday, 1=Monday ... 6=Saturday.
+
+    Args:
+        moment: Date and time
+
+    Returns:
+        int: API weekday number
+    """
+    python_weekday = moment.weekday()
+    return python_weekday + 1 if python_weekday < 6 else 0
+
+
+class PollingPolicy(ABC):
+    """
+    Decides when a tracker calls the API.
+
+    A policy ticks every ``interval_seconds`` (the coordinator's update interval)
+    and :meth:`should_poll` tells whether that tick makes an API call.
+    """
+
+    name = "policy"
+
+    def __init__(self, interval_seconds: int = 30):
+        """
+        Initialize polling policy
+
+        Args:
+            interval_seconds: Seconds between ticks
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.interval_seconds = interval_seconds
+
+    @abstractmethod
+    def should_poll(self, now: datetime) -> bool:
+        """
+        Check whether the tick at ``now`` calls the API
+
+        Args:
+            now: Local time of the tick
+
+        Returns:
+            bool: True to call the API
+        """
+
+    def __str__(self) -> str:
+        """Return string representation of policy"""
+        return self.name
+
+
+class FixedIntervalPolicy(PollingPolicy):
+    """Calls the API on every tick"""
+
+    def __init__(self, interval_seconds: int = 30):
+        super().__init__(interval_seconds)
+        self.name = f"every {interval_seconds}s"
+
+    def should_poll(self, now: datetime) -> bool:
+        return True
+
+
+class SchedulePolicy(PollingPolicy):
+    """
+    Calls the API only on collection days, within the scheduled time range plus a buffer.
+
+    Gates the Home Assistant coordinator's polls. Without weekdays the
+    policy always polls (configs created before schedules were stored).
+    """
+
+    def __init__(
+        self,
+        weekdays: Optional[List[int]],
+        time_start: Optional[str],
+        time_end: Optional[str],
+        buffer_minutes: int = 10,
+        interval_seconds: int = 30,
+    ):
+        """
+        Initialize schedule policy
+
+        Args:
+            weekdays: Collection days in API format (0=Sunday, 1-6=Monday-Saturday)
+            time_start: Earliest scheduled time (HH:MM)
+            time_end: Latest scheduled time (HH:MM)
+            buffer_minutes: Minutes to poll before start and after end
+            interval_seconds: Seconds between ticks
+        """
+        super().__init__(interval_seconds)
+        self.weekdays = list(weekdays or [])
+        self.buffer = timedelta(minutes=buffer_minutes)
+        self.start = self._parse_time(time_start)
+        self.end = self._parse_time(time_end)
+        self.name = f"schedule ±{buffer_minutes}min every {interval_seconds}s"
+
+    def should_poll(self, now: datetime) -> bool:
+        if not self.weekdays:
+            return True
+
+        if to_api_weekday(now) not in self.weekdays:
+            return False
+
+        if self.start is None or self.end is None:
+            return True
+
+        window_start, window_end = self.window_for(now)
+        return window_start <= now <= window_end
+
+    def window_for(self, now: datetime) -> tuple[datetime, datetime]:
+        """
+        Get the buffered polling window on the day of ``now``
+
+        Args:
+            now: Any time on the day of interest
+
+        Returns:
+            tuple: (window start, window end) in the timezone of ``now``
+
+        Raises:
+            ValueError: If the policy has no time range
+        """
+        if self.start is None or self.end is None:
+            raise ValueError("Schedule has no time range")
+
+        start = datetime.combine(now.date(), self.start, tzinfo=now.tzinfo) - self.buffer
+        end = datetime.combine(now.date(), self.end, tzinfo=now.tzinfo) + self.buffer
+        return start, end
+
+    def should_prewarm(self, now: datetime, lead: timedelta) -> bool:
+        """
+        Check whether ``now`` falls in the lead time before today's polling window
+
+        Connections opened then are still alive when the first poll of the
+        window goes out, which therefore skips DNS, TCP and TLS setup.
+
+        Args:
+            now: Local time of the tick
+            lead: How long before the window to start warming up
+
+        Returns:
+            bool: True when the window starts within ``lead``
+        """
+        if self.start is None or self.end is None or to_api_weekday(now) not in self.weekdays:
+            return False
+
+        window_start, _ = self.window_for(now)
+        return window_start - lead <= now < window_start
+
+    @staticmethod
+    def _parse_time(value: Optional[str]) -> Optional[time]:
+        """Parse HH:MM, returning None for missing or malformed values"""
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%H:%M").time()
+        except ValueError:
+            return None
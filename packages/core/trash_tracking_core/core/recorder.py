@@ -0,0 +1,255 @@
+"""Truck Position Recorder"""
+
+import mmap
+import struct
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# File layout: 8-byte header followed by fixed-width little-endian records
+#   header: magic (4s) | version (H) | record size (H)
+#   record: epoch seconds (I) | line index (H) | arrival rank (h) | diff (h) | lat (f) | lon (f)
+# Line IDs are stored once per day in a sidecar "<day>.lines" file; records refer to them by index.
+MAGIC = b"TTPR"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_RECORD = struct.Struct("<IHhhff")
+
+DATA_SUFFIX = ".pos"
+LINES_SUFFIX = ".lines"
+
+
+class RecorderError(Exception):
+    """Position history file error"""
+
+
+class PositionRecord(NamedTuple):
+    """One recorded truck position"""
+
+    timestamp: datetime
+    line_id: str
+    arrival_rank: int
+    diff: int
+    lat: float
+    lon: float
+
+
+class _DayFile:
+    """Open append handle for one day's data file and its line-ID table"""
+
+    def __init__(self, directory: Path, day: date):
+        self.day = day
+        self.data_path = directory / f"{day.isoformat()}{DATA_SUFFIX}"
+        self.lines_path = directory / f"{day.isoformat()}{LINES_SUFFIX}"
+        self.line_index: Dict[str, int] = {
+            line_id: index for index, line_id in enumerate(_read_line_ids(self.lines_path))
+        }
+
+        is_new = not self.data_path.exists() or self.data_path.stat().st_size == 0
+        self.data: BinaryIO = open(self.data_path, "ab")
+        if is_new:
+            self.data.write(_HEADER.pack(MAGIC, FORMAT_VERSION, _RECORD.size))
+            self.data.flush()
+
+    def index_of(self, line_id: str) -> int:
+        """Return the index of a line ID, appending it to the table if new"""
+        index = self.line_index.get(line_id)
+        if index is None:
+            index = len(self.line_index)
+            if index > 0xFFFF:
+                raise RecorderError(f"Too many distinct routes recorded for {self.day}")
+            with open(self.lines_path, "a", encoding="utf-8") as f:
+                f.write(line_id + "\n")
+            self.line_index[line_id] = index
+        return index
+
+    def close(self) -> None:
+        """Close the data file"""
+        self.data.close()
+
+
+class PositionRecorder:
+    """
+    Appends truck positions to compact per-day binary files.
+
+    Each poll is written as one batch of 18-byte records, so a full day of
+    30-second polls for a handful of routes stays in the tens of kilobytes and
+    can be memory-mapped by :func:`read_day` without parsing.
+    """
+
+    def __init__(self, directory: str, timezone: str = "Asia/Taipei"):
+        """
+        Initialize position recorder
+
+        Args:
+            directory: Directory holding the per-day history files (created if missing)
+            timezone: Timezone used to split records into days
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.timezone = ZoneInfo(timezone)
+        self._lock = threading.Lock()
+        self._day_file: Optional[_DayFile] = None
+
+        logger.info("PositionRecorder initialized: directory=%s", self.directory)
+
+    def record(self, truck_lines: Iterable[TruckLine], recorded_at: Optional[datetime] = None) -> int:
+        """
+        Append the positions of all routes from one poll
+
+        Args:
+            truck_lines: Routes returned by the API
+            recorded_at: Poll time (default: now)
+
+        Returns:
+            int: Number of records written
+        """
+        if recorded_at is None:
+            recorded_at = datetime.now(self.timezone)
+        elif recorded_at.tzinfo is None:
+            recorded_at = recorded_at.replace(tzinfo=self.timezone)
+
+        epoch = int(recorded_at.timestamp())
+        day = recorded_at.astimezone(self.timezone).date()
+
+        with self._lock:
+            day_file = self._open_day(day)
+            buffer = bytearray()
+            for line in truck_lines:
+                buffer += _RECORD.pack(
+                    epoch,
+                    day_file.index_of(line.line_id),
+                    _clamp_short(line.arrival_rank),
+                    _clamp_short(line.diff),
+                    line.location_lat or 0.0,
+                    line.location_lon or 0.0,
+                )
+
+            if buffer:
+                day_file.data.write(buffer)
+                day_file.data.flush()
+
+        count = len(buffer) // _RECORD.size
+        logger.debug("Recorded %d position(s) for %s", count, day)
+        return count
+
+    def close(self) -> None:
+        """Close the open day file"""
+        with self._lock:
+            if self._day_file is not None:
+                self._day_file.close()
+                self._day_file = None
+
+    def _open_day(self, day: date) -> _DayFile:
+        """Return the append handle for a day, rolling over at midnight"""
+        if self._day_file is None or self._day_file.day != day:
+            if self._day_file is not None:
+                self._day_file.close()
+            self._day_file = _DayFile(self.directory, day)
+        return self._day_file
+
+    def __enter__(self) -> "PositionRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        """Return string representation of recorder"""
+        return f"PositionRecorder({self.directory})"
+
+
+def read_day(directory: str, day: date) -> Iterator[PositionRecord]:
+    """
+    Stream one day of recorded positions in write order
+
+    The data file is memory-mapped and decoded lazily, so arbitrarily large
+    days can be replayed without loading them into memory. A truncated final
+    record (e.g. from a crash mid-write) is ignored.
+
+    Args:
+        directory: History directory
+        day: Day to read
+
+    Yields:
+        PositionRecord: Recorded positions
+
+    Raises:
+        RecorderError: When the file header is invalid
+    """
+    base = Path(directory)
+    data_path = base / f"{day.isoformat()}{DATA_SUFFIX}"
+    if not data_path.exists():
+        return
+
+    line_ids = _read_line_ids(base / f"{day.isoformat()}{LINES_SUFFIX}")
+
+    with open(data_path, "rb") as f:
+        size = data_path.stat().st_size
+        if size < _HEADER.size:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            magic, version, record_size = _HEADER.unpack_from(mapped, 0)
+            if magic != MAGIC or version != FORMAT_VERSION or record_size != _RECORD.size:
+                raise RecorderError(f"Unsupported position history file: {data_path}")
+
+            usable = _HEADER.size + (size - _HEADER.size) // record_size * record_size
+            view = memoryview(mapped)[_HEADER.size : usable]
+            records = _RECORD.iter_unpack(view)
+            try:
+                for epoch, index, rank, diff, lat, lon in records:
+                    yield PositionRecord(
+                        timestamp=datetime.fromtimestamp(epoch, tz=timezone.utc),
+                        line_id=line_ids[index] if index < len(line_ids) else "",
+                        arrival_rank=rank,
+                        diff=diff,
+                        lat=lat,
+                        lon=lon,
+                    )
+            finally:
+                # The iterator holds a buffer export; drop it before releasing the mapping
+                del records
+                view.release()
+
+
+def available_days(directory: str) -> List[date]:
+    """
+    List days that have recorded positions
+
+    Args:
+        directory: History directory
+
+    Returns:
+        List[date]: Recorded days in ascending order
+    """
+    base = Path(directory)
+    if not base.is_dir():
+        return []
+
+    days = []
+    for path in base.glob(f"*{DATA_SUFFIX}"):
+        try:
+            days.append(date.fromisoformat(path.stem))
+        except ValueError:
+            continue
+    return sorted(days)
+
+
+def _read_line_ids(path: Path) -> List[str]:
+    """Read a day's line-ID table"""
+    if not path.exists():
+        return []
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def _clamp_short(value: int) -> int:
+    """Clamp an integer into the signed 16-bit range used on disk"""
+    return max(-0x8000, min(0x7FFF, int(value or 0)))
@@ -0,0 +1,414 @@
+"""Offline Replay Engine"""
+
+import bisect
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+from trash_tracking_core.core.polling import FixedIntervalPolicy, PollingPolicy
+from trash_tracking_core.core.recorder import PositionRecord
+from trash_tracking_core.core.tracker import TruckTracker
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.config import ConfigManager
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ReplayFrame:
+    """One GetAroundPoints response observed at a point in time"""
+
+    timestamp: datetime
+    payload: Dict[str, Any]
+
+    def to_json(self) -> str:
+        """Serialize as one JSON line"""
+        return json.dumps({"timestamp": self.timestamp.isoformat(), "payload": self.payload}, ensure_ascii=False)
+
+
+@dataclass(frozen=True)
+class Transition:
+    """State change observed during a replay"""
+
+    timestamp: datetime
+    from_state: str
+    to_state: str
+    reason: str
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "from_state": self.from_state,
+            "to_state": self.to_state,
+            "reason": self.reason,
+        }
+
+
+@dataclass
+class PolicyReport:
+    """Replay result of one polling policy"""
+
+    policy: str
+    api_calls: int
+    transitions: List[Transition]
+    lag_seconds: List[Optional[float]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "policy": self.policy,
+            "api_calls": self.api_calls,
+            "transitions": [t.to_dict() for t in self.transitions],
+            "lag_seconds": self.lag_seconds,
+        }
+
+
+@dataclass
+class ReplayReport:
+    """Result of replaying a frame sequence against several polling policies"""
+
+    frames: int
+    start: Optional[datetime]
+    end: Optional[datetime]
+    reference: List[Transition]
+    policies: List[PolicyReport]
+    elapsed_seconds: float
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return {
+            "frames": self.frames,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "reference": [t.to_dict() for t in self.reference],
+            "policies": [p.to_dict() for p in self.policies],
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+
+class ReplayApiClient:
+    """
+    Stand-in for NTPCApiClient that answers from pre-parsed frames.
+
+    The engine moves the simulated clock with :meth:`seek`; every
+    ``get_around_points`` call returns the latest frame at or before that time
+    and is counted as one API call.
+    """
+
+    def __init__(self, times: Sequence[datetime], lines: Sequence[List[TruckLine]]):
+        self._times = times
+        self._lines = lines
+        self.now: Optional[datetime] = None
+        self.calls = 0
+
+    def seek(self, now: datetime) -> None:
+        """Move the simulated clock"""
+        self.now = now
+
+    def get_around_points(
+        self, lat: float = 0.0, lng: float = 0.0, time_filter: int = 0, week: Optional[int] = None
+    ) -> List[TruckLine]:
+        """Return the routes visible at the simulated time"""
+        self.calls += 1
+        index = bisect.bisect_right(self._times, self.now) - 1 if self.now is not None else -1
+        return self._lines[index] if index >= 0 else []
+
+
+class ReplayEngine:
+    """
+    Drives TruckTracker from recorded or synthetic GetAroundPoints payloads.
+
+    A reference tracker sees every frame, which gives the "true" transition
+    times. Each polling policy then runs its own tracker on its own tick
+    schedule over the same timeline, without sleeping, so a whole day replays
+    in milliseconds. Reports include the transitions each policy saw, how late
+    it saw them compared with the reference, and how many API calls it made.
+    """
+
+    def __init__(self, config: ConfigManager, timezone: str = "Asia/Taipei"):
+        """
+        Initialize replay engine
+
+        Args:
+            config: Tracking configuration (enter/exit points, target lines)
+            timezone: Local timezone used by schedule-based policies
+        """
+        self.config = config
+        self.timezone = ZoneInfo(timezone)
+
+    def run(self, frames: Iterable[ReplayFrame], policies: Optional[List[PollingPolicy]] = None) -> ReplayReport:
+        """
+        Replay frames against polling policies
+
+        Args:
+            frames: Observed payloads (any order)
+            policies: Policies to evaluate (default: poll every 30 seconds)
+
+        Returns:
+            ReplayReport: Transitions, lags and API call counts per policy
+        """
+        started = time.perf_counter()
+        policies = policies or [FixedIntervalPolicy(30)]
+
+        ordered = sorted(frames, key=lambda f: f.timestamp)
+        times = [self._localize(f.timestamp) for f in ordered]
+        lines = [_parse_lines(f.payload) for f in ordered]
+
+        if not ordered:
+            return ReplayReport(0, None, None, [], [], time.perf_counter() - started)
+
+        reference, _ = self._simulate(times, lines, times, None)
+
+        reports = []
+        for policy in policies:
+            ticks = _ticks(times[0], times[-1], policy.interval_seconds)
+            transitions, calls = self._simulate(times, lines, ticks, policy)
+            reports.append(
+                PolicyReport(
+                    policy=policy.name,
+                    api_calls=calls,
+                    transitions=transitions,
+                    lag_seconds=_lags(reference, transitions),
+                )
+            )
+
+        elapsed = time.perf_counter() - started
+        logger.info("Replayed %d frame(s) against %d policy(ies) in %.3fs", len(ordered), len(policies), elapsed)
+
+        return ReplayReport(
+            frames=len(ordered),
+            start=times[0],
+            end=times[-1],
+            reference=reference,
+            policies=reports,
+            elapsed_seconds=elapsed,
+        )
+
+    def _simulate(
+        self,
+        times: Sequence[datetime],
+        lines: Sequence[List[TruckLine]],
+        ticks: Iterable[datetime],
+        policy: Optional[PollingPolicy],
+    ) -> tuple[List[Transition], int]:
+        """Run one tracker over the tick schedule and collect its transitions"""
+        client = ReplayApiClient(times, lines)
+        tracker = TruckTracker(self.config, api_client=client, record=False)
+        transitions: List[Transition] = []
+
+        for tick in ticks:
+            previous = tracker.state_manager.current_state.value
+            client.seek(tick)
+
+            if policy is None or policy.should_poll(tick):
+                response = tracker.get_current_status()
+            else:
+                # Same as the coordinator: outside the schedule the tracker falls back to idle
+                if not tracker.state_manager.is_idle():
+                    tracker.state_manager.update_state(new_state="idle", reason="Outside scheduled operating hours")
+                response = {"status": tracker.state_manager.current_state.value, "reason": tracker.state_manager.reason}
+
+            if response["status"] != previous:
+                transitions.append(Transition(tick, previous, response["status"], response["reason"]))
+
+        return transitions, client.calls
+
+    def _localize(self, value: datetime) -> datetime:
+        """Return an aware datetime in the engine's timezone"""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=self.timezone)
+        return value.astimezone(self.timezone)
+
+
+def load_frames(path: str) -> Iterator[ReplayFrame]:
+    """
+    Read frames from a JSON Lines file
+
+    Each line is ``{"timestamp": "<ISO 8601>", "payload": <GetAroundPoints response>}``.
+
+    Args:
+        path: File path
+
+    Yields:
+        ReplayFrame: Frames in file order
+    """
+    with open(Path(path), "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                yield ReplayFrame(timestamp=datetime.fromisoformat(data["timestamp"]), payload=data["payload"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Skipping invalid frame on line %d: %s", line_number, e)
+
+
+def synthetic_frames(
+    template: TruckLine,
+    service_date: date,
+    step_seconds: int = 30,
+    delay_minutes: int = 0,
+    lead_minutes: int = 30,
+    timezone: str = "Asia/Taipei",
+) -> Iterator[ReplayFrame]:
+    """
+    Generate frames of a truck driving a route exactly on (delayed) schedule
+
+    The truck reaches each point at ``point_time + delay_minutes``; frames are
+    emitted every ``step_seconds`` from ``lead_minutes`` before the first stop
+    until ``lead_minutes`` after the last.
+
+    Args:
+        template: Route whose points carry the schedule (point_time)
+        service_date: Day to simulate
+        step_seconds: Seconds between frames
+        delay_minutes: Minutes the truck runs late (negative for early)
+        lead_minutes: Minutes of frames before the first and after the last stop
+        timezone: Local timezone of the schedule
+
+    Yields:
+        ReplayFrame: Frames in time order
+    """
+    tz = ZoneInfo(timezone)
+    schedule = []
+    for point in sorted(template.points, key=lambda p: p.point_rank):
+        try:
+            scheduled = datetime.strptime(point.point_time, "%H:%M").time()
+        except ValueError:
+            continue
+        arrival = datetime.combine(service_date, scheduled, tzinfo=tz) + timedelta(minutes=delay_minutes)
+        schedule.append((arrival, point))
+
+    if not schedule:
+        return
+
+    start = schedule[0][0] - timedelta(minutes=lead_minutes)
+    end = schedule[-1][0] + timedelta(minutes=lead_minutes)
+
+    for tick in _ticks(start, end, step_seconds):
+        reached = {point.point_rank: arrival for arrival, point in schedule if arrival <= tick}
+        yield ReplayFrame(
+            timestamp=tick,
+            payload={"Line": [line_payload_at(template, reached, delay_minutes)]},
+        )
+
+
+def frames_from_positions(
+    records: Iterable[PositionRecord], template: TruckLine, timezone: str = "Asia/Taipei"
+) -> Iterator[ReplayFrame]:
+    """
+    Rebuild frames from recorded positions of one route
+
+    Points up to the recorded ``arrival_rank`` are marked as passed at the time the
+    truck was first seen at or beyond them.
+
+    Args:
+        records: Recorded positions (e.g. from ``read_day``), in time order
+        template: Route providing the point list
+        timezone: Local timezone of the API clock strings (``read_day`` returns UTC)
+
+    Yields:
+        ReplayFrame: One frame per matching record
+    """
+    tz = ZoneInfo(timezone)
+    reached: Dict[int, datetime] = {}
+    for record in records:
+        if record.line_id != template.line_id:
+            continue
+
+        timestamp = record.timestamp.astimezone(tz)
+        for point in template.points:
+            if point.point_rank <= record.arrival_rank and point.point_rank not in reached:
+                reached[point.point_rank] = timestamp
+
+        line = line_payload_at(template, reached, record.diff)
+        line.update({"LocationLat": record.lat, "LocationLon": record.lon})
+        yield ReplayFrame(timestamp=timestamp, payload={"Line": [line]})
+
+
+def line_payload_at(template: TruckLine, reached: Dict[int, datetime], diff: int) -> Dict[str, Any]:
+    """
+    Build an API route payload with the given points marked as reached
+
+    Args:
+        template: Route whose points are copied
+        reached: Local arrival time of each reached point, by point rank
+        diff: Delay in minutes reported for the route and its reached points
+
+    Returns:
+        dict: Route in the GetAroundPoints response format
+    """
+    points = []
+    for point in template.points:
+        data = point.to_api_dict()
+        arrival = reached.get(point.point_rank)
+        data["Arrival"] = arrival.strftime("%H:%M") if arrival else ""
+        data["ArrivalDiff"] = diff if arrival else 65535
+        points.append(data)
+
+    current: Optional[Point] = None
+    if reached:
+        current = max((p for p in template.points if p.point_rank in reached), key=lambda p: p.point_rank)
+
+    line = template.to_api_dict()
+    line.update(
+        {
+            "ArrivalRank": current.point_rank if current else 0,
+            "Diff": diff,
+            "Location": current.point_name if current else "",
+            "LocationLat": current.lat if current else 0.0,
+            "LocationLon": current.lon if current else 0.0,
+            "Point": points,
+        }
+    )
+    return line
+
+
+def _parse_lines(payload: Dict[str, Any]) -> List[TruckLine]:
+    """Parse a payload the same way NTPCApiClient does"""
+    lines = []
+    for line_data in payload.get("Line", []) if isinstance(payload, dict) else []:
+        try:
+            lines.append(TruckLine.from_dict(line_data))
+        except Exception as e:
+            logger.warning("Failed to parse route data: %s", e)
+    return lines
+
+
+def _ticks(start: datetime, end: datetime, step_seconds: int) -> Iterator[datetime]:
+    """Yield times from start to end (inclusive) every step_seconds"""
+    step = timedelta(seconds=step_seconds)
+    tick = start
+    while tick <= end:
+        yield tick
+        tick += step
+
+
+def _lags(reference: List[Transition], observed: List[Transition]) -> List[Optional[float]]:
+    """
+    Pair each observed transition with the same-numbered reference transition to the
+    same state and return how many seconds later it was observed (None if unmatched)
+    """
+    by_state: Dict[str, List[Transition]] = {}
+    for transition in reference:
+        by_state.setdefault(transition.to_state, []).append(transition)
+
+    seen: Dict[str, int] = {}
+    lags: List[Optional[float]] = []
+    for transition in observed:
+        index = seen.get(transition.to_state, 0)
+        seen[transition.to_state] = index + 1
+        candidates = by_state.get(transition.to_state, [])
+        if index < len(candidates):
+            lags.append((transition.timestamp - candidates[index].timestamp).total_seconds())
+        else:
+            lags.append(None)
+    return lags
@@ -0,0 +1,306 @@
+"""NTPC API Simulator"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from trash_tracking_core.core.replay import line_payload_at
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """
+    Failure behavior of the simulated API
+
+    Rates are independent per-request probabilities; at most one fault is
+    injected per request (error, then slow, then malformed).
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    slow_rate: float = 0.0
+    slow_ms: float = 15000.0
+    malformed_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        for name in ("error_rate", "slow_rate", "malformed_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        for name in ("latency_ms", "jitter_ms", "slow_ms"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must not be negative")
+
+
+@dataclass
+class SimulatorStats:
+    """Request counters of a simulator"""
+
+    requests: int = 0
+    ok: int = 0
+    errors: int = 0
+    slow: int = 0
+    malformed: int = 0
+    not_found: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format"""
+        return asdict(self)
+
+
+class SimulatedClock:
+    """Clock that runs from a chosen start time at a multiple of real time"""
+
+    def __init__(self, start: datetime, speed: float = 1.0):
+        """
+        Initialize simulated clock
+
+        Args:
+            start: Simulated time when the clock is created
+            speed: Simulated seconds per real second
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.start = start
+        self.speed = speed
+        self._started = time.monotonic()
+
+    def now(self) -> datetime:
+        """Return the current simulated time"""
+        return self.start + timedelta(seconds=(time.monotonic() - self._started) * self.speed)
+
+
+class NTPCSimulator:
+    """
+    Local stand-in for the NTPC ``GetAroundPoints`` endpoint.
+
+    Each route drives its points in ``point_rank`` order, reaching every point at
+    its scheduled ``point_time`` plus the route's delay on the simulated clock.
+    Responses can be delayed, fail with HTTP 500, hang, or return truncated JSON
+    according to a :class:`FaultProfile`, so clients can be exercised offline.
+    """
+
+    def __init__(
+        self,
+        routes: Sequence[TruckLine],
+        faults: Optional[FaultProfile] = None,
+        clock: Optional[SimulatedClock] = None,
+        delays: Optional[Dict[str, int]] = None,
+        seed: Optional[int] = None,
+        timezone: str = "Asia/Taipei",
+    ):
+        """
+        Initialize simulator
+
+        Args:
+            routes: Route templates whose points carry the schedule (point_time)
+            faults: Latency and failure injection settings (default: none)
+            clock: Simulated clock (default: real time)
+            delays: Minutes each route runs late, by line_id (negative for early)
+            seed: Random seed for reproducible fault injection
+            timezone: Local timezone of the schedule
+        """
+        self.routes = list(routes)
+        self.faults = faults or FaultProfile()
+        self.tz = ZoneInfo(timezone)
+        self.clock = clock or SimulatedClock(datetime.now(self.tz))
+        self.delays = dict(delays or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = SimulatorStats()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> SimulatorStats:
+        """Snapshot of the request counters"""
+        with self._lock:
+            return SimulatorStats(**asdict(self._stats))
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to NTPCApiClient (only while running)"""
+        if self._server is None:
+            raise RuntimeError("Simulator is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def payload_at(self, now: datetime) -> Dict[str, Any]:
+        """
+        Build the API response for a simulated time
+
+        Args:
+            now: Simulated local time
+
+        Returns:
+            dict: GetAroundPoints response body
+        """
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=self.tz)
+
+        lines = []
+        for route in self.routes:
+            delay = self.delays.get(route.line_id, 0)
+            reached = {
+                point.point_rank: arrival
+                for point, arrival in _schedule(route, now.date(), delay, self.tz)
+                if arrival <= now
+            }
+            lines.append(line_payload_at(route, reached, delay))
+
+        return {"TimeStamp": now.strftime("%Y%m%d%H%M%S"), "Line": lines}
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving in a background thread
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            str: Base URL of the running simulator
+        """
+        if self._server is not None:
+            raise RuntimeError("Simulator is already running")
+
+        self._server = ThreadingHTTPServer((host, port), _SimulatorHandler)
+        self._server.daemon_threads = True
+        self._server.simulator = self  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ntpc-simulator", daemon=True)
+        self._thread.start()
+
+        logger.info("NTPC simulator listening on %s (%d route(s))", self.base_url, len(self.routes))
+        return self.base_url
+
+    def stop(self) -> None:
+        """Stop serving"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def handle(self, path: str) -> Tuple[int, bytes, float]:
+        """
+        Produce a response for one request
+
+        All routes are returned regardless of the queried location.
+
+        Args:
+            path: Request path
+
+        Returns:
+            tuple: (HTTP status, body, seconds to wait before responding)
+        """
+        fault = self._draw_fault()
+        with self._lock:
+            self._stats.requests += 1
+            if not path.rstrip("/").endswith("/GetAroundPoints"):
+                self._stats.not_found += 1
+                fault = "not_found"
+            elif fault == "error":
+                self._stats.errors += 1
+            elif fault == "slow":
+                self._stats.slow += 1
+            elif fault == "malformed":
+                self._stats.malformed += 1
+            else:
+                self._stats.ok += 1
+
+        wait = self._latency() + (self.faults.slow_ms / 1000 if fault == "slow" else 0.0)
+
+        if fault == "not_found":
+            return 404, b'{"Message":"Not Found"}', wait
+        if fault == "error":
+            return 500, b'{"Message":"An error has occurred."}', wait
+
+        body = json.dumps(self.payload_at(self.clock.now()), ensure_ascii=False).encode("utf-8")
+        if fault == "malformed":
+            body = body[: len(body) // 2]
+        return 200, body, wait
+
+    def _draw_fault(self) -> str:
+        """Pick the fault (or "ok") for the next request"""
+        with self._lock:
+            if self._random.random() < self.faults.error_rate:
+                return "error"
+            if self._random.random() < self.faults.slow_rate:
+                return "slow"
+            if self._random.random() < self.faults.malformed_rate:
+                return "malformed"
+        return "ok"
+
+    def _latency(self) -> float:
+        """Base response delay in seconds"""
+        jitter = 0.0
+        if self.faults.jitter_ms:
+            with self._lock:
+                jitter = self._random.uniform(0.0, self.faults.jitter_ms)
+        return (self.faults.latency_ms + jitter) / 1000
+
+    def __enter__(self) -> "NTPCSimulator":
+        if self._server is None:
+            self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def __str__(self) -> str:
+        """Return string representation of simulator"""
+        return f"NTPCSimulator({len(self.routes)} route(s))"
+
+
+class _SimulatorHandler(BaseHTTPRequestHandler):
+    """HTTP handler delegating to the owning NTPCSimulator"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        # Drain the form body so the keep-alive connection stays usable
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status, body, wait = self.server.simulator.handle(self.path)  # type: ignore[attr-defined]
+
+        if wait:
+            time.sleep(wait)
+
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (e.g. timed out on a slow response)
+            pass
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("Simulator: " + format, *args)
+
+
+def _schedule(route: TruckLine, service_date: date, delay_minutes: int, tz: ZoneInfo) -> List[Tuple[Point, datetime]]:
+    """Return (point, arrival time) for every scheduled point of a route"""
+    schedule = []
+    for point in route.points:
+        try:
+            scheduled = datetime.strptime(point.point_time, "%H:%M").time()
+        except ValueError:
+            continue
+        arrival = datetime.combine(service_date, scheduled, tzinfo=tz) + timedelta(minutes=delay_minutes)
+        schedule.append((point, arrival))
+    return schedule
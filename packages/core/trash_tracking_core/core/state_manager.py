@@ -2,12 +2,15 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from zoneinfo import ZoneInfo
 
 from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.snapshot import LineSnapshot, PointSnapshot
 from trash_tracking_core.models.truck import TruckLine
-from trash_tracking_core.utils.logger import logger
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class TruckState(Enum):
@@ -28,9 +31,9 @@ class StateManager:
             timezone: Timezone setting
         """
         self.current_state = TruckState.IDLE
-        self.current_truck: Optional[TruckLine] = None
-        self.enter_point: Optional[Point] = None
-        self.exit_point: Optional[Point] = None
+        self.current_truck: Optional[Union[TruckLine, LineSnapshot]] = None
+        self.enter_point: Optional[Union[Point, PointSnapshot]] = None
+        self.exit_point: Optional[Union[Point, PointSnapshot]] = None
         self.last_update: Optional[datetime] = None
         self.reason = "System initialized"
         self.timezone = ZoneInfo(timezone)
@@ -41,9 +44,9 @@ class StateManager:
         self,
         new_state: str,
         reason: str,
-        truck_line: Optional[TruckLine] = None,
-        enter_point: Optional[Point] = None,
-        exit_point: Optional[Point] = None,
+        truck_line: Optional[Union[TruckLine, LineSnapshot]] = None,
+        enter_point: Optional[Union[Point, PointSnapshot]] = None,
+        exit_point: Optional[Union[Point, PointSnapshot]] = None,
     ) -> None:
         """
         Update system state
@@ -51,7 +54,8 @@ class StateManager:
         Args:
             new_state: New state ('idle' or 'nearby')
             reason: Reason for state change
-            truck_line: Truck data (required when state is nearby)
+            truck_line: Truck data (required when state is nearby); stored by
+                reference, so pass a LineSnapshot to share it safely
             enter_point: Enter point data
             exit_point: Exit point data
         """
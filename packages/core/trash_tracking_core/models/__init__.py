@@ -1,7 +1,23 @@
 """Data models for trash tracking"""
 
+from trash_tracking_core.models.codec import CodecError, pack_truck_lines, unpack_truck_lines
 from trash_tracking_core.models.point import Point, PointStatus
+from trash_tracking_core.models.pool import PointPool, PoolStats
+from trash_tracking_core.models.snapshot import LineSnapshot, PointSnapshot, PollSnapshot
 from trash_tracking_core.models.tracking_window import TrackingWindow
 from trash_tracking_core.models.truck import TruckLine
 
-__all__ = ["Point", "PointStatus", "TrackingWindow", "TruckLine"]
+__all__ = [
+    "CodecError",
+    "LineSnapshot",
+    "Point",
+    "PointPool",
+    "PointSnapshot",
+    "PointStatus",
+    "PollSnapshot",
+    "PoolStats",
+    "TrackingWindow",
+    "TruckLine",
+    "pack_truck_lines",
+    "unpack_truck_lines",
+]
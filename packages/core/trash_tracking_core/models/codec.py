@@ -0,0 +1,239 @@
+"""Compact Binary Snapshots of Truck Routes"""
+
+import json
+import struct
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Tuple
+
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"TTS"
+
+# Header: magic, version, string count, string table size in bytes, route count
+_HEADER = struct.Struct("<3sBIII")
+
+# Records start with a kind byte. A packed record holds the fields in their
+# declared types, strings as string table indexes. A record with a field that
+# does not fit (None ids, out-of-range ints, non-float coordinates) is stored
+# as JSON in the string table instead; its index takes the first field slot.
+_PACKED = 0
+_JSON = 1
+
+# kind, line_id, line_name, area, arrival_rank, diff, car_no, location,
+# location_lat, location_lon, bar_code, point count
+_LINE = struct.Struct("<BIIIiiIIddII")
+_LINE_TYPES = (str, str, str, int, int, str, str, float, float, str)
+
+# kind, source_point_id, vil, point_name, lon, lat, point_id, point_rank,
+# point_time, arrival, arrival_diff, fixed_point, point_weekknd, in_scope, like_count
+_POINT = struct.Struct("<BiIIddiiIIiiIIi")
+_POINT_TYPES = (int, str, str, float, float, int, int, str, str, int, int, str, str, int)
+
+# Filler for the fields after the JSON index in a JSON record
+_EMPTY = {
+    _LINE: tuple(0.0 if kind is float else 0 for kind in _LINE_TYPES[1:]),
+    _POINT: tuple(0.0 if kind is float else 0 for kind in _POINT_TYPES[1:]),
+}
+
+
+class CodecError(Exception):
+    """Malformed or unsupported binary snapshot"""
+
+
+def pack_truck_lines(lines: List[TruckLine]) -> bytes:
+    """
+    Serialize routes to a compact binary snapshot
+
+    Strings (point names, times, district names, ...) are stored once in a
+    string table and referenced by index, numbers as fixed-size binary fields.
+    The round trip through unpack_truck_lines is lossless.
+
+    Args:
+        lines: Routes with their points
+
+    Returns:
+        bytes: Versioned snapshot
+    """
+    strings: Dict[str, int] = {}
+    records = []
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    for line in lines:
+        values = (
+            line.line_id,
+            line.line_name,
+            line.area,
+            line.arrival_rank,
+            line.diff,
+            line.car_no,
+            line.location,
+            line.location_lat,
+            line.location_lon,
+            line.bar_code,
+        )
+        records.append(_pack_record(_LINE, _LINE_TYPES, values, intern, _line_fields, line, len(line.points)))
+        for point in line.points:
+            values = (
+                point.source_point_id,
+                point.vil,
+                point.point_name,
+                point.lon,
+                point.lat,
+                point.point_id,
+                point.point_rank,
+                point.point_time,
+                point.arrival,
+                point.arrival_diff,
+                point.fixed_point,
+                point.point_weekknd,
+                point.in_scope,
+                point.like_count,
+            )
+            records.append(_pack_record(_POINT, _POINT_TYPES, values, intern, Point.to_api_dict, point))
+
+    table = list(strings)
+    blob = "".join(table).encode("utf-8", "surrogatepass")
+    return b"".join(
+        (
+            _HEADER.pack(_MAGIC, FORMAT_VERSION, len(table), len(blob), len(lines)),
+            struct.pack(f"<{len(table)}I", *map(len, table)),
+            blob,
+            *records,
+        )
+    )
+
+
+def unpack_truck_lines(data: bytes) -> List[TruckLine]:
+    """
+    Inverse of pack_truck_lines
+
+    Args:
+        data: Snapshot written by pack_truck_lines
+
+    Returns:
+        List[TruckLine]: Routes with their points
+
+    Raises:
+        CodecError: If the data is truncated, corrupt or of another format version
+    """
+    try:
+        magic, version, string_count, blob_size, line_count = _HEADER.unpack_from(data)
+    except (struct.error, TypeError) as e:
+        raise CodecError(f"Not a route snapshot: {e}") from e
+    if magic != _MAGIC:
+        raise CodecError("Not a route snapshot")
+    if version != FORMAT_VERSION:
+        raise CodecError(f"Unsupported route snapshot version: {version}")
+
+    try:
+        view = memoryview(data)
+        offset = _HEADER.size
+        lengths = struct.unpack_from(f"<{string_count}I", view, offset)
+        offset += 4 * string_count
+        text = bytes(view[offset : offset + blob_size]).decode("utf-8", "surrogatepass")
+        offset += blob_size
+        ends = list(accumulate(lengths))
+        strings = [text[end - length : end] for end, length in zip(ends, lengths)]
+
+        lines = []
+        for _ in range(line_count):
+            record = _LINE.unpack_from(view, offset)
+            offset += _LINE.size
+            point_count = record[11]
+            points = [
+                _unpack_point(point, strings)
+                for point in _POINT.iter_unpack(view[offset : offset + point_count * _POINT.size])
+            ]
+            offset += point_count * _POINT.size
+            if len(points) != point_count:
+                raise CodecError("Truncated route snapshot")
+            lines.append(_unpack_line(record, strings, points))
+    except (struct.error, IndexError, ValueError, KeyError, TypeError) as e:
+        raise CodecError(f"Corrupt route snapshot: {e}") from e
+
+    if offset != len(data):
+        raise CodecError("Trailing data after route snapshot")
+    return lines
+
+
+def _pack_record(
+    layout: struct.Struct,
+    types: Tuple[type, ...],
+    values: tuple,
+    intern: Callable[[str], int],
+    as_dict: Callable[[Any], dict],
+    model: Any,
+    *trailer: int,
+) -> bytes:
+    """Pack one record, falling back to JSON when a field does not fit the layout"""
+    if all(type(value) is kind for value, kind in zip(values, types)):
+        fields = [intern(value) if kind is str else value for value, kind in zip(values, types)]
+        try:
+            return layout.pack(_PACKED, *fields, *trailer)
+        except struct.error:
+            pass  # An int out of range
+
+    text = json.dumps(as_dict(model), ensure_ascii=False, separators=(",", ":"))
+    return layout.pack(_JSON, intern(text), *_EMPTY[layout], *trailer)
+
+
+def _line_fields(line: TruckLine) -> dict:
+    """API dict of a route without its points"""
+    data = line.to_api_dict()
+    del data["Point"]
+    return data
+
+
+def _unpack_line(record: tuple, strings: List[str], points: List[Point]) -> TruckLine:
+    """Build a route from its record"""
+    if record[0] == _JSON:
+        line = TruckLine.from_dict(json.loads(strings[record[1]]))
+        line.points = points
+        return line
+    if record[0] != _PACKED:
+        raise CodecError(f"Unknown record kind {record[0]}")
+    return TruckLine(
+        line_id=strings[record[1]],
+        line_name=strings[record[2]],
+        area=strings[record[3]],
+        arrival_rank=record[4],
+        diff=record[5],
+        car_no=strings[record[6]],
+        location=strings[record[7]],
+        location_lat=record[8],
+        location_lon=record[9],
+        bar_code=strings[record[10]],
+        points=points,
+    )
+
+
+def _unpack_point(record: tuple, strings: List[str]) -> Point:
+    """Build a point from its record"""
+    if record[0] == _JSON:
+        return Point.from_dict(json.loads(strings[record[1]]))
+    if record[0] != _PACKED:
+        raise CodecError(f"Unknown record kind {record[0]}")
+    return Point(
+        source_point_id=record[1],
+        vil=strings[record[2]],
+        point_name=strings[record[3]],
+        lon=record[4],
+        lat=record[5],
+        point_id=record[6],
+        point_rank=record[7],
+        point_time=strings[record[8]],
+        arrival=strings[record[9]],
+        arrival_diff=record[10],
+        fixed_point=record[11],
+        point_weekknd=strings[record[12]],
+        in_scope=strings[record[13]],
+        like_count=record[14],
+    )
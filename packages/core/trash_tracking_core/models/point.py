@@ -61,6 +61,30 @@ class Point:
             like_count=data.get("LikeCount", 0),
         )
 
+    def to_api_dict(self) -> dict:
+        """
+        Convert back to the API response format (inverse of from_dict)
+
+        Returns:
+            dict: Collection point data in API field names
+        """
+        return {
+            "SourcePointID": self.source_point_id,
+            "Vil": self.vil,
+            "PointName": self.point_name,
+            "Lon": self.lon,
+            "Lat": self.lat,
+            "PointID": self.point_id,
+            "PointRank": self.point_rank,
+            "PointTime": self.point_time,
+            "Arrival": self.arrival,
+            "ArrivalDiff": self.arrival_diff,
+            "FixedPoint": self.fixed_point,
+            "PointWeekKnd": self.point_weekknd,
+            "InScope": self.in_scope,
+            "LikeCount": self.like_count,
+        }
+
     def to_dict(self) -> dict:
         """
         Convert to dictionary format
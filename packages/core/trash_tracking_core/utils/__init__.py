@@ -1,8 +1,34 @@
 """Utilities for trash tracking"""
 
+from trash_tracking_core.utils.address import (
+    AddressParts,
+    ParsedAddress,
+    normalize_component,
+    parse_address,
+    tokenize_address,
+)
 from trash_tracking_core.utils.config import ConfigError, ConfigManager
+from trash_tracking_core.utils.gazetteer import (
+    Gazetteer,
+    GazetteerError,
+    GazetteerMatch,
+    build_gazetteer,
+    build_gazetteer_from_csv,
+)
+from trash_tracking_core.utils.geocode_cache import GeocodeCache, GeocodeCacheStats, GeocodeEntry
 from trash_tracking_core.utils.geocoding import Geocoder, GeocodingError
+from trash_tracking_core.utils.geohash import encode_geohash, geohash_bounds, tile_center
 from trash_tracking_core.utils.logger import logger
+from trash_tracking_core.utils.metrics import (
+    CallRecord,
+    HistogramSink,
+    Instrumentation,
+    LoggingSink,
+    MetricsSink,
+    PrometheusSink,
+)
+from trash_tracking_core.utils.projection import twd97_to_wgs84, twd97_to_wgs84_many, wgs84_to_twd97
+from trash_tracking_core.utils.rate_limit import RateLimiter
 from trash_tracking_core.utils.route_analyzer import CollectionPointRecommendation, RouteAnalyzer, RouteRecommendation
 
 __all__ = [
@@ -11,6 +37,32 @@ __all__ = [
     "logger",
     "Geocoder",
     "GeocodingError",
+    "GeocodeCache",
+    "GeocodeCacheStats",
+    "GeocodeEntry",
+    "Gazetteer",
+    "GazetteerError",
+    "GazetteerMatch",
+    "AddressParts",
+    "parse_address",
+    "normalize_component",
+    "ParsedAddress",
+    "tokenize_address",
+    "build_gazetteer",
+    "build_gazetteer_from_csv",
+    "twd97_to_wgs84",
+    "twd97_to_wgs84_many",
+    "wgs84_to_twd97",
+    "RateLimiter",
+    "encode_geohash",
+    "geohash_bounds",
+    "tile_center",
+    "CallRecord",
+    "Instrumentation",
+    "MetricsSink",
+    "HistogramSink",
+    "PrometheusSink",
+    "LoggingSink",
     "RouteAnalyzer",
     "RouteRecommendation",
     "CollectionPointRecommendation",
@@ -0,0 +1,216 @@
+"""Taiwan Address Parsing"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Most to least specific; each level drops the components after it
+LEVELS = ("number", "alley", "lane", "section", "road")
+
+_FULLWIDTH = str.maketrans("０１２３４５６７８９－臺", "0123456789-台")
+# Suffix of each numbered component
+_SUFFIXES = {"section": "段", "lane": "巷", "alley": "弄", "number": "號"}
+_CHINESE_DIGITS = {"一": 1, "二": 2, "三": 3, "四": 4, "五": 5, "六": 6, "七": 7, "八": 8, "九": 9}
+
+_ADDRESS_RE = re.compile(
+    r"(?:(?P<city>[^\d]{2}[市縣]))?"
+    r"(?:(?P<district>[^\d]{1,3}?[區鄉鎮市]))?"
+    r"(?:[^\d]{1,3}?里)?(?:\d+鄰)?"
+    r"(?P<road>[^\d]+?(?:大道|路|街))?"
+    r"(?:(?P<section>\d+|[一二三四五六七八九十]+)段)?"
+    r"(?:(?P<lane>\d+)巷)?"
+    r"(?:(?P<alley>\d+)弄)?"
+    r"(?:(?P<number>\d+(?:[之-]\d+)?)號)?"
+)
+
+# Numbered components wherever they appear (also in addresses the structured pattern cannot follow)
+_COMPONENT_RE = re.compile(
+    r"(?P<section>(?:\d+|[一二三四五六七八九十]+)段)" r"|(?P<lane>\d+巷)" r"|(?P<alley>\d+弄)" r"|(?P<number>\d+(?:[之-]\d+)?號)"
+)
+
+# Components removed by each simplification step, most detailed first
+_SIMPLIFY_ORDER = ("number", "alley", "lane", "section")
+
+
+@dataclass(frozen=True)
+class AddressParts:
+    """Components of a Taiwan street address (missing components are empty)"""
+
+    district: str = ""
+    road: str = ""
+    section: str = ""
+    lane: str = ""
+    alley: str = ""
+    number: str = ""
+
+    def key(self, level: str, district: Optional[str] = None) -> str:
+        """
+        Build the index key of this address truncated to a level
+
+        Args:
+            level: One of LEVELS
+            district: Override the district (e.g. "" for the district-less key)
+
+        Returns:
+            str: Index key
+        """
+        values = [self.district if district is None else district, self.road, self.section]
+        values += [self.lane, self.alley, self.number]
+        keep = {"road": 2, "section": 3, "lane": 4, "alley": 5, "number": 6}[level]
+        return "|".join(values[:keep] + [""] * (6 - keep))
+
+    def levels(self) -> List[str]:
+        """Levels present in this address, most specific first (empty without a road)"""
+        if not self.road:
+            return []
+        return [level for level in LEVELS if level == "road" or getattr(self, level)]
+
+
+@dataclass(frozen=True)
+class ParsedAddress:
+    """
+    An address tokenized once into everything the geocoding pipeline needs
+
+    Attributes:
+        text: Address as given, without whitespace
+        key: Normalized spelling (half-width digits, 台, digit sections, "-" for 之)
+            shared by spelling variants; used as the geocode cache key
+        city: City or county ("" when absent)
+        parts: Normalized components, as indexed by the gazetteer
+        simplifications: Progressively shorter prefixes of ``text``, each without the
+            most detailed remaining number, alley, lane or section component
+    """
+
+    text: str
+    key: str
+    city: str
+    parts: AddressParts
+    simplifications: Tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
+def tokenize_address(address: str) -> ParsedAddress:
+    """
+    Parse an address (memoized)
+
+    Args:
+        address: Address string
+
+    Returns:
+        ParsedAddress: Tokenized address
+    """
+    text = re.sub(r"\s+", "", address)
+    # One character in, one character out, so offsets in `normalized` are offsets in `text`
+    normalized = text.translate(_FULLWIDTH)
+
+    # First occurrence of every numbered component, in one scan
+    spans: Dict[str, Tuple[int, int]] = {}
+    for match in _COMPONENT_RE.finditer(normalized):
+        spans.setdefault(match.lastgroup or "", match.span())
+
+    city, parts = _structure(normalized)
+    return ParsedAddress(
+        text=text,
+        key=_normalized_key(normalized, spans),
+        city=city,
+        parts=parts,
+        simplifications=_simplifications(text, spans),
+    )
+
+
+def parse_address(address: str) -> AddressParts:
+    """
+    Split a Taiwan address into district, road, section, lane, alley and number
+
+    Full-width digits and Chinese section numerals are normalized, so
+    "民生路二段８０號" and "民生路2段80號" produce the same parts.
+
+    Args:
+        address: Address string
+
+    Returns:
+        AddressParts: Parsed components
+    """
+    return tokenize_address(address).parts
+
+
+def normalize_component(level: str, value: str) -> str:
+    """
+    Normalize one numbered address component the way parsed addresses are
+
+    Used for components that arrive separately, such as the columns of an
+    address point CSV, so they match the parts of ``parse_address``.
+
+    Args:
+        level: Component level ("section", "lane", "alley" or "number")
+        value: Component, with or without its suffix (e.g. "二段", "８０之1")
+
+    Returns:
+        str: Normalized component without suffix ("2", "80-1"), "" when empty
+
+    Raises:
+        ValueError: When ``level`` is not a numbered component
+    """
+    if level not in _SUFFIXES:
+        raise ValueError(f"Not a numbered address component: {level}")
+
+    value = value.strip().translate(_FULLWIDTH).replace(_SUFFIXES[level], "")
+    if level == "section":
+        return _section_number(value)
+    if level == "number":
+        return value.replace("之", "-")
+    return value
+
+
+def _structure(normalized: str) -> Tuple[str, AddressParts]:
+    """Match the city and the ordered components of a normalized address"""
+    match = _ADDRESS_RE.match(normalized)
+    if match is None:
+        return "", AddressParts()
+
+    parts = match.groupdict(default="")
+    return parts["city"], AddressParts(
+        district=parts["district"],
+        road=parts["road"],
+        section=_section_number(parts["section"]),
+        lane=parts["lane"],
+        alley=parts["alley"],
+        number=parts["number"].replace("之", "-"),
+    )
+
+
+def _simplifications(text: str, spans: Dict[str, Tuple[int, int]]) -> Tuple[str, ...]:
+    """Cut the address before each component in turn, most detailed first"""
+    levels = []
+    end = len(text)
+    for kind in _SIMPLIFY_ORDER:
+        span = spans.get(kind)
+        if span is not None and span[0] < end:
+            end = span[0]
+            levels.append(text[:end].strip())
+    return tuple(levels)
+
+
+def _normalized_key(normalized: str, spans: Dict[str, Tuple[int, int]]) -> str:
+    """Rewrite the section and number tokens of a normalized address in canonical form"""
+    key = normalized
+    # Replace from the end so earlier offsets stay valid
+    for kind, (start, end) in sorted(spans.items(), key=lambda item: item[1], reverse=True):
+        token = normalized[start:end]
+        if kind == "section":
+            token = _section_number(token[:-1]) + "段"
+        elif kind == "number":
+            token = token.replace("之", "-")
+        key = key[:start] + token + key[end:]
+    return key
+
+
+def _section_number(value: str) -> str:
+    """Normalize a section number ("二", "十一", "2") to digits"""
+    if not value or value.isdigit():
+        return value.lstrip("0") or value
+    if "十" in value:
+        tens, _, ones = value.partition("十")
+        return str(_CHINESE_DIGITS.get(tens, 1) * 10 + _CHINESE_DIGITS.get(ones, 0))
+    return str(_CHINESE_DIGITS.get(value, 0) or "")
@@ -4,7 +4,9 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
-from trash_tracking_core.utils.logger import logger
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class ConfigError(Exception):
@@ -28,6 +30,28 @@ class ConfigManager:
         self.config = self._load_config()
         self._validate_config()
 
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "ConfigManager":
+        """
+        Create configuration manager from an in-memory dictionary
+
+        Used by tools (e.g. replay) that build a tracker without a config file.
+
+        Args:
+            config: Configuration content in the same layout as config.yaml
+
+        Returns:
+            ConfigManager: Validated configuration manager
+
+        Raises:
+            ConfigError: When required fields are missing or have invalid format
+        """
+        instance = cls.__new__(cls)
+        instance.config_path = Path("<memory>")
+        instance.config = config
+        instance._validate_config()
+        return instance
+
     def _load_config(self) -> Dict[str, Any]:
         """
         Load configuration file
@@ -1,48 +1,110 @@
 """Address Geocoding Utilities"""
 
 import re
-from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
-from trash_tracking_core.utils.logger import logger
+from trash_tracking_core.utils.address import tokenize_address
+from trash_tracking_core.utils.gazetteer import Gazetteer
+from trash_tracking_core.utils.geocode_cache import GeocodeCache
+from trash_tracking_core.utils.logger import get_logger
+from trash_tracking_core.utils.metrics import metrics
+from trash_tracking_core.utils.projection import twd97_to_wgs84
+from trash_tracking_core.utils.rate_limit import RateLimiter
+
+logger = get_logger(__name__)
 
 
 class GeocodingError(Exception):
     """Geocoding error"""
 
 
+ProviderQuery = Callable[[str, float], Optional[Tuple[float, float]]]
+
+
 class Geocoder:
     """Taiwan address to coordinates converter"""
 
-    def __init__(self):
-        self.base_url = "https://api.nlsc.gov.tw/other/TownVillagePointQuery"
+    # How providers are queried:
+    #   sequential: one after another (worst case is the sum of all timeouts)
+    #   concurrent: all at once
+    #   hedged: staggered by hedge_delay, later providers start only while no answer is in
+    MODES = ("sequential", "concurrent", "hedged")
+
+    # Services that can be rate limited (both Nominatim providers share "nominatim")
+    SERVICES = ("nlsc", "nominatim", "tgos")
+
+    def __init__(
+        self,
+        cache: Optional[GeocodeCache] = None,
+        mode: str = "sequential",
+        hedge_delay: float = 1.0,
+        deadline: Optional[float] = None,
+        gazetteer: Optional[Gazetteer] = None,
+        rate_limits: Optional[Dict[str, RateLimiter]] = None,
+    ):
+        """
+        Initialize geocoder
+
+        Args:
+            cache: Cache of results keyed by cleaned address (default: no caching)
+            mode: Provider query mode ("sequential", "concurrent" or "hedged")
+            hedge_delay: Seconds between provider starts in hedged mode
+            deadline: Overall time limit in seconds for concurrent and hedged modes
+                (default: the per-request timeout)
+            gazetteer: Offline address index consulted before any network provider
+            rate_limits: Limiters by service name (see SERVICES), shared by every
+                thread using this geocoder (e.g. Nominatim allows 1 request/second)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+        if hedge_delay < 0:
+            raise ValueError("hedge_delay must not be negative")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        unknown = set(rate_limits or {}) - set(self.SERVICES)
+        if unknown:
+            raise ValueError(f"Unknown rate-limited service(s): {', '.join(sorted(unknown))}")
 
-    def _try_simplified_addresses(self, address: str, timeout: int) -> Optional[Tuple[float, float]]:
+        self.base_url = "https://api.nlsc.gov.tw/other/TownVillagePointQuery"
+        self.cache = cache
+        self.mode = mode
+        self.hedge_delay = hedge_delay
+        self.deadline = deadline
+        self.gazetteer = gazetteer
+        self.rate_limits = dict(rate_limits or {})
+
+    def _try_simplified_addresses(
+        self, address: str, timeout: int, cancelled: Optional[threading.Event] = None
+    ) -> Optional[Tuple[float, float]]:
         """
         Try progressively simplified addresses with Nominatim
 
         Args:
             address: Cleaned address
             timeout: Request timeout
+            cancelled: Set when the result is no longer needed (a race was decided);
+                no further level is queried once it is set
 
         Returns:
             Optional[tuple]: (latitude, longitude) or None
         """
-        current_address = address
-        for attempt in range(4):
-            simplified = self._simplify_address(current_address)
-            if simplified == current_address:
-                break
+        for level, simplified in enumerate(tokenize_address(address).simplifications, start=1):
+            if cancelled is not None and cancelled.is_set():
+                logger.debug("Simplified address lookup cancelled before level %s", level)
+                return None
 
-            logger.info("Trying simplified address (level %s): {simplified}", attempt + 1)
+            logger.info("Trying simplified address (level %s): %s", level, simplified)
 
             result = self._query_nominatim(simplified, timeout)
             if result is not None and len(result) == 2:
                 logger.warning("Found coordinates using simplified address: %s", simplified)
                 return result
 
-            current_address = simplified
-
         return None
 
     def address_to_coordinates(self, address: str, timeout: int = 10) -> Tuple[float, float]:
@@ -60,43 +122,263 @@ class Geocoder:
             GeocodingError: When conversion fails
         """
         cleaned_address = self._clean_address(address)
+        cache_key = tokenize_address(cleaned_address).key
+
+        cached = self._lookup_cache(cache_key, address)
+        if cached is not None:
+            return cached
+
+        local = self._lookup_gazetteer(cleaned_address)
+        if local is not None:
+            return local
 
         try:
-            result = self._query_nlsc(cleaned_address, timeout)
-            if result is not None and len(result) == 2:
-                logger.info("NLSC API succeeded")
-                return result
+            result = self._query_providers(cleaned_address, timeout)
+            if result is None:
+                error_msg = self._not_found_message(address, cleaned_address)
+                if self.cache is not None:
+                    self.cache.put_failure(cache_key, error_msg)
+                raise GeocodingError(error_msg)
+
+            if self.cache is not None:
+                self.cache.put(cache_key, result)
+            return result
+
+        except GeocodingError:
+            raise
+        except requests.RequestException as e:
+            raise GeocodingError(f"地址查詢失敗: {e}")
+        except Exception as e:
+            raise GeocodingError(f"地址轉換錯誤: {e}")
+
+    def _lookup_cache(self, cache_key: str, address: str) -> Optional[Tuple[float, float]]:
+        """
+        Look up an address in the cache
+
+        Args:
+            cache_key: Normalized cleaned address (ParsedAddress.key)
+            address: Original address, for the error message
+
+        Returns:
+            Optional[tuple]: Cached (latitude, longitude), None on a miss or without cache
+
+        Raises:
+            GeocodingError: When the address is cached as not found
+        """
+        if self.cache is None:
+            return None
+
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            metrics.cache("geocoder", "address", "miss")
+            return None
+        metrics.cache("geocoder", "address", "hit")
+
+        if entry.coordinates is None:
+            logger.info("Geocode cache hit (failed lookup): %s", cache_key)
+            raise GeocodingError(entry.error or self._not_found_message(address, cache_key))
+
+        logger.info("Geocode cache hit: %s", cache_key)
+        return entry.coordinates
+
+    def _lookup_gazetteer(self, cleaned_address: str) -> Optional[Tuple[float, float]]:
+        """
+        Look up a cleaned address in the offline gazetteer
+
+        Only exact matches, or matches at lane level or finer, are used; a
+        numbered address that is only known down to its road goes to the network.
+
+        Args:
+            cleaned_address: Cleaned address
+
+        Returns:
+            Optional[tuple]: (latitude, longitude), None without a usable match
+        """
+        if self.gazetteer is None:
+            return None
+
+        match = self.gazetteer.lookup(cleaned_address)
+        if match is None or not (match.exact or match.level in ("number", "alley", "lane")):
+            return None
+
+        logger.info("Gazetteer hit (%s level): %s", match.level, cleaned_address)
+        return match.coordinates
+
+    def _not_found_message(self, address: str, cleaned_address: str) -> str:
+        """Build the user-facing error for an address no provider could find"""
+        simplified = self._simplify_address(cleaned_address)
+        error_msg = f"無法找到地址的座標: {address}\n\n"
+        error_msg += "建議解決方法：\n"
+        error_msg += "1. 使用 Google Maps 查詢你的地址，右鍵點擊位置，複製座標\n"
+        error_msg += "2. 然後使用座標執行: python3 cli.py --lat 緯度 --lng 經度\n"
+        error_msg += f"3. 或嘗試簡化地址，例如: {simplified}\n"
+        error_msg += "4. 或使用互動式設定手動輸入座標: python3 cli.py --setup"
+        return error_msg
+
+    def _providers(self, cancelled: Optional[threading.Event] = None) -> List[Tuple[str, ProviderQuery]]:
+        """
+        Providers in priority order
+
+        Args:
+            cancelled: Event stopping the multi-request simplified lookup between requests
+        """
+        return [
+            ("NLSC", self._query_nlsc),
+            ("Nominatim", self._query_nominatim),
+            ("Nominatim (simplified)", partial(self._try_simplified_addresses, cancelled=cancelled)),
+            ("TGOS", self._query_tgos),
+        ]
+
+    def _query_providers(self, cleaned_address: str, timeout: int) -> Optional[Tuple[float, float]]:
+        """
+        Query the providers in priority order: NLSC, Nominatim, simplified Nominatim, TGOS
+
+        Args:
+            cleaned_address: Cleaned address
+            timeout: Request timeout per provider call
+
+        Returns:
+            Optional[tuple]: (latitude, longitude) from the first provider that succeeds,
+                or None when every provider answered without a match
+
+        Raises:
+            GeocodingError: When no provider found the address and at least one of them
+                failed, or the deadline of a concurrent or hedged lookup passed
+        """
+        if self.mode != "sequential":
+            return self._race_providers(cleaned_address, timeout)
+
+        failures: List[str] = []
+        for name, query in self._providers():
+            try:
+                result = query(cleaned_address, timeout)
+            except requests.RequestException as e:
+                logger.debug("%s API 查詢失敗: %s", name, e)
+                failures.append(f"{name}: {e}")
+                continue
 
-            result = self._query_nominatim(cleaned_address, timeout)
             if result is not None and len(result) == 2:
-                logger.info("Nominatim API succeeded")
+                logger.info("%s API succeeded", name)
                 return result
 
-            result = self._try_simplified_addresses(cleaned_address, timeout)
+        self._raise_for_failures(failures)
+        return None
+
+    def _race_providers(self, cleaned_address: str, timeout: int) -> Optional[Tuple[float, float]]:
+        """
+        Query the providers in parallel and keep the first valid result in priority order
+
+        A provider's answer is accepted once every higher-priority provider has
+        failed, so a fast low-precision answer never overrides a slower precise one.
+        Providers that have not started yet are skipped as soon as an answer is
+        accepted; requests already in flight finish in the background and are ignored,
+        and the simplified Nominatim lookup sends no further requests.
+
+        Args:
+            cleaned_address: Cleaned address
+            timeout: Request timeout per provider call
+
+        Returns:
+            Optional[tuple]: (latitude, longitude), or None when every provider answered
+                without a match
+
+        Raises:
+            GeocodingError: When no provider found the address and at least one of them
+                failed, or the deadline passes before any provider succeeds
+        """
+        budget = self.deadline or float(timeout)
+        request_timeout = min(float(timeout), budget)
+        stagger = self.hedge_delay if self.mode == "hedged" else 0.0
+        deadline = time.monotonic() + budget
+        settled = threading.Event()
+        providers = self._providers(cancelled=settled)
+
+        def run(index: int, query: ProviderQuery) -> Optional[Tuple[float, float]]:
+            # Hedged providers wait their turn and give up if an answer arrived meanwhile
+            if settled.wait(index * stagger):
+                return None
+            return query(cleaned_address, request_timeout)
+
+        executor = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="geocode")
+        futures = [executor.submit(run, index, query) for index, (_, query) in enumerate(providers)]
+        try:
+            pending = set(futures)
+            while True:
+                winner = self._first_valid(providers, futures)
+                if winner is not None:
+                    return winner
+                if not pending:
+                    self._raise_for_failures(
+                        [
+                            f"{name}: {future.exception()}"
+                            for (name, _), future in zip(providers, futures)
+                            if self._failed(future)
+                        ]
+                    )
+                    return None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+            # Deadline passed: fall back to the best answer that did arrive
+            for future in futures:
+                result = self._result_of(future)
+                if future.done() and result is not None:
+                    return result
+            raise GeocodingError(f"地址查詢逾時: 所有服務在 {budget:.0f} 秒內皆未回應")
+        finally:
+            settled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _first_valid(
+        self,
+        providers: List[Tuple[str, ProviderQuery]],
+        futures: List["Future[Optional[Tuple[float, float]]]"],
+    ) -> Optional[Tuple[float, float]]:
+        """Return the highest-priority valid result once all higher-priority providers have finished"""
+        for (name, _), future in zip(providers, futures):
+            if not future.done():
+                return None
+            result = self._result_of(future)
             if result is not None:
+                logger.info("%s API succeeded", name)
                 return result
+        return None
 
-            result = self._query_tgos(cleaned_address, timeout)
-            if result is not None and len(result) == 2:
-                logger.info("TGOS API succeeded")
-                return result
+    @staticmethod
+    def _failed(future: "Future[Optional[Tuple[float, float]]]") -> bool:
+        """True when a finished provider call could not reach its service"""
+        return future.done() and not future.cancelled() and isinstance(future.exception(), requests.RequestException)
 
-            simplified = self._simplify_address(cleaned_address)
-            error_msg = f"無法找到地址的座標: {address}\n\n"
-            error_msg += "建議解決方法：\n"
-            error_msg += "1. 使用 Google Maps 查詢你的地址，右鍵點擊位置，複製座標\n"
-            error_msg += "2. 然後使用座標執行: python3 cli.py --lat 緯度 --lng 經度\n"
-            error_msg += f"3. 或嘗試簡化地址，例如: {simplified}\n"
-            error_msg += "4. 或使用互動式設定手動輸入座標: python3 cli.py --setup"
+    @staticmethod
+    def _raise_for_failures(failures: List[str]) -> None:
+        """
+        Raise when a provider failed, so an unreachable service is not taken for "not found"
 
-            raise GeocodingError(error_msg)
+        Args:
+            failures: "provider: error" for every provider that could not be reached
 
-        except GeocodingError:
-            raise
-        except requests.RequestException as e:
-            raise GeocodingError(f"地址查詢失敗: {e}")
+        Raises:
+            GeocodingError: When ``failures`` is not empty
+        """
+        if failures:
+            raise GeocodingError(f"地址查詢失敗: {'; '.join(failures)}")
+
+    @staticmethod
+    def _result_of(
+        future: "Future[Optional[Tuple[float, float]]]",
+    ) -> Optional[Tuple[float, float]]:
+        """Result of a finished provider call; provider errors count as no result"""
+        if not future.done() or future.cancelled():
+            return None
+        try:
+            result = future.result()
         except Exception as e:
-            raise GeocodingError(f"地址轉換錯誤: {e}")
+            logger.debug("Geocoding provider failed: %s", e)
+            return None
+        return result if result is not None and len(result) == 2 else None
 
     def _clean_address(self, address: str) -> str:
         """
@@ -126,20 +408,8 @@ class Geocoder:
         Returns:
             str: Simplified address (one level up)
         """
-
-        if re.search(r"\d+號", address):
-            return re.sub(r"\d+號.*", "", address).strip()
-
-        if re.search(r"\d+弄", address):
-            return re.sub(r"\d+弄.*", "", address).strip()
-
-        if re.search(r"\d+巷", address):
-            return re.sub(r"\d+巷.*", "", address).strip()
-
-        if re.search(r"\d+段", address):
-            return re.sub(r"\d+段.*", "", address).strip()
-
-        return address
+        simplifications = tokenize_address(address).simplifications
+        return simplifications[0] if simplifications else address
 
     def _query_tgos(self, address: str, timeout: int) -> Optional[Tuple[float, float]]:
         """
@@ -150,31 +420,42 @@ class Geocoder:
             timeout: Request timeout
 
         Returns:
-            Optional[tuple]: (latitude, longitude) or None
+            Optional[tuple]: (latitude, longitude), None when TGOS has no match
+
+        Raises:
+            requests.RequestException: When TGOS cannot be reached or fails
         """
         try:
             url = "https://addr.tgos.tw/addrapi/addr"
             params: Dict[str, Any] = {"addr": address, "type": "json"}
 
-            response = requests.get(url, params=params, timeout=timeout)
-            response.raise_for_status()
-
-            data = response.json()
-
-            if isinstance(data, dict) and "AddressList" in data:
-                addr_list = data.get("AddressList", [])
-                if addr_list and len(addr_list) > 0:
-                    first = addr_list[0]
-                    x = first.get("X")
-                    y = first.get("Y")
-
-                    if x and y:
-                        lat, lng = self._twd97_to_wgs84(float(x), float(y))
-                        logger.info("TGOS API succeeded: %s -> ({lat}, {lng})", address)
-                        return (lat, lng)
-
+            self._throttle("tgos")
+            with metrics.call("tgos", "addr") as call:
+                response = requests.get(url, params=params, timeout=timeout)
+                call.bytes = len(response.content)
+                response.raise_for_status()
+
+                with call.parsing():
+                    data = response.json()
+
+                if isinstance(data, dict) and "AddressList" in data:
+                    addr_list = data.get("AddressList", [])
+                    if addr_list and len(addr_list) > 0:
+                        first = addr_list[0]
+                        x = first.get("X")
+                        y = first.get("Y")
+
+                        if x and y:
+                            lat, lng = self._twd97_to_wgs84(float(x), float(y))
+                            logger.info("TGOS API succeeded: %s -> (%s, %s)", address, lat, lng)
+                            return (lat, lng)
+                call.status = "empty"
+
+        except requests.RequestException:
+            # Unreachable or failing service: not the same as "address not found"
+            raise
         except Exception as e:
-            logger.debug("TGOS API 查詢失敗: %s", e)
+            logger.debug("TGOS API 回應無法解析: %s", e)
 
         return None
 
@@ -187,27 +468,38 @@ class Geocoder:
             timeout: Request timeout
 
         Returns:
-            Optional[tuple]: (latitude, longitude) or None
+            Optional[tuple]: (latitude, longitude), None when NLSC has no match
+
+        Raises:
+            requests.RequestException: When NLSC cannot be reached or fails
         """
         try:
             params: Dict[str, str] = {"addr": address, "format": "json"}
-            response = requests.get(self.base_url, params=params, timeout=timeout)
-            response.raise_for_status()
-
-            data = response.json()
-
-            if isinstance(data, list) and len(data) > 0:
-                result = data[0]
-                x = float(result.get("x", 0))
-                y = float(result.get("y", 0))
-
-                if x > 0 and y > 0:
-                    lat, lng = self._twd97_to_wgs84(x, y)
-                    logger.info("NLSC API succeeded: %s -> ({lat}, {lng})", address)
-                    return (lat, lng)
+            self._throttle("nlsc")
+            with metrics.call("nlsc", "TownVillagePointQuery") as call:
+                response = requests.get(self.base_url, params=params, timeout=timeout)
+                call.bytes = len(response.content)
+                response.raise_for_status()
+
+                with call.parsing():
+                    data = response.json()
+
+                if isinstance(data, list) and len(data) > 0:
+                    result = data[0]
+                    x = float(result.get("x", 0))
+                    y = float(result.get("y", 0))
+
+                    if x > 0 and y > 0:
+                        lat, lng = self._twd97_to_wgs84(x, y)
+                        logger.info("NLSC API succeeded: %s -> (%s, %s)", address, lat, lng)
+                        return (lat, lng)
+                call.status = "empty"
 
+        except requests.RequestException:
+            # Unreachable or failing service: not the same as "address not found"
+            raise
         except Exception as e:
-            logger.debug("NLSC API 查詢失敗: %s", e)
+            logger.debug("NLSC API 回應無法解析: %s", e)
 
         return None
 
@@ -220,47 +512,58 @@ class Geocoder:
             timeout: Request timeout
 
         Returns:
-            Optional[tuple]: (latitude, longitude) or None
+            Optional[tuple]: (latitude, longitude), None when Nominatim has no match
+
+        Raises:
+            requests.RequestException: When Nominatim cannot be reached or fails
         """
         try:
             url = "https://nominatim.openstreetmap.org/search"
-            params: Dict[str, Any] = {"q": address, "format": "json", "limit": 1, "countrycodes": "tw"}
+            params: Dict[str, Any] = {
+                "q": address,
+                "format": "json",
+                "limit": 1,
+                "countrycodes": "tw",
+            }
             headers: Dict[str, str] = {"User-Agent": "TrashTrackingSystem/1.0"}
 
-            response = requests.get(url, params=params, headers=headers, timeout=timeout)
-            response.raise_for_status()
+            self._throttle("nominatim")
+            with metrics.call("nominatim", "search") as call:
+                response = requests.get(url, params=params, headers=headers, timeout=timeout)
+                call.bytes = len(response.content)
+                response.raise_for_status()
 
-            data = response.json()
+                with call.parsing():
+                    data = response.json()
 
-            if data and len(data) > 0:
-                lat = float(data[0]["lat"])
-                lng = float(data[0]["lon"])
-                logger.info("Nominatim API succeeded: %s -> ({lat}, {lng})", address)
-                return (lat, lng)
+                if data and len(data) > 0:
+                    lat = float(data[0]["lat"])
+                    lng = float(data[0]["lon"])
+                    logger.info("Nominatim API succeeded: %s -> (%s, %s)", address, lat, lng)
+                    return (lat, lng)
+                call.status = "empty"
 
+        except requests.RequestException:
+            # Unreachable or failing service: not the same as "address not found"
+            raise
         except Exception as e:
-            logger.debug("Nominatim API 查詢失敗: %s", e)
+            logger.debug("Nominatim API 回應無法解析: %s", e)
 
         return None
 
+    def _throttle(self, service: str) -> None:
+        """Wait for the rate limiter of a service, if one is configured"""
+        limiter = self.rate_limits.get(service)
+        if limiter is not None:
+            limiter.acquire()
+
     def _twd97_to_wgs84(self, x: float, y: float) -> Tuple[float, float]:
         """
-        Convert TWD97 to WGS84 (simplified approximation)
+        Convert TWD97 TM2 coordinates (as returned by TGOS/NLSC) to WGS84
 
-        Note: For production use, consider using pyproj library for accurate conversion
+        See trash_tracking_core.utils.projection.twd97_to_wgs84.
         """
-        a = 6378137.0
-        lon0 = 121.0 * 3.14159265358979 / 180.0
-        k0 = 0.9999
-        dx = 250000
-
-        lng = lon0 + (x - dx) / (a * k0)
-        lat = y / (a * k0 * (1 - (1 / 298.257222101)))
-
-        lat = lat * 180.0 / 3.14159265358979
-        lng = lng * 180.0 / 3.14159265358979
-
-        return (lat, lng)
+        return twd97_to_wgs84(x, y)
 
 
 def get_current_location_from_address(address: str) -> Tuple[float, float]:
@@ -0,0 +1,72 @@
+"""Request Rate Limiting"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls at least ``1 / rate`` seconds apart.
+
+    Every ``acquire`` reserves the next free slot under a lock and then sleeps
+    outside it until that slot, so concurrent callers are served in arrival
+    order and N callers take (N - 1) / rate seconds. Up to ``burst`` calls may
+    go out back to back after an idle period.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate: Sustained calls per second
+            burst: Calls allowed back to back after being idle
+            clock: Monotonic clock (for tests)
+            sleep: Sleep function (for tests)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.interval = 1.0 / rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # Theoretical arrival time of the next call (GCRA); `burst` calls may run ahead of it
+        self._tat = clock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a slot
+
+        Args:
+            timeout: Give up (without consuming a slot) if the wait would be longer
+
+        Returns:
+            bool: True when the call may proceed, False when timed out
+        """
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            wait = max(0.0, tat - (self.burst - 1) * self.interval - now)
+            if timeout is not None and wait > timeout:
+                return False
+            self._tat = tat + self.interval
+
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def __str__(self) -> str:
+        """Return string representation of limiter"""
+        return f"RateLimiter({self.rate:g}/s, burst={self.burst})"
@@ -5,7 +5,9 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from trash_tracking_core.models.truck import TruckLine
-from trash_tracking_core.utils.logger import logger
+from trash_tracking_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -218,6 +220,6 @@ class RouteAnalyzer:
         # Sort by nearest point distance
         recommendations.sort(key=lambda r: r.nearest_point.distance_meters)
 
-        logger.info("分析了 %s 條路線，產生 {len(recommendations)} 個推薦", len(trucks))
+        logger.info("分析了 %s 條路線，產生 %s 個推薦", len(trucks), len(recommendations))
 
         return recommendations
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Build the offline address gazetteer from a CSV of address points
+
+The CSV needs road, lat and lng columns (English headers or the Chinese headers
+of the national address-point open data: 鄉鎮市區, 街路段, 巷, 弄, 號, 緯度, 經度).
+
+Usage:
+    python3 scripts/build_gazetteer.py addresses.csv -o trash_tracking_gazetteer.db
+    python3 scripts/build_gazetteer.py addresses.csv -o gazetteer.db --lookup "板橋區民生路二段80號"
+"""
+
+import argparse
+import sys
+import time
+
+from trash_tracking_core.utils.gazetteer import Gazetteer, GazetteerError, build_gazetteer_from_csv
+
+
+def main() -> int:
+    """Build the index and optionally try some lookups"""
+    parser = argparse.ArgumentParser(description="Compile address points into an offline gazetteer index")
+    parser.add_argument("csv", help="Address point CSV file")
+    parser.add_argument("-o", "--output", default="trash_tracking_gazetteer.db", help="Output index path")
+    parser.add_argument("--encoding", default="utf-8-sig", help="CSV encoding (default: utf-8-sig)")
+    parser.add_argument("--lookup", nargs="*", default=[], help="Addresses to look up after building")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        points = build_gazetteer_from_csv(args.csv, args.output, encoding=args.encoding)
+    except (OSError, UnicodeDecodeError, GazetteerError) as e:
+        print(f"❌ Build failed: {e}", file=sys.stderr)
+        return 1
+    print(f"✅ Indexed {points} address point(s) into {args.output} in {time.perf_counter() - started:.1f}s")
+
+    if args.lookup:
+        with Gazetteer(args.output) as gazetteer:
+            for address in args.lookup:
+                match = gazetteer.lookup(address)
+                if match is None:
+                    print(f"   {address}: not found")
+                else:
+                    print(f"   {address}: ({match.lat:.6f}, {match.lng:.6f}) [{match.level}, {match.points} point(s)]")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
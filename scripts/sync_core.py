@@ -6,12 +6,20 @@ This script:
 1. Copies all files from packages/core/trash_tracking_core/ to custom_components/trash_tracking/trash_tracking_core/
 2. Converts absolute imports to relative imports for Home Assistant compatibility
 3. Preserves directory structure and maintains code consistency
+4. Leaves out the development-only modules (DEV_ONLY_MODULES)
 """
 
 import re
 import shutil
 from pathlib import Path
 
+# Development tools that Home Assistant never imports (paths relative to the package)
+DEV_ONLY_MODULES = {
+    'core/load_test.py',
+    'core/replay.py',
+    'core/simulator.py',
+}
+
 
 def convert_imports(content: str) -> str:
     """
@@ -58,8 +66,18 @@ def sync_directory(src_dir: Path, dst_dir: Path):
         print(f"   Removing existing {dst_dir}")
         shutil.rmtree(dst_dir)
 
-    # Copy entire directory
-    shutil.copytree(src_dir, dst_dir, ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '*.pyo'))
+    ignore_cache = shutil.ignore_patterns('__pycache__', '*.pyc', '*.pyo')
+
+    def ignore(directory, names):
+        """Skip caches and the development-only modules"""
+        ignored = set(ignore_cache(directory, names))
+        for name in names:
+            if (Path(directory) / name).relative_to(src_dir).as_posix() in DEV_ONLY_MODULES:
+                ignored.add(name)
+        return ignored
+
+    # Copy entire directory (except the development-only modules)
+    shutil.copytree(src_dir, dst_dir, ignore=ignore)
 
     # Convert all Python files
     python_files = list(dst_dir.rglob('*.py'))
@@ -0,0 +1,104 @@
+"""Tests for Asynchronous NTPC API Client"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from trash_tracking_core.clients.async_ntpc_api import AsyncNTPCApiClient
+from trash_tracking_core.clients.ntpc_api import NTPCApiError
+from trash_tracking_core.utils.metrics import HistogramSink, metrics
+
+
+class SlowClient:
+    """Blocking client that takes a while and counts its requests"""
+
+    def __init__(self, delay=0.05, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_around_points(self, lat, lng, time_filter=0, week=None):
+        with self._lock:
+            self.calls.append((lat, lng, time_filter, week))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return [f"route at {lat},{lng}"]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestAsyncNTPCApiClient:
+    """Tests for AsyncNTPCApiClient"""
+
+    def test_rejects_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            AsyncNTPCApiClient(SlowClient(), max_concurrency=0)
+
+    async def test_concurrent_identical_queries_share_one_request(self):
+        blocking = SlowClient()
+        client = AsyncNTPCApiClient(blocking)
+        sink = HistogramSink()
+        metrics.add_sink(sink)
+        try:
+            results = await asyncio.gather(*(client.get_around_points(25.0, 121.5) for _ in range(5)))
+        finally:
+            metrics.remove_sink(sink)
+
+        assert len(blocking.calls) == 1
+        assert all(result == ["route at 25.0,121.5"] for result in results)
+        assert sink.snapshot()["cache"]["ntpc/GetAroundPoints"]["coalesced"] == 4
+
+    async def test_distinct_queries_are_not_shared(self):
+        blocking = SlowClient()
+        client = AsyncNTPCApiClient(blocking)
+
+        await asyncio.gather(client.get_around_points(25.0, 121.5), client.get_around_points(25.0, 121.5, week=2))
+
+        assert len(blocking.calls) == 2
+
+    async def test_finished_request_is_not_reused(self):
+        blocking = SlowClient(delay=0)
+        client = AsyncNTPCApiClient(blocking)
+
+        await client.get_around_points(25.0, 121.5)
+        await client.get_around_points(25.0, 121.5)
+
+        assert len(blocking.calls) == 2
+
+    async def test_concurrency_is_bounded(self):
+        blocking = SlowClient()
+        client = AsyncNTPCApiClient(blocking, max_concurrency=2)
+
+        await asyncio.gather(*(client.get_around_points(25.0, 121.5 + i / 100) for i in range(6)))
+
+        assert blocking.max_active == 2
+
+    async def test_error_reaches_every_caller(self):
+        client = AsyncNTPCApiClient(SlowClient(error=NTPCApiError("down")))
+
+        results = await asyncio.gather(
+            client.get_around_points(25.0, 121.5), client.get_around_points(25.0, 121.5), return_exceptions=True
+        )
+
+        assert all(isinstance(result, NTPCApiError) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        blocking = SlowClient()
+        client = AsyncNTPCApiClient(blocking)
+
+        first = asyncio.ensure_future(client.get_around_points(25.0, 121.5))
+        second = asyncio.ensure_future(client.get_around_points(25.0, 121.5))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == ["route at 25.0,121.5"]
+        assert len(blocking.calls) == 1
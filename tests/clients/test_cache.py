@@ -0,0 +1,85 @@
+"""Tests for the response cache"""
+import threading
+
+import pytest
+from trash_tracking_core.clients.cache import ResponseCache, StripedCache
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    """Tests for the ResponseCache interface"""
+
+    def test_is_abstract(self):
+        with pytest.raises(TypeError):
+            ResponseCache()
+
+
+class TestStripedCache:
+    """Tests for StripedCache"""
+
+    def test_rejects_no_stripes(self):
+        with pytest.raises(ValueError):
+            StripedCache(stripes=0)
+
+    def test_get_missing(self):
+        assert StripedCache().get("missing", max_age=60) is None
+
+    def test_put_and_get(self):
+        cache = StripedCache()
+        cache.put("key", [1, 2])
+        assert cache.get("key", max_age=60) == [1, 2]
+
+    def test_expired_entry_is_dropped(self):
+        clock = FakeClock()
+        cache = StripedCache(clock=clock)
+        cache.put("key", "value")
+
+        clock.now = 60
+        assert cache.get("key", max_age=60) == "value"
+
+        clock.now = 61
+        assert cache.get("key", max_age=60) is None
+        assert len(cache) == 0
+
+    def test_max_age_is_per_read(self):
+        clock = FakeClock()
+        cache = StripedCache(clock=clock)
+        cache.put("key", "value")
+        clock.now = 30
+
+        assert cache.get("key", max_age=60) == "value"
+        assert cache.get("key", max_age=10) is None
+
+    def test_clear(self):
+        cache = StripedCache(stripes=4)
+        for i in range(20):
+            cache.put(f"key{i}", i)
+        assert len(cache) == 20
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_concurrent_writers(self):
+        cache = StripedCache(stripes=4)
+
+        def write(prefix):
+            for i in range(200):
+                cache.put(f"{prefix}{i}", i)
+                assert cache.get(f"{prefix}{i}", max_age=60) == i
+
+        threads = [threading.Thread(target=write, args=(f"t{n}-",)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 8 * 200
@@ -0,0 +1,164 @@
+"""Tests for GetAroundPoints response decoding"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from trash_tracking_core.clients.decoding import (
+    JSON_BACKENDS,
+    available_json_backends,
+    decode_around_points,
+    default_json_backend,
+    parse_around_points,
+)
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.core.simulator import NTPCSimulator
+from trash_tracking_core.models.truck import TruckLine
+
+
+def make_line_data(line_id="L001", points=3):
+    return {
+        "LineID": line_id,
+        "LineName": f"Route {line_id}",
+        "Area": "板橋區",
+        "ArrivalRank": 1,
+        "Diff": -2,
+        "CarNO": "KKA-1234",
+        "Location": "民生路二段1號",
+        "LocationLat": 25.0176,
+        "LocationLon": 121.4626,
+        "BarCode": "BC001",
+        "Point": [
+            {
+                "SourcePointID": 1000 + rank,
+                "Vil": "文化里",
+                "PointName": f"民生路二段{rank}號",
+                "Lon": 121.4625,
+                "Lat": 25.0175,
+                "PointID": rank,
+                "PointRank": rank,
+                "PointTime": "18:00",
+                "Arrival": "18:01" if rank == 1 else "",
+                "ArrivalDiff": 1 if rank == 1 else 65535,
+                "FixedPoint": 1,
+                "PointWeekKnd": "1,2,4,5,6",
+                "InScope": "Y",
+                "LikeCount": 3,
+            }
+            for rank in range(1, points + 1)
+        ],
+    }
+
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+@pytest.fixture(params=JSON_BACKENDS)
+def backend(request):
+    """Every JSON backend installed here"""
+    if request.param not in available_json_backends():
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+class TestBackends:
+    """Tests for the backend selection"""
+
+    def test_stdlib_is_always_available(self):
+        assert available_json_backends()[-1] == "json"
+
+    def test_default_is_fastest_installed(self):
+        assert default_json_backend() == available_json_backends()[0]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            decode_around_points(b"{}", "yaml")
+
+
+class TestDecodeAroundPoints:
+    """Every backend decodes like the generic path"""
+
+    def test_routes(self, backend):
+        data = {"TimeStamp": "2026-01-05 18:00:00", "Line": [make_line_data("L001"), make_line_data("L002", 5)]}
+
+        payload = decode_around_points(encode(data), backend)
+
+        assert payload.timestamp == "2026-01-05 18:00:00"
+        assert payload.lines == [TruckLine.from_dict(line) for line in data["Line"]]
+
+    def test_missing_fields_get_model_defaults(self, backend):
+        data = {"Line": [{"LineName": "A12", "Point": [{"PointName": "P1"}]}]}
+
+        (line,) = decode_around_points(encode(data), backend).lines
+
+        assert line == TruckLine.from_dict(data["Line"][0])
+        assert line.points[0].point_id is None
+        assert line.points[0].arrival_diff == 65535
+
+    def test_unexpected_field_types_are_kept(self, backend):
+        data = {"Line": [make_line_data()]}
+        data["Line"][0]["Point"][0]["PointRank"] = "1"
+
+        (line,) = decode_around_points(encode(data), backend).lines
+
+        assert line.points[0].point_rank == "1"
+
+    def test_no_line_field(self, backend):
+        payload = decode_around_points(encode({"TimeStamp": "t"}), backend)
+
+        assert payload.lines is None
+        assert payload.timestamp == "t"
+
+    def test_null_line_field(self, backend):
+        assert decode_around_points(b'{"Line": null}', backend).lines == []
+
+    def test_not_an_object(self, backend):
+        assert decode_around_points(b"[]", backend) is None
+
+    def test_invalid_json(self, backend):
+        with pytest.raises(ValueError):
+            decode_around_points(b'{"Line": [', backend)
+
+
+class TestParseAroundPoints:
+    """Tests for the generic path"""
+
+    def test_bad_route_is_skipped(self):
+        payload = parse_around_points({"Line": [make_line_data(), "not a route"]})
+
+        assert [line.line_id for line in payload.lines] == ["L001"]
+
+
+class TestClientBackend:
+    """Tests for NTPCApiClient's json_backend"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_session(self):
+        SessionManager.default().close()
+        yield
+        SessionManager.default().close()
+
+    def test_rejects_unavailable_backend(self):
+        with pytest.raises(ValueError):
+            NTPCApiClient(json_backend="yaml")
+
+    def test_defaults_to_fastest(self):
+        assert NTPCApiClient().json_backend == default_json_backend()
+
+    def test_query_with_backend(self, backend):
+        route = TruckLine.from_dict(make_line_data())
+        with NTPCSimulator([route]) as simulator:
+            client = NTPCApiClient(base_url=simulator.base_url, cache_enabled=False, json_backend=backend)
+            lines = client.get_around_points(25.0175, 121.4625)
+
+        assert [line.line_id for line in lines] == ["L001"]
+
+    def test_invalid_json_fails_query(self, backend, monkeypatch):
+        client = NTPCApiClient(base_url="http://127.0.0.1:9", cache_enabled=False, retry_count=1, json_backend=backend)
+        response = MagicMock(content=b"{")
+        response.json.side_effect = lambda: json.loads(response.content)
+        monkeypatch.setattr(SessionManager.default().session, "post", lambda *args, **kwargs: response)
+
+        with pytest.raises(NTPCApiError, match="JSON parse error"):
+            client.get_around_points(25.0, 121.5)
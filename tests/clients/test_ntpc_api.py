@@ -1,10 +1,31 @@
 """Tests for NTPC API Client"""
+import json
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from trash_tracking_core.clients.cache import StripedCache
 from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
-from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.core.simulator import FaultProfile, NTPCSimulator
+from trash_tracking_core.models.pool import PointPool
+from trash_tracking_core.models.snapshot import LineSnapshot, PollSnapshot
+from trash_tracking_core.utils.geohash import tile_center
+from trash_tracking_core.utils.metrics import HistogramSink, metrics
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    """Open the shared session inside each test, so patched sessions do not leak"""
+    SessionManager.default().close()
+    yield
+    SessionManager.default().close()
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json(monkeypatch):
+    """The mocked responses implement .json(), the standard library backend's input"""
+    monkeypatch.setattr("trash_tracking_core.clients.ntpc_api.default_json_backend", lambda: "json")
 
 
 @pytest.fixture
@@ -124,8 +145,8 @@ class TestGetAroundPoints:
         result = client.get_around_points(25.018, 121.471, 0, None)
 
         assert len(result) == 2
-        assert isinstance(result[0], TruckLine)
-        assert isinstance(result[1], TruckLine)
+        assert isinstance(result[0], LineSnapshot)
+        assert isinstance(result[1], LineSnapshot)
         assert result[0].line_name == "Route A"
         assert result[1].line_name == "Route B"
 
@@ -282,8 +303,26 @@ class TestCacheHitAndMiss:
         assert len(result2) == 1
         assert mock_session.return_value.post.call_count == 1  # Still 1, not 2!
 
-        # Results should be identical
-        assert result1[0].line_name == result2[0].line_name
+        # Results should be identical: the cached snapshot's routes, not copies
+        assert result2[0] is result1[0]
+
+    @patch("trash_tracking_core.clients.ntpc_api.requests.Session")
+    def test_response_size_is_per_call(self, mock_session, sample_api_response):
+        """A download reports its body size, a cache hit none"""
+        NTPCApiClient.clear_cache()
+        mock_response = MagicMock()
+        mock_response.json.return_value = sample_api_response
+        mock_response.content = json.dumps(sample_api_response).encode()
+        mock_session.return_value.post.return_value = mock_response
+
+        client = NTPCApiClient(cache_enabled=True, json_backend="json")
+
+        _, downloaded = client.get_around_points_with_size(25.018, 121.471)
+        lines, cached = client.get_around_points_with_size(25.018, 121.471)
+
+        assert downloaded == len(mock_response.content)
+        assert cached is None
+        assert len(lines) == 1
 
     @patch("trash_tracking_core.clients.ntpc_api.requests.Session")
     def test_cache_disabled_makes_api_calls(self, mock_session, sample_api_response):
@@ -318,22 +357,23 @@ class TestCacheExpiration:
         NTPCApiClient.clear_cache()
         original_ttl = NTPCApiClient._cache_ttl
         NTPCApiClient._cache_ttl = 1  # 1 second
+        client = NTPCApiClient()
 
         try:
             # Put data in cache
             cache_key = "test_key"
             test_data = []  # Use empty list for simplicity
-            NTPCApiClient._put_in_cache(cache_key, test_data)
+            client._put_in_cache(cache_key, test_data)
 
             # Should be in cache
-            cached = NTPCApiClient._get_from_cache(cache_key)
+            cached = client._get_from_cache(cache_key)
             assert cached is not None
 
             # Wait for expiration
             time.sleep(1.5)
 
             # Should be expired
-            cached = NTPCApiClient._get_from_cache(cache_key)
+            cached = client._get_from_cache(cache_key)
             assert cached is None
 
         finally:
@@ -344,20 +384,21 @@ class TestCacheExpiration:
     def test_clear_cache(self):
         """Test cache clearing"""
         NTPCApiClient.clear_cache()
+        client = NTPCApiClient()
 
         # Add some data
         cache_key = "test_key"
         test_data = []  # Use empty list for simplicity
-        NTPCApiClient._put_in_cache(cache_key, test_data)
+        client._put_in_cache(cache_key, test_data)
 
         # Verify it's there
-        assert NTPCApiClient._get_from_cache(cache_key) is not None
+        assert client._get_from_cache(cache_key) is not None
 
         # Clear cache
         NTPCApiClient.clear_cache()
 
         # Should be gone
-        assert NTPCApiClient._get_from_cache(cache_key) is None
+        assert client._get_from_cache(cache_key) is None
 
 
 class TestCacheSharing:
@@ -387,3 +428,130 @@ class TestCacheSharing:
         result2 = client2.get_around_points(25.018, 121.471, 0, None)
         assert len(result2) == 1
         assert mock_session.return_value.post.call_count == 1  # Still 1!
+
+    def test_own_cache_backend_is_not_shared(self):
+        """A client created with a cache backend keeps it to itself"""
+        own = StripedCache()
+        client = NTPCApiClient(cache_backend=own)
+        client._put_in_cache("key", [])
+
+        assert own.get("key", max_age=60) == []
+        assert NTPCApiClient()._get_from_cache("key") is None
+
+
+class TestPointPooling:
+    """Test reusing points across uncached queries"""
+
+    def test_clients_share_pooled_strings(self, make_line):
+        pool = PointPool()
+        with NTPCSimulator([make_line(points=1)]) as simulator:
+            first = NTPCApiClient(base_url=simulator.base_url, cache_enabled=False, point_pool=pool)
+            second = NTPCApiClient(base_url=simulator.base_url, cache_enabled=False, point_pool=pool)
+            first_point = first.get_around_points(25.0, 121.5)[0].points[0]
+            second_point = second.get_around_points(25.0, 121.5)[0].points[0]
+
+        assert second_point is not first_point
+        assert second_point.point_name is first_point.point_name
+        assert pool.stats.reused == 1
+
+    def test_pooling_is_off_by_default(self):
+        assert NTPCApiClient().point_pool is None
+
+
+class TestFrozenResponses:
+    """Test that responses are frozen once and shared, not copied"""
+
+    def test_cache_holds_the_returned_routes(self, make_line):
+        own = StripedCache()
+        with NTPCSimulator([make_line(points=2)]) as simulator:
+            client = NTPCApiClient(base_url=simulator.base_url, cache_backend=own)
+            lines = client.get_around_points(25.0, 121.5)
+
+        cached = own.get(client._get_cache_key(25.0, 121.5, 0, None), max_age=60)
+        assert isinstance(cached, PollSnapshot)
+        assert cached.lines[0] is lines[0]
+
+    def test_unchanged_routes_are_shared_across_downloads(self, make_line):
+        with NTPCSimulator([make_line("L001", points=2), make_line("L002", points=2)]) as simulator:
+            client = NTPCApiClient(base_url=simulator.base_url, cache_enabled=False)
+            first = client.get_around_points(25.0, 121.5)
+            second = client.get_around_points(25.0, 121.5)
+
+        assert second is not first
+        assert [a is b for a, b in zip(first, second)] == [True, True]
+        assert PollSnapshot.from_lines(second, PollSnapshot.from_lines(first)).changed_since(
+            PollSnapshot.from_lines(first)
+        ) == ()
+
+
+class TestInstrumentation:
+    """Upstream calls and cache lookups are reported to the metrics sinks"""
+
+    @pytest.fixture
+    def sink(self):
+        NTPCApiClient.clear_cache()
+        sink = HistogramSink()
+        metrics.add_sink(sink)
+        yield sink
+        metrics.remove_sink(sink)
+        NTPCApiClient.clear_cache()
+
+    def test_successful_call_and_cache_hit(self, sink):
+        with NTPCSimulator([], faults=FaultProfile()) as simulator:
+            client = NTPCApiClient(base_url=simulator.base_url)
+            client.get_around_points(25.0, 121.5)
+            client.get_around_points(25.0, 121.5)
+
+        snapshot = sink.snapshot()
+        calls = snapshot["calls"]["ntpc/GetAroundPoints"]
+        assert calls["count"] == 1 and calls["statuses"] == {"ok": 1}
+        assert calls["bytes"] > 0
+        assert snapshot["cache"]["ntpc/GetAroundPoints"] == {"hit": 1, "miss": 1, "coalesced": 0}
+
+    def test_failed_attempts_are_counted_as_retries(self, sink):
+        with NTPCSimulator([], faults=FaultProfile(error_rate=1.0)) as simulator:
+            client = NTPCApiClient(base_url=simulator.base_url, retry_count=3, retry_delay=0, cache_enabled=False)
+            with pytest.raises(NTPCApiError):
+                client.get_around_points(25.0, 121.5)
+
+        calls = sink.snapshot()["calls"]["ntpc/GetAroundPoints"]
+        assert calls["statuses"] == {"http_500": 3}
+        assert calls["retries"] == 2
+        assert "ntpc/GetAroundPoints" not in sink.snapshot()["cache"]
+
+
+class TestTiledMode:
+    """Test tiled queries shared by nearby locations"""
+
+    @pytest.fixture
+    def post(self, sample_multi_line_response):
+        """Mocked POST answering every query with two routes"""
+        NTPCApiClient.clear_cache()
+        with patch("trash_tracking_core.clients.ntpc_api.requests.Session") as mock_session:
+            mock_session.return_value.post.return_value.json.return_value = sample_multi_line_response
+            yield mock_session.return_value.post
+
+    def test_neighbours_share_one_query(self, post):
+        first = NTPCApiClient(tile_precision=7)
+        second = NTPCApiClient(tile_precision=7)
+
+        first.get_around_points(25.0001, 121.5001)
+        second.get_around_points(25.0003, 121.4995)
+
+        assert post.call_count == 1
+        payload = post.call_args.kwargs["data"]
+        assert (payload["lat"], payload["lng"]) == tile_center(25.0001, 121.5001, 7)
+
+    def test_routes_are_filtered_by_distance(self, post):
+        near = NTPCApiClient(tile_precision=7, tile_radius=300).get_around_points(25.0001, 121.5001)
+        wide = NTPCApiClient(tile_precision=7, tile_radius=3000).get_around_points(25.0001, 121.5001)
+
+        assert [line.line_name for line in near] == ["Route A"]
+        assert [line.line_name for line in wide] == ["Route A", "Route B"]
+
+    def test_untiled_queries_exact_location(self, post):
+        lines = NTPCApiClient().get_around_points(25.0001, 121.5001)
+
+        payload = post.call_args.kwargs["data"]
+        assert (payload["lat"], payload["lng"]) == (25.0001, 121.5001)
+        assert len(lines) == 2
@@ -0,0 +1,147 @@
+"""Tests for filtered route queries"""
+import pytest
+from trash_tracking_core.clients.route_query import RouteQuery, time_filter_for
+from trash_tracking_core.models.truck import TruckLine
+
+
+def make_line(name):
+    return TruckLine(
+        line_id=name,
+        line_name=name,
+        area="板橋區",
+        arrival_rank=0,
+        diff=0,
+        car_no="ABC-1234",
+        location="",
+        location_lat=25.0,
+        location_lon=121.5,
+        bar_code="",
+        points=[],
+    )
+
+
+class FakeClient:
+    """Client answering from canned responses keyed by time filter"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def get_around_points_with_size(self, lat, lng, time_filter=0, week=None):
+        self.calls.append(time_filter)
+        names, size = self.responses[time_filter]
+        return [make_line(name) for name in names], size
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimeFilterFor:
+    """Tests for time_filter_for"""
+
+    @pytest.mark.parametrize(
+        "start, end, expected",
+        [
+            ("06:30", "07:10", 1),
+            ("12:00", "17:59", 2),
+            ("18:05", "19:30", 3),
+            ("11:50", "12:20", 0),
+            ("04:30", "05:10", 0),
+            (None, "19:00", 0),
+            ("6pm", "19:00", 0),
+        ],
+    )
+    def test_periods(self, start, end, expected):
+        assert time_filter_for(start, end) == expected
+
+
+class TestRouteQuery:
+    """Tests for RouteQuery"""
+
+    def test_first_poll_measures_baseline(self):
+        client = FakeClient({0: (["A12", "B3"], 5000), 3: (["A12"], 1200)})
+        query = RouteQuery(client, "A12", "18:00", "19:00")
+
+        query.fetch(25.0, 121.5)
+
+        assert client.calls == [0]
+        assert query.baseline_bytes == 5000
+        assert query.last_bytes_saved is None
+
+    def test_later_polls_are_filtered(self):
+        client = FakeClient({0: (["A12", "B3"], 5000), 3: (["A12"], 1200)})
+        query = RouteQuery(client, "A12", "18:00", "19:00")
+
+        query.fetch(25.0, 121.5)
+        lines = query.fetch(25.0, 121.5)
+        query.fetch(25.0, 121.5)
+
+        assert client.calls == [0, 3, 3]
+        assert [line.line_name for line in lines] == ["A12"]
+        assert query.last_bytes_saved == 3800
+        assert query.total_bytes_saved == 7600
+
+    def test_without_filter_polls_unfiltered(self):
+        client = FakeClient({0: (["A12"], 5000)})
+        query = RouteQuery(client, "A12", "11:00", "13:00")
+
+        query.fetch(25.0, 121.5)
+        query.fetch(25.0, 121.5)
+
+        assert client.calls == [0, 0]
+        assert query.total_bytes_saved == 0
+
+    def test_falls_back_when_filter_drops_route(self):
+        client = FakeClient({0: (["A12", "B3"], 5000), 3: (["B3"], 1200)})
+        query = RouteQuery(client, "A12", "18:00", "19:00")
+
+        query.fetch(25.0, 121.5)
+        lines = query.fetch(25.0, 121.5)
+        query.fetch(25.0, 121.5)
+
+        assert client.calls == [0, 3, 0, 0]
+        assert "A12" in [line.line_name for line in lines]
+        assert query.time_filter == 0
+        assert query.total_bytes_saved == -1200
+
+    def test_keeps_filter_when_route_is_absent_everywhere(self):
+        client = FakeClient({0: (["B3"], 5000), 3: ([], 100)})
+        clock = FakeClock()
+        query = RouteQuery(client, "A12", "18:00", "19:00", recheck_seconds=300, clock=clock)
+
+        query.fetch(25.0, 121.5)
+        clock.now = 300
+        query.fetch(25.0, 121.5)
+
+        assert client.calls == [0, 3, 0]
+        assert query.time_filter == 3
+
+    def test_rechecks_at_most_once_per_interval_before_route_starts(self):
+        """Polls before the truck sets out cost one request, not two"""
+        client = FakeClient({0: (["B3"], 5000), 3: ([], 100)})
+        clock = FakeClock()
+        query = RouteQuery(client, "A12", "18:00", "19:00", recheck_seconds=300, clock=clock)
+
+        for now in (0, 30, 60, 300, 330):
+            clock.now = now
+            query.fetch(25.0, 121.5)
+
+        assert client.calls == [0, 3, 3, 3, 0, 3]
+        assert query.total_bytes_saved == 3 * 4900 - 100
+
+    def test_cache_hits_report_no_saving(self):
+        client = FakeClient({0: (["A12"], 5000), 3: (["A12"], None)})
+        query = RouteQuery(client, "A12", "18:00", "19:00")
+
+        query.fetch(25.0, 121.5)
+        query.fetch(25.0, 121.5)
+
+        assert query.last_bytes_saved is None
+        assert query.to_dict()["total_bytes_saved"] == 0
@@ -0,0 +1,158 @@
+"""Tests for the shared HTTP session"""
+import socket
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from requests.adapters import HTTPAdapter
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.core.simulator import NTPCSimulator
+
+
+class TestSessionManager:
+    """Tests for SessionManager"""
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            SessionManager(pool_maxsize=0)
+
+    def test_session_is_created_lazily(self):
+        manager = SessionManager()
+        assert manager._session is None
+        session = manager.session
+        assert manager.session is session
+
+    def test_adapter_settings(self):
+        manager = SessionManager(pool_connections=2, pool_maxsize=3, pool_block=False)
+        adapter = manager.session.get_adapter("https://example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block is False
+        assert manager.session.headers["Connection"] == "keep-alive"
+
+    def test_last_release_closes_session(self):
+        manager = SessionManager()
+        manager.acquire()
+        manager.acquire()
+        session = manager.session
+
+        manager.release()
+        assert manager.users == 1
+        assert manager._session is session
+
+        manager.release()
+        assert manager.users == 0
+        assert manager._session is None
+
+    def test_release_while_creating_session(self):
+        """A client collected while the session is created releases without deadlocking"""
+        manager = SessionManager()
+        manager.acquire()
+        create = manager._create_session
+
+        def create_and_release():
+            manager.release()
+            return create()
+
+        manager._create_session = create_and_release
+        worker = threading.Thread(target=lambda: manager.session, daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert manager.users == 0
+
+    def test_session_reopens_after_close(self):
+        manager = SessionManager()
+        first = manager.session
+        manager.close()
+        assert manager.session is not first
+
+    def test_default_is_shared(self):
+        assert SessionManager.default() is SessionManager.default()
+
+    def test_default_does_not_block(self):
+        """Callers of unknown concurrency get an extra connection instead of waiting"""
+        assert SessionManager().pool_block is False
+
+    def test_configure_default(self, monkeypatch):
+        monkeypatch.setattr(SessionManager, "_default", None)
+
+        manager = SessionManager.configure_default(pool_maxsize=2, pool_block=True)
+
+        assert SessionManager.default() is manager
+        assert (manager.pool_maxsize, manager.pool_block) == (2, True)
+
+    def test_configure_default_in_use(self, monkeypatch):
+        monkeypatch.setattr(SessionManager, "_default", SessionManager().acquire())
+
+        with pytest.raises(RuntimeError):
+            SessionManager.configure_default(pool_maxsize=2)
+
+
+class TestClientSessionSharing:
+    """Tests for clients sharing a session manager"""
+
+    def test_clients_share_session(self):
+        manager = SessionManager()
+        first = NTPCApiClient(session_manager=manager)
+        second = NTPCApiClient(session_manager=manager)
+
+        assert first.session is second.session
+        assert manager.users == 2
+
+        first.close()
+        second.close()
+
+    def test_close_is_idempotent(self):
+        manager = SessionManager()
+        client = NTPCApiClient(session_manager=manager)
+        other = NTPCApiClient(session_manager=manager)
+
+        client.close()
+        client.close()
+        assert manager.users == 1
+
+        other.close()
+
+    def test_context_manager_releases(self):
+        manager = SessionManager()
+        with NTPCApiClient(session_manager=manager) as client:
+            session = client.session
+            assert manager.users == 1
+
+        assert manager.users == 0
+        assert manager._session is None
+        assert session is not None
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestPrewarm:
+    """Tests for connection pre-warming"""
+
+    def test_prewarm_reaches_host(self):
+        manager = SessionManager()
+        with NTPCSimulator([]) as simulator:
+            assert manager.prewarm(simulator.base_url, timeout=2)
+        manager.close()
+
+    def test_prewarm_failure_is_reported(self):
+        manager = SessionManager()
+        assert not manager.prewarm(f"http://127.0.0.1:{_unused_port()}/WebAPI", timeout=1)
+        manager.close()
+
+    def test_client_prewarms_with_query_tls_settings(self):
+        manager = MagicMock()
+        client = NTPCApiClient(base_url="https://example.com/WebAPI", timeout=3, session_manager=manager)
+
+        client.prewarm()
+
+        manager.acquire.return_value.prewarm.assert_called_once_with(
+            "https://example.com/WebAPI", verify=False, timeout=3
+        )
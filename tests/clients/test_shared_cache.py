@@ -0,0 +1,176 @@
+"""Tests for the cross-process response cache"""
+import json
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.clients.shared_cache import SharedResponseCache, decode_truck_lines, encode_truck_lines
+from trash_tracking_core.core.simulator import FaultProfile, NTPCSimulator
+from trash_tracking_core.models.snapshot import LineSnapshot
+from trash_tracking_core.models.truck import TruckLine
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_line(name="A12"):
+    return TruckLine.from_dict({"LineID": name, "LineName": name, "Point": [{"PointName": "P1", "PointRank": 1}]})
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "responses.db")
+
+
+@pytest.fixture
+def restore_backend():
+    """Give NTPCApiClient a fresh in-memory cache after the test"""
+    SessionManager.default().close()
+    yield
+    NTPCApiClient.set_cache_backend(None)
+    SessionManager.default().close()
+
+
+class TestCodec:
+    """Tests for the TruckLine serialization"""
+
+    def test_round_trip(self):
+        lines = [make_line("A12"), make_line("B3")]
+
+        assert decode_truck_lines(encode_truck_lines(lines)) == lines
+
+
+class TestSharedResponseCache:
+    """Tests for SharedResponseCache"""
+
+    def test_put_and_get(self, cache_path):
+        with SharedResponseCache(cache_path) as cache:
+            cache.put("key", [make_line()])
+
+            assert cache.get("key", max_age=5) == [make_line()]
+            assert cache.get("missing", max_age=5) is None
+            assert len(cache) == 1
+
+    def test_entries_expire(self, cache_path):
+        clock = FakeClock()
+        with SharedResponseCache(cache_path, clock=clock) as cache:
+            cache.put("key", [make_line()])
+
+            clock.now += 5
+            assert cache.get("key", max_age=5) is not None
+            clock.now += 1
+            assert cache.get("key", max_age=5) is None
+
+    def test_old_entries_are_purged_on_write(self, cache_path):
+        clock = FakeClock()
+        with SharedResponseCache(cache_path, retention=60, clock=clock) as cache:
+            cache.put("old", [])
+            clock.now += 61
+            cache.put("new", [])
+
+            assert len(cache) == 1
+
+    def test_shared_between_instances(self, cache_path):
+        with SharedResponseCache(cache_path) as writer, SharedResponseCache(cache_path) as reader:
+            writer.put("key", [make_line()])
+
+            assert reader.get("key", max_age=5) == [make_line()]
+
+    def test_clear(self, cache_path):
+        with SharedResponseCache(cache_path) as cache:
+            cache.put("key", [])
+            cache.clear()
+
+            assert len(cache) == 0
+
+    def test_lease_excludes_other_instances(self, cache_path):
+        with SharedResponseCache(cache_path) as first, SharedResponseCache(cache_path, poll_interval=0.01) as second:
+            with first.lease("key", wait=1) as held:
+                assert held
+                with second.lease("key", wait=0.05) as other:
+                    assert not other
+
+            with second.lease("key", wait=0.05) as other:
+                assert other
+
+    def test_waiter_gets_lease_after_release(self, cache_path):
+        with SharedResponseCache(cache_path) as first, SharedResponseCache(cache_path, poll_interval=0.01) as second:
+            released = threading.Event()
+
+            def hold():
+                with first.lease("key", wait=1):
+                    time.sleep(0.1)
+                    first.put("key", [make_line()])
+                released.set()
+
+            holder = threading.Thread(target=hold)
+            holder.start()
+            time.sleep(0.02)
+            with second.lease("key", wait=2) as held:
+                assert held
+                assert released.is_set()
+                assert second.get("key", max_age=5) == [make_line()]
+            holder.join()
+
+    def test_expired_lease_is_taken_over(self, cache_path):
+        clock = FakeClock()
+        with SharedResponseCache(cache_path, lease_seconds=30, clock=clock) as cache:
+            # A holder that died without releasing
+            assert cache._try_lease("key", "dead")
+
+            clock.now += 31
+            with cache.lease("key", wait=0) as held:
+                assert held
+
+
+class TestClientWithSharedCache:
+    """Tests for NTPCApiClient on a shared cache backend"""
+
+    @patch("trash_tracking_core.clients.ntpc_api.requests.Session")
+    def test_clients_share_responses(self, mock_session, cache_path, restore_backend):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"Line": [make_line().to_api_dict()]}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_session.return_value.post.return_value = mock_response
+        NTPCApiClient.set_cache_backend(SharedResponseCache(cache_path))
+
+        first = NTPCApiClient().get_around_points(25.0, 121.5)
+        second = NTPCApiClient().get_around_points(25.0, 121.5)
+
+        assert mock_session.return_value.post.call_count == 1
+        assert first == second == [LineSnapshot.of(make_line())]
+
+    def test_processes_share_one_upstream_request(self, cache_path, restore_backend):
+        script = (
+            "import sys\n"
+            "from trash_tracking_core.clients.ntpc_api import NTPCApiClient\n"
+            "from trash_tracking_core.clients.shared_cache import SharedResponseCache\n"
+            "NTPCApiClient.set_cache_backend(SharedResponseCache(sys.argv[1]))\n"
+            "lines = NTPCApiClient(base_url=sys.argv[2], retry_count=1).get_around_points(25.0, 121.5)\n"
+            "print(len(lines))\n"
+        )
+        with NTPCSimulator([], faults=FaultProfile(latency_ms=300)) as simulator:
+            processes = [
+                subprocess.Popen(
+                    [sys.executable, "-c", script, cache_path, simulator.base_url],
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+                for _ in range(3)
+            ]
+            outputs = [process.communicate(timeout=60)[0].splitlines()[-1] for process in processes]
+
+            assert outputs == ["0", "0", "0"]
+            assert simulator.stats.requests == 1
@@ -0,0 +1,72 @@
+"""Shared test fixtures"""
+import pytest
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+
+
+def _point_data(rank, arrived=False, **overrides):
+    """API dict of collection point ``rank`` on a street running east, one point every 0.001° (about 100 m)"""
+    data = {
+        "SourcePointID": 1000 + rank,
+        "Vil": "文化里",
+        # Built at runtime, so equal strings of two calls are distinct objects, as in decoded responses
+        "PointName": f"Point {rank}",
+        "Lon": 121.46 + rank * 0.001,
+        "Lat": 25.01,
+        "PointID": rank,
+        "PointRank": rank,
+        "PointTime": f"18:{rank:02d}",
+        "Arrival": "18:01" if arrived else "",
+        "ArrivalDiff": 1 if arrived else 65535,
+        "FixedPoint": 1,
+        "PointWeekKnd": ",".join(["1", "3", "5"]),
+        "InScope": "Y",
+        "LikeCount": 0,
+    }
+    data.update(overrides)
+    return data
+
+
+def _line_data(line_id="L001", points=3, arrival_rank=0, **overrides):
+    """API dict of route ``line_id`` whose truck has passed the first ``arrival_rank`` points"""
+    data = {
+        "LineID": line_id,
+        "LineName": f"Route {line_id}",
+        "Area": "板橋區",
+        "ArrivalRank": arrival_rank,
+        "Diff": 0,
+        "CarNO": "KKA-1234",
+        "Location": f"Point {arrival_rank}" if arrival_rank else "",
+        "LocationLat": 25.01,
+        "LocationLon": 121.46 + arrival_rank * 0.001,
+        "BarCode": "BC001",
+        "Point": [_point_data(rank, rank <= arrival_rank) for rank in range(1, points + 1)],
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture
+def point_data():
+    """Factory of collection points as API dicts: point_data(rank, arrived=False, **api_fields)"""
+    return _point_data
+
+
+@pytest.fixture
+def make_point():
+    """Factory of collection points: make_point(rank, arrived=False, **api_fields)"""
+
+    def make(rank, arrived=False, **overrides):
+        return Point.from_dict(_point_data(rank, arrived, **overrides))
+
+    return make
+
+
+@pytest.fixture
+def make_line():
+    """Factory of freshly decoded routes: make_line(line_id="L001", points=3, arrival_rank=0, **api_fields)"""
+
+    def make(line_id="L001", points=3, arrival_rank=0, **overrides):
+        return TruckLine.from_dict(_line_data(line_id, points, arrival_rank, **overrides))
+
+    return make
@@ -0,0 +1,177 @@
+"""Tests for AsyncTruckTracker"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from trash_tracking_core.clients.async_ntpc_api import AsyncNTPCApiClient
+from trash_tracking_core.clients.ntpc_api import NTPCApiError
+from trash_tracking_core.core.async_tracker import AsyncTruckTracker
+from trash_tracking_core.core.state_manager import TruckState
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.config import ConfigManager
+
+
+def make_point(name, rank, arrival=""):
+    return Point(
+        source_point_id=rank,
+        vil="Village",
+        point_name=name,
+        lon=121.5,
+        lat=25.0,
+        point_id=100 + rank,
+        point_rank=rank,
+        point_time=f"18:{rank:02d}",
+        arrival=arrival,
+        arrival_diff=0 if arrival else 65535,
+        fixed_point=1,
+        point_weekknd="1,3,5",
+        in_scope="Y",
+        like_count=0,
+    )
+
+
+def make_truck(enter_arrival=""):
+    """Route whose enter point is reached when enter_arrival is set"""
+    return TruckLine(
+        line_id="L001",
+        line_name="Test Route 1",
+        area="Test Area",
+        arrival_rank=2 if enter_arrival else 1,
+        diff=0,
+        car_no="ABC-1234",
+        location="Current Location",
+        location_lat=25.0,
+        location_lon=121.5,
+        bar_code="12345",
+        points=[make_point("Enter Point", 2, enter_arrival), make_point("Exit Point", 4)],
+    )
+
+
+class CountingClient:
+    """Blocking client returning a fixed answer after a delay"""
+
+    def __init__(self, lines=None, delay=0.05, error=None):
+        self.lines = lines
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_around_points(self, lat, lng, time_filter=0, week=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.lines
+
+
+@pytest.fixture
+def config():
+    """Mock ConfigManager"""
+    config = Mock(spec=ConfigManager)
+    config.location = {"lat": 25.0, "lng": 121.5}
+    config.api_base_url = "https://example.com/api"
+    config.api_timeout = 10
+    config.enter_point = "Enter Point"
+    config.exit_point = "Exit Point"
+    config.target_lines = []
+    config.get = Mock(side_effect=lambda key, default: default)
+    return config
+
+
+def make_tracker(config, blocking):
+    return AsyncTruckTracker(config, api_client=AsyncNTPCApiClient(blocking))
+
+
+class TestAsyncTruckTracker:
+    """Tests for AsyncTruckTracker"""
+
+    async def test_truck_at_enter_point_triggers_nearby(self, config):
+        tracker = make_tracker(config, CountingClient([make_truck(enter_arrival="18:02")]))
+
+        status = await tracker.get_current_status()
+
+        assert status["status"] == "nearby"
+        assert tracker.state_manager.current_state == TruckState.NEARBY
+
+    async def test_concurrent_callers_share_one_poll(self, config):
+        blocking = CountingClient([make_truck(enter_arrival="18:02")])
+        tracker = make_tracker(config, blocking)
+        updates = []
+        original = tracker.tracker.apply_poll
+        tracker.tracker.apply_poll = lambda lines: updates.append(lines) or original(lines)
+
+        statuses = await asyncio.gather(*(tracker.get_current_status() for _ in range(20)))
+
+        assert blocking.calls == 1
+        assert len(updates) == 1
+        assert {status["status"] for status in statuses} == {"nearby"}
+
+    async def test_callers_get_independent_copies(self, config):
+        tracker = make_tracker(config, CountingClient([make_truck(enter_arrival="18:02")]))
+
+        first, second = await asyncio.gather(tracker.get_current_status(), tracker.get_current_status())
+        first["status"] = "changed"
+
+        assert second["status"] == "nearby"
+
+    async def test_sequential_calls_poll_again(self, config):
+        blocking = CountingClient([], delay=0)
+        tracker = make_tracker(config, blocking)
+
+        await tracker.get_current_status()
+        await tracker.get_current_status()
+
+        assert blocking.calls == 2
+
+    async def test_api_error_keeps_state(self, config):
+        tracker = make_tracker(config, CountingClient([make_truck(enter_arrival="18:02")], delay=0))
+        await tracker.get_current_status()
+        tracker.api_client.client.error = NTPCApiError("down")
+
+        status = await tracker.get_current_status()
+
+        assert status["status"] == "nearby"
+        assert status["error"] == "down"
+
+    async def test_unexpected_error_resets_state(self, config):
+        tracker = make_tracker(config, CountingClient([make_truck(enter_arrival="18:02")], delay=0))
+        await tracker.get_current_status()
+        tracker.api_client.client.error = RuntimeError("boom")
+
+        status = await tracker.get_current_status()
+
+        assert status["status"] == "idle"
+        assert status["error"] == "System error: boom"
+
+    async def test_reset_waits_for_state_update(self, config):
+        tracker = make_tracker(config, CountingClient([make_truck(enter_arrival="18:02")], delay=0))
+        order = []
+        original = tracker.tracker.apply_poll
+
+        def slow_apply(lines):
+            time.sleep(0.05)
+            result = original(lines)
+            order.append("poll")
+            return result
+
+        tracker.tracker.apply_poll = slow_apply
+        poll = asyncio.ensure_future(tracker.get_current_status())
+        await asyncio.sleep(0.01)
+        await tracker.reset()
+        order.append("reset")
+        await poll
+
+        assert order == ["poll", "reset"]
+        assert tracker.state_manager.current_state == TruckState.IDLE
+
+    def test_default_client_wraps_tracker_client(self, config):
+        tracker = AsyncTruckTracker(config)
+
+        assert tracker.api_client.client is tracker.tracker.api_client
+        assert str(tracker).startswith("AsyncTruckTracker(")
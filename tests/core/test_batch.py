@@ -0,0 +1,226 @@
+"""Tests for batch address lookup"""
+
+import io
+import threading
+import time
+
+import pytest
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient
+from trash_tracking_core.core.batch import BatchCheckpoint, BatchLookup, BatchRow, read_batch_rows
+from trash_tracking_core.core.simulator import FaultProfile, NTPCSimulator
+from trash_tracking_core.utils.geocoding import GeocodingError
+
+
+class FakeGeocoder:
+    """Geocoder answering from a dict, failing for unknown addresses"""
+
+    def __init__(self, known, delay=0.0):
+        self.known = known
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def address_to_coordinates(self, address, timeout=10):
+        with self._lock:
+            self.calls.append(address)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if address not in self.known:
+                raise GeocodingError(f"無法找到地址的座標: {address}\n\n建議解決方法：...")
+            return self.known[address]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def simulator(make_line):
+    """Running simulator serving one five-point route"""
+    NTPCApiClient.clear_cache()
+    with NTPCSimulator([make_line(points=5)], faults=FaultProfile()) as sim:
+        yield sim
+    NTPCApiClient.clear_cache()
+
+
+class TestReadBatchRows:
+    """Tests for input parsing"""
+
+    def test_csv_with_address_and_id_columns(self):
+        text = "id,name,address\nh1,Chen,新北市板橋區民生路二段80號\nh2,Lin,板橋區文化路一段1號\n"
+
+        rows = list(read_batch_rows(io.StringIO(text)))
+
+        assert rows == [
+            BatchRow("h1", "新北市板橋區民生路二段80號"),
+            BatchRow("h2", "板橋區文化路一段1號"),
+        ]
+
+    def test_chinese_address_header_without_id_uses_row_number(self):
+        text = "地址\n民生路二段80號\n\n文化路一段1號\n"
+
+        rows = list(read_batch_rows(io.StringIO(text)))
+
+        assert rows == [BatchRow("1", "民生路二段80號"), BatchRow("3", "文化路一段1號")]
+
+    def test_plain_address_list(self):
+        text = "新北市板橋區民生路二段80號\n\n板橋區文化路一段1號, 2F\n"
+
+        rows = list(read_batch_rows(io.StringIO(text)))
+
+        assert rows == [BatchRow("1", "新北市板橋區民生路二段80號"), BatchRow("3", "板橋區文化路一段1號, 2F")]
+
+    def test_empty_input(self):
+        assert list(read_batch_rows(io.StringIO(""))) == []
+
+
+class TestBatchCheckpoint:
+    """Tests for the resumable checkpoint"""
+
+    def test_records_survive_reopen(self, tmp_path):
+        path = str(tmp_path / "run.checkpoint")
+        with BatchCheckpoint(path) as checkpoint:
+            checkpoint.mark_done("a")
+            checkpoint.mark_done("b")
+            checkpoint.mark_done("a")
+
+        with BatchCheckpoint(path) as checkpoint:
+            assert checkpoint.is_done("a") and checkpoint.is_done("b")
+            assert not checkpoint.is_done("c")
+            assert len(checkpoint) == 2
+
+        assert (tmp_path / "run.checkpoint").read_text(encoding="utf-8") == "a\nb\n"
+
+
+class TestBatchLookup:
+    """Tests for the worker pool"""
+
+    def test_rejects_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            BatchLookup(FakeGeocoder({}), workers=0)
+
+    def test_lookup_with_routes(self, simulator):
+        geocoder = FakeGeocoder({"A": (25.01, 121.4621)})
+        lookup = BatchLookup(geocoder, client_factory=lambda: NTPCApiClient(base_url=simulator.base_url))
+
+        result = lookup.lookup(BatchRow("1", "A"))
+
+        assert result.ok
+        assert (result.lat, result.lng) == (25.01, 121.4621)
+        assert [route["line_name"] for route in result.routes] == ["Route L001"]
+        assert result.routes[0]["nearest_point"] == "Point 2"
+        assert result.routes[0]["schedule"] == "18:01 - 18:05"
+
+    def test_failure_reports_first_line_of_error(self):
+        lookup = BatchLookup(FakeGeocoder({}), with_routes=False)
+
+        result = lookup.lookup(BatchRow("7", "Nowhere"))
+
+        assert not result.ok
+        assert result.error == "無法找到地址的座標: Nowhere"
+        assert result.to_dict()["ok"] is False
+
+    def test_api_failure_is_reported(self, simulator):
+        simulator.faults = FaultProfile(error_rate=1.0)
+        lookup = BatchLookup(
+            FakeGeocoder({"A": (25.01, 121.4625)}),
+            client_factory=lambda: NTPCApiClient(base_url=simulator.base_url, retry_count=1, retry_delay=0),
+        )
+
+        result = lookup.lookup(BatchRow("1", "A"))
+
+        assert result.lat == 25.01
+        assert "HTTP error: 500" in result.error
+
+    def test_run_streams_every_row(self):
+        known = {f"addr {i}": (25.0, 121.0 + i / 1000) for i in range(20) if i % 5}
+        geocoder = FakeGeocoder(known, delay=0.01)
+        lookup = BatchLookup(geocoder, workers=3, with_routes=False)
+        rows = [BatchRow(str(i), f"addr {i}") for i in range(20)]
+        results = []
+
+        summary = lookup.run(rows, results.append)
+
+        assert sorted(int(r.row_id) for r in results) == list(range(20))
+        assert summary.succeeded == 16 and summary.failed == 4 and summary.skipped == 0
+        assert 1 < geocoder.max_active <= 3
+
+    def test_input_is_read_lazily(self):
+        geocoder = FakeGeocoder({}, delay=0.02)
+        lookup = BatchLookup(geocoder, workers=2, with_routes=False)
+        finished_at_read = []
+
+        def rows():
+            for i in range(12):
+                finished_at_read.append(len(results))
+                yield BatchRow(str(i), f"addr {i}")
+
+        results = []
+        lookup.run(rows(), results.append)
+
+        # With 2 workers at most 4 rows are in flight: row 6 is read after 2 results
+        assert finished_at_read[6] >= 2
+        assert len(results) == 12
+
+    def test_resume_skips_finished_rows(self, tmp_path):
+        known = {f"addr {i}": (25.0, 121.0) for i in range(6)}
+        path = str(tmp_path / "run.checkpoint")
+        rows = [BatchRow(str(i), f"addr {i}") for i in range(6)]
+
+        with BatchCheckpoint(path) as checkpoint:
+            BatchLookup(FakeGeocoder(known), with_routes=False).run(rows[:4], lambda r: None, checkpoint)
+
+        geocoder = FakeGeocoder(known)
+        with BatchCheckpoint(path) as checkpoint:
+            summary = BatchLookup(geocoder, with_routes=False).run(rows, lambda r: None, checkpoint)
+
+        assert sorted(geocoder.calls) == ["addr 4", "addr 5"]
+        assert summary.skipped == 4 and summary.succeeded == 2
+
+    def test_resume_retries_failed_rows(self, tmp_path):
+        path = str(tmp_path / "run.checkpoint")
+        rows = [BatchRow(str(i), f"addr {i}") for i in range(3)]
+        known = {"addr 0": (25.0, 121.0), "addr 2": (25.1, 121.1)}
+
+        with BatchCheckpoint(path) as checkpoint:
+            first = BatchLookup(FakeGeocoder(known), with_routes=False).run(rows, lambda r: None, checkpoint)
+
+        geocoder = FakeGeocoder({**known, "addr 1": (25.2, 121.2)})
+        results = []
+        with BatchCheckpoint(path) as checkpoint:
+            second = BatchLookup(geocoder, with_routes=False).run(rows, results.append, checkpoint)
+            assert len(checkpoint) == 3
+
+        assert first.failed == 1 and first.succeeded == 2
+        assert geocoder.calls == ["addr 1"]
+        assert second.skipped == 2 and second.succeeded == 1
+        assert results[0].ok and results[0].row_id == "1"
+
+    def test_row_is_checkpointed_after_output(self, tmp_path):
+        checkpoint = BatchCheckpoint(str(tmp_path / "run.checkpoint"))
+        seen_done = []
+
+        def on_result(result):
+            seen_done.append(checkpoint.is_done(result.row_id))
+
+        BatchLookup(FakeGeocoder({"a": (25.0, 121.0)}), with_routes=False).run(
+            [BatchRow("1", "a")], on_result, checkpoint
+        )
+        checkpoint.close()
+
+        assert seen_done == [False]
+
+    def test_api_calls_are_rate_limited(self, simulator):
+        limiter = type("Limiter", (), {"calls": 0, "acquire": lambda self: setattr(self, "calls", self.calls + 1)})()
+        lookup = BatchLookup(
+            FakeGeocoder({"A": (25.01, 121.4625), "B": (25.01, 121.463)}),
+            api_rate_limit=limiter,
+            client_factory=lambda: NTPCApiClient(base_url=simulator.base_url, cache_enabled=False),
+        )
+
+        lookup.run([BatchRow("1", "A"), BatchRow("2", "B")], lambda r: None)
+
+        assert limiter.calls == 2
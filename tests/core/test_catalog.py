@@ -0,0 +1,156 @@
+"""Tests for the route catalog"""
+
+import json
+
+import pytest
+from trash_tracking_core.core.catalog import CatalogError, CatalogRoute, RouteCatalog
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+
+
+def make_route(line_id="L001", lat=25.01, lng=121.46, name=None):
+    """Three-point route heading east from (lat, lng)"""
+    points = [
+        Point(
+            source_point_id=rank,
+            vil="Village",
+            point_name=f"{line_id} Point {rank}",
+            lon=lng + rank * 0.001,
+            lat=lat,
+            point_id=rank,
+            point_rank=rank,
+            point_time=f"18:{rank:02d}",
+            arrival="18:05" if rank == 1 else "",
+            arrival_diff=0 if rank == 1 else 65535,
+            fixed_point=1,
+            point_weekknd="",
+            in_scope="Y",
+            like_count=0,
+        )
+        for rank in (3, 1, 2)
+    ]
+    return TruckLine(
+        line_id=line_id,
+        line_name=name or f"Route {line_id}",
+        area="Banqiao",
+        arrival_rank=1,
+        diff=3,
+        car_no="ABC-1234",
+        location="",
+        location_lat=lat,
+        location_lon=lng,
+        bar_code="",
+        points=points,
+    )
+
+
+class TestCatalogRoute:
+    """Tests for CatalogRoute"""
+
+    def test_keeps_static_fields_in_rank_order(self):
+        route = CatalogRoute.from_truck_line(make_route(), weekdays=[3, 1, 3])
+
+        assert route.weekdays == (1, 3)
+        assert [point.rank for point in route.points] == [1, 2, 3]
+        assert route.points[0].time == "18:01"
+
+    def test_dict_round_trip(self):
+        route = CatalogRoute.from_truck_line(make_route(), weekdays=[1])
+
+        assert CatalogRoute.from_dict(json.loads(json.dumps(route.to_dict()))) == route
+
+    def test_truck_line_has_no_live_data(self):
+        line = CatalogRoute.from_truck_line(make_route()).to_truck_line()
+
+        assert line.line_name == "Route L001"
+        assert [point.point_rank for point in line.points] == [1, 2, 3]
+        assert all(not point.has_passed() for point in line.points)
+
+
+class TestRouteCatalog:
+    """Tests for RouteCatalog"""
+
+    def test_add_dedupes_by_line_id(self):
+        catalog = RouteCatalog()
+
+        assert catalog.add(make_route(), week=1) == "added"
+        assert catalog.add(make_route(), week=1) is None
+        assert catalog.add(make_route(), week=2) == "updated"
+
+        assert len(catalog) == 1
+        assert catalog.get("L001").weekdays == (1, 2)
+
+    def test_live_fields_do_not_count_as_changes(self):
+        catalog = RouteCatalog()
+        catalog.add(make_route(), week=1)
+        moved = make_route()
+        moved.diff = 10
+        moved.points[0].arrival = ""
+
+        assert catalog.add(moved, week=1) is None
+
+    def test_routes_near(self):
+        catalog = RouteCatalog()
+        catalog.add(make_route("NEAR", 25.01, 121.46), week=1)
+        catalog.add(make_route("FAR", 25.05, 121.50), week=1)
+
+        near = catalog.routes_near(25.0105, 121.461, radius=300)
+
+        assert [route.line_id for route in near] == ["NEAR"]
+        assert len(catalog.routes_near(25.0105, 121.461, radius=10_000)) == 2
+
+    def test_routes_near_across_cells(self):
+        catalog = RouteCatalog()
+        catalog.add(make_route("EDGE", 25.0199, 121.4699), week=1)
+
+        assert [route.line_id for route in catalog.routes_near(25.0201, 121.4701, radius=200)] == ["EDGE"]
+
+    def test_routes_near_on_weekday(self):
+        catalog = RouteCatalog()
+        catalog.add(make_route("MON"), week=1)
+        catalog.add(make_route("TUE", lng=121.4605), week=2)
+
+        assert [route.line_id for route in catalog.routes_near(25.01, 121.461, 300, week=2)] == ["TUE"]
+
+    def test_routes_on(self):
+        catalog = RouteCatalog()
+        catalog.add(make_route("B"), week=1)
+        catalog.add(make_route("A"), week=1)
+        catalog.add(make_route("B"), week=2)
+
+        assert [route.line_id for route in catalog.routes_on(1)] == ["A", "B"]
+        assert [route.line_id for route in catalog.routes_on(2)] == ["B"]
+        assert catalog.routes_on(0) == []
+
+    def test_update_moves_index_entries(self):
+        catalog = RouteCatalog()
+        catalog.add(make_route("L001", 25.01, 121.46), week=1)
+        catalog.add(make_route("L001", 25.10, 121.60), week=1)
+
+        assert catalog.routes_near(25.01, 121.461, radius=300) == []
+        assert len(catalog.routes_near(25.10, 121.601, radius=300)) == 1
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "routes.json"
+        catalog = RouteCatalog()
+        catalog.add(make_route("A"), week=1)
+        catalog.add(make_route("B", 25.05, 121.50), week=6)
+
+        catalog.save(str(path))
+        loaded = RouteCatalog.load(str(path))
+
+        assert len(loaded) == 2
+        assert loaded.get("B") == catalog.get("B")
+        assert [route.line_id for route in loaded.routes_on(6)] == ["B"]
+        assert not (tmp_path / "routes.json.tmp").exists()
+
+    def test_load_missing_file(self, tmp_path):
+        with pytest.raises(CatalogError):
+            RouteCatalog.load(str(tmp_path / "missing.json"))
+
+    def test_load_other_version(self, tmp_path):
+        path = tmp_path / "routes.json"
+        path.write_text(json.dumps({"version": 99, "routes": []}), encoding="utf-8")
+
+        with pytest.raises(CatalogError):
+            RouteCatalog.load(str(path))
@@ -0,0 +1,186 @@
+"""Tests for the route crawler"""
+
+import threading
+
+import pytest
+from trash_tracking_core.clients.ntpc_api import NTPCApiError
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.core.batch import BatchCheckpoint
+from trash_tracking_core.core.catalog import RouteCatalog
+from trash_tracking_core.core.crawler import CrawlTask, RouteCrawler, grid_tasks
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.rate_limit import RateLimiter
+
+BBOX = (25.0, 121.4, 25.01, 121.41)
+
+
+def make_route(line_id, lat, lng):
+    """Two-point route starting at (lat, lng)"""
+    points = [
+        Point(
+            source_point_id=rank,
+            vil="",
+            point_name=f"{line_id} Point {rank}",
+            lon=lng + rank * 0.001,
+            lat=lat,
+            point_id=rank,
+            point_rank=rank,
+            point_time=f"18:{rank:02d}",
+            arrival="",
+            arrival_diff=65535,
+            fixed_point=1,
+            point_weekknd="",
+            in_scope="Y",
+            like_count=0,
+        )
+        for rank in (0, 1)
+    ]
+    return TruckLine(
+        line_id=line_id,
+        line_name=f"Route {line_id}",
+        area="Banqiao",
+        arrival_rank=0,
+        diff=0,
+        car_no="",
+        location="",
+        location_lat=0.0,
+        location_lon=0.0,
+        bar_code="",
+        points=points,
+    )
+
+
+class GridClient:
+    """Client returning the routes whose first point lies within 0.006° of the query"""
+
+    def __init__(self, routes, fail_weeks=()):
+        self.routes = routes
+        self.fail_weeks = fail_weeks
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_around_points(self, lat, lng, time_filter=0, week=None):
+        with self.lock:
+            self.calls.append((lat, lng, week))
+        if week in self.fail_weeks:
+            raise NTPCApiError("down")
+        return [
+            route
+            for route in self.routes
+            if abs(route.points[0].lat - lat) < 0.006 and abs(route.points[0].lon - lng) < 0.006
+        ]
+
+
+class TestGridTasks:
+    """Tests for grid_tasks"""
+
+    def test_covers_bbox(self):
+        tasks = list(grid_tasks(BBOX, spacing=500, weeks=[1]))
+
+        assert min(task.lat for task in tasks) == 25.0
+        assert max(task.lat for task in tasks) <= 25.01
+        assert max(task.lng for task in tasks) <= 121.41
+        assert len(tasks) == 9
+
+    def test_one_task_per_week(self):
+        tasks = list(grid_tasks(BBOX, spacing=500, weeks=[1, 2]))
+
+        assert len(tasks) == 18
+        assert len({task.task_id for task in tasks}) == 18
+
+    def test_rejects_bad_bbox(self):
+        with pytest.raises(ValueError):
+            list(grid_tasks((25.01, 121.4, 25.0, 121.41)))
+
+
+class TestRouteCrawler:
+    """Tests for RouteCrawler"""
+
+    def make_client(self, **kwargs):
+        routes = [make_route("A", 25.0, 121.4), make_route("B", 25.009, 121.409)]
+        return GridClient(routes, **kwargs)
+
+    def test_dedupes_routes_across_tiles(self):
+        client = self.make_client()
+        catalog = RouteCatalog()
+
+        summary = RouteCrawler(workers=3, client_factory=lambda: client).crawl(
+            grid_tasks(BBOX, spacing=500, weeks=[1, 2]), catalog
+        )
+
+        assert summary.queried == 18
+        assert summary.routes_added == 2
+        assert summary.routes_updated == 2
+        assert len(catalog) == 2
+        assert catalog.get("A").weekdays == (1, 2)
+
+    def test_rate_limit_is_shared(self):
+        client = self.make_client()
+        limiter = RateLimiter(1000, burst=1)
+        acquired = []
+        original = limiter.acquire
+        limiter.acquire = lambda timeout=None: acquired.append(1) or original(timeout)
+
+        RouteCrawler(workers=2, rate_limit=limiter, client_factory=lambda: client).crawl(
+            grid_tasks(BBOX, spacing=500, weeks=[1]), RouteCatalog()
+        )
+
+        assert len(acquired) == len(client.calls) == 9
+
+    def test_default_clients_use_own_pool(self):
+        """The default clients share a pool with one connection per worker, not the process-wide one"""
+        crawler = RouteCrawler(workers=3)
+        client = crawler._client_factory()
+        try:
+            assert client.session_manager is crawler.session_manager
+            assert client.session_manager is not SessionManager.default()
+            assert crawler.session_manager.pool_maxsize == 3
+        finally:
+            client.close()
+
+    def test_checkpoint_requires_catalog_path(self, tmp_path):
+        with BatchCheckpoint(str(tmp_path / "crawl.checkpoint")) as checkpoint:
+            with pytest.raises(ValueError):
+                RouteCrawler(client_factory=self.make_client).crawl([], RouteCatalog(), checkpoint=checkpoint)
+
+    def test_resume_skips_done_queries(self, tmp_path):
+        catalog_path = str(tmp_path / "routes.json")
+        checkpoint_path = str(tmp_path / "crawl.checkpoint")
+        tasks = list(grid_tasks(BBOX, spacing=500, weeks=[1]))
+
+        first = self.make_client()
+        with BatchCheckpoint(checkpoint_path) as checkpoint:
+            RouteCrawler(workers=1, client_factory=lambda: first).crawl(
+                tasks[:5], RouteCatalog(), catalog_path, checkpoint, save_every=2
+            )
+
+        second = self.make_client()
+        with BatchCheckpoint(checkpoint_path) as checkpoint:
+            summary = RouteCrawler(workers=1, client_factory=lambda: second).crawl(
+                tasks, RouteCatalog.load(catalog_path), catalog_path, checkpoint
+            )
+
+        assert summary.skipped == 5
+        assert len(second.calls) == 4
+        assert len(RouteCatalog.load(catalog_path)) == 2
+
+    def test_failed_queries_are_retried_next_run(self, tmp_path):
+        catalog_path = str(tmp_path / "routes.json")
+        checkpoint_path = str(tmp_path / "crawl.checkpoint")
+        tasks = [CrawlTask(25.0, 121.4, 1), CrawlTask(25.0, 121.4, 2)]
+
+        with BatchCheckpoint(checkpoint_path) as checkpoint:
+            summary = RouteCrawler(client_factory=lambda: self.make_client(fail_weeks=(2,))).crawl(
+                tasks, RouteCatalog(), catalog_path, checkpoint
+            )
+        assert summary.failed == 1
+
+        with BatchCheckpoint(checkpoint_path) as checkpoint:
+            summary = RouteCrawler(client_factory=self.make_client).crawl(
+                tasks, RouteCatalog.load(catalog_path), catalog_path, checkpoint
+            )
+
+        assert summary.skipped == 1
+        assert summary.queried == 1
+        assert RouteCatalog.load(catalog_path).get("A").weekdays == (1, 2)
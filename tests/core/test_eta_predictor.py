@@ -0,0 +1,239 @@
+"""Tests for ArrivalPredictor"""
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from trash_tracking_core.core.eta_predictor import ArrivalPredictor, _parse_minutes
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+
+TZ = ZoneInfo("Asia/Taipei")
+
+
+def make_point(rank, point_time, arrival=""):
+    """Build a collection point; a non-empty arrival marks it as passed"""
+    return Point(
+        source_point_id=rank,
+        vil="Village",
+        point_name=f"Point {rank}",
+        lon=121.5,
+        lat=25.0,
+        point_id=100 + rank,
+        point_rank=rank,
+        point_time=point_time,
+        arrival=arrival,
+        arrival_diff=0 if arrival else 65535,
+        fixed_point=1,
+        point_weekknd="1,3,5",
+        in_scope="Y",
+        like_count=0,
+    )
+
+
+def make_line(arrivals, arrival_rank=None):
+    """Build a five-point route scheduled every 10 minutes from 18:00"""
+    schedule = ["18:00", "18:10", "18:20", "18:30", "18:40"]
+    points = [make_point(i + 1, t, arrivals[i] if i < len(arrivals) else "") for i, t in enumerate(schedule)]
+    return TruckLine(
+        line_id="L001",
+        line_name="Test Route",
+        area="Banqiao",
+        arrival_rank=arrival_rank if arrival_rank is not None else len(arrivals),
+        diff=0,
+        car_no="ABC-1234",
+        location="",
+        location_lat=25.0,
+        location_lon=121.5,
+        bar_code="",
+        points=points,
+    )
+
+
+@pytest.fixture
+def predictor():
+    """In-memory predictor requiring two samples per segment"""
+    p = ArrivalPredictor(min_samples=2)
+    yield p
+    p.close()
+
+
+class TestParseMinutes:
+    """Tests for API clock string parsing"""
+
+    def test_hh_mm(self):
+        assert _parse_minutes("18:05") == 18 * 60 + 5
+
+    def test_hh_mm_ss(self):
+        assert _parse_minutes("07:30:59") == 7 * 60 + 30
+
+    @pytest.mark.parametrize("value", ["", "abc", "25:00", "18"])
+    def test_invalid(self, value):
+        assert _parse_minutes(value) is None
+
+
+class TestObserve:
+    """Tests for learning from polls"""
+
+    def test_learns_segments_from_consecutive_arrivals(self, predictor):
+        learned = predictor.observe(make_line(["18:00", "18:12", "18:20"]), datetime(2026, 1, 5, 18, 21, tzinfo=TZ))
+
+        assert learned == 2
+        assert predictor.segment_stats("L001", 2).mean_minutes == 12
+        assert predictor.segment_stats("L001", 3).mean_minutes == 8
+        assert predictor.segment_stats("L001", 1) is None
+
+    def test_repeated_polls_do_not_double_count(self, predictor):
+        line = make_line(["18:00", "18:12"])
+        observed_at = datetime(2026, 1, 5, 18, 13, tzinfo=TZ)
+
+        predictor.observe(line, observed_at)
+        learned_again = predictor.observe(line, observed_at)
+
+        assert learned_again == 0
+        assert predictor.segment_stats("L001", 2).samples == 1
+
+    def test_progression_across_polls(self, predictor):
+        predictor.observe(make_line(["18:00", "18:12"]), datetime(2026, 1, 5, 18, 13, tzinfo=TZ))
+        learned = predictor.observe(make_line(["18:00", "18:12", "18:22"]), datetime(2026, 1, 5, 18, 23, tzinfo=TZ))
+
+        assert learned == 1
+        assert predictor.segment_stats("L001", 3).mean_minutes == 10
+
+    def test_skipped_ranks_share_the_gap(self, predictor):
+        line = make_line(["18:00", "", "", "18:30"], arrival_rank=4)
+
+        predictor.observe(line, datetime(2026, 1, 5, 18, 31, tzinfo=TZ))
+
+        for rank in (2, 3, 4):
+            assert predictor.segment_stats("L001", rank).mean_minutes == 10
+
+    def test_days_accumulate_statistics(self, predictor):
+        predictor.observe(make_line(["18:00", "18:10"]), datetime(2026, 1, 5, 19, 0, tzinfo=TZ))
+        predictor.observe(make_line(["18:00", "18:14"]), datetime(2026, 1, 6, 19, 0, tzinfo=TZ))
+
+        stats = predictor.segment_stats("L001", 2)
+        assert stats.samples == 2
+        assert stats.mean_minutes == 12
+        assert stats.variance == pytest.approx(8.0)
+
+    def test_no_arrivals_learns_nothing(self, predictor):
+        assert predictor.observe(make_line([], arrival_rank=0)) == 0
+
+    def test_old_arrival_stamps_are_pruned(self):
+        predictor = ArrivalPredictor(retention_days=7)
+        predictor.observe(make_line(["18:00", "18:10"]), datetime(2026, 1, 5, 19, 0, tzinfo=TZ))
+        predictor.observe(make_line(["18:00", "18:12"]), datetime(2026, 1, 13, 19, 0, tzinfo=TZ))
+
+        days = predictor._conn.execute("SELECT DISTINCT service_date FROM arrivals").fetchall()
+        assert days == [("2026-01-13",)]
+        assert predictor.segment_stats("L001", 2).samples == 2
+        assert predictor.prune(date(2026, 1, 14)) == 2
+        predictor.close()
+
+    def test_persists_to_disk(self, tmp_path):
+        db_path = str(tmp_path / "eta.db")
+        first = ArrivalPredictor(db_path=db_path)
+        first.observe(make_line(["18:00", "18:12"]), datetime(2026, 1, 5, 18, 13, tzinfo=TZ))
+        first.close()
+
+        second = ArrivalPredictor(db_path=db_path)
+        assert second.segment_stats("L001", 2).mean_minutes == 12
+        second.close()
+
+
+class TestPredict:
+    """Tests for arrival prediction"""
+
+    def test_uses_learned_segments(self, predictor):
+        for day in (5, 6):
+            line = make_line(["18:00", "18:15", "18:30", "18:45"])
+            predictor.observe(line, datetime(2026, 1, day, 19, 0, tzinfo=TZ))
+
+        current = make_line(["18:00"])
+        prediction = predictor.predict(current, current.points[3], now=datetime(2026, 1, 7, 18, 1, tzinfo=TZ))
+
+        assert prediction.estimated == datetime(2026, 1, 7, 18, 45, tzinfo=TZ)
+        assert prediction.learned_segments == 3
+        assert prediction.total_segments == 3
+        assert prediction.is_learned
+
+    def test_falls_back_to_schedule_with_interval(self, predictor):
+        current = make_line(["18:05"])
+        now = datetime(2026, 1, 7, 18, 6, tzinfo=TZ)
+
+        prediction = predictor.predict(current, current.points[2], now=now)
+
+        assert prediction.estimated == datetime(2026, 1, 7, 18, 25, tzinfo=TZ)
+        assert prediction.lower < prediction.estimated < prediction.upper
+        assert prediction.lower >= now
+        assert prediction.learned_segments == 0
+        assert not prediction.is_learned
+
+    def test_interval_narrows_with_consistent_history(self, predictor):
+        current = make_line(["18:00"])
+        now = datetime(2026, 1, 9, 18, 1, tzinfo=TZ)
+        before = predictor.predict(current, current.points[2], now=now)
+
+        for day in (5, 6, 7):
+            predictor.observe(make_line(["18:00", "18:10", "18:20"]), datetime(2026, 1, day, 19, 0, tzinfo=TZ))
+        after = predictor.predict(current, current.points[2], now=now)
+
+        assert after.upper - after.lower < before.upper - before.lower
+
+    def test_passed_point_returns_actual_arrival(self, predictor):
+        current = make_line(["18:00", "18:11"])
+
+        prediction = predictor.predict(current, current.points[1], now=datetime(2026, 1, 7, 18, 20, tzinfo=TZ))
+
+        assert prediction.estimated == prediction.lower == prediction.upper
+        assert prediction.estimated.strftime("%H:%M") == "18:11"
+
+    def test_truck_not_started_uses_schedule(self, predictor):
+        current = make_line([], arrival_rank=0)
+
+        prediction = predictor.predict(current, current.points[2], now=datetime(2026, 1, 7, 17, 0, tzinfo=TZ))
+
+        assert prediction.estimated.strftime("%H:%M") == "18:20"
+
+    def test_never_predicts_the_past(self, predictor):
+        current = make_line(["18:00"])
+        now = datetime(2026, 1, 7, 19, 0, tzinfo=TZ)
+
+        prediction = predictor.predict(current, current.points[1], now=now)
+
+        assert prediction.estimated == now
+        assert prediction.lower == now
+
+    def test_predict_point_by_name(self, predictor):
+        current = make_line(["18:00"])
+        now = datetime(2026, 1, 7, 18, 1, tzinfo=TZ)
+
+        prediction = predictor.predict_point(current, "Point 3", now=now)
+
+        assert prediction == predictor.predict(current, current.points[2], now=now)
+        assert predictor.predict_point(current, "Nowhere", now=now) is None
+
+    def test_to_dict(self, predictor):
+        current = make_line(["18:00"])
+
+        data = predictor.predict(current, current.points[1], now=datetime(2026, 1, 7, 18, 1, tzinfo=TZ)).to_dict()
+
+        assert data["point_name"] == "Point 2"
+        assert data["confidence"] == 0.9
+        assert data["estimated"].startswith("2026-01-07T18:10")
+
+
+class TestInit:
+    """Tests for predictor initialization"""
+
+    @pytest.mark.parametrize("confidence", [0, 1, 1.5])
+    def test_invalid_confidence(self, confidence):
+        with pytest.raises(ValueError):
+            ArrivalPredictor(confidence=confidence)
+
+    def test_invalid_retention(self):
+        with pytest.raises(ValueError):
+            ArrivalPredictor(retention_days=0)
+
+    def test_str(self, predictor):
+        assert str(predictor) == "ArrivalPredictor(db=:memory:, confidence=0.9)"
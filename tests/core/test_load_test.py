@@ -0,0 +1,135 @@
+"""Tests for the load test harness"""
+import pytest
+from trash_tracking_core.clients.session import SessionManager
+from trash_tracking_core.core import load_test
+from trash_tracking_core.core.load_test import LoadTestReport, run_load_test
+from trash_tracking_core.core.simulator import FaultProfile, NTPCSimulator
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.config import ConfigManager
+
+
+def make_route():
+    """Two-point route served by the simulator"""
+    points = [
+        Point(
+            source_point_id=rank,
+            vil="Village",
+            point_name=f"Point {rank}",
+            lon=121.5,
+            lat=25.0,
+            point_id=rank,
+            point_rank=rank,
+            point_time=f"18:{rank:02d}",
+            arrival="",
+            arrival_diff=65535,
+            fixed_point=1,
+            point_weekknd="",
+            in_scope="Y",
+            like_count=0,
+        )
+        for rank in (1, 2)
+    ]
+    return TruckLine(
+        line_id="L001",
+        line_name="Test Route",
+        area="Banqiao",
+        arrival_rank=0,
+        diff=0,
+        car_no="ABC-1234",
+        location="",
+        location_lat=0.0,
+        location_lon=0.0,
+        bar_code="",
+        points=points,
+    )
+
+
+@pytest.fixture
+def config():
+    """Tracker configuration for the simulator route"""
+    return ConfigManager.from_dict(
+        {
+            "location": {"lat": 25.0, "lng": 121.5},
+            "tracking": {"enter_point": "Point 1", "exit_point": "Point 2"},
+            "api": {},
+        }
+    )
+
+
+class TestLoadTestReport:
+    """Tests for report statistics"""
+
+    def test_percentiles_use_nearest_rank(self):
+        report = LoadTestReport(coordinators=1, duration_seconds=1.0, latencies_ms=[float(i) for i in range(1, 101)])
+
+        assert report.percentile(50) == 50.0
+        assert report.percentile(95) == 95.0
+        assert report.percentile(99) == 99.0
+        assert report.percentile(100) == 100.0
+
+    def test_empty_report(self):
+        report = LoadTestReport(coordinators=1, duration_seconds=0.0)
+
+        data = report.to_dict()
+
+        assert data["updates"] == 0
+        assert data["throughput"] == 0.0
+        assert data["latency_ms"]["p99"] == 0.0
+
+
+class TestRunLoadTest:
+    """Tests for running coordinators against the simulator"""
+
+    def test_counts_every_update(self, config):
+        with NTPCSimulator([make_route()]) as simulator:
+            report = run_load_test(
+                simulator.base_url, config, coordinators=3, duration_seconds=0.5, interval_seconds=0.1
+            )
+
+        assert report.updates >= 3
+        assert report.successes == report.updates
+        assert report.failures == {}
+        assert simulator.stats.requests == report.updates
+        assert report.percentile(50) > 0
+
+    def test_classifies_failures(self, config):
+        with NTPCSimulator([make_route()], faults=FaultProfile(error_rate=1.0)) as simulator:
+            report = run_load_test(
+                simulator.base_url,
+                config,
+                coordinators=2,
+                duration_seconds=0.3,
+                interval_seconds=0.1,
+                client_options={"retry_count": 1, "retry_delay": 0},
+            )
+
+        assert report.successes == 0
+        assert report.failures == {"HTTP error: 500": report.updates}
+
+    def test_releases_client_sessions(self, config):
+        users = SessionManager.default().users
+
+        with NTPCSimulator([make_route()]) as simulator:
+            run_load_test(simulator.base_url, config, coordinators=3, duration_seconds=0.2, interval_seconds=0.1)
+
+        assert SessionManager.default().users == users
+
+    def test_pool_sized_to_coordinators(self, config, monkeypatch):
+        managers = []
+
+        class RecordingManager(SessionManager):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                managers.append(self)
+
+        monkeypatch.setattr(load_test, "SessionManager", RecordingManager)
+        with NTPCSimulator([make_route()]) as simulator:
+            run_load_test(simulator.base_url, config, coordinators=3, duration_seconds=0.2, interval_seconds=0.1)
+
+        assert [(m.pool_maxsize, m.pool_block) for m in managers] == [(3, True)]
+        assert managers[0]._session is None
+
+    def test_rejects_zero_coordinators(self, config):
+        with pytest.raises(ValueError):
+            run_load_test("http://127.0.0.1:1", config, coordinators=0)
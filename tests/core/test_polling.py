@@ -0,0 +1,97 @@
+"""Tests for polling policies"""
+from datetime import datetime, timedelta
+
+import pytest
+from trash_tracking_core.core.polling import FixedIntervalPolicy, PollingPolicy, SchedulePolicy, to_api_weekday
+
+# 2026-01-05 is a Monday (API weekday 1)
+MONDAY = datetime(2026, 1, 5, 18, 0)
+
+
+class TestToApiWeekday:
+    """Tests for weekday conversion"""
+
+    def test_monday(self):
+        assert to_api_weekday(MONDAY) == 1
+
+    def test_sunday(self):
+        assert to_api_weekday(datetime(2026, 1, 11)) == 0
+
+
+class TestPollingPolicy:
+    """Tests for the PollingPolicy base class"""
+
+    def test_is_abstract(self):
+        with pytest.raises(TypeError):
+            PollingPolicy()
+
+
+class TestFixedIntervalPolicy:
+    """Tests for FixedIntervalPolicy"""
+
+    def test_always_polls(self):
+        policy = FixedIntervalPolicy(60)
+
+        assert policy.should_poll(MONDAY)
+        assert policy.interval_seconds == 60
+        assert str(policy) == "every 60s"
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            FixedIntervalPolicy(0)
+
+
+class TestSchedulePolicy:
+    """Tests for SchedulePolicy"""
+
+    def test_polls_within_buffered_window(self):
+        policy = SchedulePolicy([1], "18:00", "18:30", buffer_minutes=10)
+
+        assert policy.should_poll(MONDAY.replace(hour=17, minute=50))
+        assert policy.should_poll(MONDAY.replace(hour=18, minute=40))
+        assert not policy.should_poll(MONDAY.replace(hour=17, minute=49))
+        assert not policy.should_poll(MONDAY.replace(hour=18, minute=41))
+
+    def test_skips_other_weekdays(self):
+        policy = SchedulePolicy([2, 4], "18:00", "18:30")
+
+        assert not policy.should_poll(MONDAY)
+
+    def test_without_weekdays_always_polls(self):
+        policy = SchedulePolicy([], None, None)
+
+        assert policy.should_poll(MONDAY.replace(hour=3))
+
+    def test_malformed_times_poll_all_day(self):
+        policy = SchedulePolicy([1], "6pm", "18:30")
+
+        assert policy.should_poll(MONDAY.replace(hour=3))
+
+    def test_window_for(self):
+        policy = SchedulePolicy([1], "18:00", "18:30", buffer_minutes=5)
+
+        start, end = policy.window_for(MONDAY)
+
+        assert start == datetime(2026, 1, 5, 17, 55)
+        assert end == datetime(2026, 1, 5, 18, 35)
+
+    def test_window_for_requires_times(self):
+        with pytest.raises(ValueError):
+            SchedulePolicy([1], None, None).window_for(MONDAY)
+
+    def test_prewarm_in_lead_time_before_window(self):
+        policy = SchedulePolicy([1], "18:00", "18:30", buffer_minutes=10)
+        lead = timedelta(seconds=90)
+
+        assert policy.should_prewarm(MONDAY.replace(hour=17, minute=49), lead)
+        assert policy.should_prewarm(MONDAY.replace(hour=17, minute=48, second=30), lead)
+        assert not policy.should_prewarm(MONDAY.replace(hour=17, minute=48), lead)
+        assert not policy.should_prewarm(MONDAY.replace(hour=17, minute=50), lead)
+
+    def test_no_prewarm_on_other_days_or_without_times(self):
+        lead = timedelta(seconds=90)
+        evening = MONDAY.replace(hour=17, minute=49)
+
+        assert not SchedulePolicy([2], "18:00", "18:30").should_prewarm(evening, lead)
+        assert not SchedulePolicy([1], None, None).should_prewarm(evening, lead)
+        assert not SchedulePolicy([], None, None).should_prewarm(evening, lead)
@@ -0,0 +1,134 @@
+"""Tests for PositionRecorder"""
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from trash_tracking_core.core.recorder import PositionRecord, PositionRecorder, RecorderError, available_days, read_day
+from trash_tracking_core.models.truck import TruckLine
+
+TZ = ZoneInfo("Asia/Taipei")
+
+
+def make_line(line_id, arrival_rank, diff=0, lat=25.0175, lon=121.4625):
+    """Build a truck route carrying only the recorded fields"""
+    return TruckLine(
+        line_id=line_id,
+        line_name=f"Route {line_id}",
+        area="Banqiao",
+        arrival_rank=arrival_rank,
+        diff=diff,
+        car_no="ABC-1234",
+        location="",
+        location_lat=lat,
+        location_lon=lon,
+        bar_code="",
+        points=[],
+    )
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """Recorder writing to a temporary directory"""
+    r = PositionRecorder(str(tmp_path))
+    yield r
+    r.close()
+
+
+class TestRecordAndRead:
+    """Tests for writing and streaming back a day"""
+
+    def test_round_trip(self, recorder, tmp_path):
+        at = datetime(2026, 1, 5, 18, 0, 30, tzinfo=TZ)
+
+        written = recorder.record([make_line("L1", 3, diff=-2), make_line("L2", 10, diff=5)], recorded_at=at)
+        records = list(read_day(str(tmp_path), date(2026, 1, 5)))
+
+        assert written == 2
+        assert [r.line_id for r in records] == ["L1", "L2"]
+        assert records[0].timestamp == at.astimezone(timezone.utc)
+        assert records[0].arrival_rank == 3
+        assert records[0].diff == -2
+        assert records[1].diff == 5
+        assert records[0].lat == pytest.approx(25.0175, abs=1e-5)
+        assert records[0].lon == pytest.approx(121.4625, abs=1e-5)
+
+    def test_line_ids_stored_once_per_day(self, recorder, tmp_path):
+        for minute in range(3):
+            recorder.record([make_line("L1", minute)], recorded_at=datetime(2026, 1, 5, 18, minute, tzinfo=TZ))
+
+        lines_file = tmp_path / "2026-01-05.lines"
+        records = list(read_day(str(tmp_path), date(2026, 1, 5)))
+
+        assert lines_file.read_text(encoding="utf-8") == "L1\n"
+        assert [r.arrival_rank for r in records] == [0, 1, 2]
+
+    def test_fixed_width_records(self, recorder, tmp_path):
+        recorder.record([make_line("L1", 1), make_line("L1", 2)], recorded_at=datetime(2026, 1, 5, 18, 0, tzinfo=TZ))
+
+        assert (tmp_path / "2026-01-05.pos").stat().st_size == 8 + 2 * 18
+
+    def test_splits_days_in_local_timezone(self, recorder, tmp_path):
+        recorder.record([make_line("L1", 1)], recorded_at=datetime(2026, 1, 5, 23, 59, tzinfo=TZ))
+        recorder.record([make_line("L1", 2)], recorded_at=datetime(2026, 1, 6, 0, 1, tzinfo=TZ))
+
+        assert available_days(str(tmp_path)) == [date(2026, 1, 5), date(2026, 1, 6)]
+        assert len(list(read_day(str(tmp_path), date(2026, 1, 6)))) == 1
+
+    def test_appends_across_recorder_instances(self, tmp_path):
+        at = datetime(2026, 1, 5, 18, 0, tzinfo=TZ)
+        with PositionRecorder(str(tmp_path)) as first:
+            first.record([make_line("L1", 1)], recorded_at=at)
+        with PositionRecorder(str(tmp_path)) as second:
+            second.record([make_line("L2", 1), make_line("L1", 2)], recorded_at=at)
+
+        records = list(read_day(str(tmp_path), date(2026, 1, 5)))
+
+        assert [(r.line_id, r.arrival_rank) for r in records] == [("L1", 1), ("L2", 1), ("L1", 2)]
+
+    def test_out_of_range_values_are_clamped(self, recorder, tmp_path):
+        recorder.record([make_line("L1", 1, diff=100000)], recorded_at=datetime(2026, 1, 5, 18, 0, tzinfo=TZ))
+
+        (record,) = read_day(str(tmp_path), date(2026, 1, 5))
+
+        assert record.diff == 32767
+
+    def test_empty_poll_writes_nothing(self, recorder, tmp_path):
+        assert recorder.record([], recorded_at=datetime(2026, 1, 5, 18, 0, tzinfo=TZ)) == 0
+        assert list(read_day(str(tmp_path), date(2026, 1, 5))) == []
+
+
+class TestReadDay:
+    """Tests for the streaming reader"""
+
+    def test_missing_day_yields_nothing(self, tmp_path):
+        assert list(read_day(str(tmp_path), date(2026, 1, 5))) == []
+
+    def test_is_lazy_generator(self, recorder, tmp_path):
+        recorder.record([make_line("L1", i) for i in range(100)], recorded_at=datetime(2026, 1, 5, 18, 0, tzinfo=TZ))
+
+        stream = read_day(str(tmp_path), date(2026, 1, 5))
+        first = next(stream)
+        stream.close()
+
+        assert isinstance(first, PositionRecord)
+        assert first.arrival_rank == 0
+
+    def test_ignores_truncated_trailing_record(self, recorder, tmp_path):
+        recorder.record([make_line("L1", 1), make_line("L1", 2)], recorded_at=datetime(2026, 1, 5, 18, 0, tzinfo=TZ))
+        recorder.close()
+        with open(tmp_path / "2026-01-05.pos", "ab") as f:
+            f.write(b"\x00" * 5)
+
+        assert len(list(read_day(str(tmp_path), date(2026, 1, 5)))) == 2
+
+    def test_rejects_foreign_file(self, tmp_path):
+        (tmp_path / "2026-01-05.pos").write_bytes(b"NOPE" + b"\x00" * 20)
+
+        with pytest.raises(RecorderError):
+            list(read_day(str(tmp_path), date(2026, 1, 5)))
+
+    def test_available_days_ignores_unrelated_files(self, tmp_path):
+        (tmp_path / "notes.pos").write_bytes(b"")
+
+        assert available_days(str(tmp_path)) == []
+        assert available_days(str(tmp_path / "missing")) == []
@@ -0,0 +1,216 @@
+"""Tests for ReplayEngine"""
+import json
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from trash_tracking_core.core.polling import FixedIntervalPolicy, SchedulePolicy
+from trash_tracking_core.core.recorder import PositionRecord, PositionRecorder, read_day
+from trash_tracking_core.core.replay import (
+    ReplayEngine,
+    ReplayFrame,
+    frames_from_positions,
+    load_frames,
+    synthetic_frames,
+)
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+from trash_tracking_core.utils.config import ConfigManager
+
+TZ = ZoneInfo("Asia/Taipei")
+SERVICE_DATE = date(2026, 1, 5)  # Monday
+
+
+def make_template():
+    """Five-point route scheduled every 5 minutes from 18:00"""
+    points = [
+        Point(
+            source_point_id=rank,
+            vil="Village",
+            point_name=f"Point {rank}",
+            lon=121.5 + rank / 1000,
+            lat=25.0 + rank / 1000,
+            point_id=100 + rank,
+            point_rank=rank,
+            point_time=f"18:{(rank - 1) * 5:02d}",
+            arrival="",
+            arrival_diff=65535,
+            fixed_point=1,
+            point_weekknd="1,2,4",
+            in_scope="Y",
+            like_count=0,
+        )
+        for rank in range(1, 6)
+    ]
+    return TruckLine(
+        line_id="L001",
+        line_name="Test Route",
+        area="Banqiao",
+        arrival_rank=0,
+        diff=0,
+        car_no="ABC-1234",
+        location="",
+        location_lat=0.0,
+        location_lon=0.0,
+        bar_code="",
+        points=points,
+    )
+
+
+@pytest.fixture
+def engine():
+    """Replay engine tracking Point 2 → Point 4"""
+    config = ConfigManager.from_dict(
+        {
+            "location": {"lat": 25.0, "lng": 121.5},
+            "tracking": {"enter_point": "Point 2", "exit_point": "Point 4"},
+            "api": {},
+        }
+    )
+    return ReplayEngine(config)
+
+
+class TestSyntheticFrames:
+    """Tests for synthetic frame generation"""
+
+    def test_truck_progresses_on_schedule(self):
+        frames = list(synthetic_frames(make_template(), SERVICE_DATE, step_seconds=60, lead_minutes=0))
+
+        at_1807 = next(f for f in frames if f.timestamp == datetime(2026, 1, 5, 18, 7, tzinfo=TZ))
+        line = TruckLine.from_dict(at_1807.payload["Line"][0])
+
+        assert frames[0].timestamp == datetime(2026, 1, 5, 18, 0, tzinfo=TZ)
+        assert frames[-1].timestamp == datetime(2026, 1, 5, 18, 20, tzinfo=TZ)
+        assert line.arrival_rank == 2
+        assert [p.has_passed() for p in line.points] == [True, True, False, False, False]
+        assert line.points[1].arrival == "18:05"
+
+    def test_delay_shifts_arrivals(self):
+        frames = list(synthetic_frames(make_template(), SERVICE_DATE, step_seconds=60, delay_minutes=3))
+
+        last = TruckLine.from_dict(frames[-1].payload["Line"][0])
+
+        assert last.diff == 3
+        assert last.points[0].arrival == "18:03"
+
+    def test_template_without_schedule_yields_nothing(self):
+        template = make_template()
+        for point in template.points:
+            point.point_time = ""
+
+        assert list(synthetic_frames(template, SERVICE_DATE)) == []
+
+
+class TestReplayEngine:
+    """Tests for replaying frames against policies"""
+
+    def test_reference_transitions(self, engine):
+        report = engine.run(synthetic_frames(make_template(), SERVICE_DATE, step_seconds=30))
+
+        assert [(t.from_state, t.to_state) for t in report.reference] == [("idle", "nearby"), ("nearby", "idle")]
+        assert report.reference[0].timestamp == datetime(2026, 1, 5, 18, 5, tzinfo=TZ)
+        assert report.reference[1].timestamp == datetime(2026, 1, 5, 18, 15, tzinfo=TZ)
+
+    def test_counts_api_calls_and_lag_per_policy(self, engine):
+        frames = list(synthetic_frames(make_template(), SERVICE_DATE, step_seconds=30, lead_minutes=10))
+
+        report = engine.run(frames, [FixedIntervalPolicy(30), FixedIntervalPolicy(420)])
+        every_30s, every_7min = report.policies
+
+        assert report.frames == len(frames)
+        assert every_30s.api_calls == len(frames)
+        assert every_30s.lag_seconds == [0.0, 0.0]
+        assert every_7min.api_calls == 6
+        assert all(lag >= 0 for lag in every_7min.lag_seconds)
+        assert every_7min.lag_seconds[0] > 0
+
+    def test_schedule_policy_saves_calls(self, engine):
+        frames = list(synthetic_frames(make_template(), SERVICE_DATE, step_seconds=30, lead_minutes=60))
+
+        report = engine.run(frames, [FixedIntervalPolicy(30), SchedulePolicy([1], "18:00", "18:20", 10, 30)])
+        always, scheduled = report.policies
+
+        assert scheduled.api_calls < always.api_calls
+        assert [t.to_state for t in scheduled.transitions] == ["nearby", "idle"]
+
+    def test_schedule_policy_on_wrong_day_sees_nothing(self, engine):
+        report = engine.run(
+            synthetic_frames(make_template(), SERVICE_DATE), [SchedulePolicy([2], "18:00", "18:20", 10, 30)]
+        )
+
+        assert report.policies[0].api_calls == 0
+        assert report.policies[0].transitions == []
+
+    def test_configured_history_is_not_written(self, tmp_path):
+        config = ConfigManager.from_dict(
+            {
+                "location": {"lat": 25.0, "lng": 121.5},
+                "tracking": {"enter_point": "Point 2", "exit_point": "Point 4"},
+                "api": {},
+                "history": {"directory": str(tmp_path / "history")},
+            }
+        )
+
+        ReplayEngine(config).run(synthetic_frames(make_template(), SERVICE_DATE), [FixedIntervalPolicy(60)])
+
+        assert not (tmp_path / "history").exists()
+
+    def test_empty_frames(self, engine):
+        report = engine.run([])
+
+        assert report.frames == 0
+        assert report.reference == []
+        assert report.to_dict()["start"] is None
+
+    def test_report_to_dict_is_json_serializable(self, engine):
+        report = engine.run(synthetic_frames(make_template(), SERVICE_DATE))
+
+        data = json.loads(json.dumps(report.to_dict()))
+
+        assert data["policies"][0]["policy"] == "every 30s"
+        assert data["reference"][0]["to_state"] == "nearby"
+
+
+class TestFrameSources:
+    """Tests for loading recorded frames"""
+
+    def test_load_frames_round_trip(self, tmp_path):
+        frames = list(synthetic_frames(make_template(), SERVICE_DATE, step_seconds=300))
+        path = tmp_path / "frames.jsonl"
+        path.write_text("\n".join(f.to_json() for f in frames) + "\n\nnot json\n", encoding="utf-8")
+
+        loaded = list(load_frames(str(path)))
+
+        assert loaded == frames
+
+    def test_frames_from_positions(self, engine):
+        template = make_template()
+        start = datetime(2026, 1, 5, 18, 0, tzinfo=TZ)
+        records = [
+            PositionRecord(start + timedelta(minutes=minute), "L001", minute // 5 + 1, 0, 25.0, 121.5)
+            for minute in range(0, 25)
+        ]
+        records.append(PositionRecord(start, "OTHER", 5, 0, 25.0, 121.5))
+
+        frames = list(frames_from_positions(records, template))
+        report = engine.run(frames)
+
+        assert len(frames) == 25
+        assert isinstance(frames[0], ReplayFrame)
+        assert TruckLine.from_dict(frames[6].payload["Line"][0]).points[1].arrival == "18:05"
+        assert [t.to_state for t in report.reference] == ["nearby", "idle"]
+
+    def test_frames_from_recorded_history_use_local_time(self, tmp_path):
+        template = make_template()
+        recorder = PositionRecorder(str(tmp_path))
+        for minute, rank in [(0, 1), (7, 2)]:
+            recorder.record([replace(template, arrival_rank=rank)], datetime(2026, 1, 5, 18, minute, tzinfo=TZ))
+        recorder.close()
+
+        frames = list(frames_from_positions(read_day(str(tmp_path), SERVICE_DATE), template))
+
+        points = TruckLine.from_dict(frames[-1].payload["Line"][0]).points
+        assert [p.arrival for p in points[:2]] == ["18:00", "18:07"]
+        assert frames[-1].timestamp == datetime(2026, 1, 5, 18, 7, tzinfo=TZ)
+        assert frames[-1].timestamp.utcoffset() == timedelta(hours=8)
@@ -0,0 +1,170 @@
+"""Tests for NTPCSimulator"""
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+import requests
+from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.core.simulator import FaultProfile, NTPCSimulator, SimulatedClock
+from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.truck import TruckLine
+
+TZ = ZoneInfo("Asia/Taipei")
+
+
+def make_route():
+    """Three-point route scheduled every 5 minutes from 18:00"""
+    points = [
+        Point(
+            source_point_id=rank,
+            vil="Village",
+            point_name=f"Point {rank}",
+            lon=121.5 + rank / 1000,
+            lat=25.0 + rank / 1000,
+            point_id=100 + rank,
+            point_rank=rank,
+            point_time=f"18:{(rank - 1) * 5:02d}",
+            arrival="",
+            arrival_diff=65535,
+            fixed_point=1,
+            point_weekknd="1,2,4",
+            in_scope="Y",
+            like_count=0,
+        )
+        for rank in range(1, 4)
+    ]
+    return TruckLine(
+        line_id="L001",
+        line_name="Test Route",
+        area="Banqiao",
+        arrival_rank=0,
+        diff=0,
+        car_no="ABC-1234",
+        location="",
+        location_lat=0.0,
+        location_lon=0.0,
+        bar_code="",
+        points=points,
+    )
+
+
+def make_client(base_url):
+    """Client that fails fast and never shares cached responses"""
+    return NTPCApiClient(base_url=base_url, timeout=1, retry_count=1, retry_delay=0, cache_enabled=False)
+
+
+class TestPayload:
+    """Tests for simulated route progress"""
+
+    def test_truck_moves_along_point_rank(self):
+        simulator = NTPCSimulator([make_route()])
+
+        line = TruckLine.from_dict(simulator.payload_at(datetime(2026, 1, 5, 18, 7, tzinfo=TZ))["Line"][0])
+
+        assert line.arrival_rank == 2
+        assert line.location == "Point 2"
+        assert [p.arrival for p in line.points] == ["18:00", "18:05", ""]
+
+    def test_route_delay_shifts_arrivals(self):
+        simulator = NTPCSimulator([make_route()], delays={"L001": 10})
+
+        line = TruckLine.from_dict(simulator.payload_at(datetime(2026, 1, 5, 18, 7, tzinfo=TZ))["Line"][0])
+
+        assert line.arrival_rank == 0
+        assert line.diff == 10
+
+    def test_naive_time_is_local(self):
+        simulator = NTPCSimulator([make_route()])
+
+        payload = simulator.payload_at(datetime(2026, 1, 5, 18, 12))
+
+        assert payload["Line"][0]["ArrivalRank"] == 3
+        assert payload["TimeStamp"] == "20260105181200"
+
+
+class TestSimulatedClock:
+    """Tests for the accelerated clock"""
+
+    def test_runs_faster_than_real_time(self):
+        start = datetime(2026, 1, 5, 18, 0, tzinfo=TZ)
+        clock = SimulatedClock(start, speed=3600)
+
+        assert clock.now() >= start
+
+    def test_rejects_non_positive_speed(self):
+        with pytest.raises(ValueError):
+            SimulatedClock(datetime(2026, 1, 5, 18, 0, tzinfo=TZ), speed=0)
+
+
+class TestServer:
+    """Tests for the HTTP endpoint"""
+
+    def test_serves_api_client(self):
+        clock = SimulatedClock(datetime(2026, 1, 5, 18, 6, tzinfo=TZ), speed=1)
+
+        with NTPCSimulator([make_route()], clock=clock) as simulator:
+            lines = make_client(simulator.base_url).get_around_points(25.0, 121.5)
+
+        assert len(lines) == 1
+        assert lines[0].arrival_rank == 2
+        assert simulator.stats.requests == 1
+        assert simulator.stats.ok == 1
+
+    def test_injected_errors(self):
+        with NTPCSimulator([make_route()], faults=FaultProfile(error_rate=1.0)) as simulator:
+            with pytest.raises(NTPCApiError, match="HTTP error: 500"):
+                make_client(simulator.base_url).get_around_points(25.0, 121.5)
+
+        assert simulator.stats.errors == 1
+
+    def test_malformed_json(self):
+        with NTPCSimulator([make_route()], faults=FaultProfile(malformed_rate=1.0)) as simulator:
+            response = requests.post(f"{simulator.base_url}/GetAroundPoints", data={"lat": 25.0}, timeout=5)
+
+        assert response.status_code == 200
+        with pytest.raises(ValueError):
+            response.json()
+        assert simulator.stats.malformed == 1
+
+    def test_slow_response_times_out_client(self):
+        faults = FaultProfile(slow_rate=1.0, slow_ms=1500)
+
+        with NTPCSimulator([make_route()], faults=faults) as simulator:
+            with pytest.raises(NTPCApiError, match="timeout"):
+                make_client(simulator.base_url).get_around_points(25.0, 121.5)
+
+        assert simulator.stats.slow == 1
+
+    def test_unknown_path_returns_404(self):
+        with NTPCSimulator([make_route()]) as simulator:
+            response = requests.post(f"{simulator.base_url}/Other", timeout=5)
+
+        assert response.status_code == 404
+        assert simulator.stats.not_found == 1
+
+    def test_base_url_requires_running_server(self):
+        with pytest.raises(RuntimeError):
+            NTPCSimulator([make_route()]).base_url
+
+    def test_same_seed_injects_same_faults(self):
+        faults = FaultProfile(error_rate=0.5)
+
+        def draw(seed):
+            simulator = NTPCSimulator([make_route()], faults=faults, seed=seed)
+            return [simulator.handle("/WebAPI/GetAroundPoints")[0] for _ in range(20)]
+
+        assert draw(7) == draw(7)
+        assert set(draw(7)) == {200, 500}
+
+
+class TestFaultProfile:
+    """Tests for fault settings validation"""
+
+    @pytest.mark.parametrize("field", ["error_rate", "slow_rate", "malformed_rate"])
+    def test_rejects_rate_above_one(self, field):
+        with pytest.raises(ValueError):
+            FaultProfile(**{field: 1.5})
+
+    def test_rejects_negative_latency(self):
+        with pytest.raises(ValueError):
+            FaultProfile(latency_ms=-1)
@@ -1,12 +1,18 @@
 """Tests for TruckTracker"""
+import copy
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from trash_tracking_core.clients.ntpc_api import NTPCApiClient, NTPCApiError
+from trash_tracking_core.clients.shared_cache import SharedResponseCache
+from trash_tracking_core.core.eta_predictor import ArrivalPredictor
 from trash_tracking_core.core.point_matcher import MatchResult, PointMatcher
+from trash_tracking_core.core.recorder import PositionRecorder
 from trash_tracking_core.core.state_manager import StateManager, TruckState
 from trash_tracking_core.core.tracker import TruckTracker
 from trash_tracking_core.models.point import Point
+from trash_tracking_core.models.snapshot import LineSnapshot
 from trash_tracking_core.models.truck import TruckLine
 from trash_tracking_core.utils.config import ConfigManager
 
@@ -160,7 +166,9 @@ class TestGetCurrentStatusNormalFlow:
         tracker.api_client.get_around_points.assert_called_once_with(lat=25.0, lng=121.5)
 
         # Verify point matcher was called
-        tracker.point_matcher.check_line.assert_called_once_with(sample_truck, current_state=TruckState.IDLE)
+        tracker.point_matcher.check_line.assert_called_once_with(
+            LineSnapshot.of(sample_truck), current_state=TruckState.IDLE
+        )
 
         # Verify state manager was updated
         tracker.state_manager.update_state.assert_called_once_with(
@@ -250,9 +258,7 @@ class TestGetCurrentStatusNoTrucks:
         response = tracker.get_current_status()
 
         # Verify state manager was updated to idle
-        tracker.state_manager.update_state.assert_called_once_with(
-            new_state="idle", reason="No trucks nearby"
-        )
+        tracker.state_manager.update_state.assert_called_once_with(new_state="idle", reason="No trucks nearby")
 
         assert response["status"] == "idle"
         assert response["reason"] == "No trucks nearby"
@@ -305,7 +311,9 @@ class TestGetCurrentStatusTargetLines:
         response = tracker.get_current_status()
 
         # Verify only the matching truck was checked
-        tracker.point_matcher.check_line.assert_called_once_with(sample_truck, current_state=TruckState.IDLE)
+        tracker.point_matcher.check_line.assert_called_once_with(
+            LineSnapshot.of(sample_truck), current_state=TruckState.IDLE
+        )
 
         assert response["status"] == "nearby"
 
@@ -357,9 +365,7 @@ class TestGetCurrentStatusTargetLines:
         response = tracker.get_current_status()
 
         # Verify state manager was updated to idle
-        tracker.state_manager.update_state.assert_called_once_with(
-            new_state="idle", reason="Tracked routes not nearby"
-        )
+        tracker.state_manager.update_state.assert_called_once_with(new_state="idle", reason="Tracked routes not nearby")
 
         assert response["status"] == "idle"
 
@@ -627,6 +633,48 @@ class TestReset:
         assert tracker.state_manager.reset.call_count == 3
 
 
+class TestClose:
+    """Test closing what the tracker created"""
+
+    def test_shared_cache_belongs_to_own_client(self, mock_config, tmp_path):
+        """Test that api.ntpc.shared_cache only changes the tracker's own client"""
+        cache_path = str(tmp_path / "cache.sqlite")
+        mock_config.get = Mock(side_effect=lambda key, default: cache_path if key == "api.ntpc.shared_cache" else default)
+        default_cache = NTPCApiClient._cache
+
+        with patch.object(SharedResponseCache, "close", autospec=True, side_effect=SharedResponseCache.close) as close:
+            with TruckTracker(mock_config) as tracker:
+                assert isinstance(tracker.api_client._cache, SharedResponseCache)
+                assert NTPCApiClient._cache is default_cache
+                assert NTPCApiClient()._cache is default_cache
+
+        assert tracker.api_client._closed
+        close.assert_called_once_with(tracker.api_client._cache)
+
+    def test_passed_in_objects_are_not_closed(self, mock_config):
+        """Test that close() leaves the caller's client and recorder open"""
+        api_client = Mock(spec=NTPCApiClient)
+        recorder = Mock(spec=PositionRecorder)
+
+        TruckTracker(mock_config, recorder=recorder, api_client=api_client).close()
+
+        api_client.close.assert_not_called()
+        recorder.close.assert_not_called()
+
+    def test_close_is_idempotent(self, mock_config, tmp_path):
+        """Test that created recorders and predictors are closed once"""
+        mock_config.get = Mock(
+            side_effect=lambda key, default: str(tmp_path / "eta.sqlite") if key == "history.eta_database" else default
+        )
+        tracker = TruckTracker(mock_config)
+        tracker.predictor.close = Mock()
+
+        tracker.close()
+        tracker.close()
+
+        tracker.predictor.close.assert_called_once()
+
+
 class TestMultipleTrucksScenarios:
     """Test scenarios with multiple trucks"""
 
@@ -687,7 +735,7 @@ class TestMultipleTrucksScenarios:
         response = tracker.get_current_status()
 
         # Verify only first truck was checked (loop breaks after first trigger)
-        tracker.point_matcher.check_line.assert_called_once_with(truck1, current_state=TruckState.IDLE)
+        tracker.point_matcher.check_line.assert_called_once_with(LineSnapshot.of(truck1), current_state=TruckState.IDLE)
 
         assert response["status"] == "nearby"
 
@@ -750,8 +798,8 @@ class TestMultipleTrucksScenarios:
 
         # Verify both trucks were checked
         assert tracker.point_matcher.check_line.call_count == 2
-        tracker.point_matcher.check_line.assert_any_call(truck1, current_state=TruckState.IDLE)
-        tracker.point_matcher.check_line.assert_any_call(truck2, current_state=TruckState.IDLE)
+        tracker.point_matcher.check_line.assert_any_call(LineSnapshot.of(truck1), current_state=TruckState.IDLE)
+        tracker.point_matcher.check_line.assert_any_call(LineSnapshot.of(truck2), current_state=TruckState.IDLE)
 
         assert response["status"] == "nearby"
 
@@ -811,3 +859,176 @@ class TestMultipleTrucksScenarios:
         tracker.state_manager.update_state.assert_not_called()
 
         assert response["status"] == "idle"
+
+
+class TestHistoryRecording:
+    """Test optional position recording"""
+
+    def test_no_recorder_by_default(self, mock_config):
+        """Test that recording is disabled unless configured"""
+        tracker = TruckTracker(mock_config)
+
+        assert tracker.recorder is None
+
+    def test_recorder_created_from_config(self, mock_config, tmp_path):
+        """Test that history.directory enables the recorder"""
+        mock_config.get = Mock(
+            side_effect=lambda key, default: str(tmp_path) if key == "history.directory" else default
+        )
+
+        tracker = TruckTracker(mock_config)
+
+        assert isinstance(tracker.recorder, PositionRecorder)
+        assert tracker.recorder.directory == tmp_path
+
+    def test_record_false_ignores_configured_history(self, mock_config, tmp_path):
+        """Test that simulated trackers do not create the configured recorder and predictor"""
+        mock_config.get = Mock(
+            side_effect=lambda key, default: str(tmp_path) if key.startswith("history.") else default
+        )
+
+        tracker = TruckTracker(mock_config, record=False)
+
+        assert tracker.recorder is None
+        assert tracker.predictor is None
+
+    def test_polled_lines_are_recorded(self, mock_config, sample_truck):
+        """Test that every polled route is handed to the recorder"""
+        recorder = Mock(spec=PositionRecorder)
+        tracker = TruckTracker(mock_config, recorder=recorder)
+        tracker.api_client.get_around_points = Mock(return_value=[sample_truck])
+
+        tracker.get_current_status()
+
+        recorder.record.assert_called_once_with([sample_truck])
+
+    def test_recording_failure_does_not_break_tracking(self, mock_config, sample_truck):
+        """Test that recorder I/O errors are logged, not propagated"""
+        recorder = Mock(spec=PositionRecorder)
+        recorder.record.side_effect = OSError("disk full")
+        tracker = TruckTracker(mock_config, recorder=recorder)
+        tracker.api_client.get_around_points = Mock(return_value=[sample_truck])
+
+        response = tracker.get_current_status()
+
+        assert "error" not in response
+
+
+class TestArrivalLearning:
+    """Test feeding polls to the arrival predictor"""
+
+    def test_no_predictor_by_default(self, mock_config):
+        """Test that learning is disabled unless configured"""
+        tracker = TruckTracker(mock_config)
+
+        assert tracker.predictor is None
+
+    def test_predictor_created_from_config(self, mock_config, tmp_path):
+        """Test that history.eta_database enables the predictor"""
+        db_path = str(tmp_path / "eta.sqlite")
+        mock_config.get = Mock(side_effect=lambda key, default: db_path if key == "history.eta_database" else default)
+
+        tracker = TruckTracker(mock_config)
+
+        assert isinstance(tracker.predictor, ArrivalPredictor)
+        assert tracker.predictor.db_path == db_path
+        tracker.predictor.close()
+
+    def test_arrivals_are_learned(self, mock_config, sample_truck):
+        """Test that arrivals seen across polls become segment samples"""
+        predictor = ArrivalPredictor()
+        tracker = TruckTracker(mock_config, predictor=predictor)
+        sample_truck.points[0].arrival = "18:01"
+        sample_truck.points[0].arrival_diff = 1
+        tracker.apply_poll([sample_truck])
+
+        arrived = copy.deepcopy(sample_truck)
+        arrived.points[1].arrival = "18:09"
+        arrived.points[1].arrival_diff = -1
+        tracker.apply_poll([arrived])
+
+        stats = predictor.segment_stats("L001", 4)
+        assert stats.samples == 1
+        assert stats.mean_minutes == 4.0
+
+    def test_unchanged_routes_are_not_observed(self, mock_config, sample_truck):
+        """Test that a route shared with the previous snapshot is skipped"""
+        predictor = Mock(spec=ArrivalPredictor)
+        tracker = TruckTracker(mock_config, predictor=predictor)
+
+        tracker.apply_poll([sample_truck])
+        tracker.apply_poll([copy.deepcopy(sample_truck)])
+
+        predictor.observe.assert_called_once_with(tracker.snapshot.get("L001"))
+
+    def test_enter_point_eta_is_reported(self, mock_config, sample_truck):
+        """Test that the response carries the predicted arrival at the enter point"""
+        predictor = ArrivalPredictor()
+        tracker = TruckTracker(mock_config, predictor=predictor)
+
+        response = tracker.apply_poll([sample_truck])
+
+        assert response["eta"]["point_name"] == "Enter Point"
+        assert response["eta"]["lower"] <= response["eta"]["estimated"] <= response["eta"]["upper"]
+        predictor.close()
+
+    def test_no_eta_without_predictor(self, mock_config, sample_truck):
+        """Test that responses are unchanged when learning is disabled"""
+        response = TruckTracker(mock_config).apply_poll([sample_truck])
+
+        assert "eta" not in response
+
+    def test_learning_failure_does_not_break_tracking(self, mock_config, sample_truck):
+        """Test that predictor database errors are logged, not propagated"""
+        predictor = ArrivalPredictor()
+        predictor.close()
+        tracker = TruckTracker(mock_config, predictor=predictor)
+        sample_truck.points[0].arrival = "18:01"
+        sample_truck.points[0].arrival_diff = 1
+        tracker.api_client.get_around_points = Mock(return_value=[sample_truck])
+
+        response = tracker.get_current_status()
+
+        assert "error" not in response
+
+
+class TestPollSnapshots:
+    """Test the frozen poll results shared with the state"""
+
+    @pytest.fixture
+    def arriving_truck(self, sample_truck):
+        """Truck that has passed the enter point"""
+        sample_truck.points[0].arrival = "18:01"
+        sample_truck.points[0].arrival_diff = 1
+        return sample_truck
+
+    def test_state_holds_frozen_route(self, mock_config, arriving_truck):
+        """Test that the state shares the snapshot's route, which cannot be modified"""
+        tracker = TruckTracker(mock_config)
+
+        response = tracker.apply_poll([arriving_truck])
+
+        assert response["status"] == "nearby"
+        assert tracker.state_manager.current_truck is tracker.snapshot.get("L001")
+        assert tracker.state_manager.enter_point is tracker.snapshot.get("L001").points[0]
+        with pytest.raises(FrozenInstanceError):
+            tracker.state_manager.current_truck.arrival_rank = 3
+
+    def test_unchanged_route_is_shared_across_polls(self, mock_config, arriving_truck):
+        """Test that a repeated poll reuses the previous snapshot's objects"""
+        tracker = TruckTracker(mock_config)
+        tracker.apply_poll([arriving_truck])
+        first = tracker.snapshot
+
+        tracker.apply_poll([copy.deepcopy(arriving_truck)])
+
+        assert tracker.snapshot.get("L001") is first.get("L001")
+        assert tracker.snapshot.changed_since(first) == ()
+
+    def test_empty_poll(self, mock_config):
+        """Test that a poll without routes leaves an empty snapshot"""
+        tracker = TruckTracker(mock_config)
+
+        tracker.apply_poll(None)
+
+        assert len(tracker.snapshot) == 0
@@ -0,0 +1,110 @@
+"""Tests for the binary route snapshot codec"""
+import json
+import struct
+
+import pytest
+from trash_tracking_core.models.codec import CodecError, pack_truck_lines, unpack_truck_lines
+
+
+class TestRoundTrip:
+    """Tests for pack_truck_lines / unpack_truck_lines"""
+
+    def test_round_trip(self, make_line):
+        lines = [make_line("L001"), make_line("L002", points=5)]
+
+        assert unpack_truck_lines(pack_truck_lines(lines)) == lines
+
+    def test_empty(self):
+        assert unpack_truck_lines(pack_truck_lines([])) == []
+
+    def test_route_without_points(self, make_line):
+        lines = [make_line(points=0)]
+
+        assert unpack_truck_lines(pack_truck_lines(lines)) == lines
+
+    def test_coordinates_are_exact(self, make_line):
+        line = make_line(points=1, LocationLat=0.1 + 0.2)
+
+        (decoded,) = unpack_truck_lines(pack_truck_lines([line]))
+
+        assert decoded.location_lat == 0.1 + 0.2
+
+    def test_strings_are_stored_once(self, make_line):
+        snapshot = pack_truck_lines([make_line(points=50)])
+
+        assert snapshot.count("1,3,5".encode()) == 1
+        assert len(snapshot) < len(json.dumps([make_line(points=50).to_api_dict()]).encode()) / 2
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"PointID": 2**40},
+            {"Lat": 25},
+            {"PointRank": "1"},
+            {"PointName": "\ud800 lone surrogate"},
+        ],
+    )
+    def test_fields_outside_the_layout_round_trip(self, overrides, point_data, make_line):
+        line = make_line(points=0, Point=[point_data(1, **overrides), point_data(2)])
+
+        (decoded,) = unpack_truck_lines(pack_truck_lines([line]))
+
+        assert decoded == line
+        assert [type(value) for value in vars(decoded.points[0]).values()] == [
+            type(value) for value in vars(line.points[0]).values()
+        ]
+
+    def test_missing_ids_round_trip(self, point_data, make_line):
+        line = make_line(points=0, Point=[{"PointName": "P1"}, point_data(2)])
+
+        (decoded,) = unpack_truck_lines(pack_truck_lines([line]))
+
+        assert decoded == line
+        assert decoded.points[0].point_id is None
+
+    def test_route_fields_outside_the_layout_round_trip(self, make_line):
+        line = make_line(ArrivalRank=None, LocationLon=121)
+
+        (decoded,) = unpack_truck_lines(pack_truck_lines([line]))
+
+        assert decoded == line
+        assert decoded.arrival_rank is None
+        assert isinstance(decoded.location_lon, int)
+
+
+class TestErrors:
+    """Tests for rejected snapshots"""
+
+    def test_not_a_snapshot(self):
+        with pytest.raises(CodecError):
+            unpack_truck_lines(b'[{"LineID": "L001"}]')
+
+    def test_text_input(self):
+        with pytest.raises(CodecError):
+            unpack_truck_lines("[]")
+
+    def test_other_version(self, make_line):
+        snapshot = bytearray(pack_truck_lines([make_line()]))
+        snapshot[3] = 99
+
+        with pytest.raises(CodecError, match="version"):
+            unpack_truck_lines(bytes(snapshot))
+
+    @pytest.mark.parametrize("cut", [1, 10, 50])
+    def test_truncated(self, cut, make_line):
+        snapshot = pack_truck_lines([make_line()])
+
+        with pytest.raises(CodecError):
+            unpack_truck_lines(snapshot[:-cut])
+
+    def test_trailing_data(self, make_line):
+        with pytest.raises(CodecError):
+            unpack_truck_lines(pack_truck_lines([make_line()]) + b"\0")
+
+    def test_unknown_record_kind(self, make_line):
+        snapshot = bytearray(pack_truck_lines([make_line(points=0)]))
+        # The route record is the end of a snapshot without points
+        snapshot[-struct.calcsize("<BIIIiiIIddII")] = 7
+
+        with pytest.raises(CodecError, match="kind"):
+            unpack_truck_lines(bytes(snapshot))
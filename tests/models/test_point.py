@@ -391,3 +391,14 @@ class TestStringRepresentation:
         assert "Test Point" in result
         assert "rank: 10" in result
         assert "Arrived" in result
+
+
+class TestPointToApiDict:
+    """Test conversion back to API format"""
+
+    def test_round_trip(self, sample_point_data):
+        """Test that from_dict(to_api_dict()) is lossless"""
+        point = Point.from_dict(sample_point_data)
+
+        assert point.to_api_dict() == sample_point_data
+        assert Point.from_dict(point.to_api_dict()) == point
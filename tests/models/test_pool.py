@@ -0,0 +1,101 @@
+"""Tests for the collection point pool"""
+import pytest
+from trash_tracking_core.models.pool import PointPool
+
+
+class TestPointPool:
+    """Tests for PointPool"""
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            PointPool(max_routes=0)
+
+    def test_unchanged_points_are_reused(self, make_line):
+        pool = PointPool()
+        first = pool.pool_line(make_line())
+
+        second = pool.pool_line(make_line())
+
+        assert all(a is b for a, b in zip(first.points, second.points))
+        assert pool.stats.created == 3
+        assert pool.stats.reused == 3
+        assert len(pool) == 3
+
+    def test_arrival_refreshes_live_fields_only(self, make_line):
+        pool = PointPool()
+        first = pool.pool_line(make_line(arrival_rank=0))
+
+        second = pool.pool_line(make_line(arrival_rank=1))
+
+        assert second.points[0] is not first.points[0]
+        assert second.points[0].arrival == "18:01"
+        assert second.points[0].arrival_diff == 1
+        assert second.points[0].point_name is first.points[0].point_name
+        assert second.points[1] is first.points[1]
+        assert first.points[0].arrival == ""
+        assert pool.stats.refreshed == 1
+
+    def test_changed_static_fields_replace_point(self, make_line):
+        pool = PointPool()
+        pool.pool_line(make_line())
+        line = make_line()
+        line.points[0].point_name = "Renamed"
+
+        pooled = pool.pool_line(line)
+
+        assert pooled.points[0].point_name == "Renamed"
+        assert pool.stats.created == 4
+
+    def test_strings_are_interned_across_routes(self, make_line):
+        pool = PointPool()
+
+        first = pool.pool_line(make_line("L001"))
+        second = pool.pool_line(make_line("L002"))
+
+        assert second.points[0] is not first.points[0]
+        assert second.points[0].point_name is first.points[0].point_name
+        assert second.points[0].point_weekknd is first.points[0].point_weekknd
+
+    def test_points_are_pooled_per_route(self, make_line):
+        pool = PointPool()
+
+        pool.pool_line(make_line("L001"))
+        pool.pool_line(make_line("L002"))
+
+        assert len(pool) == 6
+
+    def test_points_without_id_are_not_pooled(self, make_line):
+        pool = PointPool()
+        line = make_line(points=1)
+        line.points[0].point_id = None
+
+        pool.pool_line(line)
+
+        assert len(pool) == 0
+
+    def test_least_recently_polled_route_is_evicted(self, make_line):
+        pool = PointPool(max_routes=2)
+        pool.pool_line(make_line("L001"))
+        pool.pool_line(make_line("L002"))
+        pool.pool_line(make_line("L001"))
+
+        pool.pool_line(make_line("L003"))
+
+        assert pool.stats.evicted_routes == 1
+        assert pool.pool_point("L001", make_line("L001").points[0]) is not None
+        assert pool.stats.reused == 4
+        assert len(pool) == 6
+
+    def test_clear(self, make_line):
+        pool = PointPool()
+        pool.pool_line(make_line())
+
+        pool.clear()
+
+        assert len(pool) == 0
+
+    def test_stats_to_dict(self, make_line):
+        pool = PointPool()
+        pool.pool_line(make_line())
+
+        assert pool.stats.to_dict() == {"reused": 0, "refreshed": 0, "created": 3, "evicted_routes": 0}
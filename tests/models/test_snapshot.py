@@ -0,0 +1,132 @@
+"""Tests for the immutable poll snapshots"""
+import copy
+from dataclasses import FrozenInstanceError
+
+import pytest
+from trash_tracking_core.models.point import PointStatus
+from trash_tracking_core.models.snapshot import LineSnapshot, PointSnapshot, PollSnapshot
+
+
+class TestPointSnapshot:
+    """Tests for PointSnapshot"""
+
+    def test_is_frozen(self, make_point):
+        snapshot = PointSnapshot.of(make_point(1))
+
+        with pytest.raises(FrozenInstanceError):
+            snapshot.arrival = "18:05"
+
+    def test_reads_like_point(self, make_point):
+        point = make_point(1, arrived=True)
+        snapshot = PointSnapshot.of(point)
+
+        assert snapshot.to_api_dict() == point.to_api_dict()
+        assert snapshot.to_dict() == point.to_dict()
+        assert snapshot.get_status() == PointStatus.PASSED
+        assert snapshot.get_weekdays() == [1, 3, 5]
+        assert str(snapshot) == str(point)
+
+    def test_snapshot_is_returned_as_is(self, make_point):
+        snapshot = PointSnapshot.of(make_point(1))
+
+        assert PointSnapshot.of(snapshot) is snapshot
+
+    def test_unchanged_point_reuses_previous(self, make_point):
+        previous = PointSnapshot.of(make_point(1))
+
+        assert PointSnapshot.of(make_point(1), previous) is previous
+        assert PointSnapshot.of(make_point(1, arrived=True), previous) is not previous
+
+
+class TestLineSnapshot:
+    """Tests for LineSnapshot"""
+
+    def test_is_frozen(self, make_line):
+        snapshot = LineSnapshot.of(make_line())
+
+        assert isinstance(snapshot.points, tuple)
+        with pytest.raises(FrozenInstanceError):
+            snapshot.arrival_rank = 2
+
+    def test_reads_like_truck_line(self, make_line):
+        line = make_line(arrival_rank=2)
+        snapshot = LineSnapshot.of(line)
+
+        assert snapshot.to_api_dict() == line.to_api_dict()
+        assert snapshot.find_point("Point 3").point_rank == 3
+        assert snapshot.get_current_point().point_name == "Point 2"
+        assert [p.point_rank for p in snapshot.get_upcoming_points()] == [3]
+        assert snapshot.to_dict(snapshot.points[0], snapshot.points[2]) == line.to_dict(line.points[0], line.points[2])
+        assert str(snapshot) == str(line)
+
+    def test_unchanged_line_reuses_previous(self, make_line):
+        previous = LineSnapshot.of(make_line())
+
+        assert LineSnapshot.of(make_line(), previous) is previous
+
+    def test_moved_truck_shares_unchanged_points(self, make_line):
+        previous = LineSnapshot.of(make_line(arrival_rank=1))
+
+        snapshot = LineSnapshot.of(make_line(arrival_rank=2), previous)
+
+        assert snapshot is not previous
+        assert snapshot.points[0] is previous.points[0]
+        assert snapshot.points[1] is not previous.points[1]
+        assert snapshot.points[2] is previous.points[2]
+
+
+class TestPollSnapshot:
+    """Tests for PollSnapshot"""
+
+    def test_from_lines(self, make_line):
+        snapshot = PollSnapshot.from_lines([make_line("L001"), make_line("L002")])
+
+        assert len(snapshot) == 2
+        assert snapshot.get("L002").line_name == "Route L002"
+        assert snapshot.get("L003") is None
+        assert [line.line_id for line in snapshot] == ["L001", "L002"]
+
+    def test_no_lines(self):
+        assert len(PollSnapshot.from_lines(None)) == 0
+
+    def test_changed_since(self, make_line):
+        lines = [make_line("L001"), make_line("L002")]
+        first = PollSnapshot.from_lines(lines)
+
+        second = PollSnapshot.from_lines([copy.deepcopy(lines[0]), make_line("L002", arrival_rank=2)], first)
+
+        assert second.get("L001") is first.get("L001")
+        assert [line.line_id for line in second.changed_since(first)] == ["L002"]
+        assert second.changed_since(None) == second.lines
+
+    def test_new_route(self, make_line):
+        first = PollSnapshot.from_lines([make_line("L001")])
+
+        second = PollSnapshot.from_lines([make_line("L001"), make_line("L002")], first)
+
+        assert [line.line_id for line in second.changed_since(first)] == ["L002"]
+
+    def test_source_lines_are_not_retained(self, make_line):
+        line = make_line(arrival_rank=1)
+        snapshot = PollSnapshot.from_lines([line])
+
+        line.points[0].arrival = "changed"
+
+        assert snapshot.get("L001").points[0].arrival == "18:01"
+
+    def test_frozen_routes_are_taken_over(self, make_line):
+        cached = PollSnapshot.from_lines([make_line("L001"), make_line("L002")])
+
+        snapshot = PollSnapshot.from_lines(list(cached.lines))
+
+        assert all(line is cached_line for line, cached_line in zip(snapshot, cached))
+
+    def test_equal_frozen_route_reuses_previous(self, make_line):
+        first = PollSnapshot.from_lines([make_line("L001"), make_line("L002")])
+        decoded = PollSnapshot.from_lines([make_line("L001"), make_line("L002", arrival_rank=2)])
+
+        second = PollSnapshot.from_lines(decoded.lines, first)
+
+        assert second.get("L001") is first.get("L001")
+        assert second.get("L002") is decoded.get("L002")
+        assert [line.line_id for line in second.changed_since(first)] == ["L002"]
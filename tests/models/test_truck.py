@@ -366,3 +366,13 @@ class TestStringRepresentation:
         assert "ABC-1234" in result
         assert "Unknown" in result  # Should show Unknown for current location
         assert "99/3" in result
+
+
+class TestTruckLineToApiDict:
+    """Test conversion back to API format"""
+
+    def test_round_trip(self, sample_truck_data):
+        """Test that from_dict(to_api_dict()) is lossless"""
+        truck = TruckLine.from_dict(sample_truck_data)
+
+        assert TruckLine.from_dict(truck.to_api_dict()) == truck
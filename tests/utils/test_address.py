@@ -0,0 +1,106 @@
+"""Tests for Taiwan Address Parsing"""
+
+import pytest
+from trash_tracking_core.utils.address import AddressParts, normalize_component, parse_address, tokenize_address
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    """Start every test with an empty parse memo"""
+    tokenize_address.cache_clear()
+    yield
+    tokenize_address.cache_clear()
+
+
+class TestTokenizeAddress:
+    """Tests for tokenize_address"""
+
+    def test_components(self):
+        parsed = tokenize_address("新北市板橋區中山路一段5巷3弄12號")
+
+        assert parsed.city == "新北市"
+        assert parsed.parts == AddressParts("板橋區", "中山路", "1", "5", "3", "12")
+        assert parsed.text == "新北市板橋區中山路一段5巷3弄12號"
+
+    def test_simplification_ladder(self):
+        parsed = tokenize_address("新北市板橋區民生路2段123巷45弄67號")
+
+        assert parsed.simplifications == (
+            "新北市板橋區民生路2段123巷45弄",
+            "新北市板橋區民生路2段123巷",
+            "新北市板橋區民生路2段",
+            "新北市板橋區民生路",
+        )
+
+    def test_simplification_skips_missing_levels(self):
+        parsed = tokenize_address("新北市板橋區民生路二段80號5樓")
+
+        assert parsed.simplifications == ("新北市板橋區民生路二段", "新北市板橋區民生路")
+
+    def test_simplification_keeps_original_spelling(self):
+        parsed = tokenize_address("新北市板橋區 民生路２段８０之1號")
+
+        assert parsed.simplifications == ("新北市板橋區民生路２段", "新北市板橋區民生路")
+
+    def test_components_outside_structured_pattern(self):
+        """Rural addresses without a road still simplify"""
+        parsed = tokenize_address("新北市坪林區坪林村12鄰坪林5號")
+
+        assert parsed.parts.road == ""
+        assert parsed.simplifications == ("新北市坪林區坪林村12鄰坪林",)
+
+    def test_unsimplifiable_address(self):
+        assert tokenize_address("新北市板橋區").simplifications == ()
+
+    def test_key_is_shared_by_spelling_variants(self):
+        variants = ["新北市板橋區民生路二段80之1號", "新北市板橋區民生路2段８０-1號", "新北市 板橋區 民生路２段80之1號"]
+
+        keys = {tokenize_address(variant).key for variant in variants}
+
+        assert keys == {"新北市板橋區民生路2段80-1號"}
+
+    def test_key_normalizes_tai(self):
+        assert tokenize_address("臺北市中正區重慶南路一段122號").key == "台北市中正區重慶南路1段122號"
+
+    def test_key_keeps_distinct_addresses_apart(self):
+        assert tokenize_address("民生路二段80號").key != tokenize_address("民生路二段某大樓80號").key
+
+    def test_memoized(self):
+        first = tokenize_address("新北市板橋區民生路二段80號")
+        second = tokenize_address("新北市板橋區民生路二段80號")
+        parse_address("新北市板橋區民生路二段80號")
+
+        assert first is second
+        info = tokenize_address.cache_info()
+        assert info.misses == 1 and info.hits == 2
+
+
+class TestNormalizeComponent:
+    """Tests for normalizing separately given address components"""
+
+    @pytest.mark.parametrize(
+        "level,value,expected",
+        [
+            ("section", "二段", "2"),
+            ("section", "十一", "11"),
+            ("section", "０2段", "2"),
+            ("lane", " ８０巷", "80"),
+            ("alley", "3弄", "3"),
+            ("number", "80之1號", "80-1"),
+            ("number", "", ""),
+        ],
+    )
+    def test_matches_parsed_parts(self, level, value, expected):
+        assert normalize_component(level, value) == expected
+
+    def test_agrees_with_parse_address(self):
+        parts = parse_address("新北市板橋區民生路二段８０巷3弄5之1號")
+
+        assert [
+            normalize_component(level, value)
+            for level, value in [("section", "二"), ("lane", "８０"), ("alley", "3"), ("number", "5之1")]
+        ] == [parts.section, parts.lane, parts.alley, parts.number]
+
+    def test_unknown_level(self):
+        with pytest.raises(ValueError):
+            normalize_component("road", "民生路")
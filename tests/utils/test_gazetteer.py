@@ -0,0 +1,139 @@
+"""Tests for the offline gazetteer"""
+import pytest
+from trash_tracking_core.utils.gazetteer import (
+    AddressParts,
+    Gazetteer,
+    GazetteerError,
+    build_gazetteer,
+    build_gazetteer_from_csv,
+    parse_address,
+)
+
+ROWS = [
+    {"district": "板橋區", "road": "民生路二段", "number": "80", "lat": "25.0180", "lng": "121.4710"},
+    {"district": "板橋區", "road": "民生路二段", "number": "82", "lat": "25.0182", "lng": "121.4712"},
+    {"district": "板橋區", "road": "民生路", "section": "2", "lane": "5", "number": "1", "lat": "25.0190", "lng": "121.4720"},
+    {"district": "板橋區", "road": "成功路", "number": "23", "lat": "25.0200", "lng": "121.4745"},
+    {"district": "中和區", "road": "中山路", "number": "1", "lat": "25.0000", "lng": "121.5000"},
+    {"district": "板橋區", "road": "中山路", "number": "1", "lat": "25.0100", "lng": "121.4600"},
+    {"district": "板橋區", "road": "", "number": "1", "lat": "25.0", "lng": "121.4"},
+    {"district": "板橋區", "road": "成功路", "number": "25", "lat": "", "lng": "121.4"},
+]
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    """Gazetteer built from ROWS"""
+    path = str(tmp_path / "gazetteer.db")
+    build_gazetteer(ROWS, path)
+    g = Gazetteer(path)
+    yield g
+    g.close()
+
+
+class TestParseAddress:
+    """Tests for address component parsing"""
+
+    def test_full_address(self):
+        parts = parse_address("新北市板橋區中山路一段5巷3弄12號")
+
+        assert parts == AddressParts("板橋區", "中山路", "1", "5", "3", "12")
+
+    def test_normalizes_numerals(self):
+        assert parse_address("板橋區 民生路二段８０之1號") == parse_address("板橋區民生路2段80-1號")
+
+    def test_skips_village_and_neighborhood(self):
+        parts = parse_address("新北市板橋區民生里5鄰民生路二段80號")
+
+        assert (parts.district, parts.road, parts.number) == ("板橋區", "民生路", "80")
+
+    def test_district_is_optional(self):
+        parts = parse_address("新北市民生路二段")
+
+        assert parts.district == ""
+        assert parts.levels() == ["section", "road"]
+
+    def test_tens_section(self):
+        assert parse_address("板橋區文化路十一段3號").section == "11"
+
+    def test_unparseable(self):
+        assert parse_address("Invalid Address").levels() == []
+
+
+class TestLookup:
+    """Tests for gazetteer lookups"""
+
+    def test_exact_number(self, gazetteer):
+        match = gazetteer.lookup("新北市板橋區民生路二段80號")
+
+        assert match.coordinates == pytest.approx((25.0180, 121.4710))
+        assert match.level == "number"
+        assert match.exact
+
+    def test_unknown_number_falls_back_to_section(self, gazetteer):
+        match = gazetteer.lookup("新北市板橋區民生路二段99號")
+
+        assert match.level == "section"
+        assert not match.exact
+        assert match.points == 3
+        assert match.lat == pytest.approx((25.0180 + 25.0182 + 25.0190) / 3)
+
+    def test_lane_level(self, gazetteer):
+        match = gazetteer.lookup("板橋區民生路二段5巷")
+
+        assert match.level == "lane"
+        assert match.exact
+
+    def test_without_district_for_unique_road(self, gazetteer):
+        match = gazetteer.lookup("新北市成功路23號")
+
+        assert match.coordinates == pytest.approx((25.0200, 121.4745))
+
+    def test_without_district_for_ambiguous_road(self, gazetteer):
+        assert gazetteer.lookup("新北市中山路1號") is None
+        assert gazetteer.lookup("新北市中和區中山路1號").lat == pytest.approx(25.0)
+
+    def test_unknown_road(self, gazetteer):
+        assert gazetteer.lookup("新北市板橋區文化路一段1號") is None
+
+    def test_counts_indexed_addresses(self, gazetteer):
+        assert len(gazetteer) == 6
+
+
+class TestBuild:
+    """Tests for building an index"""
+
+    def test_from_csv_with_chinese_headers(self, tmp_path):
+        csv_path = tmp_path / "addresses.csv"
+        csv_path.write_text("鄉鎮市區,街路段,巷,弄,號,緯度,經度\n板橋區,民生路二段,,,80號,25.018,121.471\n", encoding="utf-8")
+        db_path = str(tmp_path / "out" / "gazetteer.db")
+
+        assert build_gazetteer_from_csv(str(csv_path), db_path) == 1
+        with Gazetteer(db_path) as gazetteer:
+            assert gazetteer.lookup("板橋區民生路二段80號").exact
+
+    def test_csv_missing_columns(self, tmp_path):
+        csv_path = tmp_path / "addresses.csv"
+        csv_path.write_text("district,road\n板橋區,民生路\n", encoding="utf-8")
+
+        with pytest.raises(GazetteerError, match="lat"):
+            build_gazetteer_from_csv(str(csv_path), str(tmp_path / "gazetteer.db"))
+
+    def test_rebuild_replaces_index(self, tmp_path):
+        path = str(tmp_path / "gazetteer.db")
+        build_gazetteer(ROWS, path)
+        build_gazetteer(ROWS[:1], path)
+
+        with Gazetteer(path) as gazetteer:
+            assert len(gazetteer) == 1
+
+    def test_open_missing_index(self, tmp_path):
+        with pytest.raises(GazetteerError):
+            Gazetteer(str(tmp_path / "missing.db"))
+
+    def test_open_foreign_file(self, tmp_path):
+        path = tmp_path / "other.db"
+        path.write_bytes(b"not a database" * 100)
+
+        with pytest.raises(GazetteerError):
+            Gazetteer(str(path))
@@ -0,0 +1,116 @@
+"""Tests for GeocodeCache"""
+import pytest
+from trash_tracking_core.utils.geocode_cache import GeocodeCache
+
+ADDRESS = "新北市板橋區民生路二段80號"
+
+
+@pytest.fixture
+def cache():
+    """In-memory cache with a 100s TTL and 10s negative TTL"""
+    c = GeocodeCache(ttl_seconds=100, negative_ttl_seconds=10)
+    yield c
+    c.close()
+
+
+class TestLookup:
+    """Tests for storing and reading entries"""
+
+    def test_miss_on_empty_cache(self, cache):
+        assert cache.get(ADDRESS) is None
+
+    def test_hit_returns_coordinates(self, cache):
+        cache.put(ADDRESS, (25.0183, 121.4717), now=1000.0)
+
+        entry = cache.get(ADDRESS, now=1050.0)
+
+        assert entry.coordinates == (25.0183, 121.4717)
+        assert not entry.is_failure
+
+    def test_entry_expires_after_ttl(self, cache):
+        cache.put(ADDRESS, (25.0183, 121.4717), now=1000.0)
+
+        assert cache.get(ADDRESS, now=1100.0) is None
+
+    def test_failure_is_cached_with_short_ttl(self, cache):
+        cache.put_failure(ADDRESS, "not found", now=1000.0)
+
+        entry = cache.get(ADDRESS, now=1005.0)
+
+        assert entry.is_failure
+        assert entry.error == "not found"
+        assert cache.get(ADDRESS, now=1010.0) is None
+
+    def test_success_replaces_failure(self, cache):
+        cache.put_failure(ADDRESS, "not found", now=1000.0)
+        cache.put(ADDRESS, (25.0, 121.0), now=1001.0)
+
+        assert cache.get(ADDRESS, now=1002.0).coordinates == (25.0, 121.0)
+        assert len(cache) == 1
+
+    def test_negative_caching_can_be_disabled(self):
+        cache = GeocodeCache(negative_ttl_seconds=0)
+
+        cache.put_failure(ADDRESS, "not found")
+
+        assert len(cache) == 0
+
+
+class TestStats:
+    """Tests for hit-rate counters"""
+
+    def test_counts_hits_negative_hits_and_misses(self, cache):
+        cache.put("A", (25.0, 121.0), now=1000.0)
+        cache.put_failure("B", "not found", now=1000.0)
+
+        cache.get("A", now=1001.0)
+        cache.get("A", now=1001.0)
+        cache.get("B", now=1001.0)
+        cache.get("C", now=1001.0)
+        stats = cache.stats
+
+        assert (stats.hits, stats.negative_hits, stats.misses) == (2, 1, 1)
+        assert stats.hit_rate == 0.75
+        assert stats.to_dict()["hit_rate"] == 0.75
+
+    def test_hit_rate_without_lookups(self, cache):
+        assert cache.stats.hit_rate == 0.0
+
+    def test_clear_resets_entries_and_counters(self, cache):
+        cache.put("A", (25.0, 121.0))
+        cache.get("A")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats.lookups == 0
+
+
+class TestPersistence:
+    """Tests for the on-disk database"""
+
+    def test_entries_survive_reopen(self, tmp_path):
+        path = str(tmp_path / "cache" / "geocode.db")
+        first = GeocodeCache(path)
+        first.put(ADDRESS, (25.0183, 121.4717))
+        first.close()
+
+        second = GeocodeCache(path)
+
+        assert second.get(ADDRESS).coordinates == (25.0183, 121.4717)
+        second.close()
+
+    def test_purge_expired(self, cache):
+        cache.put("old", (25.0, 121.0), now=1000.0)
+        cache.put("new", (25.0, 121.0), now=1090.0)
+        cache.put_failure("failed", "not found", now=1085.0)
+
+        removed = cache.purge_expired(now=1100.0)
+
+        assert removed == 2
+        assert cache.get("new", now=1100.0) is not None
+
+    @pytest.mark.parametrize("kwargs", [{"ttl_seconds": 0}, {"negative_ttl_seconds": -1}])
+    def test_rejects_invalid_ttl(self, kwargs):
+        with pytest.raises(ValueError):
+            GeocodeCache(**kwargs)
@@ -1,13 +1,18 @@
 """Tests for Geocoding Utilities"""
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 import requests
 
+from trash_tracking_core.utils.gazetteer import Gazetteer, build_gazetteer
+from trash_tracking_core.utils.geocode_cache import GeocodeCache
 from trash_tracking_core.utils.geocoding import (
     Geocoder,
     GeocodingError,
     get_current_location_from_address,
 )
+from trash_tracking_core.utils.metrics import HistogramSink, metrics
 
 
 @pytest.fixture
@@ -228,27 +233,24 @@ class TestQueryNLSC:
         """Test NLSC API with HTTP error"""
         mock_get.side_effect = requests.HTTPError("500 Server Error")
 
-        result = geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.HTTPError):
+            geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
 
     @patch("trash_tracking_core.utils.geocoding.requests.get")
     def test_query_nlsc_timeout(self, mock_get, geocoder):
         """Test NLSC API with timeout"""
         mock_get.side_effect = requests.Timeout("Connection timeout")
 
-        result = geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.Timeout):
+            geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
 
     @patch("trash_tracking_core.utils.geocoding.requests.get")
     def test_query_nlsc_connection_error(self, mock_get, geocoder):
         """Test NLSC API with connection error"""
         mock_get.side_effect = requests.ConnectionError("Connection failed")
 
-        result = geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.ConnectionError):
+            geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
 
 
 class TestQueryNominatim:
@@ -318,18 +320,16 @@ class TestQueryNominatim:
         """Test Nominatim API with HTTP error"""
         mock_get.side_effect = requests.HTTPError("500 Server Error")
 
-        result = geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.HTTPError):
+            geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=10)
 
     @patch("trash_tracking_core.utils.geocoding.requests.get")
     def test_query_nominatim_timeout(self, mock_get, geocoder):
         """Test Nominatim API with timeout"""
         mock_get.side_effect = requests.Timeout("Connection timeout")
 
-        result = geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.Timeout):
+            geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=10)
 
 
 class TestQueryTGOS:
@@ -395,18 +395,16 @@ class TestQueryTGOS:
         """Test TGOS API with HTTP error"""
         mock_get.side_effect = requests.HTTPError("500 Server Error")
 
-        result = geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.HTTPError):
+            geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=10)
 
     @patch("trash_tracking_core.utils.geocoding.requests.get")
     def test_query_tgos_timeout(self, mock_get, geocoder):
         """Test TGOS API with timeout"""
         mock_get.side_effect = requests.Timeout("Connection timeout")
 
-        result = geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=10)
-
-        assert result is None
+        with pytest.raises(requests.Timeout):
+            geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=10)
 
 
 class TestCoordinateConversion:
@@ -551,7 +549,9 @@ class TestAddressToCoordinates:
     @patch.object(Geocoder, "_try_simplified_addresses")
     @patch.object(Geocoder, "_query_nominatim")
     @patch.object(Geocoder, "_query_nlsc")
-    def test_address_to_coordinates_tgos_fallback(self, mock_nlsc, mock_nominatim, mock_simplified, mock_tgos, geocoder):
+    def test_address_to_coordinates_tgos_fallback(
+        self, mock_nlsc, mock_nominatim, mock_simplified, mock_tgos, geocoder
+    ):
         """Test fallback to TGOS when all other APIs fail"""
         # All APIs except TGOS return None
         mock_nlsc.return_value = None
@@ -674,27 +674,24 @@ class TestTimeoutHandling:
         """Test timeout handling in NLSC API"""
         mock_get.side_effect = requests.Timeout("Connection timeout")
 
-        result = geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=5)
-
-        assert result is None
+        with pytest.raises(requests.Timeout):
+            geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=5)
 
     @patch("trash_tracking_core.utils.geocoding.requests.get")
     def test_timeout_in_nominatim(self, mock_get, geocoder):
         """Test timeout handling in Nominatim API"""
         mock_get.side_effect = requests.Timeout("Connection timeout")
 
-        result = geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=5)
-
-        assert result is None
+        with pytest.raises(requests.Timeout):
+            geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=5)
 
     @patch("trash_tracking_core.utils.geocoding.requests.get")
     def test_timeout_in_tgos(self, mock_get, geocoder):
         """Test timeout handling in TGOS API"""
         mock_get.side_effect = requests.Timeout("Connection timeout")
 
-        result = geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=5)
-
-        assert result is None
+        with pytest.raises(requests.Timeout):
+            geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=5)
 
     @patch.object(Geocoder, "_query_nlsc")
     def test_timeout_propagates_to_geocoding_error(self, mock_nlsc, geocoder):
@@ -706,3 +703,401 @@ class TestTimeoutHandling:
             geocoder.address_to_coordinates("新北市板橋區民生路二段80號", timeout=5)
 
         assert "地址查詢失敗" in str(exc_info.value)
+
+
+class TestGeocoderCache:
+    """Test persistent caching of geocoding results"""
+
+    @pytest.fixture
+    def cached_geocoder(self):
+        """Geocoder backed by an in-memory cache"""
+        cache = GeocodeCache()
+        yield Geocoder(cache=cache)
+        cache.close()
+
+    @patch.object(Geocoder, "_query_providers")
+    def test_second_lookup_skips_providers(self, mock_providers, cached_geocoder):
+        """Test that a cached address does not hit the network again"""
+        mock_providers.return_value = (25.018269, 121.471703)
+
+        first = cached_geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+        second = cached_geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert first == second == (25.018269, 121.471703)
+        assert mock_providers.call_count == 1
+        assert cached_geocoder.cache.stats.hits == 1
+
+    @patch.object(Geocoder, "_query_providers")
+    def test_cache_key_is_cleaned_address(self, mock_providers, cached_geocoder):
+        """Test that spelling variants sharing a cleaned form share an entry"""
+        mock_providers.return_value = (25.018269, 121.471703)
+
+        cached_geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+        cached_geocoder.address_to_coordinates("板橋區 民生路二段 80號")
+
+        assert mock_providers.call_count == 1
+
+    @patch.object(Geocoder, "_query_providers")
+    def test_failures_are_negatively_cached(self, mock_providers, cached_geocoder):
+        """Test that a failed lookup is not retried while cached"""
+        mock_providers.return_value = None
+
+        with pytest.raises(GeocodingError):
+            cached_geocoder.address_to_coordinates("Invalid Address")
+        with pytest.raises(GeocodingError) as exc_info:
+            cached_geocoder.address_to_coordinates("Invalid Address")
+
+        assert "無法找到地址的座標" in str(exc_info.value)
+        assert mock_providers.call_count == 1
+        assert cached_geocoder.cache.stats.negative_hits == 1
+
+    @patch.object(Geocoder, "_query_nlsc")
+    def test_network_errors_are_not_cached(self, mock_nlsc, cached_geocoder):
+        """Test that unexpected request errors are not negatively cached"""
+        mock_nlsc.side_effect = requests.RequestException("Network error")
+
+        with pytest.raises(GeocodingError):
+            cached_geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert len(cached_geocoder.cache) == 0
+
+    @patch("trash_tracking_core.utils.geocoding.requests.get")
+    def test_provider_outage_is_not_cached(self, mock_get, cached_geocoder):
+        """Test that an address no provider could be asked about is not cached as not found"""
+        mock_get.side_effect = requests.ConnectionError("Connection failed")
+
+        with pytest.raises(GeocodingError) as exc_info:
+            cached_geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert "地址查詢失敗" in str(exc_info.value)
+        assert len(cached_geocoder.cache) == 0
+
+    @patch.object(Geocoder, "_query_tgos", return_value=None)
+    @patch.object(Geocoder, "_try_simplified_addresses", return_value=None)
+    @patch.object(Geocoder, "_query_nominatim", return_value=None)
+    @patch.object(Geocoder, "_query_nlsc")
+    def test_partial_outage_is_not_cached(self, mock_nlsc, mock_nominatim, mock_simplified, mock_tgos, cached_geocoder):
+        """Test that a miss is not cached while a provider was unreachable"""
+        mock_nlsc.side_effect = requests.HTTPError("503 Service Unavailable")
+
+        with pytest.raises(GeocodingError) as exc_info:
+            cached_geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert "NLSC" in str(exc_info.value)
+        assert mock_tgos.called
+        assert len(cached_geocoder.cache) == 0
+
+
+class TestConcurrentGeocoding:
+    """Test concurrent and hedged provider racing"""
+
+    @staticmethod
+    def provider(result=None, delay=0.0, calls=None, name="", error=None):
+        """Fake provider returning ``result`` (or raising ``error``) after ``delay`` seconds"""
+
+        def query(address, timeout, cancelled=None):
+            if calls is not None:
+                calls.append(name)
+            time.sleep(delay)
+            if error is not None:
+                raise error
+            return result
+
+        return staticmethod(query)
+
+    def patch_providers(self, nlsc, nominatim, simplified, tgos):
+        """Patch the four providers in priority order"""
+        return patch.multiple(
+            Geocoder,
+            _query_nlsc=nlsc,
+            _query_nominatim=nominatim,
+            _try_simplified_addresses=simplified,
+            _query_tgos=tgos,
+        )
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected"""
+        with pytest.raises(ValueError):
+            Geocoder(mode="parallel")
+
+    def test_prefers_higher_priority_result(self):
+        """Test that a fast low-priority answer waits for a slower higher-priority one"""
+        geocoder = Geocoder(mode="concurrent", deadline=5)
+        providers = self.patch_providers(
+            self.provider((25.0, 121.0), delay=0.2),
+            self.provider((24.0, 120.0)),
+            self.provider(),
+            self.provider(),
+        )
+
+        with providers:
+            result = geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert result == (25.0, 121.0)
+
+    def test_latency_bounded_by_fastest_good_provider(self):
+        """Test that failures do not add up in concurrent mode"""
+        geocoder = Geocoder(mode="concurrent", deadline=5)
+        providers = self.patch_providers(
+            self.provider(delay=0.3),
+            self.provider(delay=0.3),
+            self.provider(delay=0.3),
+            self.provider((25.0, 121.0), delay=0.3),
+        )
+
+        started = time.monotonic()
+        with providers:
+            result = geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert result == (25.0, 121.0)
+        assert time.monotonic() - started < 0.9
+
+    def test_hedged_skips_later_providers_after_answer(self):
+        """Test that hedged mode never starts providers once an answer is accepted"""
+        calls = []
+        geocoder = Geocoder(mode="hedged", hedge_delay=0.3, deadline=5)
+        providers = self.patch_providers(
+            self.provider((25.0, 121.0), delay=0.05, calls=calls, name="nlsc"),
+            self.provider(calls=calls, name="nominatim"),
+            self.provider(calls=calls, name="simplified"),
+            self.provider(calls=calls, name="tgos"),
+        )
+
+        with providers:
+            result = geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+        time.sleep(0.4)
+
+        assert result == (25.0, 121.0)
+        assert calls == ["nlsc"]
+
+    def test_simplified_lookup_stops_after_answer(self):
+        """Test that the simplified Nominatim ladder sends no requests once the race is decided"""
+        calls = []
+        geocoder = Geocoder(mode="concurrent", deadline=5)
+        providers = patch.multiple(
+            Geocoder,
+            _query_nlsc=self.provider((25.0, 121.0), delay=0.05),
+            _query_nominatim=self.provider(delay=0.04, calls=calls, name="nominatim"),
+            _query_tgos=self.provider(),
+        )
+
+        with providers:
+            result = geocoder.address_to_coordinates("新北市板橋區民生路二段123巷45弄67號")
+            settled_calls = len(calls)
+            time.sleep(0.3)
+
+        assert result == (25.0, 121.0)
+        assert len(calls) == settled_calls
+        assert settled_calls < 5
+
+    def test_deadline_returns_best_arrived_answer(self):
+        """Test that a lower-priority answer is used when a better provider hangs past the deadline"""
+        geocoder = Geocoder(mode="concurrent", deadline=0.3)
+        providers = self.patch_providers(
+            self.provider((25.0, 121.0), delay=2),
+            self.provider((24.0, 120.0)),
+            self.provider(),
+            self.provider(),
+        )
+
+        with providers:
+            result = geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert result == (24.0, 120.0)
+
+    def test_deadline_without_answer_raises_and_is_not_cached(self):
+        """Test that a timed-out lookup raises and is not negatively cached"""
+        cache = GeocodeCache()
+        geocoder = Geocoder(cache=cache, mode="concurrent", deadline=0.2)
+        slow = self.provider(delay=1)
+
+        with self.patch_providers(slow, slow, slow, slow):
+            with pytest.raises(GeocodingError) as exc_info:
+                geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert "逾時" in str(exc_info.value)
+        assert len(cache) == 0
+
+    def test_all_providers_fail(self):
+        """Test that a lookup every provider rejects raises the not-found error"""
+        geocoder = Geocoder(mode="concurrent", deadline=5)
+        failing = self.provider()
+
+        with self.patch_providers(failing, failing, failing, failing):
+            with pytest.raises(GeocodingError) as exc_info:
+                geocoder.address_to_coordinates("Invalid Address")
+
+        assert "無法找到地址的座標" in str(exc_info.value)
+
+    def test_provider_exception_does_not_abort_race(self):
+        """Test that one provider raising does not hide other providers' answers"""
+        geocoder = Geocoder(mode="concurrent", deadline=5)
+        providers = self.patch_providers(
+            self.provider(error=requests.RequestException("boom")),
+            self.provider((24.0, 120.0)),
+            self.provider(),
+            self.provider(),
+        )
+
+        with providers:
+            assert geocoder.address_to_coordinates("新北市板橋區民生路二段80號") == (24.0, 120.0)
+
+    def test_provider_outage_is_not_cached(self):
+        """Test that a race lost to an unreachable provider raises instead of caching a miss"""
+        cache = GeocodeCache()
+        geocoder = Geocoder(cache=cache, mode="concurrent", deadline=5)
+        missing = self.provider()
+
+        with self.patch_providers(self.provider(error=requests.Timeout("timeout")), missing, missing, missing):
+            with pytest.raises(GeocodingError) as exc_info:
+                geocoder.address_to_coordinates("新北市板橋區民生路二段80號")
+
+        assert "地址查詢失敗" in str(exc_info.value)
+        assert len(cache) == 0
+
+
+class TestGeocoderGazetteer:
+    """Test offline gazetteer lookups before network providers"""
+
+    @pytest.fixture
+    def gazetteer(self, tmp_path):
+        """Gazetteer with one address point"""
+        path = str(tmp_path / "gazetteer.db")
+        build_gazetteer([{"district": "板橋區", "road": "民生路二段", "number": "80", "lat": "25.018", "lng": "121.471"}], path)
+        g = Gazetteer(path)
+        yield g
+        g.close()
+
+    @patch.object(Geocoder, "_query_providers")
+    def test_exact_match_skips_network(self, mock_providers, gazetteer):
+        """Test that an indexed address never reaches the network"""
+        geocoder = Geocoder(gazetteer=gazetteer)
+
+        result = geocoder.address_to_coordinates("板橋區民生路二段80號")
+
+        assert result == pytest.approx((25.018, 121.471))
+        mock_providers.assert_not_called()
+
+    @patch.object(Geocoder, "_query_providers")
+    def test_road_level_match_uses_network_for_numbered_address(self, mock_providers, gazetteer):
+        """Test that a coarse match does not replace a precise remote lookup"""
+        mock_providers.return_value = (25.1, 121.5)
+        geocoder = Geocoder(gazetteer=gazetteer)
+
+        result = geocoder.address_to_coordinates("板橋區民生路二段99號")
+
+        assert result == (25.1, 121.5)
+        mock_providers.assert_called_once()
+
+
+class TestGeocoderRateLimits:
+    """Test per-service rate limiting"""
+
+    def test_unknown_service_rejected(self):
+        """Test that only known services can be rate limited"""
+        with pytest.raises(ValueError, match="google"):
+            Geocoder(rate_limits={"google": MagicMock()})
+
+    @patch("trash_tracking_core.utils.geocoding.requests.get")
+    def test_each_service_uses_its_limiter(self, mock_get, nominatim_response):
+        """Test that every request waits for its own service's limiter"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = nominatim_response
+        mock_get.return_value = mock_response
+        limiters = {"nlsc": MagicMock(), "nominatim": MagicMock(), "tgos": MagicMock()}
+        geocoder = Geocoder(rate_limits=limiters)
+
+        geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=10)
+        geocoder._query_nominatim("新北市板橋區民生路二段", timeout=10)
+        geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=10)
+
+        assert limiters["nominatim"].acquire.call_count == 2
+        assert limiters["tgos"].acquire.call_count == 1
+        limiters["nlsc"].acquire.assert_not_called()
+
+    @patch("trash_tracking_core.utils.geocoding.requests.get")
+    def test_simplified_nominatim_shares_limiter(self, mock_get):
+        """Test that simplified-address retries count against the Nominatim limit"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = []
+        mock_get.return_value = mock_response
+        limiter = MagicMock()
+        geocoder = Geocoder(rate_limits={"nominatim": limiter})
+
+        geocoder._try_simplified_addresses("新北市板橋區民生路2段80巷3號", timeout=10)
+
+        assert limiter.acquire.call_count == mock_get.call_count == 3
+
+
+class TestGeocoderAddressKey:
+    """Test that caches and the fallback ladder share the parsed address"""
+
+    @patch.object(Geocoder, "_query_providers")
+    def test_section_and_digit_variants_share_cache_entry(self, mock_providers):
+        """Test that "二段" and full-width digits hit the entry of "2段" """
+        mock_providers.return_value = (25.018269, 121.471703)
+        cache = GeocodeCache()
+        geocoder = Geocoder(cache=cache)
+
+        geocoder.address_to_coordinates("新北市板橋區民生路2段80號")
+        result = geocoder.address_to_coordinates("新北市板橋區民生路二段８０號")
+
+        assert result == (25.018269, 121.471703)
+        assert mock_providers.call_count == 1
+        cache.close()
+
+    @patch.object(Geocoder, "_query_nominatim", return_value=None)
+    def test_simplified_ladder_includes_chinese_section(self, mock_query, geocoder):
+        """Test that the ladder also drops a section written with Chinese numerals"""
+        geocoder._try_simplified_addresses("新北市板橋區民生路二段80號", timeout=10)
+
+        assert [c.args[0] for c in mock_query.call_args_list] == ["新北市板橋區民生路二段", "新北市板橋區民生路"]
+
+
+class TestGeocoderInstrumentation:
+    """Test that provider calls and cache lookups reach the metrics sinks"""
+
+    @pytest.fixture
+    def sink(self):
+        sink = HistogramSink()
+        metrics.add_sink(sink)
+        yield sink
+        metrics.remove_sink(sink)
+
+    @patch("trash_tracking_core.utils.geocoding.requests.get")
+    def test_provider_calls_are_recorded(self, mock_get, geocoder, nlsc_response, sink):
+        """Test that a successful and an empty provider answer are told apart"""
+        mock_response = MagicMock()
+        mock_response.content = b"[...]"
+        mock_response.json.side_effect = [nlsc_response, []]
+        mock_get.return_value = mock_response
+
+        geocoder._query_nlsc("新北市板橋區民生路二段80號", timeout=10)
+        geocoder._query_nominatim("新北市板橋區民生路二段80號", timeout=10)
+
+        calls = sink.snapshot()["calls"]
+        assert calls["nlsc/TownVillagePointQuery"]["statuses"] == {"ok": 1}
+        assert calls["nlsc/TownVillagePointQuery"]["bytes"] == 5
+        assert calls["nominatim/search"]["statuses"] == {"empty": 1}
+
+    @patch("trash_tracking_core.utils.geocoding.requests.get")
+    def test_provider_errors_are_recorded(self, mock_get, geocoder, sink):
+        """Test that a provider timeout is recorded"""
+        mock_get.side_effect = requests.exceptions.Timeout()
+
+        with pytest.raises(requests.exceptions.Timeout):
+            geocoder._query_tgos("新北市板橋區民生路二段80號", timeout=10)
+
+        assert sink.snapshot()["calls"]["tgos/addr"]["statuses"] == {"timeout": 1}
+
+    @patch.object(Geocoder, "_query_providers", return_value=(25.018269, 121.471703))
+    def test_cache_lookups_are_recorded(self, mock_providers, sink):
+        """Test that cache misses and hits are counted"""
+        cache = GeocodeCache()
+        geocoder = Geocoder(cache=cache)
+
+        geocoder.address_to_coordinates("新北市板橋區民生路2段80號")
+        geocoder.address_to_coordinates("新北市板橋區民生路2段80號")
+
+        assert sink.snapshot()["cache"]["geocoder/address"] == {"hit": 1, "miss": 1, "coalesced": 0}
+        cache.close()
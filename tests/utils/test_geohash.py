@@ -0,0 +1,48 @@
+"""Tests for geohash tiles"""
+import pytest
+from trash_tracking_core.utils.geohash import encode_geohash, geohash_bounds, tile_center
+
+
+class TestEncodeGeohash:
+    """Tests for encode_geohash"""
+
+    def test_known_value(self):
+        assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_precision(self):
+        assert len(encode_geohash(25.0, 121.5, 5)) == 5
+        assert encode_geohash(25.0, 121.5, 7).startswith(encode_geohash(25.0, 121.5, 5))
+
+    def test_rejects_zero_precision(self):
+        with pytest.raises(ValueError):
+            encode_geohash(25.0, 121.5, 0)
+
+
+class TestGeohashBounds:
+    """Tests for geohash_bounds"""
+
+    def test_bounds_contain_location(self):
+        south, west, north, east = geohash_bounds(encode_geohash(25.0133, 121.4637, 7))
+
+        assert south <= 25.0133 <= north
+        assert west <= 121.4637 <= east
+        assert north - south == pytest.approx(180 / 2**17)
+        assert east - west == pytest.approx(360 / 2**18)
+
+    def test_rejects_invalid_characters(self):
+        with pytest.raises(ValueError):
+            geohash_bounds("wsqa")
+
+
+class TestTileCenter:
+    """Tests for tile_center"""
+
+    def test_neighbours_share_center(self):
+        assert tile_center(25.0001, 121.5001) == tile_center(25.0003, 121.4995)
+
+    def test_center_is_stable(self):
+        center = tile_center(25.0133, 121.4637)
+        assert tile_center(*center) == center
+
+    def test_distant_locations_differ(self):
+        assert tile_center(25.0, 121.5) != tile_center(25.01, 121.51)
@@ -0,0 +1,131 @@
+"""Tests for Logging Module"""
+
+import io
+import logging
+import threading
+
+import pytest
+from trash_tracking_core.utils.logger import (
+    get_logger,
+    set_module_levels,
+    setup_logger,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+@pytest.fixture
+def test_logger():
+    """Logger with a stream handler, removed afterwards"""
+    stream = io.StringIO()
+    logger = logging.getLogger("trash_tracking_test")
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger, stream
+    stop_queue_logging("trash_tracking_test")
+    logger.handlers.clear()
+
+
+class TestGetLogger:
+    """Tests for module loggers"""
+
+    def test_module_logger_is_child_of_package_logger(self):
+        assert get_logger("trash_tracking_core.core.point_matcher").name == "trash_tracking.core.point_matcher"
+
+    def test_embedded_package_path(self):
+        name = "custom_components.trash_tracking.trash_tracking_core.utils.geocoding"
+
+        assert get_logger(name).name == "trash_tracking.utils.geocoding"
+
+    def test_foreign_module_gets_package_logger(self):
+        assert get_logger("__main__").name == "trash_tracking"
+
+
+class TestModuleLevels:
+    """Tests for per-module level gating"""
+
+    @pytest.fixture(autouse=True)
+    def restore_levels(self):
+        package = logging.getLogger("trash_tracking")
+        level = package.level
+        yield
+        package.setLevel(level)
+        set_module_levels({"core.point_matcher": "NOTSET", "core.state_machine": "NOTSET"})
+
+    def test_module_level_overrides_package_level(self, caplog):
+        setup_logger(log_level="WARNING", module_levels={"core.point_matcher": "DEBUG"})
+        matcher = get_logger("trash_tracking_core.core.point_matcher")
+        machine = get_logger("trash_tracking_core.core.state_machine")
+
+        with caplog.at_level(logging.NOTSET):
+            matcher.debug("matcher detail")
+            machine.info("machine detail")
+
+        assert "matcher detail" in caplog.text
+        assert "machine detail" not in caplog.text
+
+    def test_disabled_levels_skip_formatting(self):
+        set_module_levels({"core.state_machine": "ERROR"})
+        formatted = []
+
+        class Expensive:
+            def __str__(self):
+                formatted.append(True)
+                return "expensive"
+
+        get_logger("trash_tracking_core.core.state_machine").info("value: %s", Expensive())
+
+        assert formatted == []
+
+    def test_package_handlers_accept_module_debug(self):
+        """The console handler must not filter what a module logger lets through"""
+        package = setup_logger()
+
+        assert all(handler.level == logging.NOTSET for handler in package.handlers)
+
+    def test_setup_logger_changes_level_of_configured_logger(self):
+        setup_logger(log_level="ERROR")
+
+        assert logging.getLogger("trash_tracking").level == logging.ERROR
+
+
+class TestQueueLogging:
+    """Tests for the non-blocking queue handler"""
+
+    def test_records_reach_original_handlers(self, test_logger):
+        logger, stream = test_logger
+
+        start_queue_logging("trash_tracking_test")
+        logger.info("queued %s", "message")
+        stop_queue_logging("trash_tracking_test")
+
+        assert stream.getvalue() == "INFO queued message\n"
+
+    def test_formatting_happens_off_the_calling_thread(self, test_logger):
+        logger, _ = test_logger
+        formatted_on = []
+
+        class Value:
+            def __str__(self):
+                formatted_on.append(threading.current_thread().name)
+                return "value"
+
+        start_queue_logging("trash_tracking_test")
+        logger.info("%s", Value())
+        stop_queue_logging("trash_tracking_test")
+
+        assert formatted_on and threading.current_thread().name not in formatted_on
+
+    def test_stop_restores_handlers(self, test_logger):
+        logger, stream = test_logger
+        handlers = list(logger.handlers)
+
+        assert start_queue_logging("trash_tracking_test") is start_queue_logging("trash_tracking_test")
+        stop_queue_logging("trash_tracking_test")
+        logger.info("direct")
+
+        assert logger.handlers == handlers
+        assert "direct" in stream.getvalue()
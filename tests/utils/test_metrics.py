@@ -0,0 +1,189 @@
+"""Tests for Upstream Call Instrumentation"""
+
+import logging
+
+import pytest
+import requests
+from trash_tracking_core.utils.metrics import (
+    CallRecord,
+    HistogramSink,
+    Instrumentation,
+    LoggingSink,
+    MetricsSink,
+    PrometheusSink,
+)
+
+
+class ListSink(MetricsSink):
+    """Sink keeping every event"""
+
+    def __init__(self):
+        self.calls = []
+        self.cache = []
+
+    def record_call(self, record):
+        self.calls.append(record)
+
+    def record_cache(self, service, endpoint, result):
+        self.cache.append((service, endpoint, result))
+
+
+def make_record(latency_ms=120.0, status="ok", attempt=1, **kwargs):
+    return CallRecord("ntpc", "GetAroundPoints", attempt, status, latency_ms, **kwargs)
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(response=response)
+
+
+class TestInstrumentation:
+    """Tests for Instrumentation and CallTimer"""
+
+    def test_call_records_bytes_and_parse_time(self):
+        instrumentation = Instrumentation()
+        sink = ListSink()
+        instrumentation.add_sink(sink)
+
+        with instrumentation.call("ntpc", "GetAroundPoints", attempt=2) as call:
+            call.bytes = 512
+            with call.parsing():
+                sum(range(1000))
+
+        (record,) = sink.calls
+        assert (record.service, record.endpoint, record.attempt) == ("ntpc", "GetAroundPoints", 2)
+        assert record.status == "ok" and record.bytes == 512
+        assert 0 < record.parse_ms <= record.latency_ms
+
+    def test_explicit_status_wins(self):
+        instrumentation = Instrumentation()
+        sink = ListSink()
+        instrumentation.add_sink(sink)
+
+        with instrumentation.call("nlsc", "TownVillagePointQuery") as call:
+            call.status = "empty"
+
+        assert sink.calls[0].status == "empty"
+
+    @pytest.mark.parametrize(
+        "exc, status",
+        [
+            (requests.exceptions.ConnectTimeout(), "timeout"),
+            (http_error(503), "http_503"),
+            (requests.exceptions.ConnectionError(), "network_error"),
+            (ValueError("bad json"), "parse_error"),
+            (KeyError("lat"), "error"),
+        ],
+    )
+    def test_status_from_exception(self, exc, status):
+        instrumentation = Instrumentation()
+        sink = ListSink()
+        instrumentation.add_sink(sink)
+
+        with pytest.raises(type(exc)):
+            with instrumentation.call("ntpc", "GetAroundPoints"):
+                raise exc
+
+        assert sink.calls[0].status == status
+
+    def test_cache_events(self):
+        instrumentation = Instrumentation()
+        sink = ListSink()
+        instrumentation.add_sink(sink)
+
+        instrumentation.cache("ntpc", "GetAroundPoints", "hit")
+
+        assert sink.cache == [("ntpc", "GetAroundPoints", "hit")]
+
+    def test_sinks_can_be_removed(self):
+        instrumentation = Instrumentation()
+        sink = ListSink()
+        instrumentation.add_sink(sink)
+        instrumentation.add_sink(sink)
+        instrumentation.remove_sink(sink)
+
+        with instrumentation.call("ntpc", "GetAroundPoints"):
+            pass
+
+        assert instrumentation.sinks == () and sink.calls == []
+
+
+class TestHistogramSink:
+    """Tests for HistogramSink"""
+
+    def test_snapshot(self):
+        sink = HistogramSink()
+        sink.record_call(make_record(40.0, bytes=1000, parse_ms=2.0))
+        sink.record_call(make_record(80.0, bytes=3000, parse_ms=4.0))
+        sink.record_call(make_record(3000.0, status="timeout", attempt=2))
+        sink.record_cache("ntpc", "GetAroundPoints", "hit")
+        sink.record_cache("ntpc", "GetAroundPoints", "miss")
+        sink.record_cache("ntpc", "GetAroundPoints", "hit")
+
+        snapshot = sink.snapshot()
+
+        calls = snapshot["calls"]["ntpc/GetAroundPoints"]
+        assert calls["count"] == 3
+        assert calls["statuses"] == {"ok": 2, "timeout": 1}
+        assert calls["retries"] == 1
+        assert calls["latency_ms"] == {"mean": 1040.0, "p50": 100.0, "p95": 5000.0, "max": 3000.0}
+        assert calls["bytes"] == 4000 and calls["parse_ms"] == 6.0
+        assert snapshot["cache"] == {"ntpc/GetAroundPoints": {"hit": 2, "miss": 1, "coalesced": 0}}
+
+    def test_reset(self):
+        sink = HistogramSink()
+        sink.record_call(make_record())
+
+        sink.reset()
+
+        assert sink.snapshot() == {"calls": {}, "cache": {}}
+
+
+class TestPrometheusSink:
+    """Tests for the text exposition"""
+
+    def test_render(self):
+        sink = PrometheusSink()
+        sink.record_call(make_record(40.0, bytes=1000, parse_ms=2.5))
+        sink.record_call(make_record(25.0))
+        sink.record_call(make_record(20000.0, status="http_500", attempt=3))
+        sink.record_cache("geocoder", "address", "miss")
+
+        text = sink.render()
+
+        base = 'service="ntpc",endpoint="GetAroundPoints"'
+        assert f'trash_tracking_upstream_requests_total{{{base},status="ok"}} 2' in text
+        assert f'trash_tracking_upstream_requests_total{{{base},status="http_500"}} 1' in text
+        assert f"trash_tracking_upstream_retries_total{{{base}}} 1" in text
+        assert f'trash_tracking_upstream_latency_seconds_bucket{{{base},le="0.025"}} 1' in text
+        assert f'trash_tracking_upstream_latency_seconds_bucket{{{base},le="0.05"}} 2' in text
+        assert f'trash_tracking_upstream_latency_seconds_bucket{{{base},le="10.0"}} 2' in text
+        assert f'trash_tracking_upstream_latency_seconds_bucket{{{base},le="+Inf"}} 3' in text
+        assert f"trash_tracking_upstream_latency_seconds_sum{{{base}}} 20.065" in text
+        assert f"trash_tracking_upstream_latency_seconds_count{{{base}}} 3" in text
+        assert f"trash_tracking_upstream_response_bytes_total{{{base}}} 1000" in text
+        assert f"trash_tracking_upstream_parse_seconds_total{{{base}}} 0.0025" in text
+        assert 'trash_tracking_cache_lookups_total{service="geocoder",endpoint="address",result="miss"} 1' in text
+        assert "# TYPE trash_tracking_upstream_latency_seconds histogram" in text
+        assert text.endswith("\n")
+
+    def test_label_values_are_escaped(self):
+        sink = PrometheusSink(prefix="tt")
+        sink.record_call(CallRecord("svc", 'a"b\\c', 1, "ok", 1.0))
+
+        assert 'tt_upstream_retries_total{service="svc",endpoint="a\\"b\\\\c"} 0' in sink.render()
+
+
+class TestLoggingSink:
+    """Tests for LoggingSink"""
+
+    def test_logs_calls_and_cache_lookups(self, caplog):
+        sink = LoggingSink(level=logging.INFO)
+
+        with caplog.at_level(logging.INFO, logger="trash_tracking"):
+            sink.record_call(make_record(12.34, bytes=100, parse_ms=1.0))
+            sink.record_cache("ntpc", "GetAroundPoints", "hit")
+
+        assert "ntpc GetAroundPoints attempt 1: ok in 12.3 ms (100 bytes, parse 1.0 ms)" in caplog.text
+        assert "ntpc GetAroundPoints cache hit" in caplog.text
@@ -0,0 +1,113 @@
+"""Tests for TWD97 TM2 Projection"""
+
+import math
+
+import pytest
+from trash_tracking_core.utils import projection
+from trash_tracking_core.utils.projection import twd97_to_wgs84, twd97_to_wgs84_many, wgs84_to_twd97
+
+# (lat, lng) -> (x, y); grid values cross-checked against Snyder's USGS series to 0.1 mm
+CONTROL_POINTS = [
+    ((25.0339, 121.5645), (306965.5788, 2769651.1471)),  # Taipei 101
+    ((22.6273, 120.3014), (178188.5533, 2503182.3669)),  # Kaohsiung
+    ((24.0, 121.0), (250000.0, 2655023.1250)),  # Central meridian
+    ((23.5, 120.0), (147865.6180, 2600006.7746)),  # West edge of the zone
+]
+
+# 1e-8 degrees is about 1 mm on the ground
+DEGREE_TOLERANCE = 1e-8
+
+
+def _meridian_arc(lat: float) -> float:
+    """Meridian distance from the equator on GRS80 by Simpson integration"""
+    e2 = projection.F * (2 - projection.F)
+    phi = math.radians(lat)
+    steps = 2000
+    h = phi / steps
+    total = 0.0
+    for i in range(steps + 1):
+        weight = 1 if i in (0, steps) else (4 if i % 2 else 2)
+        total += weight * projection.A * (1 - e2) / (1 - e2 * math.sin(i * h) ** 2) ** 1.5
+    return total * h / 3
+
+
+class TestTwd97ToWgs84:
+    """Test the inverse projection"""
+
+    @pytest.mark.parametrize("geographic,grid", CONTROL_POINTS)
+    def test_control_points(self, geographic, grid):
+        lat, lng = twd97_to_wgs84(*grid)
+
+        assert lat == pytest.approx(geographic[0], abs=DEGREE_TOLERANCE)
+        assert lng == pytest.approx(geographic[1], abs=DEGREE_TOLERANCE)
+
+    def test_false_origin_is_equator_on_central_meridian(self):
+        assert twd97_to_wgs84(250000.0, 0.0) == pytest.approx((0.0, 121.0), abs=1e-12)
+
+    @pytest.mark.parametrize("lat", [21.9, 23.0, 24.5, 25.3])
+    def test_central_meridian_northing_is_scaled_meridian_arc(self, lat):
+        y = projection.K0 * _meridian_arc(lat)
+
+        result_lat, result_lng = twd97_to_wgs84(250000.0, y)
+
+        assert result_lat == pytest.approx(lat, abs=DEGREE_TOLERANCE)
+        assert result_lng == pytest.approx(121.0, abs=1e-12)
+
+    def test_round_trip_across_zone(self):
+        for lat in (21.8, 22.5, 23.2, 24.0, 24.7, 25.4):
+            for lng in (119.9, 120.5, 121.0, 121.5, 122.0):
+                x, y = wgs84_to_twd97(lat, lng)
+                result = twd97_to_wgs84(x, y)
+
+                assert result == pytest.approx((lat, lng), abs=1e-10)
+
+    def test_geocoder_uses_projection(self):
+        from trash_tracking_core.utils.geocoding import Geocoder
+
+        assert Geocoder()._twd97_to_wgs84(306965.5788, 2769651.1471) == twd97_to_wgs84(306965.5788, 2769651.1471)
+
+
+class TestWgs84ToTwd97:
+    """Test the forward projection"""
+
+    @pytest.mark.parametrize("geographic,grid", CONTROL_POINTS)
+    def test_control_points(self, geographic, grid):
+        x, y = wgs84_to_twd97(*geographic)
+
+        assert x == pytest.approx(grid[0], abs=1e-3)
+        assert y == pytest.approx(grid[1], abs=1e-3)
+
+
+class TestTwd97ToWgs84Many:
+    """Test the batch conversion"""
+
+    def _grid(self):
+        xs = [150000.0 + 2500.0 * i for i in range(80)]
+        ys = [2420000.0 + 5000.0 * i for i in range(80)]
+        return xs, ys
+
+    def test_matches_scalar_conversion(self):
+        xs, ys = self._grid()
+
+        lats, lngs = twd97_to_wgs84_many(xs, ys)
+
+        for x, y, lat, lng in zip(xs, ys, lats, lngs):
+            assert (lat, lng) == pytest.approx(twd97_to_wgs84(x, y), abs=1e-12)
+
+    def test_fallback_without_numpy(self, monkeypatch):
+        xs, ys = self._grid()
+        monkeypatch.setattr(projection, "np", None)
+
+        lats, lngs = twd97_to_wgs84_many(xs, ys)
+
+        assert isinstance(lats, list) and isinstance(lngs, list)
+        assert list(zip(lats, lngs)) == [twd97_to_wgs84(x, y) for x, y in zip(xs, ys)]
+
+    def test_empty_input(self):
+        lats, lngs = twd97_to_wgs84_many([], [])
+
+        assert len(lats) == 0 and len(lngs) == 0
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="same length"):
+            twd97_to_wgs84_many([250000.0], [])
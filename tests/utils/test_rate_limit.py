@@ -0,0 +1,99 @@
+"""Tests for Request Rate Limiting"""
+
+import threading
+import time
+
+import pytest
+from trash_tracking_core.utils.rate_limit import RateLimiter
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter"""
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+        with pytest.raises(ValueError):
+            RateLimiter(1, burst=0)
+
+    def test_first_call_does_not_wait(self):
+        clock = FakeClock()
+        limiter = RateLimiter(1.0, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() is True
+        assert clock.sleeps == []
+
+    def test_spaces_consecutive_calls(self):
+        clock = FakeClock()
+        limiter = RateLimiter(2.0, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            limiter.acquire()
+
+        assert clock.sleeps == [0.5, 0.5, 0.5]
+
+    def test_idle_time_is_not_banked_beyond_burst(self):
+        clock = FakeClock()
+        limiter = RateLimiter(1.0, clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+
+        clock.now += 60
+        limiter.acquire()
+        limiter.acquire()
+
+        assert clock.sleeps == [1.0]
+
+    def test_burst_allows_back_to_back_calls(self):
+        clock = FakeClock()
+        limiter = RateLimiter(1.0, burst=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            limiter.acquire()
+
+        assert clock.sleeps == [1.0]
+
+    def test_timeout_does_not_consume_slot(self):
+        clock = FakeClock()
+        limiter = RateLimiter(1.0, clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=0.5) is False
+        assert limiter.acquire(timeout=1.0) is True
+        assert clock.sleeps == [1.0]
+
+    def test_concurrent_callers_are_spaced(self):
+        limiter = RateLimiter(50.0)
+        stamps = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stamps.sort()
+        assert stamps[-1] - stamps[0] >= 5 * 0.02 - 0.005
+
+    def test_str(self):
+        assert str(RateLimiter(0.5, burst=2)) == "RateLimiter(0.5/s, burst=2)"